@@ -0,0 +1,72 @@
+"""Create llm_call ledger table.
+
+One row per router call: which route/model served it, the module that
+asked, real token counts, whether it was a response-cache hit or fell back
+to another route, how many model turns it took and its latency.
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'llm_call',
+        sa.Column('id', sa.BigInteger, primary_key=True),
+        sa.Column('route', sa.Text, nullable=False),
+        sa.Column('model', sa.Text, nullable=False),
+        sa.Column('caller', sa.Text, nullable=False),
+        sa.Column('tokens_in', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('tokens_out', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('cache_hit', sa.Boolean, nullable=False, server_default=sa.false()),
+        sa.Column('attempts', sa.SmallInteger, nullable=False, server_default='1'),
+        sa.Column('fallback', sa.Boolean, nullable=False, server_default=sa.false()),
+        sa.Column('ttfb_ms', sa.Integer, nullable=False),
+        sa.Column('latency_ms', sa.Integer, nullable=False),
+        sa.Column('status', sa.Text, nullable=False),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('now()'),
+        ),
+        schema='discord',
+    )
+    op.create_index(
+        'idx_llm_call_created_at',
+        'llm_call',
+        ['created_at'],
+        schema='discord',
+    )
+    op.create_index(
+        'idx_llm_call_caller_route',
+        'llm_call',
+        ['caller', 'route', 'created_at'],
+        schema='discord',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'idx_llm_call_caller_route',
+        table_name='llm_call',
+        schema='discord',
+    )
+    op.drop_index(
+        'idx_llm_call_created_at',
+        table_name='llm_call',
+        schema='discord',
+    )
+    op.drop_table('llm_call', schema='discord')
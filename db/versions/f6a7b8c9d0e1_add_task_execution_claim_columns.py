@@ -0,0 +1,59 @@
+"""Add claim status and lease columns to task_execution.
+
+status: 'running' while a claimed execution is in flight, 'done' once it
+finished and 'failed' if it raised. Existing rows were all completed runs,
+so they default to 'done'.
+
+lease_expires_at: when a 'running' claim may be taken over by another
+instance (e.g. after a crash mid-task).
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "f6a7b8c9d0e1"
+down_revision: Union[str, None] = "e5f6a7b8c9d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "task_execution",
+        sa.Column(
+            "status",
+            sa.Text,
+            nullable=False,
+            server_default=sa.text("'done'"),
+        ),
+        schema="discord",
+    )
+    op.add_column(
+        "task_execution",
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        schema="discord",
+    )
+    op.create_check_constraint(
+        "ck_task_execution_status",
+        "task_execution",
+        "status IN ('running', 'done', 'failed')",
+        schema="discord",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "ck_task_execution_status",
+        "task_execution",
+        type_="check",
+        schema="discord",
+    )
+    op.drop_column("task_execution", "lease_expires_at", schema="discord")
+    op.drop_column("task_execution", "status", schema="discord")
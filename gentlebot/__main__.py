@@ -16,8 +16,12 @@ from . import bot_config as cfg
 from .postgres_handler import PostgresHandler
 from .github_handler import GitHubIssueHandler
 from .infra.github_issues import get_github_issue_config
-from .util import build_db_url
-from .db import close_pool
+from .infra.http import close_http_client
+from .infra.loop_watchdog import install_loop_watchdog
+from .infra.state_cache import get_state_cache
+from .llm.router import get_router
+from .util import bool_env, build_db_url, int_env
+from .db import close_pool, get_pool
 from .version import get_version
 from .capabilities import CapabilityRegistry
 
@@ -61,6 +65,27 @@ intents.presences = True
 
 class GentleBot(commands.Bot):
     async def setup_hook(self) -> None:
+        # Measure loop lag and capture blocking stacks; debug mode logs every
+        # slow callback and defaults on in the TEST environment.
+        self.loop_watchdog = install_loop_watchdog(
+            threshold_ms=int_env("LOOP_LAG_THRESHOLD_MS", 250),
+            debug=bool_env("LOOP_DEBUG", cfg.IS_TEST),
+        )
+
+        # Carry LLM quota usage across restarts so a redeploy does not reset
+        # the daily request budget.
+        get_router().quota.attach_state(get_state_cache(), "llm")
+        get_router().quota.start_checkpoints()
+
+        # Record every LLM call in discord.llm_call for /llmstats and trends
+        if build_db_url():
+            try:
+                pool = await get_pool(lane="ingest")
+            except Exception:
+                logger.exception("LLM ledger disabled: could not open ingest pool")
+            else:
+                get_router().ledger.attach(pool.tagged("llm ledger"))
+
         # Load cogs bundled with the package
         cog_dir = Path(__file__).resolve().parent / "cogs"
         failed_cogs = []
@@ -196,6 +221,14 @@ async def main() -> None:
                     logger.exception("Error awaiting backfill task")
         _backfill_tasks.clear()
 
+        watchdog = getattr(bot, "loop_watchdog", None)
+        if watchdog:
+            await watchdog.stop()
+
+        await get_router().quota.aclose()
+        await get_router().ledger.close()
+        await close_http_client()
+
         if github_handler:
             github_handler.close()
         if db_handler:
@@ -24,6 +24,8 @@ class BackfillBot(commands.Bot):
         intents.members = True
         super().__init__(command_prefix="!", intents=intents)
         self.archive = MessageArchiveCog(self)
+        # History backfills must not compete with live ingest for connections.
+        self.archive.pool_lane = "batch"
         self.days = days
         self.counts = {
             "guild": 0,
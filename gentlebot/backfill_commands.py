@@ -12,7 +12,8 @@ import discord
 from discord.ext import commands
 
 from gentlebot import bot_config as cfg
-from gentlebot.util import build_db_url, rows_from_tag, chan_name
+from gentlebot.db import close_pool, get_pool
+from gentlebot.util import rows_from_tag, chan_name
 
 log = logging.getLogger("gentlebot.backfill_commands")
 
@@ -42,24 +43,18 @@ class BackfillBot(commands.Bot):
         self.inserted = 0
 
     async def setup_hook(self) -> None:
-        url = build_db_url()
-        if not url:
+        try:
+            self.pool = await get_pool(lane="batch")
+        except RuntimeError:
             log.error("PG_DSN is required for backfill")
             await self.close()
             return
-        url = url.replace("postgresql+asyncpg://", "postgresql://")
-
-        async def _init(conn: asyncpg.Connection) -> None:
-            await conn.execute("SET search_path=discord,public")
-
-        self.pool = await asyncpg.create_pool(url, init=_init)
 
     async def on_ready(self) -> None:
         log.info("Backfill bot logged in as %s", self.user)
         if self.pool:
             await self.backfill_history(self.days)
             log.info("Inserted %d command_invocation records", self.inserted)
-            await self.pool.close()
         await self.close()
 
     async def backfill_history(self, days: int) -> None:
@@ -109,8 +104,11 @@ async def run_backfill(days: int) -> None:
 
 
 async def main() -> None:
-    args = parse_args()
-    await run_backfill(args.days)
+    try:
+        args = parse_args()
+        await run_backfill(args.days)
+    finally:
+        await close_pool()
 
 
 if __name__ == "__main__":
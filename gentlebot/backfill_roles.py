@@ -10,7 +10,8 @@ import discord
 from discord.ext import commands
 
 from gentlebot import bot_config as cfg
-from gentlebot.util import build_db_url, rows_from_tag
+from gentlebot.db import close_pool, get_pool
+from gentlebot.util import rows_from_tag
 
 log = logging.getLogger("gentlebot.backfill_roles")
 
@@ -39,17 +40,12 @@ class BackfillBot(commands.Bot):
         }
 
     async def setup_hook(self) -> None:
-        url = build_db_url()
-        if not url:
+        try:
+            self.pool = await get_pool(lane="batch")
+        except RuntimeError:
             log.error("PG_DSN is required for backfill")
             await self.close()
             return
-        url = url.replace("postgresql+asyncpg://", "postgresql://")
-
-        async def _init(conn: asyncpg.Connection) -> None:
-            await conn.execute("SET search_path=discord,public")
-
-        self.pool = await asyncpg.create_pool(url, init=_init)
 
     async def on_ready(self) -> None:
         log.info("Backfill bot logged in as %s", self.user)
@@ -116,7 +112,6 @@ class BackfillBot(commands.Bot):
                         member.id,
                     )
                     self.counts["role_event"] += rows_from_tag(tag)
-        await self.pool.close()
         log.info(
             "Inserted %d roles, %d assignments, %d events",
             self.counts["role"],
@@ -134,7 +129,10 @@ async def run_backfill() -> None:
 
 
 async def main() -> None:
-    await run_backfill()
+    try:
+        await run_backfill()
+    finally:
+        await close_pool()
 
 
 if __name__ == "__main__":
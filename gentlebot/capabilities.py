@@ -154,6 +154,8 @@ class CapabilityRegistry:
         self._reactions: list[ReactionCapability] = []
         self._scheduled: list[ScheduledCapability] = []
         self._discovered_command_names: set[str] = set()
+        # Rendered prompt; capabilities only change on discover()
+        self._prompt: str | None = None
 
     async def discover(self) -> None:
         """Discover all capabilities from loaded cogs.
@@ -164,6 +166,8 @@ class CapabilityRegistry:
         2. Read CAPABILITIES from each cog
         3. Validate that declared commands actually exist
         """
+        self._prompt = None
+
         # Get all registered command names for validation
         self._discovered_command_names = {
             cmd.name for cmd in self.bot.tree.get_commands()
@@ -211,8 +215,14 @@ class CapabilityRegistry:
         """Generate the capabilities prompt for the LLM system prompt.
 
         Returns a formatted markdown string describing all bot capabilities,
-        organized by category.
+        organized by category.  The string is rendered once per discovery
+        and reused, so it stays byte-identical across requests.
         """
+        if self._prompt is None:
+            self._prompt = self._render_prompt()
+        return self._prompt
+
+    def _render_prompt(self) -> str:
         sections = []
 
         # Header
@@ -4,7 +4,9 @@ book_enrichment_cog.py – Book Info Enrichment for #reading
 Provides on-demand book information when users discuss books.
 
 How it works:
-  • Detects book mentions in #reading using LLM analysis
+  • A local prefilter (reading cues, title-case spans, titles seen before)
+    picks out messages that might mention a book
+  • Candidates are classified in micro-batches with one LLM call per batch
   • Auto-reacts with 📚 emoji to indicate info is available
   • When any user taps 📚, bot replies with book metadata:
     - Rating from Open Library
@@ -20,6 +22,7 @@ from __future__ import annotations
 
 import asyncio
 import collections
+import json
 import logging
 import os
 import re
@@ -27,13 +30,19 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 import discord
-import requests
 from discord.ext import commands
-from requests.adapters import HTTPAdapter, Retry
 
 from .. import bot_config as cfg
-from ..llm.router import router, SafetyBlocked
-from ..infra import RateLimited
+from ..llm.router import Priority, router, SafetyBlocked
+from ..infra import (
+    CachePolicy,
+    MicroBatcher,
+    RateLimited,
+    SingleFlight,
+    StateCache,
+    get_http_client,
+    get_state_cache,
+)
 from ..util import user_name, chan_name
 from ..capabilities import CogCapabilities, ReactionCapability
 
@@ -46,6 +55,8 @@ BOOK_EMOJI = "📚"
 OPEN_LIBRARY_SEARCH_URL = "https://openlibrary.org/search.json"
 OPEN_LIBRARY_WORKS_URL = "https://openlibrary.org/works/{work_id}.json"
 OPEN_LIBRARY_BOOK_URL = "https://openlibrary.org{key}"
+# Catalogue records rarely change; repeat lookups come from the HTTP cache
+OPEN_LIBRARY_CACHE = CachePolicy(ttl=7 * 86400, stale=30 * 86400)
 
 # Cache for book info to avoid repeated API calls
 # Key: message_id, Value: (book_title, book_data)
@@ -54,6 +65,93 @@ _book_cache: Dict[int, Tuple[str, Dict[str, Any]]] = {}
 # Maximum cache size
 MAX_CACHE_SIZE = 100
 
+# Candidate messages are classified in batches of up to BATCH_SIZE, waiting at
+# most BATCH_WINDOW seconds for a batch to fill.
+BATCH_SIZE = 10
+BATCH_WINDOW = 2.0
+
+# Titles previously found on Open Library, persisted so the prefilter
+# recognizes them after a restart.
+GAZETTEER_KEY = "book_enrichment:gazetteer"
+MAX_GAZETTEER_SIZE = 500
+MIN_GAZETTEER_TITLE = 4
+
+# Words that on their own suggest a message is about a book.
+_CUE_RE = re.compile(
+    r"\b(?:book|books|novel|novels|author|chapter|chapters|audiobook|"
+    r"kindle|goodreads|paperback|hardcover|memoir|trilogy|sequel)\b",
+    re.IGNORECASE,
+)
+# Everyday verbs count only when a capitalized word or number follows:
+# "finished reading 1984", "started Dune", but not "started work".
+_CUE_TITLE_RE = re.compile(
+    r"\b(?i:read|reads|reading|reread|re-read|finished|finishing|started|"
+    r"starting|recommend|recommends)\s+(?:(?i:the|a|an)\s+)?[A-Z0-9]"
+)
+# "by Andy Weir", but not "by Monday"
+_BY_AUTHOR_RE = re.compile(r"\bby\s+[A-Z][\w'.-]*\s+[A-Z][\w'.-]+")
+# Quoted or emphasized capitalized spans: "Dune", *Dune*, _Dune_
+_QUOTED_RE = re.compile(
+    r"[\"“][A-Z0-9][^\"“”\n]{1,79}[\"”]|(?<!\w)[*_][A-Z0-9][^*_\n]{1,79}[*_](?!\w)"
+)
+_WORD_RE = re.compile(r"[\w'-]+")
+# Lowercase words allowed inside a title span ("The Name of the Wind")
+_TITLE_JOINERS = frozenset({"of", "the", "a", "an", "and", "in", "on", "to", "for", "at"})
+
+
+def _has_title_span(text: str) -> bool:
+    """Whether *text* has two or more consecutive title-case words.
+
+    The first word of a sentence and the pronoun "I" don't count, so
+    "Thanks John" and "Yeah I agree" are not spans but "Project Hail Mary" is.
+    """
+    count = 0
+    prev_end = -1
+    for match in _WORD_RE.finditer(text):
+        word = match.group()
+        gap = text[max(prev_end, 0):match.start()]
+        initial = prev_end < 0 or gap.strip()[-1:] in (".", "!", "?") or "\n" in gap
+        prev_end = match.end()
+        if gap.strip():
+            count = 0
+        if initial or word == "I" or word.startswith("I'"):
+            count = 0
+            continue
+        if word[0].isupper() or (count and word[0].isdigit()):
+            count += 1
+            if count >= 2:
+                return True
+        elif word not in _TITLE_JOINERS:
+            count = 0
+    return False
+
+
+def _parse_batch_response(response: str, count: int) -> List[Optional[str]]:
+    """Map a batch classification response onto *count* titles."""
+    text = response.strip()
+    if text.startswith("```"):
+        text = text.strip("`").removeprefix("json").strip()
+    try:
+        data = json.loads(text)
+    except ValueError:
+        log.warning("Unparseable book detection response: %s", text[:200])
+        return [None] * count
+    if isinstance(data, list):
+        data = {str(idx): value for idx, value in enumerate(data, 1)}
+    if not isinstance(data, dict):
+        return [None] * count
+    titles: List[Optional[str]] = []
+    for idx in range(1, count + 1):
+        value = data.get(str(idx))
+        if isinstance(value, str):
+            value = value.strip()
+            if value.upper() == "NONE" or len(value) < 2:
+                value = None
+        else:
+            value = None
+        titles.append(value)
+    return titles
+
 
 class BookEnrichmentCog(commands.Cog):
     """Provides book information enrichment for #reading channel."""
@@ -71,72 +169,134 @@ class BookEnrichmentCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
-        self.session = self._build_session()
+        self.http = get_http_client()
         self.reading_channel_id = getattr(cfg, "READING_CHANNEL_ID", 0)
         self.enabled = getattr(cfg, "BOOK_ENRICHMENT_ENABLED", True)
         self._responded_messages: collections.deque[int] = collections.deque(maxlen=500)
-
-    def _build_session(self) -> requests.Session:
-        """Build a requests session with retry logic."""
-        session = requests.Session()
-        retries = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=["GET"],
+        # Concurrent mentions of the same title share one Open Library lookup
+        self._lookups = SingleFlight("open_library")
+        self._batcher: MicroBatcher[str, Optional[str]] = MicroBatcher(
+            self._classify_batch,
+            max_size=BATCH_SIZE,
+            max_delay=BATCH_WINDOW,
+            name="book_detection",
+        )
+        self._state: StateCache | None = None
+        # Insertion-ordered so the oldest titles are evicted first
+        self._gazetteer: dict[str, None] | None = None
+        # One alternation over every gazetteer title, rebuilt when it changes
+        self._gazetteer_re: re.Pattern[str] | None = None
+
+    @property
+    def state(self) -> StateCache:
+        if self._state is None:
+            self._state = get_state_cache()
+        return self._state
+
+    async def _load_gazetteer(self) -> dict[str, None]:
+        if self._gazetteer is None:
+            try:
+                stored = await asyncio.to_thread(self.state.get, GAZETTEER_KEY)
+            except Exception:
+                log.exception("Failed to load book gazetteer")
+                stored = None
+            self._gazetteer = dict.fromkeys(t for t in stored or [] if isinstance(t, str))
+            self._compile_gazetteer()
+        return self._gazetteer
+
+    def _compile_gazetteer(self) -> None:
+        titles = sorted(self._gazetteer or (), key=len, reverse=True)
+        self._gazetteer_re = (
+            re.compile(r"\b(?:" + "|".join(map(re.escape, titles)) + r")\b")
+            if titles
+            else None
         )
-        adapter = HTTPAdapter(max_retries=retries)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
-        return session
+
+    async def _remember_title(self, title: str) -> None:
+        """Add an Open Library title to the gazetteer and persist it."""
+        normalized = title.casefold().strip()
+        gazetteer = await self._load_gazetteer()
+        if len(normalized) < MIN_GAZETTEER_TITLE or normalized in gazetteer:
+            return
+        gazetteer[normalized] = None
+        while len(gazetteer) > MAX_GAZETTEER_SIZE:
+            del gazetteer[next(iter(gazetteer))]
+        self._compile_gazetteer()
+        try:
+            await asyncio.to_thread(self.state.set, GAZETTEER_KEY, list(gazetteer))
+        except Exception:
+            log.exception("Failed to persist book gazetteer")
+
+    async def _is_candidate(self, text: str) -> bool:
+        """Cheap local check for whether *text* could mention a book."""
+        if (
+            _CUE_RE.search(text)
+            or _CUE_TITLE_RE.search(text)
+            or _BY_AUTHOR_RE.search(text)
+            or _QUOTED_RE.search(text)
+            or _has_title_span(text)
+        ):
+            return True
+        lowered = text.casefold()
+        await self._load_gazetteer()
+        return self._gazetteer_re is not None and self._gazetteer_re.search(lowered) is not None
 
     async def _detect_book_mention(self, text: str) -> Optional[str]:
-        """Use LLM to detect if a message mentions a book and extract the title.
+        """Detect if a message mentions a book and extract the title.
 
-        Returns the book title if detected, None otherwise.
+        The message joins the current micro-batch; returns the book title if
+        detected, None otherwise.
         """
-        prompt = f"""Analyze this Discord message and determine if it mentions a specific book.
-If it does, extract the book title. If not, respond with "NONE".
+        try:
+            return await self._batcher.submit(text)
+        except (RateLimited, SafetyBlocked):
+            log.info("LLM unavailable for book detection")
+            return None
+        except Exception:
+            log.exception("Failed to detect book mention")
+            return None
 
-Message: "{text}"
+    async def _classify_batch(self, texts: List[str]) -> List[Optional[str]]:
+        """Classify a batch of messages with a single LLM call."""
+        numbered = "\n".join(
+            f"{idx}. {json.dumps(text, ensure_ascii=False)}"
+            for idx, text in enumerate(texts, 1)
+        )
+        prompt = f"""Analyze each numbered Discord message and determine if it mentions a specific book.
+Respond with a JSON object mapping every message number to the book title, or null if the message does not mention a book.
+
+Messages:
+{numbered}
 
 Rules:
 - Only extract actual book titles, not general topics
 - Include author name if mentioned (e.g., "1984 by George Orwell")
 - If multiple books are mentioned, extract only the first one
-- Respond with ONLY the book title or "NONE", nothing else
+- Respond with ONLY the JSON object
 
 Examples:
 - "Just finished reading Hyperion" → "Hyperion"
 - "Has anyone read Project Hail Mary by Andy Weir?" → "Project Hail Mary by Andy Weir"
-- "I love reading sci-fi books" → "NONE"
+- "I love reading sci-fi books" → null
 - "The Midnight Library was amazing" → "The Midnight Library"
 """
-        try:
-            response = await asyncio.to_thread(
-                router.generate,
-                "general",
-                [{"role": "user", "content": prompt}],
-                temperature=0.3,
-            )
-            result = response.strip()
-            if result.upper() == "NONE" or len(result) < 2:
-                return None
-            return result
-        except (RateLimited, SafetyBlocked):
-            log.info("LLM unavailable for book detection")
-            return None
-        except Exception:
-            log.exception("Failed to detect book mention")
-            return None
+        response = await router.generate_async(
+            "general",
+            [{"role": "user", "content": prompt}],
+            temperature=0.3,
+            json_mode=True,
+            cache=True,
+            priority=Priority.SPECULATIVE,
+        )
+        return _parse_batch_response(response, len(texts))
 
-    def _search_open_library(self, query: str) -> Optional[Dict[str, Any]]:
+    async def _search_open_library(self, query: str) -> Optional[Dict[str, Any]]:
         """Search Open Library for book information."""
         try:
             # Clean up the query
             clean_query = re.sub(r'\s+', ' ', query.strip())
 
-            resp = self.session.get(
+            resp = await self.http.get(
                 OPEN_LIBRARY_SEARCH_URL,
                 params={
                     "q": clean_query,
@@ -144,6 +304,7 @@ Examples:
                     "fields": "key,title,author_name,first_publish_year,number_of_pages_median,subject,ratings_average,ratings_count,cover_i",
                 },
                 timeout=10,
+                cache=OPEN_LIBRARY_CACHE,
             )
             resp.raise_for_status()
             data = resp.json()
@@ -159,9 +320,10 @@ Examples:
             description = None
             if work_key:
                 try:
-                    work_resp = self.session.get(
+                    work_resp = await self.http.get(
                         f"https://openlibrary.org{work_key}.json",
                         timeout=10,
+                        cache=OPEN_LIBRARY_CACHE,
                     )
                     if work_resp.ok:
                         work_data = work_resp.json()
@@ -263,6 +425,10 @@ Examples:
         if len(text) < 5:
             return
 
+        # Only escalate plausible mentions to the LLM
+        if not await self._is_candidate(text):
+            return
+
         # Detect book mention
         book_title = await self._detect_book_mention(text)
         if not book_title:
@@ -275,10 +441,14 @@ Examples:
         )
 
         # Pre-fetch book info and cache it
-        book_data = await asyncio.to_thread(self._search_open_library, book_title)
+        book_data = await self._lookups.do(
+            book_title.casefold(),
+            lambda: self._search_open_library(book_title),
+        )
         if not book_data:
             log.info("No Open Library data found for '%s'", book_title)
             return
+        await self._remember_title(book_data.get("title", ""))
 
         # Cache the book data
         global _book_cache
@@ -24,15 +24,13 @@ from typing import Any, Dict, List, Optional
 
 import asyncpg
 import discord
-import requests
 from discord import app_commands
 from discord.ext import commands
-from requests.adapters import HTTPAdapter, Retry
 
 from .. import bot_config as cfg
 from ..db import get_pool
 from ..llm.router import router, SafetyBlocked
-from ..infra import RateLimited
+from ..infra import RateLimited, get_http_client
 from ..util import user_name, chan_name
 from ..capabilities import CogCapabilities, CommandCapability, Category
 
@@ -81,23 +79,9 @@ class CelebrateCog(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
         self.pool: Optional[asyncpg.Pool] = None
-        self.session = self._build_session()
+        self.http = get_http_client()
         self.llm_enabled = getattr(cfg, "CELEBRATE_LLM_ENABLED", True)
 
-    def _build_session(self) -> requests.Session:
-        """Build a requests session with retry logic."""
-        session = requests.Session()
-        retries = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=["GET"],
-        )
-        adapter = HTTPAdapter(max_retries=retries)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
-        return session
-
     async def cog_load(self) -> None:
         """Initialize database connection and create tables."""
         try:
@@ -137,14 +121,14 @@ class CelebrateCog(commands.Cog):
             """
         )
 
-    def _fetch_giphy_gifs(self, search_term: str, limit: int = 5) -> List[str]:
+    async def _fetch_giphy_gifs(self, search_term: str, limit: int = 5) -> List[str]:
         """Fetch GIF URLs from Giphy API."""
         if not GIPHY_API_KEY:
             log.warning("GIPHY_API_KEY not configured, skipping GIF fetch")
             return []
 
         try:
-            resp = self.session.get(
+            resp = await self.http.get(
                 GIPHY_SEARCH_URL,
                 params={
                     "api_key": GIPHY_API_KEY,
@@ -195,8 +179,7 @@ Requirements:
 - Match the energy of the reason if provided"""
 
         try:
-            response = await asyncio.to_thread(
-                router.generate,
+            response = await router.generate_async(
                 "general",
                 [{"role": "user", "content": prompt}],
                 temperature=0.8,
@@ -291,7 +274,7 @@ Requirements:
         search_term = random.choice(CELEBRATION_SEARCH_TERMS)
 
         # Fetch GIFs and generate message concurrently
-        gif_task = asyncio.to_thread(self._fetch_giphy_gifs, search_term, 3)
+        gif_task = self._fetch_giphy_gifs(search_term, 3)
         message_task = self._generate_celebration_message(
             user.display_name,
             reason,
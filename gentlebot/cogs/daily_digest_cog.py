@@ -2,7 +2,6 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timedelta
 import asyncio
-import asyncpg
 import pytz
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -11,30 +10,24 @@ import discord
 from discord.ext import commands
 
 from .. import bot_config as cfg
-from ..util import build_db_url
+from ..infra import PoolAwareCog
 from ..tasks.daily_digest import assign_tiers
 
 log = logging.getLogger(f"gentlebot.{__name__}")
 
 LA = pytz.timezone("America/Los_Angeles")
 
-class DailyDigestCog(commands.Cog):
+class DailyDigestCog(PoolAwareCog):
     """Daily Digest scheduler for engagement badges."""
 
+    pool_lane = "batch"
+
     def __init__(self, bot: commands.Bot) -> None:
-        self.bot = bot
+        super().__init__(bot)
         self.scheduler: AsyncIOScheduler | None = None
-        self.pool: asyncpg.Pool | None = None
 
     async def cog_load(self) -> None:
-        url = build_db_url()
-        if url:
-            url = url.replace("postgresql+asyncpg://", "postgresql://")
-
-            async def _init(conn: asyncpg.Connection) -> None:
-                await conn.execute("SET search_path=discord,public")
-
-            self.pool = await asyncpg.create_pool(url, init=_init)
+        await super().cog_load()
         self.scheduler = AsyncIOScheduler(timezone=LA)
         trigger = CronTrigger(hour=8, minute=30, timezone=LA)
         self.scheduler.add_job(self.run_digest, trigger)
@@ -45,9 +38,7 @@ class DailyDigestCog(commands.Cog):
         if self.scheduler:
             self.scheduler.shutdown(wait=False)
             self.scheduler = None
-        if self.pool:
-            await self.pool.close()
-            self.pool = None
+        await super().cog_unload()
 
     # ── Core Logic ────────────────────────────────────────────────────────
     async def _top_posters(self, days: int = 14) -> list[tuple[int, int, datetime]]:
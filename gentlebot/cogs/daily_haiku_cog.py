@@ -1,12 +1,10 @@
 """Scheduler that posts a daily haiku summarizing server chat."""
 from __future__ import annotations
 import logging
-import asyncio
 from datetime import datetime
 from datetime import timedelta
 
 import pytz
-import asyncpg
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
@@ -14,8 +12,8 @@ import discord
 from discord.ext import commands
 
 from .. import bot_config as cfg
-from ..util import build_db_url
-from ..llm.router import router, SafetyBlocked
+from ..infra import PoolAwareCog
+from ..llm.router import Priority, router, SafetyBlocked
 from ..infra.quotas import RateLimited
 
 log = logging.getLogger(f"gentlebot.{__name__}")
@@ -41,23 +39,17 @@ def build_prompt(day_str: str, corpus: str) -> dict:
     return {"system": system, "user": user}
 
 
-class DailyHaikuCog(commands.Cog):
+class DailyHaikuCog(PoolAwareCog):
     """Scheduler that posts a daily haiku summary in the lobby at 10pm Pacific."""
 
+    pool_lane = "batch"
+
     def __init__(self, bot: commands.Bot) -> None:
-        self.bot = bot
+        super().__init__(bot)
         self.scheduler: AsyncIOScheduler | None = None
-        self.pool: asyncpg.Pool | None = None
 
     async def cog_load(self) -> None:
-        url = build_db_url()
-        if url:
-            url = url.replace("postgresql+asyncpg://", "postgresql://")
-
-            async def _init(conn: asyncpg.Connection) -> None:
-                await conn.execute("SET search_path=discord,public")
-
-            self.pool = await asyncpg.create_pool(url, init=_init)
+        await super().cog_load()
         self.scheduler = AsyncIOScheduler(timezone=LA)
         trigger = CronTrigger(hour=22, minute=0, timezone=LA)
         self.scheduler.add_job(self._post_haiku, trigger)
@@ -68,9 +60,7 @@ class DailyHaikuCog(commands.Cog):
         if self.scheduler:
             self.scheduler.shutdown(wait=False)
             self.scheduler = None
-        if self.pool:
-            await self.pool.close()
-            self.pool = None
+        await super().cog_unload()
 
     async def _fetch_corpus(self, start: datetime, end: datetime) -> tuple[str, int]:
         if not self.pool:
@@ -149,13 +139,13 @@ class DailyHaikuCog(commands.Cog):
             return
         prompt = build_prompt(start.strftime("%Y-%m-%d"), corpus)
         try:
-            text = await asyncio.to_thread(
-                router.generate,
+            text = await router.generate_async(
                 "scheduled",
                 [
                     {"role": "system", "content": prompt["system"]},
                     {"role": "user", "content": prompt["user"]},
                 ],
+                priority=Priority.SCHEDULED,
             )
             text = text.strip()
         except (RateLimited, SafetyBlocked) as e:
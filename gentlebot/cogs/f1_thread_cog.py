@@ -3,17 +3,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from zoneinfo import ZoneInfo
 
-import requests
-from dateutil import parser
-
 import asyncpg
 import discord
 from discord.ext import commands, tasks
 
 from ..db import get_pool
+from ..f1_data import get_f1_data
 from .. import bot_config as cfg
 
 log = logging.getLogger(f"gentlebot.{__name__}")
@@ -35,6 +33,8 @@ class F1ThreadCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.pool: asyncpg.Pool | None = None
+        self.f1 = get_f1_data()
+        self._synced: list[dict] | None = None
         self.session_task.start()
 
     async def cog_load(self) -> None:
@@ -52,11 +52,11 @@ class F1ThreadCog(commands.Cog):
     async def _refresh_schedule(self) -> None:
         """Fetch sessions and insert any new ones."""
         try:
-            sessions = self.fetch_schedule()
+            sessions = await self.fetch_schedule()
         except Exception:  # pragma: no cover - network
             log.exception("Failed to fetch F1 schedule")
             return
-        if not self.pool:
+        if not self.pool or sessions is self._synced:
             return
         for s in sessions:
             await self.pool.execute(
@@ -71,69 +71,17 @@ class F1ThreadCog(commands.Cog):
                 s["session"],
                 s["starts_at"],
             )
+        # The service hands back the same list until the calendar is refreshed
+        self._synced = sessions
 
-    def fetch_schedule(self) -> list[dict]:
+    async def fetch_schedule(self) -> list[dict]:
         """Return list of qualifying and race sessions with metadata."""
-        year = datetime.now(timezone.utc).year
-        url = f"https://f1calendar.com/api/calendar?season={year}"
         try:
-            resp = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
+            return await self.f1.thread_sessions()
         except Exception as exc:  # pragma: no cover - network
             log.exception("Failed to fetch F1 schedule: %s", exc)
             return []
 
-        iso_map = {
-            "Australian": "AU",
-            "Chinese": "CN",
-            "Japanese": "JP",
-            "Bahrain": "BH",
-            "Saudi Arabian": "SA",
-            "Miami": "US",
-            "Emilia Romagna": "IT",
-            "Monaco": "MC",
-            "Spanish": "ES",
-            "Canadian": "CA",
-            "Austrian": "AT",
-            "British": "GB",
-            "Belgian": "BE",
-            "Hungarian": "HU",
-            "Dutch": "NL",
-            "Italian": "IT",
-            "Azerbaijan": "AZ",
-            "Singapore": "SG",
-            "United States": "US",
-            "Mexico City": "MX",
-            "Brazilian": "BR",
-            "Las Vegas": "US",
-            "Qatar": "QA",
-            "Abu Dhabi": "AE",
-        }
-
-        sessions: list[dict] = []
-        for race in data.get("races", []):
-            gp_name_full = race.get("name", "")
-            if not gp_name_full:
-                continue
-            gp_name = gp_name_full.replace(" Grand Prix", "")
-            country_iso = iso_map.get(gp_name, "")
-            for name, iso in race.get("sessions", {}).items():
-                if name not in {"Qualifying", "Grand Prix"}:
-                    continue
-                session_code = "QUALI" if name == "Qualifying" else "RACE"
-                dt = parser.isoparse(iso).astimezone(timezone.utc)
-                sessions.append(
-                    {
-                        "country_iso": country_iso,
-                        "year": dt.year,
-                        "gp_name": gp_name,
-                        "session": session_code,
-                        "starts_at": dt,
-                    }
-                )
-        return sessions
-
     async def _due_sessions(self) -> list[asyncpg.Record]:
         if not self.pool:
             return []
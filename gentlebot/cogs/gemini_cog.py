@@ -2,20 +2,27 @@
 
 import io
 import re
+import hashlib
 import time
 import asyncio
 import inspect
 import logging
 from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
 
 import asyncpg
 import discord
 from discord import app_commands
 from discord.ext import commands
 from ..util import chan_name, user_name
-from ..llm.router import SafetyBlocked, SYSTEM_INSTRUCTION, router, get_router
-from ..llm.tokenizer import estimate_tokens, truncate_to_token_budget
+from ..llm.context import GenerationContext
+from ..llm.context_buffer import BufferedMessage, ChannelContextBuffer
+from ..llm.conversation_memory import ConversationMemory
+from ..llm.router import Priority, SafetyBlocked, SYSTEM_INSTRUCTION, router
+from ..llm.tokenizer import truncate_to_token_budget
+from ..infra.progressive_reply import ProgressiveReply
 from ..infra.quotas import RateLimited
 from ..db import get_pool
 from ..capabilities import get_default_capabilities
@@ -25,6 +32,18 @@ from ..capabilities import get_default_capabilities
 log = logging.getLogger(f"gentlebot.{__name__}")
 
 
+@dataclass
+class PendingReply:
+    """Prompts from one user in one channel waiting on a single reply."""
+
+    # Prompts not yet handed to a committed reply
+    prompts: list[str] = field(default_factory=list)
+    # Newest reply task; it may still be superseded
+    task: asyncio.Task | None = None
+    # Reply that is visible (or final) and left to finish; later tasks wait on it
+    running: asyncio.Task | None = None
+
+
 class GeminiCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -32,6 +51,8 @@ class GeminiCog(commands.Cog):
         # === Env/config ===
         self.max_tokens = 150
         self.temperature = 0.6
+        # Post replies as they stream in instead of after the full generation
+        self.stream_replies = True
 
         # === Mention strings (populated after on_ready) ===
         self.mention_strs: list[str] = []
@@ -39,6 +60,8 @@ class GeminiCog(commands.Cog):
         # === Rate‑limiting: user_id → last_timestamp ===
         self.cooldowns: dict[int, float] = defaultdict(lambda: 0)
         self.cooldown_seconds = 10
+        # Messages within the cooldown are merged into one reply per (user, channel)
+        self._pending: dict[tuple[int, int], PendingReply] = {}
 
         # === Sanitization rules ===
         self.MAX_PROMPT_LEN = 4000  # Increased from 750 to allow complex questions
@@ -48,6 +71,16 @@ class GeminiCog(commands.Cog):
         # === Database pool for archived messages ===
         self.pool: asyncpg.Pool | None = None
 
+        # === Recent messages per channel, fed by gateway events ===
+        self.context = ChannelContextBuffer(maxlen=100)
+        self._seed_locks: dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+        # === Older turns per (channel, user), folded into a running summary ===
+        self.memory = ConversationMemory(self._summarize_turns)
+
+        # === Stable system prompt, keyed by the capabilities text it embeds ===
+        self._stable_prompt: tuple[str, str] | None = None
+
     @commands.Cog.listener()
     async def on_ready(self):
         bot_id = self.bot.user.id
@@ -62,6 +95,13 @@ class GeminiCog(commands.Cog):
             self.pool = None
             log.warning("GeminiCog disabled archive due to missing database URL")
 
+    async def cog_unload(self) -> None:
+        for pending in self._pending.values():
+            if pending.task is not None:
+                pending.task.cancel()
+        self._pending.clear()
+        self.memory.close()
+
     def strip_mentions(self, raw: str) -> str:
         """Replace user mentions with names, drop role mentions, collapse blanks."""
 
@@ -110,50 +150,173 @@ class GeminiCog(commands.Cog):
                 log.debug("Failed to trigger typing indicator", exc_info=True)
 
 
+    def _buffered(self, message: discord.Message) -> BufferedMessage | None:
+        """Convert a Discord message into a context record, if it has text."""
+        content = getattr(message, "clean_content", None)
+        if not isinstance(content, str):
+            content = message.content if isinstance(message.content, str) else ""
+        content = content.strip()
+        attachments = getattr(message, "attachments", None)
+        if not content and isinstance(attachments, list) and attachments:
+            content = ", ".join(att.filename for att in attachments)
+        if not content:
+            return None
+        created_at = getattr(message, "created_at", None)
+        if not isinstance(created_at, datetime):
+            created_at = datetime.now(timezone.utc)
+        return BufferedMessage(
+            message_id=message.id,
+            author_id=message.author.id,
+            author=user_name(message.author),
+            content=content,
+            created_at=created_at.astimezone(timezone.utc),
+        )
+
+    def _remember(self, message: discord.Message) -> None:
+        channel_id = getattr(message.channel, "id", None)
+        if not isinstance(channel_id, int) or not isinstance(message.id, int):
+            return
+        record = self._buffered(message)
+        if record is not None:
+            self.context.append(channel_id, record)
+
+    async def _ensure_context(self, channel: discord.abc.Messageable | int | None) -> int | None:
+        """Return the channel id, seeding its buffer on first use.
+
+        Seeds from the archive when the database is available, otherwise from
+        one Discord history request.  Either way it happens once per channel.
+        A bare id without a database cannot be seeded, so the channel stays
+        unseeded until a caller passes the channel object.
+        """
+        channel_id = channel if isinstance(channel, int) else getattr(channel, "id", None)
+        if not isinstance(channel_id, int):
+            return None
+        if self.context.is_seeded(channel_id):
+            return channel_id
+        async with self._seed_locks[channel_id]:
+            if self.context.is_seeded(channel_id):
+                return channel_id
+            records: list[BufferedMessage] = []
+            if self.pool:
+                records = await self._archive_records(channel_id)
+            elif isinstance(channel, int):
+                return channel_id
+            elif hasattr(channel, "history"):
+                try:
+                    async for msg in channel.history(limit=15):
+                        record = self._buffered(msg)
+                        if record is not None:
+                            records.append(record)
+                except Exception:
+                    log.exception("History fetch failed while seeding context")
+                records.reverse()
+            self.context.seed(channel_id, records)
+        return channel_id
+
+    async def _archive_records(self, channel_id: int) -> list[BufferedMessage]:
+        """Load the last 24h of *channel_id* from the archive, oldest first."""
+        since = discord.utils.utcnow() - timedelta(hours=24)
+        try:
+            rows = await self.pool.fetch(
+                """
+                SELECT * FROM (
+                    SELECT m.message_id, m.author_id, m.content, m.created_at,
+                           u.display_name
+                      FROM discord.message m
+                      JOIN discord."user" u ON m.author_id = u.user_id
+                     WHERE m.channel_id=$1 AND m.created_at >= $2
+                     ORDER BY m.created_at DESC LIMIT $3
+                ) recent ORDER BY created_at ASC
+                """,
+                channel_id,
+                since,
+                self.context.maxlen,
+            )
+        except Exception:
+            log.exception("Archive fetch failed")
+            return []
+        return [
+            BufferedMessage(
+                message_id=r["message_id"],
+                author_id=r["author_id"],
+                author=r["display_name"] or "?",
+                content=self.strip_mentions(r["content"]),
+                created_at=r["created_at"],
+            )
+            for r in rows
+            if r["content"]
+        ]
+
+    @commands.Cog.listener()
+    async def on_message_edit(self, before: discord.Message, after: discord.Message):
+        record = self._buffered(after)
+        if record is not None:
+            self.context.edit(after.channel.id, after.id, record.content)
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        self.context.delete(payload.channel_id, payload.message_id)
+
     async def _build_chat_history_block(
         self, channel: discord.abc.Messageable | None, exclude: discord.Message | None
     ) -> str:
         """Return a formatted sliding window of recent channel messages."""
 
-        if not channel or not hasattr(channel, "history"):
+        channel_id = await self._ensure_context(channel) if channel else None
+        if channel_id is None:
             return "No recent chat history."
 
-        lines: list[str] = []
-
-        async for msg in channel.history(limit=15):
-            if exclude and msg.id == exclude.id:
-                continue
-            if not msg.content and not msg.attachments:
-                continue
-            timestamp = msg.created_at.astimezone(timezone.utc).isoformat()
-            author = user_name(msg.author)
-            content = msg.clean_content.strip()
-            if not content and msg.attachments:
-                content = ", ".join(att.filename for att in msg.attachments)
-            lines.append(f"[{timestamp}] {author}: {content}")
-
-        lines.reverse()
-        # Use character-based token estimation (~4 chars per token)
-        # This is more accurate than word count for mixed content
-        token_lengths = [estimate_tokens(line) for line in lines]
-        total_tokens = sum(token_lengths)
-        max_context_tokens = 1500  # Increased budget with better estimation
-        while lines and total_tokens > max_context_tokens:
-            total_tokens -= token_lengths.pop(0)
-            lines.pop(0)
-
-        if not lines:
+        recent = self.context.recent(
+            channel_id, limit=15, exclude=exclude.id if exclude else None
+        )
+        # Token estimates are precomputed when messages are buffered
+        max_context_tokens = 1500
+        total_tokens = sum(msg.tokens for msg in recent)
+        while recent and total_tokens > max_context_tokens:
+            total_tokens -= recent.pop(0).tokens
+
+        if not recent:
             return "No recent chat history."
 
-        return "\n".join(lines)
+        return "\n".join(
+            f"[{msg.created_at.isoformat()}] {msg.author}: {msg.content}" for msg in recent
+        )
+
+    def _stable_system_prompt(self) -> str:
+        """Return the persona, capabilities and core rules.
+
+        This prefix is identical across requests until the capability
+        registry changes, so providers can cache it; anything that varies
+        per message belongs in :meth:`_build_context_block`.
+        """
+        # Get capabilities prompt from registry or use fallback
+        if hasattr(self.bot, "capability_registry"):
+            capabilities_prompt = self.bot.capability_registry.generate_prompt()
+        else:
+            capabilities_prompt = get_default_capabilities()
+        if self._stable_prompt is not None and self._stable_prompt[0] is capabilities_prompt:
+            return self._stable_prompt[1]
 
-    async def _build_system_prompt(
+        _, _, remainder = SYSTEM_INSTRUCTION.partition("\n")
+        core_instructions = remainder.lstrip("\n") if remainder else SYSTEM_INSTRUCTION
+        prompt = (
+            "You are Gentlebot, a Discord copilot/robot for the Gentlefolk community.\n\n"
+            f"{capabilities_prompt}\n\n"
+            "# CORE INSTRUCTIONS\n"
+            f"{core_instructions}"
+        )
+        version = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+        log.info("System prompt prefix version %s (%d chars)", version, len(prompt))
+        self._stable_prompt = (capabilities_prompt, prompt)
+        return prompt
+
+    async def _build_context_block(
         self,
         channel: discord.abc.Messageable | None,
         user: discord.abc.User | None,
         exclude: discord.Message | None,
     ) -> str:
-        """Assemble the system prompt with context and core rules."""
+        """Assemble the per-request context: time, channel, user and history."""
 
         current_time = datetime.now(timezone.utc).isoformat()
 
@@ -169,26 +332,13 @@ class GeminiCog(commands.Cog):
 
         history_block = await self._build_chat_history_block(channel, exclude)
 
-        _, _, remainder = SYSTEM_INSTRUCTION.partition("\n")
-        core_instructions = remainder.lstrip("\n") if remainder else SYSTEM_INSTRUCTION
-
-        # Get capabilities prompt from registry or use fallback
-        if hasattr(self.bot, "capability_registry"):
-            capabilities_prompt = self.bot.capability_registry.generate_prompt()
-        else:
-            capabilities_prompt = get_default_capabilities()
-
         return (
-            "You are Gentlebot, a Discord copilot/robot for the Gentlefolk community.\n\n"
             "# CONTEXT LAYER\n"
             f"- **Time:** {current_time}\n"
             f"- **Channel:** #{channel_name} (Topic: {topic})\n"
             f"- **User:** {user_display} (Roles: {user_roles})\n"
             "- **Recent Chat History:**\n"
-            f"{history_block}\n\n"
-            f"{capabilities_prompt}\n\n"
-            "# CORE INSTRUCTIONS\n"
-            f"{core_instructions}"
+            f"{history_block}"
         )
 
     async def call_llm(
@@ -197,13 +347,23 @@ class GeminiCog(commands.Cog):
         user_prompt: str,
         user: discord.abc.User | None = None,
         exclude: discord.Message | None = None,
+        on_delta: Callable[[str], Awaitable[None]] | None = None,
+        generation: GenerationContext | None = None,
     ) -> str:
-        """Send context-aware prompts to Gemini and return the reply."""
+        """Send context-aware prompts to Gemini and return the reply.
+
+        When *on_delta* is given the reply is streamed and *on_delta* is
+        awaited with the text received so far after every chunk.  Images
+        produced by tools are collected on *generation*.
+        """
 
+        # The stable prefix goes in system_instruction so it can be cached;
+        # the per-request context rides along as the first message.
+        system_prompt = self._stable_system_prompt()
         if isinstance(channel, discord.abc.Messageable):
-            system_prompt = await self._build_system_prompt(channel, user, exclude)
+            context_block = await self._build_context_block(channel, user, exclude)
         else:
-            system_prompt = (
+            context_block = (
                 "Speak like a helpful and concise robot interacting with a Discord "
                 "server of friends."
             )
@@ -214,26 +374,41 @@ class GeminiCog(commands.Cog):
         bot_id = self.bot.user.id if self.bot.user else 0
 
         history = await self._get_conversation_turns(
-            channel_id, user_id, bot_id, max_messages=10
+            channel_id,
+            user_id,
+            bot_id,
+            max_messages=10,
+            exclude=exclude.id if exclude else None,
         )
 
-        # Build messages: system prompt + conversation history + current message
-        messages = [{"role": "system", "content": system_prompt}]
+        # Build messages: context + conversation history + current message
+        messages = [{"role": "system", "content": context_block}]
         messages.extend(history)  # Previous turns from archive
         messages.append({"role": "user", "content": user_prompt})
 
         try:
-            reply = await asyncio.to_thread(
-                router.generate,
-                "general",
-                messages,
-                self.temperature,
-                system_instruction=system_prompt,
-            )
+            if on_delta is not None:
+                reply = ""
+                async for delta in router.generate_stream(
+                    "general",
+                    messages,
+                    self.temperature,
+                    system_instruction=system_prompt,
+                    context=generation,
+                ):
+                    reply += delta
+                    await on_delta(reply)
+            else:
+                reply = await router.generate_async(
+                    "general",
+                    messages,
+                    self.temperature,
+                    system_instruction=system_prompt,
+                    context=generation,
+                )
         except TypeError as exc:
             if "system_instruction" in str(exc):
-                reply = await asyncio.to_thread(
-                    router.generate,
+                reply = await router.generate_async(
                     "general",
                     messages,
                     self.temperature,
@@ -262,6 +437,8 @@ class GeminiCog(commands.Cog):
         user_prompt: str,
         user: discord.abc.User | None = None,
         exclude: discord.Message | None = None,
+        on_delta: Callable[[str], Awaitable[None]] | None = None,
+        generation: GenerationContext | None = None,
     ) -> str:
         """Call the LLM helper while tolerating simplified test doubles."""
 
@@ -273,47 +450,48 @@ class GeminiCog(commands.Cog):
             p.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
             for p in params
         )
+        names = {p.name for p in params}
+        accepts_any = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params)
+        extra = {
+            name: value
+            for name, value in (("on_delta", on_delta), ("generation", generation))
+            if value is not None and (accepts_any or name in names)
+        }
 
         if accepts_context:
-            return await func(channel, user_prompt, user, exclude)
+            return await func(channel, user_prompt, user, exclude, **extra)
 
         return await func(channel, user_prompt)
 
-    async def _get_context_from_archive(self, channel_id: int) -> str:
-        """Return messages from the last 24h in the given channel with participant summary."""
-        if not self.pool:
+    @staticmethod
+    def _image_files(generation: GenerationContext) -> list[discord.File]:
+        """Wrap images generated during *generation* as Discord attachments."""
+        return [
+            discord.File(io.BytesIO(img_data), filename=f"generated_{idx + 1}.png")
+            for idx, (_, img_data) in enumerate(generation.images)
+        ]
+
+    async def _get_context_from_archive(self, channel: discord.abc.Messageable | int) -> str:
+        """Return messages from the last 24h in the given channel with participant summary.
+
+        Served from the channel's context buffer, which is seeded from the
+        archive (or the channel history without a database) the first time
+        the channel is used.
+        """
+        channel_id = await self._ensure_context(channel)
+        if channel_id is None:
             return ""
-        since = discord.utils.utcnow() - timedelta(hours=24)
-        try:
-            rows = await self.pool.fetch(
-                """
-                SELECT m.content, u.display_name
-                  FROM discord.message m
-                  JOIN discord."user" u ON m.author_id = u.user_id
-                 WHERE m.channel_id=$1 AND m.created_at >= $2
-                 ORDER BY m.created_at ASC LIMIT 50
-                """,
-                channel_id,
-                since,
-            )
-        except Exception:
-            log.exception("Archive fetch failed")
+        recent = self.context.recent(channel_id, limit=50, since=timedelta(hours=24))
+        if not recent:
             return ""
-        lines = []
         participants: dict[str, int] = {}
-        for r in rows:
-            content = r["content"]
-            author = r["display_name"] or "?"
-            participants[author] = participants.get(author, 0) + 1
-            if content:
-                lines.append(f"{author}: {content}")
-        if not lines:
-            return ""
+        for msg in recent:
+            participants[msg.author] = participants.get(msg.author, 0) + 1
         # Build a participant summary header
         active = sorted(participants.items(), key=lambda x: x[1], reverse=True)
         names = [name for name, _ in active[:6]]
         header = f"Active participants: {', '.join(names)}\n"
-        return header + "\n".join(lines)
+        return header + "\n".join(f"{msg.author}: {msg.content}" for msg in recent)
 
     async def _get_conversation_turns(
         self,
@@ -321,49 +499,54 @@ class GeminiCog(commands.Cog):
         user_id: int,
         bot_id: int,
         max_messages: int = 20,
+        exclude: int | None = None,
     ) -> list[dict[str, str]]:
-        """Get recent conversation turns between user and bot from archive.
+        """Get recent conversation turns between user and bot.
 
-        Returns alternating user/assistant messages for LLM context.
-        Uses message count (not time) to determine window.
+        Returns alternating user/assistant messages for LLM context, taken
+        from the channel's context buffer.  Uses message count (not time) to
+        determine window.  Turns already folded into the conversation's
+        running summary are replaced by that summary, and long runs of
+        pending turns are compacted in the background.
         """
-        if not self.pool:
-            return []
-
-        try:
-            rows = await self.pool.fetch(
-                """
-                SELECT m.content, m.author_id, m.created_at
-                FROM discord.message m
-                WHERE m.channel_id = $1
-                  AND (
-                      m.author_id = $2  -- User's messages
-                      OR m.author_id = $3  -- Bot's messages
-                  )
-                ORDER BY m.created_at DESC
-                LIMIT $4
-                """,
-                channel_id,
-                user_id,
-                bot_id,
-                max_messages,
+        await self._ensure_context(channel_id)
+        recent = self.context.recent(
+            channel_id, limit=self.context.maxlen, authors={user_id, bot_id}, exclude=exclude
+        )
+        summary, pending = await self.memory.prepare(channel_id, user_id, recent)
+        turns = [
+            {"role": "assistant" if msg.author_id == bot_id else "user", "content": msg.content}
+            for msg in pending[-max_messages:]
+        ]
+        if summary:
+            turns.insert(
+                0, {"role": "system", "content": f"Summary of your earlier conversation: {summary}"}
             )
-        except Exception:
-            log.exception("Conversation turns fetch failed")
-            return []
-
-        # Build messages (reverse to chronological order)
-        messages: list[dict[str, str]] = []
-        for row in reversed(rows):
-            role = "assistant" if row["author_id"] == bot_id else "user"
-            content = row["content"]
-            if content:
-                messages.append({"role": role, "content": content})
-
-        return messages
+        return turns
+
+    async def _summarize_turns(self, previous: str, turns: list[BufferedMessage]) -> str:
+        """Fold *turns* into the *previous* running summary (background, scheduled route)."""
+        transcript = "\n".join(f"{msg.author}: {msg.content}" for msg in turns)
+        prompt = (
+            "Update the running summary of a Discord conversation between a user "
+            "and you (Gentlebot). Keep facts the user shared, what they asked, what "
+            "you answered or promised, and anything still open. At most 120 words, "
+            "third person, no preamble.\n\n"
+            f"Current summary:\n{previous or '(none)'}\n\n"
+            f"New messages:\n{transcript}"
+        )
+        return await router.generate_async(
+            "scheduled",
+            [{"role": "user", "content": prompt}],
+            temperature=0.2,
+            priority=Priority.SCHEDULED,
+        )
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
+        # 0) Keep the channel's context buffer current, including bot replies
+        self._remember(message)
+
         # 1) Ignore bots
         if message.author.bot:
             return
@@ -402,16 +585,7 @@ class GeminiCog(commands.Cog):
         if not prompt and not mention_starts_message:
             return
 
-        # 8) Rate‑limit per user: wait instead of immediate reply
-        now = time.time()
-        last = self.cooldowns[message.author.id]
-        elapsed = now - last
-        if elapsed < self.cooldown_seconds:
-            wait_time = self.cooldown_seconds - elapsed
-            await asyncio.sleep(wait_time)
-        self.cooldowns[message.author.id] = time.time()
-
-        # 9) Sanitize user prompt
+        # 8) Sanitize user prompt
         sanitized_prompt = self.sanitize_prompt(prompt)
         if sanitized_prompt is None:
             if mention_starts_message:
@@ -424,10 +598,61 @@ class GeminiCog(commands.Cog):
                 log.info("Rejected prompt: too long, empty, or disallowed mentions.")
                 return
 
+        # 9) Coalesce with this user's pending reply in the channel
+        await self._coalesce(message, sanitized_prompt)
+
+    async def _coalesce(self, message: discord.Message, prompt: str) -> None:
+        """Answer *prompt* together with the user's other unanswered prompts.
+
+        Each (user, channel) has at most one reply task.  A message arriving
+        while that reply is still waiting out the cooldown or generating
+        unseen supersedes it: the task is cancelled and a new one answers
+        every pending prompt at once.  A reply that is already visible is
+        left to finish and the new one starts after it.
+        """
+        key = (message.author.id, message.channel.id)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = PendingReply()
+        pending.prompts.append(prompt)
+        previous = pending.task
+        if previous is not None and previous is not pending.running:
+            previous.cancel()
+        # Wait for the superseded task to unwind and for the visible reply
+        waits = {t for t in (previous, pending.running) if t is not None}
+        task = asyncio.create_task(self._answer(message, pending, waits))
+        pending.task = task
+        await asyncio.wait({task})
+        if self._pending.get(key) is pending and pending.task is task:
+            del self._pending[key]
+        if not task.cancelled() and task.exception() is not None:
+            log.error("Reply failed", exc_info=task.exception())
+
+    async def _answer(
+        self,
+        message: discord.Message,
+        pending: PendingReply,
+        waits: set[asyncio.Task],
+    ) -> None:
+        """Reply to *message* with every prompt collected on *pending*."""
+        # Only one generation per user and channel at a time
+        if waits:
+            await asyncio.wait(waits)
+
+        # Wait out the rest of the cooldown; newer messages supersede this task
+        elapsed = time.time() - self.cooldowns[message.author.id]
+        if elapsed < self.cooldown_seconds:
+            await asyncio.sleep(self.cooldown_seconds - elapsed)
+        self.cooldowns[message.author.id] = time.time()
+        prompts = list(pending.prompts)
+        sanitized_prompt = "\n".join(prompts)
+        if len(prompts) > 1:
+            log.info("Merged %d messages into one prompt", len(prompts))
+
         await self._maybe_trigger_typing(message.channel)
 
-        # 9) Build user_prompt with conversation context
-        context_str = self.strip_mentions(await self._get_context_from_archive(message.channel.id))
+        # 10) Build user_prompt with conversation context
+        context_str = self.strip_mentions(await self._get_context_from_archive(message.channel))
         prefix = "Recent conversation within the last 24 hours:\n"
         suffix = f"\n\nUser message: {sanitized_prompt}"
         max_context = self.MAX_PROMPT_LEN - len(prefix) - len(suffix)
@@ -437,38 +662,54 @@ class GeminiCog(commands.Cog):
         else:
             user_prompt = sanitized_prompt
 
-        # 10) Typing indicator while fetching
+        # 11) Typing indicator while fetching; streamed text is posted early
+        generation = GenerationContext()
+        reply = ProgressiveReply(
+            lambda content, files=None: message.reply(
+                content, files=files, mention_author=True
+            )
+        )
+
+        this = asyncio.current_task()
+
+        def commit() -> None:
+            # A newer task may already own *pending*; don't pin that one.
+            if pending.task is this and pending.running is not this:
+                pending.running = this
+                # These prompts are answered here; later replies skip them.
+                del pending.prompts[: len(prompts)]
+
+        async def show_partial(text: str) -> None:
+            await reply.update(re.sub(r"@User\b", message.author.mention, text))
+            if reply.started:
+                commit()
+
         async with message.channel.typing():
             try:
                 response = await self._invoke_llm(
-                    message.channel, user_prompt, message.author, message
+                    message.channel,
+                    user_prompt,
+                    message.author,
+                    message,
+                    on_delta=show_partial if self.stream_replies else None,
+                    generation=generation,
                 )
             except Exception as e:
                 log.exception("Model call failed: %s", e)
                 return
+        commit()
 
-        # 11) Skip empty responses to avoid posting blank messages
+        # 12) Skip empty responses to avoid posting blank messages
         if not response or not response.strip():
             log.info("Suppressed empty response in channel %s", chan_name(message.channel))
             return
 
-        # 12) Check for pending images from tool calls
-        pending_images = get_router().get_pending_images()
-        files: list[discord.File] = []
-        for idx, (img_prompt, img_data) in enumerate(pending_images):
-            filename = f"generated_{idx + 1}.png"
-            files.append(discord.File(io.BytesIO(img_data), filename=filename))
+        # 13) Attach images generated by tool calls for this request
+        files = self._image_files(generation)
 
-        # 12) Replace placeholder mentions and send, paginating if needed
+        # 14) Replace placeholder mentions and send, paginating if needed
         response = re.sub(r"@User\b", message.author.mention, response)
-        if len(response) <= 2000:
-            await message.reply(response, files=files if files else None, mention_author=True)
-        else:
-            chunks = [response[i : i + 1900] for i in range(0, len(response), 1900)]
-            for i, chunk in enumerate(chunks):
-                # Attach images only to the first chunk
-                chunk_files = files if i == 0 and files else None
-                await message.reply(chunk, files=chunk_files, mention_author=True)
+        await reply.finish(response, files or None)
 
     # === Slash command /ask ===
     @app_commands.command(name="ask", description="Ask Gentlebot a question.")
@@ -480,9 +721,19 @@ class GeminiCog(commands.Cog):
         if not sanitized:
             log.info("Rejected prompt for /ask: too long, empty, or disallowed mentions.")
             return
+        generation = GenerationContext()
+        reply = ProgressiveReply(
+            lambda content, files=None: interaction.followup.send(
+                content, files=files or discord.utils.MISSING, wait=True
+            )
+        )
         try:
             response = await self._invoke_llm(
-                interaction.channel, sanitized, interaction.user
+                interaction.channel,
+                sanitized,
+                interaction.user,
+                on_delta=reply.update if self.stream_replies else None,
+                generation=generation,
             )
         except Exception as e:
             log.exception("Model call failed in /ask: %s", e)
@@ -492,20 +743,8 @@ class GeminiCog(commands.Cog):
             log.info("Suppressed empty /ask response from %s", user_name(interaction.user))
             return
 
-        # Check for pending images from tool calls
-        pending_images = get_router().get_pending_images()
-        files: list[discord.File] = []
-        for idx, (img_prompt, img_data) in enumerate(pending_images):
-            filename = f"generated_{idx + 1}.png"
-            files.append(discord.File(io.BytesIO(img_data), filename=filename))
-
-        if len(response) <= 2000:
-            await interaction.followup.send(response, files=files if files else None)
-        else:
-            chunks = [response[i : i + 1900] for i in range(0, len(response), 1900)]
-            for i, chunk in enumerate(chunks):
-                chunk_files = files if i == 0 and files else None
-                await interaction.followup.send(chunk, files=chunk_files)
+        files = self._image_files(generation)
+        await reply.finish(response, files or None)
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(GeminiCog(bot))
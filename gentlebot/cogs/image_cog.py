@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import io
-import asyncio
 import logging
 
 import discord
@@ -31,8 +30,7 @@ class ImageCog(commands.Cog):
         to quota limits) a generic fallback message is sent instead.
         """
         try:
-            message = await asyncio.to_thread(
-                router.generate,
+            message = await router.generate_async(
                 "general",
                 [
                     {
@@ -55,7 +53,7 @@ class ImageCog(commands.Cog):
     async def imagine(self, interaction: discord.Interaction, prompt: str) -> None:
         await interaction.response.defer(thinking=True)
         try:
-            data = await asyncio.to_thread(router.generate_image, prompt)
+            data = await router.generate_image_async(prompt)
         except RateLimited as exc:
             await self._send_friendly_error(interaction, exc)
             return
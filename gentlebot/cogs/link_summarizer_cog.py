@@ -23,14 +23,12 @@ from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import discord
-import requests
 from bs4 import BeautifulSoup
 from discord.ext import commands
-from requests.adapters import HTTPAdapter, Retry
 
 from .. import bot_config as cfg
-from ..llm.router import router, SafetyBlocked
-from ..infra import RateLimited
+from ..llm.router import Priority, router, SafetyBlocked
+from ..infra import RateLimited, SingleFlight, get_http_client
 from ..util import user_name, chan_name
 from ..capabilities import CogCapabilities, ReactionCapability
 
@@ -86,6 +84,39 @@ _recent_urls: Dict[Tuple[int, str], datetime] = {}
 _URL_DEDUP_TTL = 3600  # seconds
 
 
+def _extract_page_text(html: str, max_chars: int) -> Optional[str]:
+    """Extract the title and main text of an HTML page."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Remove script, style, nav, footer elements
+    for tag in soup(["script", "style", "noscript", "nav", "footer", "header", "aside"]):
+        tag.decompose()
+
+    # Try to get main content
+    main_content = None
+    for selector in ["article", "main", '[role="main"]', ".post-content", ".article-content"]:
+        main_content = soup.select_one(selector)
+        if main_content:
+            break
+
+    if main_content:
+        text = " ".join(main_content.stripped_strings)
+    else:
+        text = " ".join(soup.stripped_strings)
+
+    # Get title
+    title = ""
+    title_tag = soup.find("title")
+    if title_tag:
+        title = title_tag.get_text(strip=True)
+
+    # Combine title and content
+    if title:
+        text = f"Title: {title}\n\n{text}"
+
+    return text[:max_chars] if text else None
+
+
 def _extract_domain(url: str) -> str:
     """Extract the domain from a URL."""
     try:
@@ -128,26 +159,18 @@ class LinkSummarizerCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
-        self.session = self._build_session()
+        self.http = get_http_client()
         self.enabled = getattr(cfg, "LINK_SUMMARIZER_ENABLED", True)
         self._responded_messages: collections.deque[int] = collections.deque(maxlen=500)
+        # Concurrent reactions on the same link share one page fetch
+        self._fetches = SingleFlight("link_fetch")
 
-    def _build_session(self) -> requests.Session:
-        """Build a requests session with retry logic."""
-        session = requests.Session()
-        retries = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=["GET"],
-        )
-        adapter = HTTPAdapter(max_retries=retries)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
-        return session
+    async def _fetch_page_content(self, url: str, max_chars: int = 8000) -> Optional[str]:
+        """Fetch and extract text content from a URL.
 
-    def _fetch_page_content(self, url: str, max_chars: int = 8000) -> Optional[str]:
-        """Fetch and extract text content from a URL."""
+        The download runs on the shared HTTP client; HTML parsing is
+        CPU-bound and runs in a worker thread.
+        """
         try:
             headers = {
                 "User-Agent": (
@@ -156,43 +179,14 @@ class LinkSummarizerCog(commands.Cog):
                     "Chrome/120.0.0.0 Safari/537.36"
                 ),
             }
-            resp = self.session.get(url, headers=headers, timeout=15)
+            resp = await self.http.get(url, headers=headers, timeout=15)
             resp.raise_for_status()
 
             content_type = resp.headers.get("Content-Type", "")
             if "text" not in content_type and "html" not in content_type:
                 return None
 
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            # Remove script, style, nav, footer elements
-            for tag in soup(["script", "style", "noscript", "nav", "footer", "header", "aside"]):
-                tag.decompose()
-
-            # Try to get main content
-            main_content = None
-            for selector in ["article", "main", '[role="main"]', ".post-content", ".article-content"]:
-                main_content = soup.select_one(selector)
-                if main_content:
-                    break
-
-            if main_content:
-                text = " ".join(main_content.stripped_strings)
-            else:
-                text = " ".join(soup.stripped_strings)
-
-            # Get title
-            title = ""
-            title_tag = soup.find("title")
-            if title_tag:
-                title = title_tag.get_text(strip=True)
-
-            # Combine title and content
-            if title:
-                text = f"Title: {title}\n\n{text}"
-
-            return text[:max_chars] if text else None
-
+            return await asyncio.to_thread(_extract_page_text, resp.text, max_chars)
         except Exception as exc:
             log.warning("Failed to fetch page content from '%s': %s", url, exc)
             return None
@@ -219,11 +213,12 @@ Requirements:
 - Do NOT write paragraphs - bullets only"""
 
         try:
-            response = await asyncio.to_thread(
-                router.generate,
+            response = await router.generate_async(
                 "general",
                 [{"role": "user", "content": prompt}],
                 temperature=0.4,
+                cache=True,
+                priority=Priority.REACTION,
             )
             return response.strip()
         except (RateLimited, SafetyBlocked):
@@ -349,7 +344,9 @@ Requirements:
             summary = existing_summary
         else:
             # Fetch content and generate summary
-            content = await asyncio.to_thread(self._fetch_page_content, url)
+            content = await self._fetches.do(
+                url, lambda: self._fetch_page_content(url)
+            )
             if not content:
                 log.warning("Could not fetch content from %s for message %s", _extract_domain(url), payload.message_id)
                 try:
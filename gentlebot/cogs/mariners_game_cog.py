@@ -11,24 +11,28 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, time, timedelta, timezone
-from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
 import asyncio
 import asyncpg
 import pytz
-import requests
 from dateutil import parser
-from requests.adapters import HTTPAdapter, Retry
 
 import discord
 from discord.ext import commands, tasks
 
-from .sports_cog import PST_TZ, STATS_TIMEOUT, TEAM_ID
+from .sports_cog import STATS_TIMEOUT, TEAM_ID
 from .. import bot_config as cfg
 from ..db import get_pool
+from ..infra.http import get_http_client
+from ..infra.http_cache import CachePolicy, cache_key
+from ..infra.singleflight import SingleFlight
 
 log = logging.getLogger(f"gentlebot.{__name__}")
 
+# Pacific time for game start times
+PST_TZ = pytz.timezone("America/Los_Angeles")
+
 ESPN_SCHEDULE_URL = (
     "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/teams/sea/schedule"
 )
@@ -44,18 +48,50 @@ STATS_STANDINGS_URL = (
     "https://statsapi.mlb.com/api/v1/standings?leagueId=103&season={season}&standingsType=byDivision"
 )
 
+# The schedule decides when threads open and summaries post, so it is never
+# served stale; an expired copy is revalidated before use (usually a 304).
+SCHEDULE_CACHE = CachePolicy(ttl=4 * 60)
+# Standings only move once a game ends; a stale table is fine while it refreshes.
+STANDINGS_CACHE = CachePolicy(ttl=15 * 60, stale=6 * 3600)
+# ESPN core-API documents that only point at others (team, group, standings
+# index) and team profiles barely change within a season.
+REF_CACHE = CachePolicy(ttl=86400, stale=7 * 86400)
+# Loop ticks within this many seconds of each other share one schedule fetch
+SNAPSHOT_SECONDS = 60
+ESPN_TEAM_URL = (
+    "https://sports.core.api.espn.com/v2/sports/baseball/leagues/mlb/seasons/{season}/teams/sea"
+)
+ESPN_GROUP_URL = (
+    "http://sports.core.api.espn.com/v2/sports/baseball/leagues/mlb/seasons/{season}/types/2/groups/{group}"
+)
+
+
+class RefResolver:
+    """Resolve ESPN core-API ``$ref`` links concurrently, once per URL.
 
-class _ImmediateResult:
-    """Awaitable wrapper returning a precomputed summary result."""
+    One resolver serves one summary build.  Each document is requested at
+    most once however many branches point at it, and callers await
+    independent branches together instead of one after another.
+    """
 
-    def __init__(self, result: Optional[Dict[str, Any]]):
-        self._result = result
+    def __init__(self, get_json: Callable[..., Awaitable[Any]]) -> None:
+        self._get_json = get_json
+        self._memo: dict[str, asyncio.Future] = {}
 
-    def __await__(self):
-        async def _runner() -> Optional[Dict[str, Any]]:
-            return self._result
+    def get(
+        self, url: str, *, cache: CachePolicy | None = None, **params: Any
+    ) -> Awaitable[Any]:
+        """Return an awaitable for the JSON at *url*, starting the fetch now."""
+        key = cache_key(url, params)
+        future = self._memo.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._get_json(url, cache=cache, **params))
+            self._memo[key] = future
+        return future
 
-        return _runner().__await__()
+    @property
+    def fetched(self) -> int:
+        return len(self._memo)
 
 
 class MarinersGameCog(commands.Cog):
@@ -70,6 +106,10 @@ class MarinersGameCog(commands.Cog):
         self.threads: Dict[str, discord.Thread] = {}
         self.threads_opened: set[str] = set()
         self.innings_posted: Dict[str, int] = {}  # game_id -> last inning posted
+        self.http = get_http_client()
+        # Schedule JSON shared by the thread, live-score and summary loops
+        self._schedule: tuple[float, Dict[str, Any]] | None = None
+        self._schedule_flight = SingleFlight("mariners_schedule")
 
     async def cog_load(self) -> None:  # pragma: no cover - startup
         try:
@@ -181,23 +221,43 @@ class MarinersGameCog(commands.Cog):
         )
         self.posted.update(str(r[0]) for r in rows)
 
-    def _build_session(self) -> requests.Session:
-        session = requests.Session()
-        retries = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=["GET"],
+    async def _get_json(
+        self, url: str, *, cache: CachePolicy | None = None, **params: Any
+    ) -> Any:
+        """GET *url* with the stats timeout and return the decoded JSON body."""
+        resp = await self.http.get(
+            url, params=params or None, timeout=STATS_TIMEOUT, cache=cache
         )
-        adapter = HTTPAdapter(max_retries=retries)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
-        return session
+        resp.raise_for_status()
+        return resp.json()
+
+    async def _schedule_snapshot(self) -> Dict[str, Any]:
+        """Return the ESPN schedule, fetched at most once per tick across loops."""
+        now = asyncio.get_running_loop().time()
+        if self._schedule is not None and now - self._schedule[0] < SNAPSHOT_SECONDS:
+            return self._schedule[1]
+        data = await self._schedule_flight.do(
+            ESPN_SCHEDULE_URL,
+            lambda: self._get_json(ESPN_SCHEDULE_URL, cache=SCHEDULE_CACHE),
+        )
+        self._schedule = (asyncio.get_running_loop().time(), data)
+        return data
+
+    async def _schedule_states(self) -> Dict[str, str]:
+        """Return ``event_id -> state`` (pre/in/post) from the schedule snapshot."""
+        data = await self._schedule_snapshot()
+        states: Dict[str, str] = {}
+        for event in data.get("events", []):
+            comp = (event.get("competitions") or [{}])[0]
+            states[str(event.get("id"))] = (
+                comp.get("status", {}).get("type", {}).get("state", "pre")
+            )
+        return states
 
     async def _sync_schedule(self) -> None:
         if not self.pool:
             return
-        schedule = await asyncio.to_thread(self._fetch_schedule)
+        schedule = await self._fetch_schedule()
         if not schedule:
             return
         for row in schedule:
@@ -256,13 +316,10 @@ class MarinersGameCog(commands.Cog):
             except Exception as exc:  # pragma: no cover - database
                 log.warning("Failed to upsert Mariners schedule %s: %s", row["event_id"], exc)
 
-    def _fetch_schedule(self) -> list[dict[str, Any]]:
+    async def _fetch_schedule(self) -> list[dict[str, Any]]:
         rows: list[dict[str, Any]] = []
         try:
-            with self._build_session() as session:
-                resp = session.get(ESPN_SCHEDULE_URL, timeout=STATS_TIMEOUT)
-                resp.raise_for_status()
-                data = resp.json()
+            data = await self._schedule_snapshot()
         except Exception as exc:  # pragma: no cover - network
             log.warning("Failed to fetch Mariners schedule: %s", exc)
             return rows
@@ -378,7 +435,7 @@ class MarinersGameCog(commands.Cog):
             data = self._deserialize_summary(summary)
             data.setdefault("event_id", event_id)
             return data
-        data = await asyncio.to_thread(self._build_summary_from_event, event_id, dict(row))
+        data = await self._build_summary_from_event(event_id, dict(row))
         if not data:
             return None
         try:
@@ -555,85 +612,97 @@ class MarinersGameCog(commands.Cog):
             "top_performers": performers,
         }
 
-    def _fetch_summary_without_db(self) -> Optional[Dict[str, Any]]:
+    async def _fetch_summary_without_db(self) -> Optional[Dict[str, Any]]:
         try:
-            with self._build_session() as session:
-                schedule_data = session.get(STATS_SCHEDULE_URL, timeout=STATS_TIMEOUT).json()
-                latest = self._latest_stats_game(schedule_data)
-                if not latest:
-                    return None
-                game_pk = latest["game_pk"]
-                mariners_home = latest["mariners_home"]
-                season_year = latest.get("season")
-                feed_data = session.get(
-                    STATS_FEED_URL.format(game_pk=game_pk), timeout=STATS_TIMEOUT
-                ).json()
-                if not season_year:
-                    dt_iso = feed_data.get("gameData", {}).get("datetime", {}).get("dateTime")
-                    if dt_iso:
-                        try:
-                            season_year = parser.isoparse(dt_iso).year
-                        except Exception:
-                            season_year = datetime.now(tz=pytz.utc).year
-                    else:
+            schedule_data = await self._get_json(STATS_SCHEDULE_URL, cache=SCHEDULE_CACHE)
+            latest = self._latest_stats_game(schedule_data)
+            if not latest:
+                return None
+            game_pk = latest["game_pk"]
+            mariners_home = latest["mariners_home"]
+            season_year = latest.get("season")
+            feed_url = STATS_FEED_URL.format(game_pk=game_pk)
+            if season_year:
+                # The standings do not depend on the feed; fetch both at once.
+                feed_data, standings_data = await asyncio.gather(
+                    self._get_json(feed_url),
+                    self._get_json(
+                        STATS_STANDINGS_URL.format(season=season_year), cache=STANDINGS_CACHE
+                    ),
+                )
+            else:
+                feed_data = await self._get_json(feed_url)
+                dt_iso = feed_data.get("gameData", {}).get("datetime", {}).get("dateTime")
+                if dt_iso:
+                    try:
+                        season_year = parser.isoparse(dt_iso).year
+                    except Exception:
                         season_year = datetime.now(tz=pytz.utc).year
-                standings_data = session.get(
-                    STATS_STANDINGS_URL.format(season=season_year), timeout=STATS_TIMEOUT
-                ).json()
+                else:
+                    season_year = datetime.now(tz=pytz.utc).year
+                standings_data = await self._get_json(
+                    STATS_STANDINGS_URL.format(season=season_year), cache=STANDINGS_CACHE
+                )
         except Exception as exc:
             log.warning("Failed to build Mariners summary without database: %s", exc)
             return None
         return self._build_stats_summary(feed_data, standings_data, mariners_home, game_pk)
 
-    def fetch_game_summary(self) -> Awaitable[Optional[Dict[str, Any]]]:
+    async def fetch_game_summary(self) -> Optional[Dict[str, Any]]:
         if not self.pool:
-            try:
-                asyncio.get_running_loop()
-            except RuntimeError:
-                return _ImmediateResult(self._fetch_summary_without_db())
-            return asyncio.to_thread(self._fetch_summary_without_db)
-        return self._fetch_game_summary_db()
+            return await self._fetch_summary_without_db()
+        return await self._fetch_game_summary_db()
 
-    def _build_summary_from_event(
+    async def _build_summary_from_event(
         self, event_id: str, row: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
+        refs = RefResolver(self._get_json)
+        season_year = row.get("season_year")
+        record_info: dict[str, str] | None = None
+        standings: list[dict[str, str]] = []
         try:
-            with self._build_session() as session:
-                summary_resp = session.get(
-                    ESPN_SUMMARY_URL,
-                    params={"event": event_id, "region": "us", "lang": "en"},
-                    timeout=STATS_TIMEOUT,
+            summary_doc = refs.get(ESPN_SUMMARY_URL, event=event_id, region="us", lang="en")
+            if season_year:
+                # Record and standings do not depend on the box score, so all
+                # three $ref graphs resolve side by side.
+                summary, record_info, standings = await asyncio.gather(
+                    summary_doc,
+                    self._fetch_record_info(season_year, refs),
+                    self._fetch_division_standings(season_year, refs),
                 )
-                summary_resp.raise_for_status()
-                summary = summary_resp.json()
-                comp = summary.get("header", {}).get("competitions", [{}])[0]
-                competitors = comp.get("competitors", [])
-                sea_comp = next(
-                    c for c in competitors if c.get("team", {}).get("abbreviation") == TEAM_ABBR
-                )
-                opp_comp = next(c for c in competitors if c is not sea_comp)
-                away_comp = next(
-                    c for c in competitors if c.get("homeAway") == "away"
-                )
-                home_comp = next(
-                    c for c in competitors if c.get("homeAway") == "home"
+            else:
+                summary = await summary_doc
+            comp = summary.get("header", {}).get("competitions", [{}])[0]
+            competitors = comp.get("competitors", [])
+            sea_comp = next(
+                c for c in competitors if c.get("team", {}).get("abbreviation") == TEAM_ABBR
+            )
+            opp_comp = next(c for c in competitors if c is not sea_comp)
+            away_comp = next(
+                c for c in competitors if c.get("homeAway") == "away"
+            )
+            home_comp = next(
+                c for c in competitors if c.get("homeAway") == "home"
+            )
+            start = parser.isoparse(comp.get("date"))
+            start_pst = start.astimezone(PST_TZ)
+            mariners_home = sea_comp is home_comp
+            mariners_score = int(float(sea_comp.get("score", "0")))
+            opp_score = int(float(opp_comp.get("score", "0")))
+            away_abbr = away_comp.get("team", {}).get("abbreviation", "")
+            home_abbr = home_comp.get("team", {}).get("abbreviation", "")
+            highlights = self._collect_highlights(summary.get("plays", []))
+            if record_info is None:
+                record_info, standings = await asyncio.gather(
+                    self._fetch_record_info(start.year, refs),
+                    self._fetch_division_standings(start.year, refs),
                 )
-                start = parser.isoparse(comp.get("date"))
-                start_pst = start.astimezone(PST_TZ)
-                mariners_home = sea_comp is home_comp
-                mariners_score = int(float(sea_comp.get("score", "0")))
-                opp_score = int(float(opp_comp.get("score", "0")))
-                away_abbr = away_comp.get("team", {}).get("abbreviation", "")
-                home_abbr = home_comp.get("team", {}).get("abbreviation", "")
-                highlights = self._collect_highlights(summary.get("plays", []))
-                season_year = row.get("season_year", start.year)
-                record_info = self._fetch_record_info(session, season_year)
-                standings = self._fetch_division_standings(session, season_year)
-                record_line = record_info["summary"]
-                if record_info["streak"]:
-                    record_line = f"{record_line} ({record_info['streak']})" if record_line else record_info["streak"]
-                al_west_line = self._format_division_line(standings, record_info["last_ten"])
-                performers = self._top_performers(summary.get("boxscore", {}), opp_comp)
+            log.debug("Built Mariners summary %s from %d ESPN documents", event_id, refs.fetched)
+            record_line = record_info["summary"]
+            if record_info["streak"]:
+                record_line = f"{record_line} ({record_info['streak']})" if record_line else record_info["streak"]
+            al_west_line = self._format_division_line(standings, record_info["last_ten"])
+            performers = self._top_performers(summary.get("boxscore", {}), opp_comp)
         except Exception as exc:  # pragma: no cover - network parsing
             log.warning("Failed to build Mariners summary for %s: %s", event_id, exc)
             return None
@@ -680,15 +749,19 @@ class MarinersGameCog(commands.Cog):
             suffix = {1: "st", 2: "nd", 3: "rd"}.get(num % 10, "th")
         return f"{num}{suffix}"
 
-    def _fetch_record_info(self, session: requests.Session, season_year: int) -> dict[str, str]:
+    async def _fetch_record_info(
+        self, season_year: int, refs: RefResolver | None = None
+    ) -> dict[str, str]:
         info = {"summary": "", "streak": "", "last_ten": ""}
+        refs = refs or RefResolver(self._get_json)
         try:
-            team = session.get(
-                f"https://sports.core.api.espn.com/v2/sports/baseball/leagues/mlb/seasons/{season_year}/teams/sea",
-                params={"lang": "en", "region": "us"},
-                timeout=STATS_TIMEOUT,
-            ).json()
-            record = session.get(team["record"]["$ref"], timeout=STATS_TIMEOUT).json()
+            team = await refs.get(
+                ESPN_TEAM_URL.format(season=season_year),
+                cache=REF_CACHE,
+                lang="en",
+                region="us",
+            )
+            record = await refs.get(team["record"]["$ref"])
             total = next((item for item in record.get("items", []) if item.get("type") == "total"), None)
             last_ten = next(
                 (item for item in record.get("items", []) if item.get("type") == "lasttengames"),
@@ -704,17 +777,19 @@ class MarinersGameCog(commands.Cog):
             pass
         return info
 
-    def _fetch_division_standings(
-        self, session: requests.Session, season_year: int
+    async def _fetch_division_standings(
+        self, season_year: int, refs: RefResolver | None = None
     ) -> list[dict[str, str]]:
         teams: list[dict[str, str]] = []
+        refs = refs or RefResolver(self._get_json)
         try:
-            group = session.get(
-                f"http://sports.core.api.espn.com/v2/sports/baseball/leagues/mlb/seasons/{season_year}/types/2/groups/{DIVISION_GROUP_ID}",
-                params={"lang": "en", "region": "us"},
-                timeout=STATS_TIMEOUT,
-            ).json()
-            standings = session.get(group["standings"]["$ref"], timeout=STATS_TIMEOUT).json()
+            group = await refs.get(
+                ESPN_GROUP_URL.format(season=season_year, group=DIVISION_GROUP_ID),
+                cache=REF_CACHE,
+                lang="en",
+                region="us",
+            )
+            standings = await refs.get(group["standings"]["$ref"], cache=REF_CACHE)
             overall_ref = None
             for item in standings.get("items", []):
                 if item.get("name") == "overall":
@@ -722,9 +797,12 @@ class MarinersGameCog(commands.Cog):
                     break
             if not overall_ref:
                 return teams
-            overall = session.get(overall_ref, timeout=STATS_TIMEOUT).json()
-            for team_entry in overall.get("standings", []):
-                team_info = session.get(team_entry["team"]["$ref"], timeout=STATS_TIMEOUT).json()
+            overall = await refs.get(overall_ref)
+            entries = overall.get("standings", [])
+            team_infos = await asyncio.gather(
+                *(refs.get(entry["team"]["$ref"], cache=REF_CACHE) for entry in entries)
+            )
+            for team_entry, team_info in zip(entries, team_infos):
                 total = next(
                     (rec for rec in team_entry.get("records", []) if rec.get("type") == "total"),
                     None,
@@ -906,14 +984,11 @@ class MarinersGameCog(commands.Cog):
         return "\n".join(lines)
 
     # ---------------------------------------------------------------- thread helpers
-    def _fetch_upcoming_games(self) -> List[Dict[str, Any]]:
+    async def _fetch_upcoming_games(self) -> List[Dict[str, Any]]:
         """Fetch upcoming Mariners games for thread creation."""
         games: List[Dict[str, Any]] = []
         try:
-            with self._build_session() as session:
-                resp = session.get(ESPN_SCHEDULE_URL, timeout=STATS_TIMEOUT)
-                resp.raise_for_status()
-                data = resp.json()
+            data = await self._schedule_snapshot()
         except Exception as exc:
             log.warning("Failed to fetch Mariners schedule: %s", exc)
             return games
@@ -974,17 +1049,12 @@ class MarinersGameCog(commands.Cog):
         ]
         return "\n".join(lines)
 
-    def _fetch_live_linescore(self, game_id: str) -> Optional[Dict[str, Any]]:
+    async def _fetch_live_linescore(self, game_id: str) -> Optional[Dict[str, Any]]:
         """Fetch live linescore for an in-progress game."""
         try:
-            with self._build_session() as session:
-                resp = session.get(
-                    ESPN_SUMMARY_URL,
-                    params={"event": game_id, "region": "us", "lang": "en"},
-                    timeout=STATS_TIMEOUT,
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            data = await self._get_json(
+                ESPN_SUMMARY_URL, event=game_id, region="us", lang="en"
+            )
         except Exception as exc:
             log.warning("Failed to fetch live score for %s: %s", game_id, exc)
             return None
@@ -1022,7 +1092,7 @@ class MarinersGameCog(commands.Cog):
         now = datetime.now(tz=pytz.utc)
 
         try:
-            games = await asyncio.to_thread(self._fetch_upcoming_games)
+            games = await self._fetch_upcoming_games()
         except Exception:
             log.exception("Failed to fetch upcoming Mariners games")
             return
@@ -1061,9 +1131,18 @@ class MarinersGameCog(commands.Cog):
 
     async def _update_live_scores(self) -> None:
         """Post inning-by-inning score updates to active threads."""
+        if not self.threads:
+            return
+        try:
+            states = await self._schedule_states()
+        except Exception as exc:
+            log.warning("Failed to read Mariners schedule snapshot: %s", exc)
+            states = {}
         for gid, thread in list(self.threads.items()):
+            if states.get(gid) == "pre":
+                continue  # not under way yet; skip the summary fetch
             try:
-                score = await asyncio.to_thread(self._fetch_live_linescore, gid)
+                score = await self._fetch_live_linescore(gid)
             except Exception:
                 log.exception("Failed to fetch live score for %s", gid)
                 continue
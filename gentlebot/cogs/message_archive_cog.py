@@ -6,6 +6,7 @@ import json
 import discord
 from discord.ext import commands
 
+from .. import db
 from ..infra import (
     PoolAwareCog,
     get_config,
@@ -45,6 +46,8 @@ def _privacy_kind(channel: discord.abc.GuildChannel | discord.abc.PrivateChannel
 class MessageArchiveCog(PoolAwareCog):
     """Persist messages and reaction events to Postgres."""
 
+    pool_lane = "ingest"
+
     def __init__(self, bot: commands.Bot):
         super().__init__(bot)
         self.enabled = get_config().archive.enabled
@@ -82,31 +85,9 @@ class MessageArchiveCog(PoolAwareCog):
             return 0
         flags = getattr(member, "public_flags", None)
         flags_value = getattr(flags, "value", None) if flags is not None else None
-        inserted = await self.pool.fetchval(
-            """
-            INSERT INTO discord."user" (
-                user_id, username, discriminator, avatar_hash, is_bot,
-                display_name, global_name, banner_hash, accent_color,
-                avatar_decoration_hash, system, public_flags,
-                first_seen_at, last_seen_at
-            )
-            VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12, now(), now())
-            ON CONFLICT (user_id)
-            DO UPDATE SET
-                username=$2,
-                discriminator=$3,
-                avatar_hash=$4,
-                is_bot=$5,
-                display_name=$6,
-                global_name=$7,
-                banner_hash=$8,
-                accent_color=$9,
-                avatar_decoration_hash=$10,
-                system=$11,
-                public_flags=$12,
-                last_seen_at=EXCLUDED.last_seen_at
-            RETURNING xmax = 0
-            """,
+        inserted = await db.fetchval_named(
+            self.pool,
+            "user_upsert",
             member.id,
             member.name,
             getattr(member, "discriminator", None),
@@ -125,14 +106,9 @@ class MessageArchiveCog(PoolAwareCog):
     async def _upsert_guild(self, guild: discord.Guild) -> int:
         if not self.pool:
             return 0
-        inserted = await self.pool.fetchval(
-            """
-            INSERT INTO discord.guild (guild_id, name, owner_id, created_at)
-            VALUES ($1,$2,$3,$4)
-            ON CONFLICT (guild_id)
-            DO UPDATE SET name=$2, owner_id=$3, updated_at=now()
-            RETURNING xmax = 0
-            """,
+        inserted = await db.fetchval_named(
+            self.pool,
+            "guild_upsert",
             guild.id,
             guild.name,
             getattr(guild.owner, "id", None),
@@ -145,31 +121,9 @@ class MessageArchiveCog(PoolAwareCog):
             return 0
         guild_id = getattr(channel.guild, "id", None)
         privacy_kind = _privacy_kind(channel)
-        inserted = await self.pool.fetchval(
-            """
-            INSERT INTO discord.channel (
-                channel_id, guild_id, name, type, position, parent_id,
-                topic, nsfw, rate_limit_per_user, last_message_id,
-                bitrate, user_limit, created_at, last_message_at,
-                privacy_kind
-            )
-            VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13,$14,$15)
-            ON CONFLICT (channel_id)
-            DO UPDATE SET
-                name=$3,
-                type=$4,
-                position=$5,
-                parent_id=$6,
-                topic=$7,
-                nsfw=$8,
-                rate_limit_per_user=$9,
-                last_message_id=$10,
-                bitrate=$11,
-                user_limit=$12,
-                last_message_at=$14,
-                privacy_kind=$15
-            RETURNING xmax = 0
-            """,
+        inserted = await db.fetchval_named(
+            self.pool,
+            "channel_upsert",
             channel.id,
             guild_id,
             getattr(channel, "name", None),
@@ -196,24 +150,14 @@ class MessageArchiveCog(PoolAwareCog):
         )
         reply_to_id = getattr(message.reference, "message_id", None)
         if reply_to_id:
-            exists = await self.pool.fetchval(
-                "SELECT 1 FROM discord.message WHERE message_id=$1",
-                reply_to_id,
-            )
+            exists = await db.fetchval_named(self.pool, "message_exists", reply_to_id)
             if not exists:
                 reply_to_id = None
 
         async with transaction(self.pool) as conn:
-            msg_tag = await conn.execute(
-                """
-                INSERT INTO discord.message (
-                    message_id, guild_id, channel_id, author_id, reply_to_id,
-                    content, created_at, edited_at, pinned, tts, type, flags,
-                    mention_everyone, mentions, mention_roles, embeds,
-                    raw_payload)
-                VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13,$14,$15,$16,$17)
-                ON CONFLICT DO NOTHING
-                """,
+            msg_tag = await db.execute_named(
+                conn,
+                "message_insert",
                 message.id,
                 getattr(message.guild, "id", None),
                 message.channel.id,
@@ -235,13 +179,9 @@ class MessageArchiveCog(PoolAwareCog):
             msg_count = rows_from_tag(msg_tag)
             att_count = 0
             for idx, att in enumerate(message.attachments):
-                att_tag = await conn.execute(
-                    """
-                    INSERT INTO discord.message_attachment (
-                        message_id, attachment_id, filename, content_type, size_bytes, url, proxy_url)
-                    VALUES ($1,$2,$3,$4,$5,$6,$7)
-                    ON CONFLICT DO NOTHING
-                    """,
+                att_tag = await db.execute_named(
+                    conn,
+                    "message_attachment_insert",
                     message.id,
                     idx,
                     att.filename,
@@ -252,8 +192,9 @@ class MessageArchiveCog(PoolAwareCog):
                 )
                 att_count += rows_from_tag(att_tag)
 
-            await conn.execute(
-                "UPDATE discord.channel SET last_message_id=$1, last_message_at=$2 WHERE channel_id=$3",
+            await db.execute_named(
+                conn,
+                "channel_touch",
                 message.id,
                 message.created_at,
                 message.channel.id,
@@ -273,8 +214,9 @@ class MessageArchiveCog(PoolAwareCog):
     async def on_message_edit(self, before: discord.Message, after: discord.Message) -> None:
         if not self.enabled or after.guild is None or not self.pool:
             return
-        await self.pool.execute(
-            """UPDATE discord.message SET content=$1, edited_at=$2, flags=$3, mention_everyone=$4, mentions=$5, mention_roles=$6, embeds=$7, raw_payload=$8 WHERE message_id=$9""",
+        await db.execute_named(
+            self.pool,
+            "message_update",
             after.content,
             after.edited_at,
             getattr(after.flags, "value", 0),
@@ -294,18 +236,12 @@ class MessageArchiveCog(PoolAwareCog):
         if not self.pool:
             return
         # Ignore events for messages that are not archived yet
-        exists = await self.pool.fetchval(
-            "SELECT 1 FROM discord.message WHERE message_id=$1",
-            payload.message_id,
-        )
+        exists = await db.fetchval_named(self.pool, "message_exists", payload.message_id)
         if not exists:
             return
-        await self.pool.execute(
-            """
-            INSERT INTO discord.reaction_event (message_id, user_id, emoji, reaction_action, event_at)
-            VALUES ($1,$2,$3,$4,$5)
-            ON CONFLICT ON CONSTRAINT uniq_reaction_event_msg_user_emoji_act_ts DO NOTHING
-            """,
+        await db.execute_named(
+            self.pool,
+            "reaction_insert",
             payload.message_id,
             payload.user_id,
             str(payload.emoji),
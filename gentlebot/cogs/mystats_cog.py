@@ -9,6 +9,7 @@ from discord import app_commands
 from discord.ext import commands
 
 from .. import bot_config as cfg
+from .. import db
 from ..infra import PoolAwareCog
 from ..capabilities import (
     CogCapabilities,
@@ -145,14 +146,7 @@ class MyStatsCog(PoolAwareCog):
         streak_current = 0
         streak_best = 0
         if self.pool:
-            row = await self.pool.fetchrow(
-                """
-                SELECT current_streak, longest_streak
-                FROM discord.user_streak
-                WHERE user_id = $1
-                """,
-                uid,
-            )
+            row = await db.fetchrow_named(self.pool, "streak_get", uid)
             if row:
                 streak_current = row["current_streak"]
                 streak_best = row["longest_streak"]
@@ -0,0 +1,274 @@
+"""Admin performance diagnostics.
+
+Provides ephemeral `/perf` commands: `/perf db` lists the statements that
+have spent the most time in Postgres since startup along with per-lane pool
+saturation, `/perf loop` shows event-loop lag and the code blamed for
+blocking it, and `/perf http` shows per-host traffic on the shared HTTP
+client.  `/llmstats` ranks the cogs spending LLM tokens with their
+latency percentiles, either since startup or over the last few hours of the
+``llm_call`` ledger.
+"""
+from __future__ import annotations
+
+import logging
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from .. import db
+from ..infra.http import get_http_client
+from ..infra.loop_watchdog import get_loop_watchdog
+from ..llm.router import get_router
+from ..query_stats import query_stats
+from ..util import chan_name, user_name
+
+log = logging.getLogger(f"gentlebot.{__name__}")
+
+TOP_N = 10
+_SQL_WIDTH = 60
+
+
+def format_db_report(limit: int = TOP_N) -> str:
+    """Render the slowest statements and pool lane stats as text."""
+    lines: list[str] = []
+    top = query_stats.top(limit)
+    if not top:
+        lines.append("No queries recorded yet.")
+    for idx, stats in enumerate(top, 1):
+        sql = stats.fingerprint
+        if len(sql) > _SQL_WIDTH:
+            sql = sql[: _SQL_WIDTH - 3] + "..."
+        lines.append(f"{idx}. [{stats.source}] {sql}")
+        lines.append(
+            f"   calls={stats.calls} total={stats.total_ms:.0f}ms "
+            f"avg={stats.avg_ms:.1f}ms p95<={stats.percentile(95):.0f}ms "
+            f"max={stats.max_ms:.0f}ms rows={stats.rows} "
+            f"wait={stats.wait_avg_ms:.1f}ms errors={stats.errors}"
+        )
+    lanes = db.pool_stats()
+    if lanes:
+        lines.append("")
+        lines.append("Pool lanes:")
+        for lane, snap in lanes.items():
+            lines.append(
+                f"  {lane}: in_use={snap['in_use']}/{snap['max_size']} "
+                f"peak={snap['peak_in_use']} wait_avg={snap['wait_avg_ms']}ms "
+                f"wait_max={snap['wait_max_ms']}ms timeouts={snap['timeouts']}"
+            )
+    return "\n".join(lines)
+
+
+def format_loop_report() -> str:
+    """Render event-loop lag stats and the top blocking call sites."""
+    watchdog = get_loop_watchdog()
+    if watchdog is None:
+        return "Loop watchdog is not running."
+    snap = watchdog.stats.snapshot()
+    lines = [
+        f"lag last={snap['last_ms']}ms p99={snap['p99_ms']}ms max={snap['max_ms']}ms",
+        f"stalls>={watchdog.threshold_ms:.0f}ms: {snap['stalls']} "
+        f"(samples={snap['samples']})",
+    ]
+    if snap["by_source"]:
+        lines.append("")
+        lines.append("Blocked by:")
+        for source, count in snap["by_source"].items():
+            lines.append(f"  {count:>4}  {source}")
+    return "\n".join(lines)
+
+
+def format_http_report() -> str:
+    """Render per-host request counts, statuses, latency and cache use of the HTTP client."""
+    hosts = get_http_client().snapshot()
+    if not hosts:
+        return "No HTTP requests recorded yet."
+    lines: list[str] = []
+    for host, stats in hosts:
+        p50 = stats.percentile(50)
+        p95 = stats.percentile(95)
+        statuses = " ".join(f"{code}={n}" for code, n in sorted(stats.statuses.items()))
+        lines.append(host)
+        lines.append(
+            f"   requests={stats.requests} retries={stats.retries} errors={stats.errors} "
+            f"p50={p50 or 0:.0f}ms p95={p95 or 0:.0f}ms {statuses}".rstrip()
+        )
+        if stats.cache:
+            lines.append(
+                "   cache " + " ".join(f"{k}={n}" for k, n in sorted(stats.cache.items()))
+            )
+    return "\n".join(lines)
+
+
+LLM_HISTORY_SQL = """
+    SELECT caller, route, count(*) AS calls,
+           count(*) FILTER (WHERE cache_hit) AS cache_hits,
+           count(*) FILTER (WHERE fallback) AS fallbacks,
+           count(*) FILTER (WHERE status NOT IN ('ok', 'cache_hit', 'shared')) AS errors,
+           percentile_cont(0.5) WITHIN GROUP (ORDER BY latency_ms)
+               FILTER (WHERE NOT cache_hit) AS p50_ms,
+           percentile_cont(0.95) WITHIN GROUP (ORDER BY latency_ms)
+               FILTER (WHERE NOT cache_hit) AS p95_ms,
+           sum(tokens_in) AS tokens_in,
+           sum(tokens_out) AS tokens_out
+    FROM discord.llm_call
+    WHERE created_at >= now() - make_interval(hours => $1)
+    GROUP BY caller, route
+    ORDER BY sum(tokens_in) DESC
+    LIMIT $2
+"""
+
+
+def _tokens(count: int) -> str:
+    return f"{count / 1000:.1f}k" if count >= 1000 else str(count)
+
+
+def format_llm_report(limit: int = TOP_N) -> str:
+    """Render LLM usage per (caller, route) since startup plus quota headroom."""
+    router = get_router()
+    lines: list[str] = []
+    top = router.ledger.top(limit)
+    if not top:
+        lines.append("No LLM calls recorded yet.")
+    for stats in top:
+        lines.append(f"{stats.caller} [{stats.route}]")
+        lines.append(
+            f"   calls={stats.calls} cache={stats.cache_hits} fallback={stats.fallbacks} "
+            f"errors={stats.errors} p50<={stats.percentile(50):.0f}ms "
+            f"p95<={stats.percentile(95):.0f}ms "
+            f"in={_tokens(stats.tokens_in)} out={_tokens(stats.tokens_out)}"
+        )
+    lines.append("")
+    lines.append("Quota left:")
+    for route in router.quota.limits:
+        left = router.quota.remaining(route)
+        lines.append(
+            f"  {route}: rpm={left['rpm']} tpm={left['tpm']} rpd={left['rpd']}"
+        )
+    endpoints = router.health.snapshot()
+    if endpoints:
+        lines.append("")
+        lines.append("Endpoints:")
+    for name, kind, stats in endpoints:
+        p50 = stats.percentile(50)
+        p95 = stats.percentile(95)
+        lines.append(
+            f"  {name} ({kind}): n={stats.samples} "
+            f"p50={'-' if p50 is None else f'{p50:.0f}ms'} "
+            f"p95={'-' if p95 is None else f'{p95:.0f}ms'} "
+            f"errors={stats.error_rate:.0%} hedges={stats.hedges} won={stats.hedge_wins}"
+        )
+    return "\n".join(lines)
+
+
+def format_llm_history(rows: list, hours: int) -> str:
+    """Render ledger aggregates returned by :data:`LLM_HISTORY_SQL`."""
+    if not rows:
+        return f"No LLM calls in the last {hours}h."
+    lines = [f"Last {hours}h:"]
+    for row in rows:
+        p50 = row["p50_ms"] or 0
+        p95 = row["p95_ms"] or 0
+        lines.append(f"{row['caller']} [{row['route']}]")
+        lines.append(
+            f"   calls={row['calls']} cache={row['cache_hits']} "
+            f"fallback={row['fallbacks']} errors={row['errors']} "
+            f"p50={p50:.0f}ms p95={p95:.0f}ms "
+            f"in={_tokens(row['tokens_in'] or 0)} out={_tokens(row['tokens_out'] or 0)}"
+        )
+    return "\n".join(lines)
+
+
+class PerfCog(commands.Cog):
+    """Cog implementing the admin-only `/perf` diagnostics commands."""
+
+    perf = app_commands.Group(
+        name="perf",
+        description="Performance diagnostics",
+        default_permissions=discord.Permissions(administrator=True),
+    )
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @perf.command(name="db", description="Show the slowest database statements")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def perf_db(self, interaction: discord.Interaction):
+        """Reply with the top statements by total time spent."""
+        log.info(
+            "/perf db invoked by %s in %s",
+            user_name(interaction.user),
+            chan_name(interaction.channel),
+        )
+        report = format_db_report()
+        await interaction.response.send_message(
+            f"```\n{report[:1900]}\n```", ephemeral=True
+        )
+
+    @perf.command(name="loop", description="Show event-loop lag and blocking calls")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def perf_loop(self, interaction: discord.Interaction):
+        """Reply with loop lag percentiles and the worst blocking call sites."""
+        log.info(
+            "/perf loop invoked by %s in %s",
+            user_name(interaction.user),
+            chan_name(interaction.channel),
+        )
+        report = format_loop_report()
+        await interaction.response.send_message(
+            f"```\n{report[:1900]}\n```", ephemeral=True
+        )
+
+    @perf.command(name="http", description="Show outbound HTTP traffic per host")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def perf_http(self, interaction: discord.Interaction):
+        """Reply with request counts, retries and latency per external host."""
+        log.info(
+            "/perf http invoked by %s in %s",
+            user_name(interaction.user),
+            chan_name(interaction.channel),
+        )
+        report = format_http_report()
+        await interaction.response.send_message(
+            f"```\n{report[:1900]}\n```", ephemeral=True
+        )
+
+
+    @app_commands.command(
+        name="llmstats", description="Show LLM latency and token spend per cog"
+    )
+    @app_commands.describe(
+        hours="Read the last N hours from the ledger table instead of since startup"
+    )
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def llmstats(
+        self,
+        interaction: discord.Interaction,
+        hours: app_commands.Range[int, 1, 720] | None = None,
+    ):
+        """Reply with per-cog LLM usage, latency percentiles and quota headroom."""
+        log.info(
+            "/llmstats invoked by %s in %s",
+            user_name(interaction.user),
+            chan_name(interaction.channel),
+        )
+        if hours is None:
+            report = format_llm_report()
+        else:
+            try:
+                pool = await db.get_pool()
+                rows = await pool.fetch(LLM_HISTORY_SQL, hours, TOP_N)
+            except Exception:
+                log.exception("Failed to read llm_call ledger")
+                report = "The LLM ledger is unavailable; showing stats since startup.\n\n"
+                report += format_llm_report()
+            else:
+                report = format_llm_history(rows, hours)
+        await interaction.response.send_message(
+            f"```\n{report[:1900]}\n```", ephemeral=True
+        )
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(PerfCog(bot))
@@ -26,7 +26,7 @@ class PresenceArchiveCog(commands.Cog):
         if not self.enabled:
             return
         try:
-            self.pool = await get_pool()
+            self.pool = await get_pool(lane="ingest")
         except RuntimeError:
             log.warning("ARCHIVE_PRESENCE set but PG_DSN is missing")
             self.enabled = False
@@ -39,7 +39,7 @@ class RoleLogCog(commands.Cog):
         if not self.enabled:
             return
         try:
-            self.pool = await get_pool()
+            self.pool = await get_pool(lane="ingest")
         except RuntimeError:
             log.warning("LOG_ROLES set but PG_DSN is missing")
             self.enabled = False
@@ -8,7 +8,7 @@ Slash commands:
 
 Requires:
   • discord.py v2+
-  • requests, python-dateutil, pytz, bs4, timezonefinder
+  • aiohttp, python-dateutil, pytz, bs4, timezonefinder
   • Bot_config with GUILD_ID
   • ENV var F1_SCHEDULE_URL (optional override)
 """
@@ -18,17 +18,12 @@ import os
 from datetime import datetime, timezone, timedelta
 import logging
 
-import asyncio
 import discord
 from discord import app_commands
 from discord.ext import commands
 from ..util import chan_name, user_name
-import requests
-from requests.adapters import HTTPAdapter, Retry
-from dateutil import parser
+from ..f1_data import get_f1_data
 import pytz
-from timezonefinder import TimezoneFinder
-from bs4 import BeautifulSoup
 
 # ── time zones --------------------------------------------------------------
 
@@ -37,10 +32,6 @@ log = logging.getLogger(f"gentlebot.{__name__}")
 
 # Local timezone for display (fallback to UTC)
 LOCAL_TZ = pytz.timezone(os.getenv("LOCAL_TZ", "UTC"))
-# Pacific time for schedule comparison
-PST_TZ = pytz.timezone("America/Los_Angeles")
-# Finder for track locales
-TF = TimezoneFinder()
 # Map session names to emojis
 SESSION_EMOJI = {
     "Free Practice 1": "🛠",
@@ -61,97 +52,35 @@ class SportsCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.session = requests.Session()
-        retries = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=["GET"],
-        )
-        adapter = HTTPAdapter(max_retries=retries)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        self.f1 = get_f1_data()
 
-    def fetch_f1_schedule(self) -> list[dict]:
-        """Fetch and parse F1 schedule sessions sorted by UTC time."""
-        url = os.getenv("F1_SCHEDULE_URL", "https://f1calendar.com/api/calendar")
+    async def fetch_f1_schedule(self) -> list[dict]:
+        """Return F1 schedule sessions sorted by UTC time."""
         try:
-            resp = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
-            resp.raise_for_status()
-            data = resp.json()
-            sessions: list[dict] = []
-            for race in data.get("races", []):
-                round_name = race.get("name")
-                location_name = race.get("location")
-                slug = race.get("slug", "")
-                round_num = race.get("round")
-                lat = race.get("latitude")
-                lon = race.get("longitude")
-                race_tz_name = TF.timezone_at(lng=lon, lat=lat)
-                race_tz = pytz.timezone(race_tz_name) if race_tz_name else pytz.UTC
-                for session_name, iso in race.get("sessions", {}).items():
-                    dt_utc = parser.isoparse(iso).astimezone(pytz.UTC)
-                    dt_local = dt_utc.astimezone(race_tz)
-                    dt_pst = dt_utc.astimezone(PST_TZ)
-                    sessions.append({
-                        "round": round_name,
-                        "slug": slug,
-                        "session": session_name,
-                        "utc": dt_utc,
-                        "pst": dt_pst,
-                        "local": dt_local,
-                        "location": location_name,
-                        "round_num": round_num,
-                    })
-            return sorted(sessions, key=lambda s: s["utc"])
+            return await self.f1.sessions()
         except Exception as e:
             log.exception("Failed to fetch F1 schedule: %s", e)
             return []
 
-    def fetch_f1_standings(self) -> tuple[list[dict], list[dict]]:
-        """Scrape top 10 driver and constructor standings from formula1.com."""
-        year = datetime.now().year
-        base = 'https://www.formula1.com'
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        # Driver standings
-        d_url = f'{base}/en/results/{year}/drivers'
-        resp_d = requests.get(d_url, headers=headers)
-        resp_d.raise_for_status()
-        soup_d = BeautifulSoup(resp_d.text, 'html.parser')
-        table_d = soup_d.find('table', class_='f1-table')
-        drivers: list[dict] = []
-        if table_d and table_d.tbody:
-            rows = table_d.tbody.find_all('tr')[:10]
-            for row in rows:
-                cells = row.find_all('td')
-                pos = cells[0].get_text(strip=True)
-                link = cells[1].find('a')
-                name_raw = link.get_text(' ', strip=True) if link else cells[1].get_text(strip=True)
-                parts = name_raw.split()
-                if parts and len(parts[-1]) == 3 and parts[-1].isalpha():
-                    parts = parts[:-1]
-                name = ' '.join(parts)
-                pts = cells[-1].get_text(strip=True)
-                drivers.append({'pos': pos, 'name': name, 'pts': pts})
-        # Constructor standings
-        t_url = f'{base}/en/results/{year}/team'
-        resp_t = requests.get(t_url, headers=headers)
-        resp_t.raise_for_status()
-        soup_t = BeautifulSoup(resp_t.text, 'html.parser')
-        table_t = soup_t.find('table', class_='f1-table-with-data') or soup_t.find('table', class_='f1-table')
-        constructors: list[dict] = []
-        if table_t and table_t.tbody:
-            rows = table_t.tbody.find_all('tr')[:10]
-            for row in rows:
-                cells = row.find_all('td')
-                pos = cells[0].get_text(strip=True)
-                link = cells[1].find('a')
-                team = link.get_text(' ', strip=True) if link else cells[1].get_text(strip=True)
-                pts = cells[2].get_text(strip=True)
-                constructors.append({'pos': pos, 'team': team, 'pts': pts})
-        return drivers, constructors
+    async def fetch_f1_standings(self) -> tuple[list[dict], list[dict]]:
+        """Return top 10 driver and constructor standings from formula1.com."""
+        try:
+            return await self.f1.standings()
+        except Exception as e:
+            log.exception("Failed to fetch F1 standings: %s", e)
+            return [], []
+
+    async def fetch_track_map(self, slug: str) -> str | None:
+        """Return the circuit map image URL from the track's Wikipedia infobox."""
+        try:
+            return await self.f1.track_map(slug)
+        except Exception as e:
+            log.exception("Failed to fetch track map: %s", e)
+            return None
 
-    def build_preview_embed(self, weekend: list[dict], embed_type: str = 'preview') -> discord.Embed:
+    def build_preview_embed(
+        self, weekend: list[dict], embed_type: str = 'preview', track_map: str | None = None
+    ) -> discord.Embed:
         """Construct the embed for a given race weekend, including track map."""
         round_name = weekend[0]['round']
         location = weekend[0]['location']
@@ -166,24 +95,8 @@ class SportsCog(commands.Cog):
         embed = discord.Embed(title=title, color=discord.Color.blue())
         embed.add_field(name="Race Location 🗺️", value=location or "", inline=False)
         # Track map via Wikipedia
-        slug = weekend[0].get('slug', '')
-        if slug:
-            wiki_slug = slug.replace('-', ' ').title().replace(' ', '_')
-            wiki_url = f"https://en.wikipedia.org/wiki/{wiki_slug}"
-            try:
-                wresp = requests.get(wiki_url, headers={'User-Agent': 'Mozilla/5.0'})
-                wresp.raise_for_status()
-                wsoup = BeautifulSoup(wresp.text, 'html.parser')
-                cell = wsoup.find('td', class_='infobox-image')
-                if cell:
-                    img = cell.find('img')
-                    if img and img.has_attr('src'):
-                        src = img['src']
-                        if src.startswith('//'):
-                            src = 'https:' + src
-                        embed.set_image(url=src)
-            except Exception as e:
-                log.exception("Failed to fetch track map: %s", e)
+        if track_map:
+            embed.set_image(url=track_map)
         # Session fields
         for s in weekend:
             # label + emoji
@@ -295,7 +208,7 @@ class SportsCog(commands.Cog):
         log.info("/nextf1 invoked by %s in %s", user_name(interaction.user), chan_name(interaction.channel))
         await interaction.response.defer(thinking=True)
         now = datetime.now(timezone.utc)
-        sessions = self.fetch_f1_schedule()
+        sessions = await self.fetch_f1_schedule()
         upcoming = [s for s in sessions if s['utc'] > now]
         if not upcoming:
             await interaction.followup.send("No upcoming sessions found.")
@@ -303,14 +216,15 @@ class SportsCog(commands.Cog):
         # Extract weekend sessions
         next_round = upcoming[0]['round']
         weekend = [s for s in upcoming if s['round'] == next_round]
-        embed = self.build_preview_embed(weekend, embed_type='preview')
+        track_map = await self.fetch_track_map(weekend[0].get('slug', ''))
+        embed = self.build_preview_embed(weekend, embed_type='preview', track_map=track_map)
         await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="f1standings", description="Show current F1 driver & constructor standings")
     async def f1standings(self, interaction: discord.Interaction):
         log.info("/f1standings invoked by %s in %s", user_name(interaction.user), chan_name(interaction.channel))
         await interaction.response.defer(thinking=True)
-        drivers, constructors = self.fetch_f1_standings()
+        drivers, constructors = await self.fetch_f1_standings()
         if not drivers and not constructors:
             await interaction.followup.send("Could not fetch standings at this time.")
             return
@@ -23,8 +23,9 @@ from discord import app_commands
 from discord.ext import commands
 
 from .. import bot_config as cfg
+from .. import db
 from ..infra import PoolAwareCog, daily_key, idempotent_task
-from ..llm.router import get_router, SafetyBlocked
+from ..llm.router import Priority, get_router, SafetyBlocked
 from ..capabilities import (
     CogCapabilities,
     CommandCapability,
@@ -138,16 +139,18 @@ class StreakCog(PoolAwareCog):
             return
 
         try:
-            await self._backfill_streaks()
+            # The year-long history scan runs on the batch lane so it cannot
+            # hold up /streak lookups on the interactive lane.
+            await self._backfill_streaks(await db.get_pool(lane="batch"))
         except Exception as exc:
             log.exception("Streak backfill failed: %s", exc)
 
-    async def _backfill_streaks(self) -> None:
+    async def _backfill_streaks(self, pool: "asyncpg.Pool") -> None:
         """Calculate and update streaks from message history for all users."""
         log.info("Starting streak backfill from message history...")
 
         # Get all distinct non-bot users with messages, grouped by date
-        rows = await self.pool.fetch(
+        rows = await pool.fetch(
             """
             SELECT
                 m.author_id,
@@ -180,7 +183,7 @@ class StreakCog(PoolAwareCog):
 
         for user_id, dates in user_dates.items():
             # Check if user already has streak data
-            existing = await self.pool.fetchrow(
+            existing = await pool.fetchrow(
                 """
                 SELECT current_streak, longest_streak, last_active_date
                 FROM discord.user_streak
@@ -227,7 +230,7 @@ class StreakCog(PoolAwareCog):
                 last_active = sorted_dates[-1] if sorted_dates else None
 
             # Update or insert streak record
-            await self.pool.execute(
+            await pool.execute(
                 """
                 INSERT INTO discord.user_streak (
                     user_id, current_streak, longest_streak, last_active_date,
@@ -326,11 +329,12 @@ class StreakCog(PoolAwareCog):
                 f"Sign as 'Gentlebot'."
             )
             messages = [{"role": "user", "content": prompt}]
-            response = router.generate(
+            response = await router.generate_async(
                 "general",
                 messages,
                 temperature=0.8,
                 system_instruction="You are Gentlebot, a friendly Discord bot. Write brief, warm celebratory messages.",
+                priority=Priority.SCHEDULED,
             )
             return response.strip()
         except SafetyBlocked:
@@ -406,15 +410,7 @@ class StreakCog(PoolAwareCog):
         if not self.pool:
             return {"current": 0, "longest": 0, "last_active": None, "started": None, "announced": 0}
 
-        row = await self.pool.fetchrow(
-            """
-            SELECT current_streak, longest_streak, last_active_date, streak_started_date,
-                   COALESCE(announced_milestones, 0) AS announced_milestones
-            FROM discord.user_streak
-            WHERE user_id = $1
-            """,
-            user_id,
-        )
+        row = await db.fetchrow_named(self.pool, "streak_get", user_id)
         if row:
             return {
                 "current": row["current_streak"],
@@ -460,20 +456,9 @@ class StreakCog(PoolAwareCog):
         if not self.pool:
             return
 
-        await self.pool.execute(
-            """
-            INSERT INTO discord.user_streak (
-                user_id, current_streak, longest_streak, last_active_date, streak_started_date,
-                announced_milestones, updated_at
-            ) VALUES ($1, $2, $3, $4, $5, $6, now())
-            ON CONFLICT (user_id) DO UPDATE SET
-                current_streak = EXCLUDED.current_streak,
-                longest_streak = EXCLUDED.longest_streak,
-                last_active_date = EXCLUDED.last_active_date,
-                streak_started_date = EXCLUDED.streak_started_date,
-                announced_milestones = EXCLUDED.announced_milestones,
-                updated_at = now()
-            """,
+        await db.execute_named(
+            self.pool,
+            "streak_upsert",
             user_id,
             new_streak,
             longest,
@@ -487,14 +472,7 @@ class StreakCog(PoolAwareCog):
         if not self.pool:
             return
 
-        await self.pool.execute(
-            """
-            UPDATE discord.user_streak
-            SET current_streak = 0, streak_started_date = NULL, updated_at = now()
-            WHERE user_id = $1
-            """,
-            user_id,
-        )
+        await db.execute_named(self.pool, "streak_reset", user_id)
 
     # ── Role Sync ──────────────────────────────────────────────────────────
 
@@ -15,7 +15,6 @@ Configuration in bot_config.py:
 """
 from __future__ import annotations
 
-import asyncio
 import collections
 import logging
 from typing import Dict, Tuple
@@ -24,7 +23,7 @@ import discord
 from discord.ext import commands
 
 from .. import bot_config as cfg
-from ..llm.router import router, SafetyBlocked
+from ..llm.router import Priority, router, SafetyBlocked
 from ..infra import RateLimited
 from ..util import user_name
 from ..capabilities import CogCapabilities, ReactionCapability
@@ -82,11 +81,12 @@ Requirements:
 - Do NOT write paragraphs - bullets only"""
 
         try:
-            response = await asyncio.to_thread(
-                router.generate,
+            response = await router.generate_async(
                 "general",
                 [{"role": "user", "content": prompt}],
                 temperature=0.4,
+                cache=True,
+                priority=Priority.REACTION,
             )
             return response.strip()
         except (RateLimited, SafetyBlocked):
@@ -9,7 +9,6 @@ import logging
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
-import asyncpg
 import discord
 import pytz
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -18,7 +17,7 @@ from discord import app_commands
 from discord.ext import commands
 
 from .. import bot_config as cfg
-from ..util import build_db_url
+from ..infra import PoolAwareCog
 from ..capabilities import CogCapabilities, CommandCapability, Category
 
 if TYPE_CHECKING:
@@ -29,7 +28,7 @@ log = logging.getLogger(f"gentlebot.{__name__}")
 LA = pytz.timezone("America/Los_Angeles")
 
 
-class TrendingCog(commands.Cog):
+class TrendingCog(PoolAwareCog):
     """Surfaces trending content and hot channels."""
 
     CAPABILITIES = CogCapabilities(
@@ -43,19 +42,11 @@ class TrendingCog(commands.Cog):
     )
 
     def __init__(self, bot: commands.Bot) -> None:
-        self.bot = bot
+        super().__init__(bot)
         self.scheduler: AsyncIOScheduler | None = None
-        self.pool: asyncpg.Pool | None = None
 
     async def cog_load(self) -> None:
-        url = build_db_url()
-        if url:
-            url = url.replace("postgresql+asyncpg://", "postgresql://")
-
-            async def _init(conn: asyncpg.Connection) -> None:
-                await conn.execute("SET search_path=discord,public")
-
-            self.pool = await asyncpg.create_pool(url, init=_init)
+        await super().cog_load()
 
         self.scheduler = AsyncIOScheduler(timezone=LA)
 
@@ -75,9 +66,7 @@ class TrendingCog(commands.Cog):
         if self.scheduler:
             self.scheduler.shutdown(wait=False)
             self.scheduler = None
-        if self.pool:
-            await self.pool.close()
-            self.pool = None
+        await super().cog_unload()
 
     # ── Data Queries ───────────────────────────────────────────────────────
 
@@ -7,7 +7,6 @@ command posts an ephemeral response.
 """
 from __future__ import annotations
 
-import asyncio
 import math
 import re
 import statistics
@@ -185,7 +184,7 @@ class VibeCheckCog(PoolAwareCog):
         )
         data = [{"role": "user", "content": prompt}]
         try:
-            resp = await asyncio.to_thread(router.generate, route, data, 0.6)
+            resp = await router.generate_async(route, data, 0.6)
             parts = [p.strip() for p in resp.splitlines() if p.strip()]
             if len(parts) >= 2:
                 return parts[:2]
@@ -418,9 +417,7 @@ class VibeCheckCog(PoolAwareCog):
         )
         data = [{"role": "user", "content": prompt}]
         try:
-            resp = await asyncio.to_thread(
-                router.generate, route, data, 0.2
-            )
+            resp = await router.generate_async(route, data, 0.2)
             topics = [t.strip().strip("\"") for t in resp.splitlines() if t.strip()]
             return tuple((topics + ["..."] * 2)[:2])
         except (RateLimited, SafetyBlocked):
@@ -1,7 +1,6 @@
 """Weekly server recap posted every Monday at 9:30 AM PT."""
 from __future__ import annotations
 
-import asyncio
 import logging
 from datetime import date, timedelta
 
@@ -14,7 +13,7 @@ from discord.ext import commands
 from .. import bot_config as cfg
 from ..infra import PoolAwareCog, idempotent_task, weekly_key
 from ..infra.quotas import RateLimited
-from ..llm.router import SafetyBlocked, router
+from ..llm.router import Priority, SafetyBlocked, router
 from ..capabilities import (
     CogCapabilities,
     ScheduledCapability,
@@ -66,14 +65,14 @@ async def _generate_vibe(stats: dict, guild_name: str) -> str:
             "No emojis. No hashtags."
         )
         messages = [{"role": "user", "content": prompt}]
-        response = await asyncio.to_thread(
-            router.generate,
+        response = await router.generate_async(
             "scheduled",
             messages,
             temperature=0.9,
             system_instruction=(
                 "You are a witty community observer. Write exactly one short sentence."
             ),
+            priority=Priority.SCHEDULED,
         )
         text = response.strip().strip('"')
         return text if len(text) < 200 else fallback
@@ -87,6 +86,8 @@ async def _generate_vibe(stats: dict, guild_name: str) -> str:
 class WeeklyRecapCog(PoolAwareCog):
     """Posts a weekly engagement recap every Monday morning."""
 
+    pool_lane = "batch"
+
     CAPABILITIES = CogCapabilities(
         scheduled=[
             ScheduledCapability(
@@ -140,6 +140,7 @@ class YahooFantasyWeeklyCog(commands.Cog):
                 """
                 SELECT 1 FROM discord.task_execution
                 WHERE task_name = 'yahoo_fantasy_weekly'
+                  AND status = 'done'
                   AND result = $1
                 """,
                 f"sent:week_{target_week}",
@@ -1,53 +1,559 @@
-"""Shared Postgres connection pool for Gentlebot."""
+"""Shared Postgres connection pools for Gentlebot.
+
+Connections are partitioned into named lanes (see :data:`LANES`) so that
+backfills and scheduled jobs cannot starve user-facing queries::
+
+    pool = await db.get_pool(lane="batch")
+
+Hot statements are declared once in :data:`STATEMENTS` and prepared on every
+pooled connection by the pool's ``init`` hook.  Callers execute them by name
+through :func:`execute_named`, :func:`fetch_named`, :func:`fetchrow_named`
+and :func:`fetchval_named`, which accept either a pool or a connection::
+
+    exists = await db.fetchval_named(pool, "message_exists", message_id)
+
+    async with transaction(pool) as conn:
+        await db.execute_named(conn, "channel_touch", msg_id, ts, channel_id)
+"""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Sequence
 
 import asyncpg
 
-from .util import build_db_url
+from .query_stats import query_stats, row_count
+from .util import build_db_url, int_env
 
 log = logging.getLogger(__name__)
 
-_pool: asyncpg.Pool | None = None
+# ─── Named statement registry ──────────────────────────────────────────────
+
+STATEMENTS: dict[str, str] = {
+    # Message archive ingest (runs for every guild message and reaction)
+    "user_upsert": """
+        INSERT INTO discord."user" (
+            user_id, username, discriminator, avatar_hash, is_bot,
+            display_name, global_name, banner_hash, accent_color,
+            avatar_decoration_hash, system, public_flags,
+            first_seen_at, last_seen_at
+        )
+        VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12, now(), now())
+        ON CONFLICT (user_id)
+        DO UPDATE SET
+            username=$2,
+            discriminator=$3,
+            avatar_hash=$4,
+            is_bot=$5,
+            display_name=$6,
+            global_name=$7,
+            banner_hash=$8,
+            accent_color=$9,
+            avatar_decoration_hash=$10,
+            system=$11,
+            public_flags=$12,
+            last_seen_at=EXCLUDED.last_seen_at
+        RETURNING xmax = 0
+    """,
+    "guild_upsert": """
+        INSERT INTO discord.guild (guild_id, name, owner_id, created_at)
+        VALUES ($1,$2,$3,$4)
+        ON CONFLICT (guild_id)
+        DO UPDATE SET name=$2, owner_id=$3, updated_at=now()
+        RETURNING xmax = 0
+    """,
+    "channel_upsert": """
+        INSERT INTO discord.channel (
+            channel_id, guild_id, name, type, position, parent_id,
+            topic, nsfw, rate_limit_per_user, last_message_id,
+            bitrate, user_limit, created_at, last_message_at,
+            privacy_kind
+        )
+        VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13,$14,$15)
+        ON CONFLICT (channel_id)
+        DO UPDATE SET
+            name=$3,
+            type=$4,
+            position=$5,
+            parent_id=$6,
+            topic=$7,
+            nsfw=$8,
+            rate_limit_per_user=$9,
+            last_message_id=$10,
+            bitrate=$11,
+            user_limit=$12,
+            last_message_at=$14,
+            privacy_kind=$15
+        RETURNING xmax = 0
+    """,
+    "message_exists": "SELECT 1 FROM discord.message WHERE message_id=$1",
+    "message_insert": """
+        INSERT INTO discord.message (
+            message_id, guild_id, channel_id, author_id, reply_to_id,
+            content, created_at, edited_at, pinned, tts, type, flags,
+            mention_everyone, mentions, mention_roles, embeds,
+            raw_payload)
+        VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13,$14,$15,$16,$17)
+        ON CONFLICT DO NOTHING
+    """,
+    "message_attachment_insert": """
+        INSERT INTO discord.message_attachment (
+            message_id, attachment_id, filename, content_type, size_bytes, url, proxy_url)
+        VALUES ($1,$2,$3,$4,$5,$6,$7)
+        ON CONFLICT DO NOTHING
+    """,
+    "message_update": (
+        "UPDATE discord.message SET content=$1, edited_at=$2, flags=$3, "
+        "mention_everyone=$4, mentions=$5, mention_roles=$6, embeds=$7, "
+        "raw_payload=$8 WHERE message_id=$9"
+    ),
+    "channel_touch": (
+        "UPDATE discord.channel SET last_message_id=$1, last_message_at=$2 "
+        "WHERE channel_id=$3"
+    ),
+    "reaction_insert": """
+        INSERT INTO discord.reaction_event (message_id, user_id, emoji, reaction_action, event_at)
+        VALUES ($1,$2,$3,$4,$5)
+        ON CONFLICT ON CONSTRAINT uniq_reaction_event_msg_user_emoji_act_ts DO NOTHING
+    """,
+    # Streak lookups
+    "streak_get": """
+        SELECT current_streak, longest_streak, last_active_date, streak_started_date,
+               COALESCE(announced_milestones, 0) AS announced_milestones
+        FROM discord.user_streak
+        WHERE user_id = $1
+    """,
+    "streak_upsert": """
+        INSERT INTO discord.user_streak (
+            user_id, current_streak, longest_streak, last_active_date, streak_started_date,
+            announced_milestones, updated_at
+        ) VALUES ($1, $2, $3, $4, $5, $6, now())
+        ON CONFLICT (user_id) DO UPDATE SET
+            current_streak = EXCLUDED.current_streak,
+            longest_streak = EXCLUDED.longest_streak,
+            last_active_date = EXCLUDED.last_active_date,
+            streak_started_date = EXCLUDED.streak_started_date,
+            announced_milestones = EXCLUDED.announced_milestones,
+            updated_at = now()
+    """,
+    "streak_reset": """
+        UPDATE discord.user_streak
+        SET current_streak = 0, streak_started_date = NULL, updated_at = now()
+        WHERE user_id = $1
+    """,
+}
+
+
+def register_statement(name: str, sql: str) -> str:
+    """Add *sql* to the registry under *name* and return the name.
+
+    Modules that own their SQL (such as :mod:`gentlebot.queries.engagement`)
+    register it at import time.  Connections opened before the registration
+    prepare the statement lazily on first use.
+    """
+    existing = STATEMENTS.get(name)
+    if existing is not None and existing != sql:
+        raise ValueError(f"statement {name!r} already registered with different SQL")
+    STATEMENTS[name] = sql
+    return name
+
+
+class Connection(asyncpg.Connection):
+    """Pooled connection carrying its prepared copies of :data:`STATEMENTS`."""
+
+    __slots__ = ("prepared",)
+
+
+async def prepare_statements(conn: asyncpg.Connection) -> None:
+    """Prepare every registered statement on *conn*.
+
+    A statement that fails to prepare (for example because its table has not
+    been migrated yet) is skipped and retried lazily when first executed.
+    """
+    prepared: dict[str, Any] = {}
+    conn.prepared = prepared  # type: ignore[attr-defined]
+    for name, sql in list(STATEMENTS.items()):
+        try:
+            prepared[name] = await conn.prepare(sql)
+        except asyncpg.PostgresError as exc:
+            log.debug("Deferred preparing statement %s: %s", name, exc)
+
+
+async def _run_on(conn: Any, name: str, method: str, args: tuple[Any, ...]) -> Any:
+    sql = STATEMENTS[name]
+    prepared = getattr(conn, "prepared", None)
+    if not isinstance(prepared, dict):
+        # Connections from pools we did not build (and test doubles) run the
+        # registered text directly; asyncpg still caches it per connection.
+        return await getattr(conn, method)(sql, *args)
+
+    stmt = prepared.get(name)
+    if stmt is None:
+        stmt = prepared[name] = await conn.prepare(sql)
+    try:
+        return await _call_statement(stmt, method, args)
+    except asyncpg.InvalidCachedStatementError:
+        # The schema changed underneath the statement; prepare it again.
+        stmt = prepared[name] = await conn.prepare(sql)
+        return await _call_statement(stmt, method, args)
+
+
+async def _call_statement(stmt: Any, method: str, args: tuple[Any, ...]) -> Any:
+    if method == "execute":
+        await stmt.fetch(*args)
+        return stmt.get_statusmsg()
+    return await getattr(stmt, method)(*args)
+
+
+async def _run(target: Any, name: str, method: str, args: tuple[Any, ...]) -> Any:
+    if name not in STATEMENTS:
+        raise KeyError(f"unknown statement {name!r}")
+    if isinstance(target, LanePool):
+        return await target._timed(
+            lambda conn: _run_on(conn, name, method, args),
+            STATEMENTS[name],
+            args,
+            name=name,
+            status=method == "execute",
+        )
+    if isinstance(target, asyncpg.Pool):
+        async with target.acquire() as conn:
+            return await _run_on(conn, name, method, args)
+    return await _run_on(target, name, method, args)
+
+
+async def execute_named(target: Any, name: str, *args: Any) -> str:
+    """Execute the registered statement *name* and return its status tag."""
+    return await _run(target, name, "execute", args)
+
+
+async def fetch_named(target: Any, name: str, *args: Any) -> list[asyncpg.Record]:
+    """Run the registered statement *name* and return all rows."""
+    return await _run(target, name, "fetch", args)
+
+
+async def fetchrow_named(target: Any, name: str, *args: Any) -> asyncpg.Record | None:
+    """Run the registered statement *name* and return the first row."""
+    return await _run(target, name, "fetchrow", args)
+
+
+async def fetchval_named(target: Any, name: str, *args: Any) -> Any:
+    """Run the registered statement *name* and return the first column."""
+    return await _run(target, name, "fetchval", args)
+
+
+# ─── Pool lanes ────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class PoolLane:
+    """Sizing and acquire timeout for one connection pool lane."""
+
+    min_size: int
+    max_size: int
+    acquire_timeout: int
+    prepare: bool = True
+
+    @classmethod
+    def from_env(cls, lane: str, default: "PoolLane") -> "PoolLane":
+        """Apply ``PG_POOL_<LANE>_{MIN,MAX,ACQUIRE_TIMEOUT}`` overrides."""
+        prefix = f"PG_POOL_{lane.upper()}_"
+        return cls(
+            min_size=int_env(f"{prefix}MIN", default.min_size),
+            max_size=int_env(f"{prefix}MAX", default.max_size),
+            acquire_timeout=int_env(f"{prefix}ACQUIRE_TIMEOUT", default.acquire_timeout),
+            prepare=default.prepare,
+        )
 
 
-async def get_pool() -> asyncpg.Pool:
-    """Return a global asyncpg pool, creating it if needed."""
-    global _pool
-    if _pool:
+# Lanes keep slow background work from queueing in front of user-facing
+# queries.  The defaults add up to the previous single pool's 10 connections.
+LANES: dict[str, PoolLane] = {
+    # Slash commands and other queries a user is waiting on
+    "interactive": PoolLane(min_size=1, max_size=4, acquire_timeout=5),
+    # Gateway event archival (messages, reactions, presence, roles)
+    "ingest": PoolLane(min_size=1, max_size=3, acquire_timeout=10),
+    # Startup backfills and scheduled jobs
+    "batch": PoolLane(min_size=0, max_size=2, acquire_timeout=60),
+    # PostgresHandler log shipping
+    "logging": PoolLane(min_size=1, max_size=1, acquire_timeout=10, prepare=False),
+}
+
+DEFAULT_LANE = "interactive"
+# Lane whose queries are the log records themselves; it never logs about them
+LOGGING_LANE = "logging"
+
+
+# Acquires that wait longer than this are logged so starved lanes show up.
+SLOW_ACQUIRE_MS = 500
+
+
+@dataclass
+class LaneStats:
+    """Running acquire metrics for one pool lane."""
+
+    max_size: int
+    acquires: int = 0
+    timeouts: int = 0
+    in_use: int = 0
+    peak_in_use: int = 0
+    wait_total_ms: float = 0.0
+    wait_max_ms: float = 0.0
+
+    @property
+    def saturation(self) -> float:
+        """Fraction of the lane's connections currently checked out."""
+        return self.in_use / self.max_size if self.max_size else 0.0
+
+    @property
+    def wait_avg_ms(self) -> float:
+        return self.wait_total_ms / self.acquires if self.acquires else 0.0
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "max_size": self.max_size,
+            "acquires": self.acquires,
+            "timeouts": self.timeouts,
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "saturation": round(self.saturation, 3),
+            "wait_avg_ms": round(self.wait_avg_ms, 2),
+            "wait_max_ms": round(self.wait_max_ms, 2),
+        }
+
+
+class _LaneAcquire:
+    """Async context manager that times a lane acquire and tracks usage."""
+
+    def __init__(self, lane_pool: "LanePool", timeout: float) -> None:
+        self._lane_pool = lane_pool
+        self._timeout = timeout
+        self._ctx: Any = None
+        self.wait_ms = 0.0
+
+    async def __aenter__(self) -> Any:
+        lane_pool = self._lane_pool
+        stats = lane_pool.stats
+        self._ctx = lane_pool._pool.acquire(timeout=self._timeout)
+        start = time.perf_counter()
+        try:
+            conn = await self._ctx.__aenter__()
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            log.warning(
+                "Pool lane %s: acquire timed out after %ss (in_use=%d/%d)",
+                lane_pool.lane,
+                self._timeout,
+                stats.in_use,
+                stats.max_size,
+            )
+            raise
+        wait_ms = self.wait_ms = (time.perf_counter() - start) * 1000
+        stats.acquires += 1
+        stats.wait_total_ms += wait_ms
+        stats.wait_max_ms = max(stats.wait_max_ms, wait_ms)
+        stats.in_use += 1
+        stats.peak_in_use = max(stats.peak_in_use, stats.in_use)
+        # Logging the logging lane's own waits would queue more inserts behind it.
+        if wait_ms >= SLOW_ACQUIRE_MS and lane_pool.lane != LOGGING_LANE:
+            log.info(
+                "Pool lane %s: slow acquire wait_ms=%d in_use=%d/%d",
+                lane_pool.lane,
+                int(wait_ms),
+                stats.in_use,
+                stats.max_size,
+            )
+        return conn
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self._lane_pool.stats.in_use -= 1
+        await self._ctx.__aexit__(*exc)
+
+
+class LanePool:
+    """An asyncpg pool bound to its lane's acquire timeout.
+
+    Exposes the subset of the :class:`asyncpg.Pool` API used across the bot;
+    anything else is forwarded to the underlying pool.  Every acquire is
+    timed and counted in :attr:`stats`, and every query issued through the
+    pool methods is recorded in :data:`gentlebot.query_stats.query_stats`
+    under :attr:`source` (see :meth:`tagged`), or the lane name when the
+    pool is untagged.  Queries run directly on an acquired connection only
+    count towards the lane's acquire metrics.
+    """
+
+    def __init__(
+        self,
+        lane: str,
+        pool: asyncpg.Pool,
+        acquire_timeout: float,
+        max_size: int = 0,
+        source: str | None = None,
+    ) -> None:
+        self.lane = lane
+        self.acquire_timeout = acquire_timeout
+        self.stats = LaneStats(max_size=max_size)
+        self.source = source
+        self._pool = pool
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool, name)
+
+    def tagged(self, source: str) -> "LanePool":
+        """Return a view of this lane that attributes its queries to *source*."""
+        view = LanePool(self.lane, self._pool, self.acquire_timeout, source=source)
+        view.stats = self.stats
+        return view
+
+    def acquire(self, *, timeout: float | None = None) -> _LaneAcquire:
+        """Acquire a connection, waiting at most the lane's acquire timeout."""
+        return _LaneAcquire(self, self.acquire_timeout if timeout is None else timeout)
+
+    async def _timed(
+        self,
+        call: Callable[[Any], Awaitable[Any]],
+        sql: str,
+        args: Sequence[Any],
+        name: str | None = None,
+        status: bool = False,
+    ) -> Any:
+        acquire = self.acquire()
+        async with acquire as conn:
+            start = time.perf_counter()
+            ok = False
+            result = None
+            try:
+                result = await call(conn)
+                ok = True
+                return result
+            finally:
+                query_stats.record(
+                    sql,
+                    args,
+                    source=self.source or f"{self.lane} lane",
+                    elapsed_ms=(time.perf_counter() - start) * 1000,
+                    rows=row_count(result, status=status),
+                    wait_ms=acquire.wait_ms,
+                    ok=ok,
+                    name=name,
+                    # Log inserts run on this lane; warning about a slow one
+                    # would queue another insert behind it.
+                    warn=self.lane != LOGGING_LANE,
+                )
+
+    async def execute(self, query: str, *args: Any, timeout: float | None = None) -> str:
+        return await self._timed(
+            lambda conn: conn.execute(query, *args, timeout=timeout),
+            query,
+            args,
+            status=True,
+        )
+
+    async def executemany(
+        self, command: str, args: Any, *, timeout: float | None = None
+    ) -> None:
+        return await self._timed(
+            lambda conn: conn.executemany(command, args, timeout=timeout),
+            command,
+            (),
+        )
+
+    async def fetch(self, query: str, *args: Any, timeout: float | None = None) -> list[Any]:
+        return await self._timed(
+            lambda conn: conn.fetch(query, *args, timeout=timeout), query, args
+        )
+
+    async def fetchrow(self, query: str, *args: Any, timeout: float | None = None) -> Any:
+        return await self._timed(
+            lambda conn: conn.fetchrow(query, *args, timeout=timeout), query, args
+        )
+
+    async def fetchval(
+        self, query: str, *args: Any, column: int = 0, timeout: float | None = None
+    ) -> Any:
+        return await self._timed(
+            lambda conn: conn.fetchval(query, *args, column=column, timeout=timeout),
+            query,
+            args,
+        )
+
+    def is_closing(self) -> bool:
+        return self._pool.is_closing()
+
+    async def close(self) -> None:
+        await self._pool.close()
+
+
+_pools: dict[str, Any] = {}
+
+
+async def get_pool(lane: str = DEFAULT_LANE) -> LanePool:
+    """Return the shared pool for *lane*, creating it if needed."""
+    if lane not in LANES:
+        raise ValueError(f"unknown pool lane {lane!r}")
+    pool = _pools.get(lane)
+    if pool:
         # ``asyncpg`` marks pools as closing/closed after :meth:`close` is awaited.
         # Some cogs previously called ``close()`` on the shared pool which left the
         # cached instance pointing at a closed pool.  Guard against that situation
         # so we can transparently rebuild the pool when needed.
         try:
-            if not _pool.is_closing():
-                return _pool
+            if not pool.is_closing():
+                return pool
         except AttributeError:  # pragma: no cover - defensive for unexpected pool
-            return _pool
-        _pool = None
+            return pool
+        _pools.pop(lane, None)
     url = build_db_url()
     if not url:
         raise RuntimeError("PG_DSN is missing")
     url = url.replace("postgresql+asyncpg://", "postgresql://")
+    config = PoolLane.from_env(lane, LANES[lane])
 
     async def _init(conn: asyncpg.Connection) -> None:
         await conn.execute("SET search_path=discord,public")
+        if config.prepare:
+            await prepare_statements(conn)
 
-    _pool = await asyncpg.create_pool(
+    raw = await asyncpg.create_pool(
         url,
         init=_init,
-        min_size=2,
-        max_size=10,
+        min_size=config.min_size,
+        max_size=config.max_size,
         command_timeout=30,
-        timeout=10,  # connection acquisition timeout
+        timeout=10,  # connection establishment timeout
+        connection_class=Connection,
+    )
+    # Pool-like objects that are not asyncpg pools (test doubles) are used as-is.
+    if isinstance(raw, asyncpg.Pool):
+        pool = LanePool(lane, raw, config.acquire_timeout, max_size=config.max_size)
+    else:
+        pool = raw
+    _pools[lane] = pool
+    log.info(
+        "Created %s pool lane (min=%d max=%d acquire_timeout=%ss)",
+        lane,
+        config.min_size,
+        config.max_size,
+        config.acquire_timeout,
     )
-    return _pool
+    return pool
+
+
+def pool_stats() -> dict[str, dict[str, float]]:
+    """Return acquire metrics for every lane created so far."""
+    return {
+        lane: pool.stats.snapshot()
+        for lane, pool in _pools.items()
+        if isinstance(pool, LanePool)
+    }
 
 
 async def close_pool() -> None:
-    """Close the global pool if it exists."""
-    global _pool
-    if _pool:
-        await _pool.close()
-        _pool = None
+    """Close every pool lane that has been created."""
+    pools = list(_pools.values())
+    _pools.clear()
+    for pool in pools:
+        await pool.close()
@@ -0,0 +1,324 @@
+"""Shared Formula 1 data for SportsCog and F1ThreadCog.
+
+Both cogs read the same season calendar, so :class:`F1Data` fetches it once
+through the shared HTTP client and keeps the parsed sessions in memory.
+Calendar bodies also persist in the HTTP response cache, so a restart
+starts warm.  Standings and Wikipedia track-map URLs are memoized the same
+way.  An expired memo is still returned immediately while one background
+task refreshes it, so ``/nextf1`` never waits on the network once the
+calendar has been loaded.
+
+Example::
+
+    f1 = get_f1_data()
+    sessions = await f1.sessions()
+    drivers, constructors = await f1.standings()
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Hashable
+
+import pytz
+from bs4 import BeautifulSoup
+from dateutil import parser
+
+from .infra.http import HttpClient, get_http_client
+from .infra.http_cache import CachePolicy
+from .infra.singleflight import SingleFlight
+
+log = logging.getLogger(f"gentlebot.{__name__}")
+
+# Overridable with F1_SCHEDULE_URL
+CALENDAR_URL = "https://f1calendar.com/api/calendar"
+STANDINGS_URL = "https://www.formula1.com/en/results/{year}/{table}"
+WIKIPEDIA_URL = "https://en.wikipedia.org/wiki/{page}"
+# formula1.com and Wikipedia serve trimmed pages to unknown agents
+BROWSER_HEADERS = {"User-Agent": "Mozilla/5.0"}
+# Pacific time for schedule comparison
+PST_TZ = pytz.timezone("America/Los_Angeles")
+
+# HTTP cache policies: the calendar changes a few times a season, standings
+# after each session and circuit pages almost never.
+CALENDAR_CACHE = CachePolicy(ttl=6 * 3600, stale=7 * 86400)
+STANDINGS_CACHE = CachePolicy(ttl=15 * 60, stale=86400)
+TRACK_MAP_CACHE = CachePolicy(ttl=7 * 86400, stale=30 * 86400)
+# Parsed results are reused from memory this long before a background refresh
+CALENDAR_MEMO_SECONDS = 15 * 60
+STANDINGS_MEMO_SECONDS = 5 * 60
+
+# Grand Prix name -> ISO country code for thread flags
+GP_COUNTRY_ISO = {
+    "Australian": "AU",
+    "Chinese": "CN",
+    "Japanese": "JP",
+    "Bahrain": "BH",
+    "Saudi Arabian": "SA",
+    "Miami": "US",
+    "Emilia Romagna": "IT",
+    "Monaco": "MC",
+    "Spanish": "ES",
+    "Canadian": "CA",
+    "Austrian": "AT",
+    "British": "GB",
+    "Belgian": "BE",
+    "Hungarian": "HU",
+    "Dutch": "NL",
+    "Italian": "IT",
+    "Azerbaijan": "AZ",
+    "Singapore": "SG",
+    "United States": "US",
+    "Mexico City": "MX",
+    "Brazilian": "BR",
+    "Las Vegas": "US",
+    "Qatar": "QA",
+    "Abu Dhabi": "AE",
+}
+
+_timezone_finder: Any = None
+
+
+def _race_timezone(lat: float | None, lon: float | None) -> Any:
+    global _timezone_finder
+    if lat is None or lon is None:
+        return pytz.UTC
+    if _timezone_finder is None:
+        from timezonefinder import TimezoneFinder
+
+        _timezone_finder = TimezoneFinder()
+    name = _timezone_finder.timezone_at(lng=lon, lat=lat)
+    return pytz.timezone(name) if name else pytz.UTC
+
+
+def parse_sessions(data: dict) -> list[dict]:
+    """Return every calendar session with UTC, Pacific and track-local times.
+
+    Timezone lookups are CPU-bound; call this off the event loop.
+    """
+    sessions: list[dict] = []
+    for race in data.get("races", []):
+        race_tz = _race_timezone(race.get("latitude"), race.get("longitude"))
+        for session_name, iso in race.get("sessions", {}).items():
+            dt_utc = parser.isoparse(iso).astimezone(pytz.UTC)
+            sessions.append({
+                "round": race.get("name"),
+                "slug": race.get("slug", ""),
+                "session": session_name,
+                "utc": dt_utc,
+                "pst": dt_utc.astimezone(PST_TZ),
+                "local": dt_utc.astimezone(race_tz),
+                "location": race.get("location"),
+                "round_num": race.get("round"),
+            })
+    return sorted(sessions, key=lambda s: s["utc"])
+
+
+def parse_thread_sessions(data: dict) -> list[dict]:
+    """Return qualifying and race sessions in the ``f1_session`` row shape."""
+    sessions: list[dict] = []
+    for race in data.get("races", []):
+        gp_name_full = race.get("name", "")
+        if not gp_name_full:
+            continue
+        gp_name = gp_name_full.replace(" Grand Prix", "")
+        for name, iso in race.get("sessions", {}).items():
+            if name not in {"Qualifying", "Grand Prix"}:
+                continue
+            dt = parser.isoparse(iso).astimezone(timezone.utc)
+            sessions.append({
+                "country_iso": GP_COUNTRY_ISO.get(gp_name, ""),
+                "year": dt.year,
+                "gp_name": gp_name,
+                "session": "QUALI" if name == "Qualifying" else "RACE",
+                "starts_at": dt,
+            })
+    return sessions
+
+
+def parse_standings(drivers_html: str, teams_html: str) -> tuple[list[dict], list[dict]]:
+    """Return the top 10 drivers and constructors from formula1.com results pages."""
+    soup_d = BeautifulSoup(drivers_html, 'html.parser')
+    table_d = soup_d.find('table', class_='f1-table')
+    drivers: list[dict] = []
+    if table_d and table_d.tbody:
+        for row in table_d.tbody.find_all('tr')[:10]:
+            cells = row.find_all('td')
+            link = cells[1].find('a')
+            name_raw = link.get_text(' ', strip=True) if link else cells[1].get_text(strip=True)
+            parts = name_raw.split()
+            if parts and len(parts[-1]) == 3 and parts[-1].isalpha():
+                parts = parts[:-1]
+            drivers.append({
+                'pos': cells[0].get_text(strip=True),
+                'name': ' '.join(parts),
+                'pts': cells[-1].get_text(strip=True),
+            })
+    soup_t = BeautifulSoup(teams_html, 'html.parser')
+    table_t = soup_t.find('table', class_='f1-table-with-data') or soup_t.find('table', class_='f1-table')
+    constructors: list[dict] = []
+    if table_t and table_t.tbody:
+        for row in table_t.tbody.find_all('tr')[:10]:
+            cells = row.find_all('td')
+            link = cells[1].find('a')
+            constructors.append({
+                'pos': cells[0].get_text(strip=True),
+                'team': link.get_text(' ', strip=True) if link else cells[1].get_text(strip=True),
+                'pts': cells[2].get_text(strip=True),
+            })
+    return drivers, constructors
+
+
+def parse_track_map(html: str) -> str | None:
+    """Return the circuit map image URL from a Wikipedia infobox."""
+    cell = BeautifulSoup(html, 'html.parser').find('td', class_='infobox-image')
+    img = cell.find('img') if cell else None
+    if img is None or not img.has_attr('src'):
+        return None
+    src = img['src']
+    return 'https:' + src if src.startswith('//') else src
+
+
+@dataclass
+class _Memo:
+    value: Any
+    loaded_at: float
+
+
+class F1Data:
+    """Calendar, standings and track maps, memoized and fetched without blocking."""
+
+    def __init__(self, http: HttpClient | None = None) -> None:
+        self.http = http or get_http_client()
+        self._memo: dict[Hashable, _Memo] = {}
+        self._flights = SingleFlight("f1_data")
+        self._refreshing: dict[Hashable, asyncio.Task] = {}
+
+    async def _memoized(
+        self, key: Hashable, max_age: float, load: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the memo for *key*, refreshing it in the background once expired."""
+        memo = self._memo.get(key)
+        if memo is None:
+            return await self._load(key, load)
+        if asyncio.get_running_loop().time() - memo.loaded_at >= max_age:
+            self._refresh_soon(key, load)
+        return memo.value
+
+    async def _load(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        value = await self._flights.do(key, load)
+        self._memo[key] = _Memo(value, asyncio.get_running_loop().time())
+        return value
+
+    def _refresh_soon(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> None:
+        task = self._refreshing.get(key)
+        if task is not None and not task.done():
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._load(key, load)
+            except Exception as exc:
+                log.warning("Refreshing F1 %s failed: %s", key, exc)
+
+        task = asyncio.create_task(refresh())
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def calendar(self, season: int | None = None) -> dict:
+        """Return the raw f1calendar JSON for *season* (default: this year)."""
+        season = season or datetime.now(timezone.utc).year
+
+        # An F1_SCHEDULE_URL override is fetched exactly as configured
+        url = os.getenv("F1_SCHEDULE_URL")
+        params = None if url else {"season": season}
+
+        async def fetch() -> dict:
+            resp = await self.http.get(
+                url or CALENDAR_URL,
+                params=params,
+                headers=BROWSER_HEADERS,
+                cache=CALENDAR_CACHE,
+            )
+            resp.raise_for_status()
+            return resp.json()
+
+        # Both session shapes load at once on a cold start; share the request.
+        return await self._flights.do(("calendar", season), fetch)
+
+    async def sessions(self, season: int | None = None) -> list[dict]:
+        """Return every session of *season*, sorted by UTC start."""
+        season = season or datetime.now(timezone.utc).year
+
+        async def load() -> list[dict]:
+            return await asyncio.to_thread(parse_sessions, await self.calendar(season))
+
+        return await self._memoized(("sessions", season), CALENDAR_MEMO_SECONDS, load)
+
+    async def thread_sessions(self, season: int | None = None) -> list[dict]:
+        """Return qualifying and race sessions of *season* for thread scheduling."""
+        season = season or datetime.now(timezone.utc).year
+
+        async def load() -> list[dict]:
+            return parse_thread_sessions(await self.calendar(season))
+
+        return await self._memoized(("thread_sessions", season), CALENDAR_MEMO_SECONDS, load)
+
+    async def standings(self) -> tuple[list[dict], list[dict]]:
+        """Return the top 10 driver and constructor standings."""
+        year = datetime.now(timezone.utc).year
+
+        async def load() -> tuple[list[dict], list[dict]]:
+            resp_d, resp_t = await asyncio.gather(*(
+                self.http.get(
+                    STANDINGS_URL.format(year=year, table=table),
+                    headers=BROWSER_HEADERS,
+                    cache=STANDINGS_CACHE,
+                )
+                for table in ("drivers", "team")
+            ))
+            resp_d.raise_for_status()
+            resp_t.raise_for_status()
+            return await asyncio.to_thread(parse_standings, resp_d.text, resp_t.text)
+
+        return await self._memoized(("standings", year), STANDINGS_MEMO_SECONDS, load)
+
+    async def track_map(self, slug: str) -> str | None:
+        """Return the circuit map image URL for the race *slug*, if Wikipedia has one."""
+        if not slug:
+            return None
+        page = slug.replace('-', ' ').title().replace(' ', '_')
+
+        async def load() -> str | None:
+            resp = await self.http.get(
+                WIKIPEDIA_URL.format(page=page), headers=BROWSER_HEADERS, cache=TRACK_MAP_CACHE
+            )
+            resp.raise_for_status()
+            return await asyncio.to_thread(parse_track_map, resp.text)
+
+        return await self._memoized(("track_map", slug), float("inf"), load)
+
+    async def wait_idle(self) -> None:
+        """Wait for background refreshes to finish."""
+        while self._refreshing:
+            await asyncio.gather(*list(self._refreshing.values()), return_exceptions=True)
+
+    def close(self) -> None:
+        """Cancel background refreshes."""
+        for task in self._refreshing.values():
+            task.cancel()
+        self._refreshing.clear()
+
+
+_f1_data: F1Data | None = None
+
+
+def get_f1_data() -> F1Data:
+    """Return the process-wide :class:`F1Data`."""
+    global _f1_data
+    if _f1_data is None:
+        _f1_data = F1Data()
+    return _f1_data
@@ -1,4 +1,5 @@
 """Infrastructure utilities for Gentlebot."""
+from .batching import MicroBatcher
 from .cog_base import PoolAwareCog, log_errors, require_pool
 from .github_issues import GitHubIssueConfig, get_github_issue_config
 from .config import (
@@ -16,9 +17,21 @@ from .logging import (
     get_logger,
     structured_log,
 )
+from .http import (
+    HostPolicy,
+    HttpClient,
+    HttpResponse,
+    HTTPStatusError,
+    close_http_client,
+    get_http_client,
+)
+from .http_cache import CachePolicy, HttpCache
 from .idempotent import daily_key, idempotent_task, monthly_key, weekly_key
+from .loop_watchdog import LoopWatchdog, get_loop_watchdog, install_loop_watchdog
+from .progressive_reply import ProgressiveReply
 from .quotas import Limit, QuotaGuard, RateLimited
 from .retries import async_retry, call_with_backoff, with_retry
+from .singleflight import SingleFlight
 from .state_cache import StateCache, get_state_cache
 from .transactions import transaction
 
@@ -38,16 +51,31 @@ __all__ = [
     "get_config",
     "reset_config",
     "set_config",
+    # HTTP
+    "CachePolicy",
+    "HostPolicy",
+    "HttpClient",
+    "HttpResponse",
+    "HTTPStatusError",
+    "HttpCache",
+    "close_http_client",
+    "get_http_client",
     # Idempotency
     "daily_key",
     "idempotent_task",
     "monthly_key",
     "weekly_key",
+    # Loop watchdog
+    "LoopWatchdog",
+    "get_loop_watchdog",
+    "install_loop_watchdog",
     # Logging
     "LogContext",
     "get_cog_logger",
     "get_logger",
     "structured_log",
+    # Progressive replies
+    "ProgressiveReply",
     # Quotas
     "Limit",
     "QuotaGuard",
@@ -56,6 +84,9 @@ __all__ = [
     "async_retry",
     "call_with_backoff",
     "with_retry",
+    # Request coalescing
+    "MicroBatcher",
+    "SingleFlight",
     # State Cache
     "StateCache",
     "get_state_cache",
@@ -0,0 +1,109 @@
+"""Micro-batching of independent async requests.
+
+Callers submit one item at a time and await their own result, while the
+handler sees lists of items.  A batch is flushed once it reaches
+``max_size`` items or ``max_delay`` seconds after its first item arrived,
+whichever comes first, so a quiet channel waits at most ``max_delay``.
+
+Example::
+
+    async def classify(texts: list[str]) -> list[str | None]:
+        ...  # one LLM call for the whole list
+
+    batcher = MicroBatcher(classify, max_size=10, max_delay=2.0)
+    title = await batcher.submit("Just finished Hyperion")
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, TypeVar
+
+log = logging.getLogger(f"gentlebot.{__name__}")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """Collect submitted items and resolve them with one handler call per batch.
+
+    Args:
+        handler: Coroutine mapping a list of items to a list of results in
+            the same order.  If it raises, every caller in the batch gets the
+            exception.
+        max_size: Flush as soon as this many items are waiting.
+        max_delay: Flush this many seconds after the first waiting item.
+        name: Label used in log messages.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[T]], Awaitable[list[R]]],
+        max_size: int = 10,
+        max_delay: float = 2.0,
+        name: str = "batch",
+    ) -> None:
+        self.handler = handler
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.name = name
+        self.batches = 0
+        self.items = 0
+        self._pending: list[tuple[T, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._running: set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        """Queue *item* and wait for its result."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Anything pending belonged to a loop that is gone.
+            self._pending = []
+            self._timer = None
+            self._loop = loop
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    async def flush(self) -> None:
+        """Flush waiting items now and wait for in-flight batches."""
+        self._flush()
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        batch = [(item, fut) for item, fut in batch if not fut.done()]
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: list[tuple[T, asyncio.Future]]) -> None:
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = await self.handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"{self.name}: handler returned {len(results)} results "
+                    f"for {len(batch)} items"
+                )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
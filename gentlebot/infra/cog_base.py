@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any, Callable, TypeVar
 import asyncpg
 from discord.ext import commands
 
-from ..db import get_pool
+from ..db import DEFAULT_LANE, LanePool, get_pool
 
 if TYPE_CHECKING:
     from discord.ext.commands import Bot
@@ -25,6 +25,12 @@ class PoolAwareCog(commands.Cog):
     initialized during ``cog_load()`` and cleared during ``cog_unload()``.
     The pool is shared across all cogs via the global ``get_pool()`` helper.
 
+    Set ``pool_lane`` to pick which connection lane the cog draws from
+    (``"interactive"``, ``"ingest"``, ``"batch"`` or ``"logging"``); cogs
+    serving slash commands keep the default interactive lane.  Queries
+    issued through ``self.pool`` are attributed to the cog in
+    :mod:`gentlebot.query_stats`.
+
     If the database URL is missing, the cog will log a warning and set
     ``self.pool`` to ``None``. Subclasses can check this to disable
     database-dependent functionality gracefully.
@@ -39,6 +45,7 @@ class PoolAwareCog(commands.Cog):
     """
 
     pool: asyncpg.Pool | None = None
+    pool_lane: str = DEFAULT_LANE
 
     def __init__(self, bot: "Bot") -> None:
         self.bot = bot
@@ -51,13 +58,18 @@ class PoolAwareCog(commands.Cog):
         to ensure the pool is properly initialized.
         """
         try:
-            self.pool = await get_pool()
+            pool = await get_pool(lane=self.pool_lane)
         except RuntimeError:
             self.pool = None
             log.warning(
                 "%s: database pool unavailable (PG_DSN missing)",
                 self.__class__.__name__,
             )
+            return
+        if isinstance(pool, LanePool):
+            # Attribute this cog's queries to it in the query metrics.
+            pool = pool.tagged(self.__class__.__name__)
+        self.pool = pool
 
     async def cog_unload(self) -> None:
         """Clear the pool reference.
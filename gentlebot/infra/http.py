@@ -6,28 +6,54 @@ This module provides centralized HTTP client configuration with:
 - Consistent timeout and User-Agent settings
 - Both synchronous (requests) and asynchronous (aiohttp) clients
 
+Cogs should use the shared :class:`HttpClient`: one long-lived aiohttp
+session owned by the bot (closed on shutdown), with keep-alive, a DNS
+cache, per-host connection limits and a per-host timeout/retry
+:class:`HostPolicy`.  Calls run on the event loop instead of an executor
+thread and reuse warm TLS connections.  Responses are read in full and
+returned as :class:`HttpResponse`, which mirrors the parts of
+``requests.Response`` the cogs use.  Every request is counted in
+per-host :class:`HostStats`.  GETs given a :class:`CachePolicy` are
+served from the response cache in :mod:`gentlebot.infra.http_cache`, with
+conditional revalidation and stale-while-revalidate.
+
 Usage:
+    # Asynchronous requests (preferred)
+    from gentlebot.infra.http import get_http_client
+    resp = await get_http_client().get("https://api.example.com/data", timeout=5)
+    resp.raise_for_status()
+    data = resp.json()
+
     # Synchronous requests
     from gentlebot.infra.http import get_sync_session
     session = get_sync_session()
     response = session.get("https://api.example.com/data")
-
-    # Asynchronous requests
-    from gentlebot.infra.http import get_async_session
-    async with get_async_session() as session:
-        async with session.get("https://api.example.com/data") as response:
-            data = await response.json()
 """
 from __future__ import annotations
 
+import asyncio
+import json as jsonlib
 import logging
+import random
+import time
+from collections import Counter, deque
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Mapping, Optional
+from urllib.parse import urlsplit
 
 import requests
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from urllib3.util.retry import Retry
 
+from .http_cache import CacheEntry, CachePolicy, HttpCache, cache_key
+from ..metrics import percentile
+from .logging import structured_log
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import aiohttp
+
 log = logging.getLogger(f"gentlebot.{__name__}")
 
 # Default configuration
@@ -37,6 +63,16 @@ DEFAULT_BACKOFF_FACTOR = 1.0
 DEFAULT_STATUS_FORCELIST = [500, 502, 503, 504]
 DEFAULT_USER_AGENT = "gentlebot/1.0"
 
+# Shared async client connection settings
+MAX_CONNECTIONS = 100
+DEFAULT_LIMIT_PER_HOST = 8
+DNS_CACHE_SECONDS = 300
+KEEPALIVE_SECONDS = 30
+# Upper bound on a single retry delay (seconds)
+MAX_BACKOFF = 8.0
+# Latency samples kept per host for percentiles
+STATS_WINDOW = 200
+
 # Shared session instance (thread-safe for requests)
 _sync_session: Optional[requests.Session] = None
 
@@ -139,39 +175,19 @@ def create_sync_session(
 async def get_async_session(
     timeout: int = DEFAULT_TIMEOUT,
 ) -> AsyncIterator["aiohttp.ClientSession"]:
-    """Get an async HTTP session for use within an async context.
-
-    Unlike the sync session, async sessions should be created per-context
-    due to event loop requirements. The session is automatically closed
-    when the context exits.
+    """Yield the shared aiohttp session for use within an async context.
 
-    Args:
-        timeout: Total timeout for requests (seconds)
-
-    Yields:
-        An aiohttp.ClientSession instance
+    The session belongs to :func:`get_http_client` and stays open when the
+    context exits, so connections are reused across callers.  Prefer
+    :meth:`HttpClient.get`, which also applies host policies and metrics;
+    pass ``timeout`` per request when using the raw session.
 
     Example:
         >>> async with get_async_session() as session:
         ...     async with session.get("https://api.example.com") as resp:
         ...         data = await resp.json()
     """
-    # Import here to avoid requiring aiohttp if only sync is used
-    import aiohttp
-
-    timeout_config = aiohttp.ClientTimeout(total=timeout)
-
-    connector = aiohttp.TCPConnector(
-        limit=20,  # Max simultaneous connections
-        limit_per_host=10,  # Max connections per host
-    )
-
-    async with aiohttp.ClientSession(
-        timeout=timeout_config,
-        connector=connector,
-        headers={"User-Agent": DEFAULT_USER_AGENT},
-    ) as session:
-        yield session
+    yield await get_http_client().session()
 
 
 def close_sessions() -> None:
@@ -199,3 +215,364 @@ def reset_sessions() -> None:
     """
     global _sync_session
     _sync_session = None
+
+
+# ---------------------------------------------------------------------------
+# Shared async client
+
+
+class HTTPStatusError(Exception):
+    """Raised by :meth:`HttpResponse.raise_for_status` for 4xx/5xx responses."""
+
+    def __init__(self, response: "HttpResponse") -> None:
+        super().__init__(f"HTTP {response.status_code} for {response.url}")
+        self.response = response
+
+
+@dataclass
+class HttpResponse:
+    """A fully read HTTP response."""
+
+    url: str
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+    encoding: str = "utf-8"
+    # Served from the response cache rather than the network
+    cached: bool = False
+
+    def __post_init__(self) -> None:
+        # Header lookups are case-insensitive, as they were under requests.
+        self.headers = CaseInsensitiveDict(self.headers)
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return jsonlib.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise HTTPStatusError(self)
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    """Timeout, retry and connection settings for one host."""
+
+    timeout: float = DEFAULT_TIMEOUT
+    retries: int = DEFAULT_RETRIES
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR
+    status_forcelist: frozenset[int] = frozenset(DEFAULT_STATUS_FORCELIST)
+    retry_methods: frozenset[str] = frozenset({"GET", "HEAD"})
+    # Concurrent requests to the host
+    limit: int = DEFAULT_LIMIT_PER_HOST
+
+
+# Hosts whose APIs are slow or fragile enough to need their own settings;
+# anything else uses the default policy.
+DEFAULT_POLICIES: dict[str, HostPolicy] = {
+    "statsapi.mlb.com": HostPolicy(timeout=30),
+    "site.api.espn.com": HostPolicy(timeout=30),
+    "sports.core.api.espn.com": HostPolicy(timeout=30, limit=16),
+    "api.giphy.com": HostPolicy(timeout=8, retries=1),
+    "openlibrary.org": HostPolicy(timeout=10),
+}
+
+
+@dataclass
+class HostStats:
+    """Request counters and recent latencies for one host."""
+
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    statuses: Counter[int] = field(default_factory=Counter)
+    # Response cache outcomes: hit, stale, revalidated, miss, stale_error
+    cache: Counter[str] = field(default_factory=Counter)
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=STATS_WINDOW))
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the *pct* latency percentile in ms, or ``None`` without samples."""
+        return percentile(self.latencies, pct)
+
+
+class HttpClient:
+    """Long-lived aiohttp client shared by every cog.
+
+    The underlying session is created on first use inside the running loop
+    and closed by :meth:`close` when the bot shuts down.
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[str, HostPolicy] | None = None,
+        default_policy: HostPolicy | None = None,
+        user_agent: str = DEFAULT_USER_AGENT,
+        cache: HttpCache | None = None,
+    ) -> None:
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self.default_policy = default_policy or HostPolicy()
+        self.user_agent = user_agent
+        self.cache = cache or HttpCache()
+        self._revalidating: dict[str, asyncio.Task] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._gates: dict[str, asyncio.Semaphore] = {}
+        self._stats: dict[str, HostStats] = {}
+
+    async def session(self) -> "aiohttp.ClientSession":
+        """Return the shared session, opening it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Sessions and semaphores are bound to the loop that created them.
+            self._session = None
+            self._gates.clear()
+            self._loop = loop
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit=MAX_CONNECTIONS,
+                ttl_dns_cache=DNS_CACHE_SECONDS,
+                keepalive_timeout=KEEPALIVE_SECONDS,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"User-Agent": self.user_agent},
+                timeout=aiohttp.ClientTimeout(total=self.default_policy.timeout),
+            )
+            log.debug("Opened shared async HTTP session")
+        return self._session
+
+    def policy(self, host: str) -> HostPolicy:
+        """Return the policy for *host*, matching parent domains too."""
+        parts = host.split(".")
+        for i in range(len(parts) - 1):
+            policy = self.policies.get(".".join(parts[i:]))
+            if policy is not None:
+                return policy
+        return self.default_policy
+
+    def stats(self, host: str) -> HostStats:
+        stats = self._stats.get(host)
+        if stats is None:
+            stats = self._stats[host] = HostStats()
+        return stats
+
+    def snapshot(self) -> list[tuple[str, HostStats]]:
+        """Return ``(host, stats)`` for every host contacted so far."""
+        return sorted(self._stats.items())
+
+    def _gate(self, host: str, policy: HostPolicy) -> asyncio.Semaphore:
+        gate = self._gates.get(host)
+        if gate is None:
+            gate = self._gates[host] = asyncio.Semaphore(policy.limit)
+        return gate
+
+    async def _send(
+        self, method: str, url: str, timeout: float, **kwargs: Any
+    ) -> HttpResponse:
+        import aiohttp
+
+        session = await self.session()
+        async with session.request(
+            method, url, timeout=aiohttp.ClientTimeout(total=timeout), **kwargs
+        ) as resp:
+            content = await resp.read()
+            return HttpResponse(
+                url=str(resp.url),
+                status_code=resp.status,
+                headers=resp.headers,
+                content=content,
+                encoding=resp.charset or "utf-8",
+            )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> HttpResponse:
+        """Send a request with the host's policy and return the read response.
+
+        Connection errors, timeouts and ``status_forcelist`` responses are
+        retried with exponential backoff for ``retry_methods``.  The last
+        response is returned whatever its status; call
+        :meth:`HttpResponse.raise_for_status` to turn errors into exceptions.
+        """
+        import aiohttp
+
+        await self.session()
+        host = urlsplit(url).hostname or ""
+        policy = self.policy(host)
+        stats = self.stats(host)
+        method = method.upper()
+        retries = policy.retries if method in policy.retry_methods else 0
+        start = time.monotonic()
+        resp: HttpResponse | None = None
+        attempt = 0
+        async with self._gate(host, policy):
+            while True:
+                stats.requests += 1
+                try:
+                    resp = await self._send(
+                        method,
+                        url,
+                        timeout or policy.timeout,
+                        params=params,
+                        headers=headers,
+                        **kwargs,
+                    )
+                    error: BaseException | None = None
+                    stats.statuses[resp.status_code] += 1
+                except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                    error = exc
+                    stats.errors += 1
+                retryable = error is not None or resp.status_code in policy.status_forcelist
+                if not retryable or attempt >= retries:
+                    break
+                attempt += 1
+                stats.retries += 1
+                delay = min(MAX_BACKOFF, policy.backoff_factor * 2 ** (attempt - 1))
+                await asyncio.sleep(delay + random.uniform(0, 0.1))
+        elapsed_ms = (time.monotonic() - start) * 1000
+        structured_log(
+            log,
+            logging.DEBUG,
+            "HTTP request",
+            method=method,
+            host=host,
+            status=resp.status_code if error is None else type(error).__name__,
+            attempts=attempt + 1,
+            ms=round(elapsed_ms),
+        )
+        if error is not None:
+            raise error
+        stats.latencies.append(elapsed_ms)
+        return resp
+
+    async def get(
+        self, url: str, *, cache: CachePolicy | None = None, **kwargs: Any
+    ) -> HttpResponse:
+        """GET *url*, through the response cache when *cache* is given."""
+        if cache is None:
+            return await self.request("GET", url, **kwargs)
+        key = cache_key(url, kwargs.get("params"))
+        stats = self.stats(urlsplit(url).hostname or "")
+        entry = await self.cache.get(key)
+        if entry is not None:
+            age = entry.age()
+            if age < cache.ttl:
+                stats.cache["hit"] += 1
+                return entry.response()
+            if age < cache.ttl + cache.stale:
+                stats.cache["stale"] += 1
+                self._revalidate_soon(key, url, cache, entry, kwargs)
+                return entry.response()
+        return await self._fetch_cached(key, url, cache, entry, kwargs)
+
+    async def _fetch_cached(
+        self,
+        key: str,
+        url: str,
+        policy: CachePolicy,
+        entry: CacheEntry | None,
+        kwargs: dict[str, Any],
+    ) -> HttpResponse:
+        """Fetch *url* (conditionally when *entry* has validators) and update the cache."""
+        stats = self.stats(urlsplit(url).hostname or "")
+        kwargs = dict(kwargs)
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            headers.update(entry.validators())
+        resp: HttpResponse | None = None
+        try:
+            resp = await self.request("GET", url, headers=headers or None, **kwargs)
+            reason = str(resp.status_code)
+        except Exception as exc:
+            if entry is None:
+                raise
+            reason = type(exc).__name__
+        if resp is not None and resp.status_code == 304 and entry is not None:
+            stats.cache["revalidated"] += 1
+            entry = entry.refreshed()
+            await self.cache.put(key, entry, policy)
+            return entry.response()
+        if resp is not None and resp.status_code == 200:
+            stats.cache["miss"] += 1
+            await self.cache.put(key, CacheEntry.from_response(resp), policy)
+            return resp
+        if entry is not None and (resp is None or resp.status_code >= 429):
+            # Upstream is failing or throttling us; an old body beats none.
+            stats.cache["stale_error"] += 1
+            log.warning("Serving cached %s after upstream %s", url, reason)
+            return entry.response()
+        return resp
+
+    def _revalidate_soon(
+        self,
+        key: str,
+        url: str,
+        policy: CachePolicy,
+        entry: CacheEntry,
+        kwargs: dict[str, Any],
+    ) -> None:
+        task = self._revalidating.get(key)
+        if task is not None and not task.done():
+            return
+
+        async def revalidate() -> None:
+            try:
+                await self._fetch_cached(key, url, policy, entry, kwargs)
+            except Exception as exc:
+                log.warning("Background revalidation of %s failed: %s", url, exc)
+
+        task = asyncio.create_task(revalidate())
+        self._revalidating[key] = task
+        task.add_done_callback(lambda _: self._revalidating.pop(key, None))
+
+    async def wait_idle(self) -> None:
+        """Wait for background revalidations to finish."""
+        while self._revalidating:
+            await asyncio.gather(*list(self._revalidating.values()), return_exceptions=True)
+
+    async def post(self, url: str, **kwargs: Any) -> HttpResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def close(self) -> None:
+        for task in self._revalidating.values():
+            task.cancel()
+        self._revalidating.clear()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            log.debug("Closed shared async HTTP session")
+        self._session = None
+        self._loop = None
+        self._gates.clear()
+
+
+_http_client: HttpClient | None = None
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide :class:`HttpClient`."""
+    global _http_client
+    if _http_client is None:
+        _http_client = HttpClient()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client's session; call once during bot shutdown."""
+    if _http_client is not None:
+        await _http_client.close()
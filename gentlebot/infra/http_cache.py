@@ -0,0 +1,195 @@
+"""HTTP response cache for the shared client.
+
+Sports schedules, standings and Open Library lookups change far less often
+than the tasks and commands that read them.  Call sites pass a
+:class:`CachePolicy` to :meth:`HttpClient.get`:
+
+* within ``ttl`` the cached body is returned without touching the network;
+* for ``stale`` seconds after that the cached body is still returned
+  immediately while one background request revalidates it
+  (stale-while-revalidate);
+* past that the request waits for the network, sending ``If-None-Match`` /
+  ``If-Modified-Since`` from the cached validators so an unchanged body
+  costs a ``304``;
+* if the upstream fails, any cached body is served instead (stale-if-error).
+
+Entries live in an in-memory LRU backed by :class:`StateCache`, so a
+restart starts warm.
+
+Example::
+
+    SCHEDULE_CACHE = CachePolicy(ttl=300, stale=3600)
+    resp = await get_http_client().get(url, cache=SCHEDULE_CACHE)
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Mapping
+from urllib.parse import urlencode
+
+from .state_cache import StateCache, get_state_cache
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .http import HttpResponse
+
+log = logging.getLogger(f"gentlebot.{__name__}")
+
+KEY_PREFIX = "http:"
+# Persisted entries are kept at least this long so they can still be
+# revalidated cheaply after they go stale.
+MIN_RETAIN_SECONDS = 86_400
+# Bodies larger than this stay in memory only
+MAX_PERSISTED_BODY = 2_000_000
+# Response headers kept with a cached body
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How long a cached response is fresh, and then usable while stale (seconds)."""
+
+    ttl: float
+    stale: float = 0.0
+    persist: bool = True
+
+    @property
+    def retain_hours(self) -> float:
+        return max(self.ttl + self.stale, MIN_RETAIN_SECONDS) / 3600
+
+
+def cache_key(url: str, params: Mapping[str, Any] | None = None) -> str:
+    """Return the cache key for a GET of *url* with *params*."""
+    if params:
+        query = urlencode(sorted((k, str(v)) for k, v in params.items()))
+        url = f"{url}{'&' if '?' in url else '?'}{query}"
+    return url
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached ``200`` response and when it was last confirmed fresh."""
+
+    url: str
+    headers: dict[str, str]
+    content: bytes
+    encoding: str
+    fetched_at: float
+
+    @classmethod
+    def from_response(cls, resp: "HttpResponse") -> "CacheEntry":
+        received = {name.lower(): value for name, value in resp.headers.items()}
+        headers = {
+            name: received[name.lower()] for name in KEPT_HEADERS if received.get(name.lower())
+        }
+        return cls(resp.url, headers, resp.content, resp.encoding, time.time())
+
+    def age(self, now: float | None = None) -> float:
+        return (now or time.time()) - self.fetched_at
+
+    def validators(self) -> dict[str, str]:
+        """Return conditional request headers for revalidating this entry."""
+        headers: dict[str, str] = {}
+        if "ETag" in self.headers:
+            headers["If-None-Match"] = self.headers["ETag"]
+        if "Last-Modified" in self.headers:
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+    def refreshed(self) -> "CacheEntry":
+        return replace(self, fetched_at=time.time())
+
+    def response(self) -> "HttpResponse":
+        from .http import HttpResponse
+
+        return HttpResponse(
+            url=self.url,
+            status_code=200,
+            headers=self.headers,
+            content=self.content,
+            encoding=self.encoding,
+            cached=True,
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "url": self.url,
+            "headers": self.headers,
+            "body": base64.b64encode(self.content).decode("ascii"),
+            "encoding": self.encoding,
+            "fetched_at": self.fetched_at,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "CacheEntry":
+        return cls(
+            url=data["url"],
+            headers=dict(data.get("headers") or {}),
+            content=base64.b64decode(data["body"]),
+            encoding=data.get("encoding") or "utf-8",
+            fetched_at=float(data["fetched_at"]),
+        )
+
+
+class HttpCache:
+    """In-memory LRU of :class:`CacheEntry` in front of :class:`StateCache`."""
+
+    def __init__(self, state: StateCache | None = None, max_entries: int = 128) -> None:
+        self._state = state
+        self.max_entries = max_entries
+        self._lru: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    @property
+    def state(self) -> StateCache:
+        if self._state is None:
+            self._state = get_state_cache()
+        return self._state
+
+    @staticmethod
+    def _state_key(key: str) -> str:
+        return KEY_PREFIX + hashlib.sha256(key.encode("utf-8")).hexdigest()[:40]
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        self._lru[key] = entry
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def _load(self, key: str) -> CacheEntry | None:
+        try:
+            stored = self.state.get(self._state_key(key))
+            return CacheEntry.from_json(stored) if isinstance(stored, dict) else None
+        except Exception:  # pragma: no cover - the cache must never break a fetch
+            log.exception("HTTP cache read failed for %s", key)
+            return None
+
+    def _store(self, key: str, entry: CacheEntry, ttl_hours: float) -> None:
+        try:
+            self.state.set(self._state_key(key), entry.to_json(), ttl_hours=ttl_hours)
+        except Exception:  # pragma: no cover - the cache must never break a fetch
+            log.exception("HTTP cache write failed for %s", key)
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for *key*, reading SQLite off the loop on LRU misses."""
+        entry = self._lru.get(key)
+        if entry is not None:
+            self._lru.move_to_end(key)
+            return entry
+        entry = await asyncio.to_thread(self._load, key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    async def put(self, key: str, entry: CacheEntry, policy: CachePolicy) -> None:
+        self._remember(key, entry)
+        if policy.persist and len(entry.content) <= MAX_PERSISTED_BODY:
+            await asyncio.to_thread(self._store, key, entry, policy.retain_hours)
+
+    def clear(self) -> None:
+        """Forget in-memory entries (persisted ones stay until they expire)."""
+        self._lru.clear()
@@ -3,11 +3,18 @@
 This module provides a decorator that ensures scheduled tasks are only
 executed once per execution key (e.g., date, week number), preventing
 duplicate operations after bot restarts or crashes.
+
+Each execution is claimed atomically before it runs: the claim inserts a
+``running`` row with a lease, or takes over a ``failed`` row or one whose
+lease has expired, in a single round trip.  A finished run is marked
+``done`` and remembered in-process so later scheduler ticks for the same
+key skip without touching the database.
 """
 from __future__ import annotations
 
 import functools
 import logging
+from collections import OrderedDict
 from datetime import date
 from typing import Any, Callable, TypeVar
 
@@ -17,18 +24,88 @@ log = logging.getLogger(f"gentlebot.{__name__}")
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+# Default time a claim stays valid; a crashed run can be retaken after it.
+DEFAULT_LEASE_SECONDS = 15 * 60
+
+# Bound for the in-process cache of completed (task_name, key) pairs.
+_COMPLETED_MAX = 1024
+_completed: OrderedDict[tuple[str, str], None] = OrderedDict()
+
+_CLAIM_SQL = """
+    WITH claim AS (
+        INSERT INTO discord.task_execution
+            (task_name, execution_key, status, lease_expires_at)
+        VALUES ($1, $2, 'running', now() + make_interval(secs => $3))
+        ON CONFLICT (task_name, execution_key) DO UPDATE SET
+            status = 'running',
+            executed_at = now(),
+            lease_expires_at = EXCLUDED.lease_expires_at,
+            result = NULL
+        WHERE task_execution.status = 'failed'
+           OR (task_execution.status = 'running'
+               AND task_execution.lease_expires_at < now())
+        RETURNING status
+    )
+    SELECT status, TRUE AS claimed FROM claim
+    UNION ALL
+    SELECT status, FALSE AS claimed FROM discord.task_execution
+    WHERE task_name = $1 AND execution_key = $2
+      AND NOT EXISTS (SELECT 1 FROM claim)
+"""
+
+
+def _remember_completed(task_name: str, key: str) -> None:
+    _completed[(task_name, key)] = None
+    _completed.move_to_end((task_name, key))
+    while len(_completed) > _COMPLETED_MAX:
+        _completed.popitem(last=False)
+
+
+def _is_completed(task_name: str, key: str) -> bool:
+    return (task_name, key) in _completed
+
+
+def clear_completed_cache() -> None:
+    """Forget every key remembered as completed in this process."""
+    _completed.clear()
+
+
+async def _claim(
+    pool: asyncpg.Pool, task_name: str, key: str, lease_seconds: float
+) -> tuple[bool, str | None]:
+    """Try to claim an execution; return ``(claimed, current_status)``."""
+    row = await pool.fetchrow(_CLAIM_SQL, task_name, key, float(lease_seconds))
+    if row is None:
+        # Another worker inserted the same new key concurrently: our ON
+        # CONFLICT check lost, and the fallback SELECT cannot see its
+        # uncommitted row.  Treat it as running elsewhere.
+        return False, STATUS_RUNNING
+    return bool(row["claimed"]), row["status"]
 
-async def _already_executed(pool: asyncpg.Pool, task_name: str, key: str) -> bool:
-    """Check if a task has already been executed with the given key."""
-    row = await pool.fetchval(
+
+async def _finish(
+    pool: asyncpg.Pool,
+    task_name: str,
+    key: str,
+    status: str,
+    result: str | None = None,
+) -> None:
+    """Record the final *status* of a claimed execution."""
+    await pool.execute(
         """
-        SELECT 1 FROM discord.task_execution
+        UPDATE discord.task_execution
+        SET status = $3, result = $4, executed_at = now(), lease_expires_at = NULL
         WHERE task_name = $1 AND execution_key = $2
         """,
         task_name,
         key,
+        status,
+        result,
     )
-    return row is not None
 
 
 async def _mark_executed(
@@ -37,13 +114,15 @@ async def _mark_executed(
     key: str,
     result: str | None = None,
 ) -> None:
-    """Mark a task as executed with the given key."""
+    """Upsert a ``done`` row for an execution that ran without a claim."""
     await pool.execute(
         """
-        INSERT INTO discord.task_execution (task_name, execution_key, result)
-        VALUES ($1, $2, $3)
+        INSERT INTO discord.task_execution (task_name, execution_key, status, result)
+        VALUES ($1, $2, 'done', $3)
         ON CONFLICT (task_name, execution_key) DO UPDATE SET
+            status = 'done',
             executed_at = now(),
+            lease_expires_at = NULL,
             result = EXCLUDED.result
         """,
         task_name,
@@ -52,17 +131,25 @@ async def _mark_executed(
     )
 
 
+def _truncate(value: Any) -> str | None:
+    text = str(value) if value is not None else None
+    if text and len(text) > 500:
+        text = text[:500] + "..."
+    return text
+
+
 def idempotent_task(
     task_name: str,
     key_func: Callable[..., str],
     pool_attr: str = "pool",
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
 ) -> Callable[[F], F]:
     """Decorator preventing duplicate task execution.
 
     This decorator wraps async methods that should only run once per
-    execution key. It checks a database table to see if the task has
-    already been executed with the computed key, and skips execution
-    if so.
+    execution key. Before running, it atomically claims the computed key
+    in the execution table; if another run already finished the key, or
+    holds an unexpired lease on it, execution is skipped.
 
     Args:
         task_name: Unique name identifying this task in the execution log.
@@ -71,6 +158,8 @@ def idempotent_task(
             execution window (e.g., today's date, week number).
         pool_attr: Name of the attribute on `self` that holds the asyncpg pool.
             Defaults to "pool".
+        lease_seconds: How long a claim is held before another run may take
+            it over (e.g. after a crash mid-task). Defaults to 15 minutes.
 
     Example::
 
@@ -92,7 +181,7 @@ def idempotent_task(
                 ...
 
     Returns:
-        Decorated function that checks for prior execution before running.
+        Decorated function that claims the execution key before running.
     """
 
     def decorator(fn: F) -> F:
@@ -115,28 +204,59 @@ def idempotent_task(
                 )
                 return await fn(self, *args, **kwargs)
 
+            if _is_completed(task_name, key):
+                log.debug(
+                    "idempotent_task %s: skipping, key=%s completed in this process",
+                    task_name,
+                    key,
+                )
+                return None
+
+            claimed = False
             try:
-                if await _already_executed(pool, task_name, key):
+                claimed, status = await _claim(pool, task_name, key, lease_seconds)
+                if not claimed:
+                    if status == STATUS_DONE:
+                        _remember_completed(task_name, key)
                     log.info(
-                        "idempotent_task %s: skipping, already executed for key=%s",
+                        "idempotent_task %s: skipping, key=%s is %s",
                         task_name,
                         key,
+                        status,
                     )
                     return None
             except Exception:
                 log.exception(
-                    "idempotent_task %s: failed to check execution status",
+                    "idempotent_task %s: failed to claim execution",
                     task_name,
                 )
-                # Proceed with execution on check failure to avoid missing tasks
+                # Proceed with execution on claim failure to avoid missing tasks
 
-            result = await fn(self, *args, **kwargs)
+            try:
+                result = await fn(self, *args, **kwargs)
+            except Exception as exc:
+                if claimed:
+                    try:
+                        await _finish(
+                            pool,
+                            task_name,
+                            key,
+                            STATUS_FAILED,
+                            _truncate(f"error: {exc!r}"),
+                        )
+                    except Exception:
+                        log.exception(
+                            "idempotent_task %s: failed to mark as failed",
+                            task_name,
+                        )
+                raise
 
             try:
-                result_str = str(result) if result is not None else None
-                if result_str and len(result_str) > 500:
-                    result_str = result_str[:500] + "..."
-                await _mark_executed(pool, task_name, key, result_str)
+                if claimed:
+                    await _finish(pool, task_name, key, STATUS_DONE, _truncate(result))
+                else:
+                    await _mark_executed(pool, task_name, key, _truncate(result))
+                _remember_completed(task_name, key)
                 log.info(
                     "idempotent_task %s: marked as executed for key=%s",
                     task_name,
@@ -0,0 +1,204 @@
+"""Event-loop lag watchdog and blocking-call detector.
+
+A heartbeat task sleeps for a short interval and measures how late it wakes
+up; the overshoot is the event-loop lag every other coroutine (including the
+Discord gateway heartbeat) experienced at that moment.
+
+Lag alone does not say *what* blocked the loop, so a companion thread watches
+the heartbeat.  When the loop has been stuck for longer than the threshold it
+captures the loop thread's current stack, attributes it to the innermost cog
+frame and logs it, which points straight at the offending synchronous call.
+
+Example::
+
+    watchdog = LoopWatchdog(threshold_ms=250)
+    watchdog.start()
+    ...
+    watchdog.stats.snapshot()
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from pathlib import PurePath
+
+from ..metrics import percentile
+
+log = logging.getLogger(f"gentlebot.{__name__}")
+
+_STACK_DEPTH = 15
+
+
+def attribute(stack: list[traceback.FrameSummary]) -> str:
+    """Name the code responsible for *stack*.
+
+    Returns ``"<cog module>:<function>"`` for the innermost frame inside
+    ``gentlebot/cogs``, falling back to the innermost ``gentlebot`` frame and
+    finally ``"unknown"``.
+    """
+    fallback = None
+    for frame in reversed(stack):
+        parts = PurePath(frame.filename).parts
+        if "gentlebot" not in parts:
+            continue
+        idx = len(parts) - 1 - parts[::-1].index("gentlebot")
+        rest = parts[idx + 1 :]
+        if rest[:1] == ("cogs",) and len(rest) == 2:
+            return f"{PurePath(rest[1]).stem}:{frame.name}"
+        if fallback is None and rest and rest[-1] != "loop_watchdog.py":
+            fallback = f"{PurePath(rest[-1]).stem}:{frame.name}"
+    return fallback or "unknown"
+
+
+@dataclass
+class LagStats:
+    """Running loop-lag measurements."""
+
+    samples: int = 0
+    last_ms: float = 0.0
+    max_ms: float = 0.0
+    stalls: int = 0
+    by_source: Counter[str] = field(default_factory=Counter)
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=600))
+
+    def observe(self, lag_ms: float, threshold_ms: float) -> None:
+        self.samples += 1
+        self.last_ms = lag_ms
+        self.max_ms = max(self.max_ms, lag_ms)
+        self.recent.append(lag_ms)
+        if lag_ms >= threshold_ms:
+            self.stalls += 1
+
+    def percentile(self, pct: float) -> float:
+        """Return the *pct* percentile over the recent samples."""
+        return percentile(self.recent, pct) or 0.0
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "samples": self.samples,
+            "last_ms": round(self.last_ms, 1),
+            "p99_ms": round(self.percentile(99), 1),
+            "max_ms": round(self.max_ms, 1),
+            "stalls": self.stalls,
+            "by_source": dict(self.by_source.most_common(10)),
+        }
+
+
+class LoopWatchdog:
+    """Measure event-loop lag and capture the stacks of blocking calls.
+
+    Args:
+        interval: Seconds between heartbeat ticks.
+        threshold_ms: Lag above which a tick counts as a stall and the
+            blocking stack is captured.
+        debug: Also enable asyncio debug mode so every callback slower than
+            the threshold is logged by the ``asyncio`` logger.  This adds
+            overhead and is meant for staging.
+    """
+
+    def __init__(
+        self, interval: float = 0.25, threshold_ms: float = 250, debug: bool = False
+    ) -> None:
+        self.interval = interval
+        self.threshold_ms = threshold_ms
+        self.debug = debug
+        self.stats = LagStats()
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._loop_thread_id: int | None = None
+        self._last_beat = time.monotonic()
+        self._reported_beat: float | None = None
+
+    def start(self) -> None:
+        """Start watching the running event loop."""
+        if self._task is not None:
+            return
+        loop = asyncio.get_running_loop()
+        if self.debug:
+            loop.set_debug(True)
+            loop.slow_callback_duration = self.threshold_ms / 1000
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = loop.create_task(self._heartbeat(), name="loop-watchdog")
+        self._thread = threading.Thread(
+            target=self._monitor, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+        log.info(
+            "Loop watchdog started (interval=%.2fs threshold=%dms debug=%s)",
+            self.interval,
+            self.threshold_ms,
+            self.debug,
+        )
+
+    async def stop(self) -> None:
+        """Stop the heartbeat task and monitor thread."""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            self._last_beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (loop.time() - start - self.interval) * 1000)
+            self.stats.observe(lag_ms, self.threshold_ms)
+
+    def _monitor(self) -> None:
+        poll = min(self.interval, self.threshold_ms / 2000)
+        while not self._stop.wait(poll):
+            beat = self._last_beat
+            stalled_ms = (time.monotonic() - beat - self.interval) * 1000
+            if stalled_ms < self.threshold_ms or beat == self._reported_beat:
+                continue
+            # Report each stall once, from inside it, while the stack is live.
+            self._reported_beat = beat
+            frame = sys._current_frames().get(self._loop_thread_id or 0)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            source = attribute(stack)
+            self.stats.by_source[source] += 1
+            log.warning(
+                "Event loop blocked for %dms+ in %s\n%s",
+                int(stalled_ms),
+                source,
+                "".join(traceback.format_list(stack[-_STACK_DEPTH:])).rstrip(),
+            )
+
+
+_watchdog: LoopWatchdog | None = None
+
+
+def get_loop_watchdog() -> LoopWatchdog | None:
+    """Return the process-wide watchdog, if one was installed."""
+    return _watchdog
+
+
+def install_loop_watchdog(
+    interval: float = 0.25, threshold_ms: float = 250, debug: bool = False
+) -> LoopWatchdog:
+    """Create and start the process-wide watchdog on the running loop."""
+    global _watchdog
+    if _watchdog is None:
+        _watchdog = LoopWatchdog(interval, threshold_ms, debug)
+        _watchdog.start()
+    return _watchdog
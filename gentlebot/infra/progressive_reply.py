@@ -0,0 +1,112 @@
+"""Progressively edited Discord replies for streamed text.
+
+A streamed LLM answer is posted as soon as there is a sentence worth
+showing and then edited in place as more text arrives.  Edits are
+throttled to stay well inside Discord's per-channel edit rate limit
+(roughly five per five seconds), and text that outgrows one message spills
+into follow-up messages using the same 1,900-character chunking the bot
+uses for long replies.
+
+Example::
+
+    reply = ProgressiveReply(lambda content, files=None: message.reply(content, files=files))
+    async for delta in router.generate_stream("general", messages):
+        text += delta
+        await reply.update(text)
+    await reply.finish(text)
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+import discord
+
+log = logging.getLogger(f"gentlebot.{__name__}")
+
+MESSAGE_LIMIT = 2000
+CHUNK_SIZE = 1900
+
+
+def split_message(text: str) -> list[str]:
+    """Split *text* into Discord-sized chunks (one chunk if it fits)."""
+    if len(text) <= MESSAGE_LIMIT:
+        return [text]
+    return [text[i : i + CHUNK_SIZE] for i in range(0, len(text), CHUNK_SIZE)]
+
+
+class ProgressiveReply:
+    """Show a growing reply, posting early and editing at a throttled cadence.
+
+    Args:
+        send: Coroutine posting a new message; called as
+            ``send(content, files=...)`` and must return the sent message.
+        min_interval: Minimum seconds between edits while streaming.
+        min_chars: Characters needed before the first message is posted, so
+            the channel does not see a reply that is a single word.
+    """
+
+    def __init__(
+        self,
+        send: Callable[..., Awaitable[Any]],
+        min_interval: float = 1.2,
+        min_chars: int = 40,
+    ) -> None:
+        self._send = send
+        self.min_interval = min_interval
+        self.min_chars = min_chars
+        self._messages: list[Any] = []
+        self._shown: list[str] = []
+        self._last_edit = 0.0
+        self.edits = 0
+
+    @property
+    def started(self) -> bool:
+        """Whether any part of the reply has been posted."""
+        return bool(self._messages)
+
+    async def update(self, text: str) -> None:
+        """Show *text*, the full reply so far, if the edit budget allows."""
+        if not self._messages:
+            if len(text.strip()) < self.min_chars:
+                return
+        elif time.monotonic() - self._last_edit < self.min_interval:
+            return
+        try:
+            await self._render(split_message(text))
+        except discord.HTTPException as exc:
+            # A skipped intermediate edit is harmless; finish() catches up.
+            log.debug("Progressive edit failed: %s", exc)
+
+    async def finish(self, text: str, files: list[discord.File] | None = None) -> None:
+        """Show the complete *text*, attaching *files* to the first message."""
+        chunks = split_message(text)
+        if not self._messages:
+            for i, chunk in enumerate(chunks):
+                await self._send(chunk, files=files if i == 0 and files else None)
+            return
+        await self._render(chunks, files)
+        for extra in self._messages[len(chunks) :]:
+            await extra.delete()
+        del self._messages[len(chunks) :]
+        del self._shown[len(chunks) :]
+
+    async def _render(
+        self, chunks: list[str], files: list[discord.File] | None = None
+    ) -> None:
+        for i, chunk in enumerate(chunks):
+            attach = files if i == 0 and files else None
+            if i < len(self._messages):
+                if self._shown[i] == chunk and attach is None:
+                    continue
+                if attach is None:
+                    await self._messages[i].edit(content=chunk)
+                else:
+                    await self._messages[i].edit(content=chunk, attachments=attach)
+                self.edits += 1
+                self._shown[i] = chunk
+            else:
+                self._messages.append(await self._send(chunk, files=attach))
+                self._shown.append(chunk)
+        self._last_edit = time.monotonic()
@@ -1,14 +1,42 @@
-"""Simple in-process quota guards."""
+"""Simple in-process quota guards.
+
+Requests and tokens are tracked in 60-second sliding windows with running
+totals, so a check costs O(1) amortized regardless of traffic.  Daily request
+counts and the current windows can be checkpointed to a :class:`StateCache`
+(see :meth:`QuotaGuard.attach_state`) so a redeploy does not hand the bot a
+fresh daily budget the provider never granted.  :meth:`QuotaGuard.check`
+runs on the event loop, so it only marks usage dirty; a background task
+writes the checkpoint from a worker thread.
+"""
 from __future__ import annotations
 
+import asyncio
+import logging
 import time
 from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import Dict
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from .state_cache import StateCache
+
+log = logging.getLogger(f"gentlebot.{__name__}")
+
+WINDOW_SECONDS = 60
+DAY_SECONDS = 86400
 
 
 class RateLimited(Exception):
-    """Raised when a quota is exceeded."""
+    """Raised when a quota is exceeded.
+
+    ``retry_after`` is the number of seconds until the exhausted window has
+    room again, or ``None`` when waiting will not help (for example the daily
+    budget is spent or a request was shed).
+    """
+
+    def __init__(self, message: str = "", retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 def _now() -> float:
@@ -27,48 +55,214 @@ class QuotaGuard:
         self.limits = limits
         self.req_hist: Dict[str, deque[float]] = defaultdict(deque)
         self.tok_hist: Dict[str, deque[tuple[float, int]]] = defaultdict(deque)
+        self.tok_used: Dict[str, int] = defaultdict(int)
         self.daily: Dict[str, tuple[float, int]] = defaultdict(lambda: (_now(), 0))
+        self._state: StateCache | None = None
+        self._state_key = ""
+        self._checkpoint_interval = 30.0
+        self._checkpoint_task: asyncio.Task | None = None
+        self._dirty = False
+
+    def _prune(self, route: str, now: float) -> None:
+        cutoff = now - WINDOW_SECONDS
+        hist = self.req_hist[route]
+        while hist and hist[0] <= cutoff:
+            hist.popleft()
+        thist = self.tok_hist[route]
+        while thist and thist[0][0] <= cutoff:
+            self.tok_used[route] -= thist.popleft()[1]
+
+    def _day(self, route: str, now: float) -> tuple[float, int]:
+        day_start, count = self.daily[route]
+        if now - day_start >= DAY_SECONDS:
+            day_start, count = now, 0
+            self.daily[route] = (day_start, count)
+        return day_start, count
 
     def check(self, route: str, tokens: int) -> float:
-        """Check quotas for *route*. Return temperature delta."""
+        """Check quotas for *route*. Return temperature delta.
+
+        A request is recorded against every window only once all of them
+        have room, so a TPM rejection does not burn an RPM slot.
+        """
         now = _now()
         limit = self.limits.get(route)
         if not limit:
             return 0.0
 
-        # RPM
-        if limit.rpm is not None:
-            hist = self.req_hist[route]
-            while hist and hist[0] <= now - 60:
-                hist.popleft()
-            if len(hist) >= limit.rpm:
-                raise RateLimited
-            hist.append(now)
-            if len(hist) >= 0.9 * limit.rpm:
-                return -0.2
-
-        # TPM
-        if limit.tpm is not None:
-            thist = self.tok_hist[route]
-            while thist and thist[0][0] <= now - 60:
-                thist.popleft()
-            used = sum(t for _, t in thist)
-            if used + tokens > limit.tpm:
-                raise RateLimited
-            thist.append((now, tokens))
-            if used + tokens >= 0.9 * limit.tpm:
-                return -0.2
-
-        # RPD
-        if limit.rpd is not None:
-            day_start, count = self.daily[route]
-            if now - day_start >= 86400:
-                day_start, count = now, 0
-            if count + 1 > limit.rpd:
-                raise RateLimited
-            count += 1
-            self.daily[route] = (day_start, count)
-            if count >= 0.9 * limit.rpd:
-                return -0.2
+        self._prune(route, now)
+        hist = self.req_hist[route]
+        thist = self.tok_hist[route]
+        day_start, count = self._day(route, now)
+
+        if limit.rpm is not None and len(hist) >= limit.rpm:
+            raise RateLimited("rpm", retry_after=hist[0] + WINDOW_SECONDS - now)
+        if limit.tpm is not None and self.tok_used[route] + tokens > limit.tpm:
+            retry_after = thist[0][0] + WINDOW_SECONDS - now if thist else None
+            raise RateLimited("tpm", retry_after=retry_after)
+        if limit.rpd is not None and count + 1 > limit.rpd:
+            raise RateLimited("rpd")
 
+        hist.append(now)
+        thist.append((now, tokens))
+        self.tok_used[route] += tokens
+        count += 1
+        self.daily[route] = (day_start, count)
+        self._dirty = True
+
+        if (
+            (limit.rpm is not None and len(hist) >= 0.9 * limit.rpm)
+            or (limit.tpm is not None and self.tok_used[route] >= 0.9 * limit.tpm)
+            or (limit.rpd is not None and count >= 0.9 * limit.rpd)
+        ):
+            return -0.2
         return 0.0
+
+    def adjust(self, route: str, delta: int) -> None:
+        """Correct the token window of *route* by *delta* tokens.
+
+        :meth:`check` is charged with an estimate before the request is sent;
+        once the provider reports real usage the difference is booked here so
+        the TPM window tracks what was actually spent.
+        """
+        if not delta or route not in self.limits:
+            return
+        now = _now()
+        self._prune(route, now)
+        self.tok_hist[route].append((now, delta))
+        self.tok_used[route] += delta
+        self._dirty = True
+
+    def remaining(self, route: str) -> dict[str, int | None]:
+        """Return what is left of each limit for *route*.
+
+        Keys are ``rpm``, ``tpm`` and ``rpd``; a value is ``None`` when that
+        limit is not configured.  Useful for planning work, e.g. skipping an
+        optional batch when the daily budget is nearly gone.
+        """
+        limit = self.limits.get(route) or Limit()
+        now = _now()
+        self._prune(route, now)
+        _, count = self._day(route, now)
+        return {
+            "rpm": None if limit.rpm is None else max(0, limit.rpm - len(self.req_hist[route])),
+            "tpm": None if limit.tpm is None else max(0, limit.tpm - self.tok_used[route]),
+            "rpd": None if limit.rpd is None else max(0, limit.rpd - count),
+        }
+
+    def rpm_window(self, route: str) -> tuple[int | None, float]:
+        """Return free RPM slots for *route* and seconds until another frees.
+
+        The slot count is ``None`` when the route has no RPM limit.
+        """
+        limit = self.limits.get(route)
+        if not limit or limit.rpm is None:
+            return None, 0.0
+        now = _now()
+        self._prune(route, now)
+        hist = self.req_hist[route]
+        free = max(0, limit.rpm - len(hist))
+        wait = max(0.0, hist[0] + WINDOW_SECONDS - now) if hist else 0.0
+        return free, wait
+
+    # ── persistence ────────────────────────────────────────────────────────
+
+    def attach_state(
+        self, state: StateCache, name: str, checkpoint_interval: float = 30.0
+    ) -> None:
+        """Restore usage from *state* and checkpoint to it from now on.
+
+        Checkpoints are written every *checkpoint_interval* seconds once
+        :meth:`start_checkpoints` has been called; :meth:`aclose` (or
+        :meth:`checkpoint`) flushes the remainder on shutdown.
+        """
+        self._state = state
+        self._state_key = f"quota:{name}"
+        self._checkpoint_interval = checkpoint_interval
+        try:
+            snapshot = state.get(self._state_key)
+        except Exception:  # pragma: no cover - quota must work without state
+            log.exception("Failed to load quota state %s", self._state_key)
+            return
+        if isinstance(snapshot, dict):
+            self._restore(snapshot)
+
+    def _snapshot(self) -> dict[str, Any]:
+        return {
+            "requests": {route: list(hist) for route, hist in self.req_hist.items() if hist},
+            "tokens": {
+                route: [list(item) for item in thist]
+                for route, thist in self.tok_hist.items()
+                if thist
+            },
+            "daily": {route: list(value) for route, value in self.daily.items()},
+        }
+
+    def _restore(self, snapshot: dict[str, Any]) -> None:
+        now = _now()
+        for route, stamps in snapshot.get("requests", {}).items():
+            self.req_hist[route] = deque(float(ts) for ts in stamps)
+        for route, items in snapshot.get("tokens", {}).items():
+            self.tok_hist[route] = deque((float(ts), int(tok)) for ts, tok in items)
+            self.tok_used[route] = sum(tok for _, tok in self.tok_hist[route])
+        for route, (day_start, count) in snapshot.get("daily", {}).items():
+            if now - float(day_start) < DAY_SECONDS:
+                self.daily[route] = (float(day_start), int(count))
+        for route in list(self.req_hist) + list(self.tok_hist):
+            self._prune(route, now)
+        log.info(
+            "Restored quota state %s: %s",
+            self._state_key,
+            {route: count for route, (_, count) in self.daily.items()},
+        )
+
+    def _write(self, snapshot: dict[str, Any]) -> bool:
+        assert self._state is not None
+        try:
+            self._state.set(self._state_key, snapshot, ttl_hours=25)
+        except Exception:  # pragma: no cover - quota must work without state
+            log.exception("Failed to checkpoint quota state %s", self._state_key)
+            return False
+        return True
+
+    def checkpoint(self) -> None:
+        """Persist current usage to the attached state cache, if any (blocking)."""
+        if self._state is None or not self._dirty:
+            return
+        self._dirty = False
+        if not self._write(self._snapshot()):
+            self._dirty = True
+
+    async def checkpoint_async(self) -> None:
+        """Like :meth:`checkpoint`, with the SQLite write off the event loop."""
+        if self._state is None or not self._dirty:
+            return
+        # Snapshot on the loop so check() cannot change the windows mid-copy
+        snapshot = self._snapshot()
+        self._dirty = False
+        if not await asyncio.to_thread(self._write, snapshot):
+            self._dirty = True
+
+    def start_checkpoints(self) -> None:
+        """Checkpoint dirty usage every *checkpoint_interval* seconds."""
+        if self._state is None or self._checkpoint_task is not None:
+            return
+        self._checkpoint_task = asyncio.get_running_loop().create_task(
+            self._checkpoint_loop(), name="quota-checkpoint"
+        )
+
+    async def _checkpoint_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._checkpoint_interval)
+            await self.checkpoint_async()
+
+    async def aclose(self) -> None:
+        """Stop periodic checkpoints and flush what is left."""
+        if self._checkpoint_task is not None:
+            self._checkpoint_task.cancel()
+            try:
+                await self._checkpoint_task
+            except asyncio.CancelledError:
+                pass
+            self._checkpoint_task = None
+        await self.checkpoint_async()
@@ -72,6 +72,7 @@ async def async_retry(
     base: float = 0.5,
     max_delay: float = 8.0,
     retry_on: tuple[type[Exception], ...] | None = None,
+    rate_limit_delay: float = 0.0,
 ) -> T:
     """Call async *fn* with exponential backoff on transient errors.
 
@@ -82,6 +83,8 @@ async def async_retry(
         max_delay: Maximum delay between retries.
         retry_on: Tuple of exception types to retry on. If None, retries on
             all exceptions.
+        rate_limit_delay: Minimum delay after an HTTP 429, for APIs whose
+            rate limits reset on a fixed window.
 
     Returns:
         The result of the function call.
@@ -109,6 +112,8 @@ async def async_retry(
                 raise
             delay = min(max_delay, base * (2 ** attempt))
             delay += random.uniform(0, 0.1)
+            if status == 429:
+                delay = max(delay, rate_limit_delay)
             log.debug(
                 "Retry %d/%d for %s after %.2fs: %s",
                 attempt + 1,
@@ -0,0 +1,99 @@
+"""Coalesce concurrent identical requests into a single in-flight call.
+
+When several callers ask for the same thing at once -- three people reacting
+📋 to one link, or two taps on 📚 within a second -- only the first caller
+(the *leader*) does the work.  Everyone else with the same key awaits the
+leader's result, or re-raises its exception.  Nothing is cached: once the
+call finishes the key is forgotten and the next request starts a new flight.
+
+Example::
+
+    flights = SingleFlight()
+
+    async def fetch(url: str) -> str:
+        return await flights.do(url, lambda: asyncio.to_thread(_download, url))
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+log = logging.getLogger(f"gentlebot.{__name__}")
+
+T = TypeVar("T")
+
+
+@dataclass
+class _BlockingCall:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: BaseException | None = None
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers with the same key."""
+
+    def __init__(self, name: str = "singleflight") -> None:
+        self.name = name
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+        self._calls: dict[Hashable, _BlockingCall] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.shared = 0
+
+    def in_flight(self) -> int:
+        """Return the number of keys currently being fetched."""
+        return len(self._tasks) + len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()`` or join the identical call already in flight.
+
+        The call runs in its own task, so cancelling one waiter does not
+        cancel the shared work for the others.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t, key=key: self._forget(key, t))
+        else:
+            self.shared += 1
+            log.debug("%s: joined in-flight call for %r", self.name, key)
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception retrieved when every waiter was cancelled.
+            task.exception()
+
+    def do_blocking(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Thread-safe counterpart of :meth:`do` for synchronous callers."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _BlockingCall()
+                self.calls += 1
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -0,0 +1,284 @@
+"""Offline throughput benchmark for the LLM router.
+
+Drives :class:`LLMRouter` -- and the TL;DR and link-summary cog paths that
+sit on top of it -- with N requests at a fixed concurrency against a
+:class:`FakeProvider`, then reports throughput, latency, time spent
+queueing for quota, how the scheduler admitted or shed requests and what
+quota was left.  Nothing touches the network, Discord or Postgres; the
+response cache uses a throwaway SQLite file.
+
+Run ``make bench`` or, e.g.::
+
+    python -m gentlebot.llm.bench --scenario mixed -n 200 -c 32 --latency-ms 800 \\
+        --server-error-rate 0.02 --rpm 120
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from ..infra.quotas import Limit, RateLimited
+from ..infra.state_cache import StateCache
+from ..metrics import percentile
+from . import router as router_module
+from .providers.fake import FakeProvider, Latency
+from .response_cache import ResponseCache
+from .router import LLMRouter, SafetyBlocked, set_router
+
+SCENARIOS = ("async", "blocking", "stream", "tldr", "links", "mixed")
+
+
+@dataclass
+class BenchResult:
+    """Measurements from one benchmark run."""
+
+    scenario: str
+    requests: int
+    concurrency: int
+    elapsed: float
+    latencies: list[float] = field(default_factory=list)
+    first_token: list[float] = field(default_factory=list)
+    admission_waits: list[float] = field(default_factory=list)
+    statuses: Counter[str] = field(default_factory=Counter)
+    provider_requests: int = 0
+    provider_busy: float = 0.0
+    max_in_flight: int = 0
+    injected: dict[int, int] = field(default_factory=dict)
+    scheduler: dict[str, dict[str, int]] = field(default_factory=dict)
+    quota_left: dict[str, dict[str, Any]] = field(default_factory=dict)
+    cache_hits: int = 0
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def overhead_ms(self) -> float:
+        """Mean time per request spent outside the provider and the quota queue.
+
+        This is router work plus retry backoff and waiting on a coalesced
+        leader request.
+        """
+        if not self.latencies:
+            return 0.0
+        outside = sum(self.latencies) - sum(self.admission_waits) - self.provider_busy
+        return max(0.0, outside) / len(self.latencies) * 1000
+
+
+def _pct(values: list[float], pct: float) -> float:
+    return percentile(values, pct) or 0.0
+
+
+def _ms(values: list[float]) -> str:
+    return (
+        f"p50={_pct(values, 50) * 1000:.0f}ms p95={_pct(values, 95) * 1000:.0f}ms "
+        f"p99={_pct(values, 99) * 1000:.0f}ms max={max(values, default=0) * 1000:.0f}ms"
+    )
+
+
+def format_result(result: BenchResult) -> str:
+    """Render *result* as a plain-text report."""
+    lines = [
+        f"scenario={result.scenario} requests={result.requests} "
+        f"concurrency={result.concurrency} elapsed={result.elapsed:.2f}s "
+        f"throughput={result.throughput:.1f} req/s",
+        f"latency        {_ms(result.latencies)}",
+    ]
+    if result.first_token:
+        lines.append(f"first token    {_ms(result.first_token)}")
+    lines.append(
+        f"quota queueing {_ms(result.admission_waits)} "
+        f"mean={statistics.fmean(result.admission_waits or [0]) * 1000:.0f}ms"
+    )
+    lines.append(f"other          ~{result.overhead_ms:.1f}ms/request (router, retries, coalescing)")
+    lines.append("statuses       " + " ".join(f"{k}={v}" for k, v in sorted(result.statuses.items())))
+    lines.append(
+        f"provider       requests={result.provider_requests} "
+        f"max_in_flight={result.max_in_flight} "
+        f"injected={dict(sorted(result.injected.items())) or '-'} "
+        f"cache_hits={result.cache_hits}"
+    )
+    for name, counts in result.scheduler.items():
+        if counts:
+            lines.append(f"scheduler {name:<8} " + " ".join(f"{k}={v}" for k, v in sorted(counts.items())))
+    for route, left in result.quota_left.items():
+        lines.append(f"quota left {route:<8} rpm={left['rpm']} tpm={left['tpm']} rpd={left['rpd']}")
+    return "\n".join(lines)
+
+
+def build_router(provider: FakeProvider, rpm: int | None, state_path: str) -> LLMRouter:
+    """Return a router serving every route from *provider* with *rpm* per route."""
+    router = LLMRouter()
+    router.client = provider
+    router.response_cache = ResponseCache(StateCache(state_path))
+    router.quota.limits = {route: Limit(rpm=rpm) for route in router.quota.limits}
+    return router
+
+
+def _scenario_calls(
+    router: LLMRouter, scenario: str, result: BenchResult
+) -> Callable[[int, str], Awaitable[str]]:
+    """Return ``call(i, prompt)`` issuing request *i* of *scenario*."""
+    tldr = links = None
+    if scenario in ("tldr", "links", "mixed"):
+        from ..cogs.link_summarizer_cog import LinkSummarizerCog
+        from ..cogs.tldr_cog import TLDRCog
+
+        tldr = TLDRCog(None)  # type: ignore[arg-type]
+        links = LinkSummarizerCog(None)  # type: ignore[arg-type]
+
+    messages = lambda prompt: [{"role": "user", "content": prompt}]  # noqa: E731
+
+    async def run_async(i: int, prompt: str) -> str:
+        return await router.generate_async("general", messages(prompt))
+
+    async def run_blocking(i: int, prompt: str) -> str:
+        return await asyncio.to_thread(router.generate, "general", messages(prompt))
+
+    async def run_stream(i: int, prompt: str) -> str:
+        start = time.monotonic()
+        parts: list[str] = []
+        async for delta in router.generate_stream("general", messages(prompt)):
+            if not parts:
+                result.first_token.append(time.monotonic() - start)
+            parts.append(delta)
+        return "".join(parts)
+
+    async def run_tldr(i: int, prompt: str) -> str:
+        assert tldr is not None
+        return await tldr._summarize_message(prompt, "bench")
+
+    async def run_links(i: int, prompt: str) -> str:
+        assert links is not None
+        return await links._summarize_content(f"https://example.com/{i}", prompt)
+
+    calls = {
+        "async": run_async,
+        "blocking": run_blocking,
+        "stream": run_stream,
+        "tldr": run_tldr,
+        "links": run_links,
+    }
+    if scenario != "mixed":
+        return calls[scenario]
+    mix = [run_stream, run_tldr, run_async, run_links]
+
+    async def run_mixed(i: int, prompt: str) -> str:
+        return await mix[i % len(mix)](i, prompt)
+
+    return run_mixed
+
+
+async def run_bench(
+    router: LLMRouter,
+    scenario: str = "async",
+    requests: int = 100,
+    concurrency: int = 16,
+    distinct: int | None = None,
+) -> BenchResult:
+    """Issue *requests* calls of *scenario*, at most *concurrency* at a time.
+
+    Prompts cycle through *distinct* variants (default: all unique), so
+    lower values exercise request coalescing and the response cache.
+    """
+    if scenario not in SCENARIOS:
+        raise ValueError(f"unknown scenario {scenario}")
+    provider = router.client
+    result = BenchResult(scenario, requests, concurrency, 0.0)
+    admit = router.scheduler.admit
+
+    async def timed_admit(*args: Any, **kwargs: Any) -> float:
+        start = time.monotonic()
+        try:
+            return await admit(*args, **kwargs)
+        finally:
+            result.admission_waits.append(time.monotonic() - start)
+
+    router.scheduler.admit = timed_admit  # type: ignore[method-assign]
+    previous = router_module._router
+    set_router(router)
+    call = _scenario_calls(router, scenario, result)
+    gate = asyncio.Semaphore(concurrency)
+    distinct = distinct or requests
+    cache_hits = router.response_cache.hits
+
+    async def one(i: int) -> None:
+        prompt = f"Benchmark message {i % distinct}: " + "lorem ipsum dolor sit amet " * 20
+        async with gate:
+            start = time.monotonic()
+            try:
+                text = await call(i, prompt)
+                status = "ok" if text else "empty"
+            except RateLimited:
+                status = "rate_limited"
+            except SafetyBlocked:
+                status = "blocked"
+            except Exception as exc:
+                status = type(exc).__name__
+            result.latencies.append(time.monotonic() - start)
+            result.statuses[status] += 1
+
+    start = time.monotonic()
+    try:
+        await asyncio.gather(*(one(i) for i in range(requests)))
+    finally:
+        result.elapsed = time.monotonic() - start
+        router.scheduler.admit = admit  # type: ignore[method-assign]
+        set_router(previous)
+
+    if isinstance(provider, FakeProvider):
+        result.provider_requests = len(provider.requests)
+        result.provider_busy = provider.busy_seconds
+        result.max_in_flight = provider.max_in_flight
+        result.injected = dict(provider.injected)
+    stats = router.scheduler.stats
+    result.scheduler = {
+        "admitted": dict(stats.admitted),
+        "queued": dict(stats.queued),
+        "shed": dict(stats.shed),
+        "expired": dict(stats.expired),
+    }
+    result.quota_left = {route: router.quota.remaining(route) for route in router.quota.limits}
+    result.cache_hits = router.response_cache.hits - cache_hits
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenario", choices=SCENARIOS, default="async")
+    parser.add_argument("-n", "--requests", type=int, default=200)
+    parser.add_argument("-c", "--concurrency", type=int, default=32)
+    parser.add_argument("--distinct", type=int, default=None, help="distinct prompts (default: all)")
+    parser.add_argument("--latency-ms", type=float, default=800.0, help="median provider latency")
+    parser.add_argument("--sigma", type=float, default=0.4, help="lognormal latency spread")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--server-error-rate", type=float, default=0.0)
+    parser.add_argument("--rpm", type=int, default=0, help="per-route RPM (0 = unlimited)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    provider = FakeProvider(
+        latency=Latency.lognormal(args.latency_ms / 1000, args.sigma, seed=args.seed),
+        rate_limit_rate=args.rate_limit_rate,
+        server_error_rate=args.server_error_rate,
+        seed=args.seed,
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        router = build_router(provider, args.rpm or None, os.path.join(tmp, "bench.db"))
+        result = asyncio.run(
+            run_bench(router, args.scenario, args.requests, args.concurrency, args.distinct)
+        )
+    print(format_result(result))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual entry point
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""Per-call state for LLM generation.
+
+A :class:`GenerationContext` travels with one ``generate*`` call through
+the router's tool loop.  It collects what the call produced besides its
+text (images from the ``generate_image`` tool), token usage per model turn
+and how long each tool took, so callers can read them back without racing
+other requests that are in flight on the same router.
+
+Example::
+
+    ctx = GenerationContext()
+    reply = await router.generate_async("general", messages, context=ctx)
+    files = [discord.File(io.BytesIO(data)) for _, data in ctx.images]
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TurnUsage:
+    """One model request inside a generation."""
+
+    model: str
+    tokens_in: int
+    tokens_out: int
+    ttfb_ms: int
+    total_ms: int
+    status: str
+    started: float = 0.0
+
+
+@dataclass
+class ToolRun:
+    """One tool invocation inside a generation."""
+
+    name: str
+    elapsed_ms: int
+    status: str
+
+
+@dataclass
+class GenerationContext:
+    """Artifacts, usage and timings gathered while serving one call.
+
+    *caller* names the feature the call is billed to in the usage ledger;
+    the router fills it from the calling module when left unset.
+    """
+
+    images: list[tuple[str, bytes]] = field(default_factory=list)
+    turns: list[TurnUsage] = field(default_factory=list)
+    tools: list[ToolRun] = field(default_factory=list)
+    started: float = field(default_factory=time.time)
+    caller: str | None = None
+    fallback: bool = False
+    # Set while a router call is using this context (fallbacks re-enter it)
+    in_call: bool = False
+
+    @property
+    def tokens_in(self) -> int:
+        return sum(turn.tokens_in for turn in self.turns)
+
+    @property
+    def tokens_out(self) -> int:
+        return sum(turn.tokens_out for turn in self.turns)
+
+    def add_image(self, prompt: str, data: bytes) -> None:
+        self.images.append((prompt, data))
+
+    def record_turn(
+        self,
+        model: str,
+        tokens_in: int,
+        tokens_out: int,
+        ttfb_ms: int,
+        total_ms: int,
+        status: str,
+        started: float = 0.0,
+    ) -> None:
+        self.turns.append(
+            TurnUsage(model, tokens_in, tokens_out, ttfb_ms, total_ms, status, started)
+        )
+
+    def record_tool(self, name: str, elapsed_ms: int, status: str) -> None:
+        self.tools.append(ToolRun(name, elapsed_ms, status))
+
+    def absorb(self, other: GenerationContext) -> None:
+        """Copy the artifacts of *other*, e.g. from a coalesced leader call.
+
+        Usage is not copied: the leader's turns were only paid for once.
+        """
+        if other is not self:
+            self.images.extend(other.images)
@@ -0,0 +1,124 @@
+"""Per-channel rolling buffer of recent messages for prompt context.
+
+Conversational replies need the last few minutes of a channel in three
+shapes: a timestamped chat log for the system prompt, a 24-hour transcript
+with active participants, and the user/bot turns of the current thread.
+Fetching those from Discord and Postgres on every mention costs several
+round trips before the model is even called, so the cog keeps them here
+instead -- appended from gateway events and seeded once per channel.
+
+Each channel holds at most ``maxlen`` messages in arrival order; edits and
+deletes are applied by message id in O(1).
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+from .tokenizer import estimate_tokens
+
+
+@dataclass
+class BufferedMessage:
+    """A cleaned channel message kept for prompt context."""
+
+    message_id: int
+    author_id: int
+    author: str
+    content: str
+    created_at: datetime
+    tokens: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.tokens:
+            self.tokens = estimate_tokens(self.content)
+
+
+class ChannelContextBuffer:
+    """Bounded, per-channel ring of :class:`BufferedMessage` records."""
+
+    def __init__(self, maxlen: int = 100) -> None:
+        self.maxlen = maxlen
+        self._channels: dict[int, OrderedDict[int, BufferedMessage]] = {}
+        self._seeded: set[int] = set()
+
+    def _ring(self, channel_id: int) -> OrderedDict[int, BufferedMessage]:
+        ring = self._channels.get(channel_id)
+        if ring is None:
+            ring = self._channels[channel_id] = OrderedDict()
+        return ring
+
+    def is_seeded(self, channel_id: int) -> bool:
+        return channel_id in self._seeded
+
+    def seed(self, channel_id: int, messages: Iterable[BufferedMessage]) -> None:
+        """Backfill *channel_id* with older *messages* (oldest first).
+
+        Messages already buffered from live events win over seeded copies
+        and stay at the newest end.
+        """
+        ring = self._ring(channel_id)
+        live = list(ring.values())
+        ring.clear()
+        for msg in messages:
+            ring[msg.message_id] = msg
+        for msg in live:
+            ring.pop(msg.message_id, None)
+            ring[msg.message_id] = msg
+        while len(ring) > self.maxlen:
+            ring.popitem(last=False)
+        self._seeded.add(channel_id)
+
+    def append(self, channel_id: int, msg: BufferedMessage) -> None:
+        ring = self._ring(channel_id)
+        ring[msg.message_id] = msg
+        ring.move_to_end(msg.message_id)
+        while len(ring) > self.maxlen:
+            ring.popitem(last=False)
+
+    def edit(self, channel_id: int, message_id: int, content: str) -> None:
+        msg = self._channels.get(channel_id, {}).get(message_id)
+        if msg is not None:
+            msg.content = content
+            msg.tokens = estimate_tokens(content)
+
+    def delete(self, channel_id: int, message_id: int) -> None:
+        ring = self._channels.get(channel_id)
+        if ring is not None:
+            ring.pop(message_id, None)
+
+    def recent(
+        self,
+        channel_id: int,
+        limit: int | None = None,
+        since: timedelta | None = None,
+        authors: set[int] | None = None,
+        exclude: int | None = None,
+    ) -> list[BufferedMessage]:
+        """Return buffered messages for *channel_id*, oldest first.
+
+        Args:
+            limit: Keep only the newest *limit* matches.
+            since: Drop messages older than this.
+            authors: Keep only messages from these author ids.
+            exclude: Skip this message id (usually the triggering message).
+        """
+        ring = self._channels.get(channel_id)
+        if not ring:
+            return []
+        cutoff = datetime.now(timezone.utc) - since if since is not None else None
+        matches: list[BufferedMessage] = []
+        for msg in reversed(ring.values()):
+            if cutoff is not None and msg.created_at < cutoff:
+                break
+            if msg.message_id == exclude:
+                continue
+            if authors is not None and msg.author_id not in authors:
+                continue
+            matches.append(msg)
+            if limit is not None and len(matches) >= limit:
+                break
+        matches.reverse()
+        return matches
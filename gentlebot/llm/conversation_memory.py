@@ -0,0 +1,164 @@
+"""Rolling per-(channel, user) conversation summaries.
+
+Conversational replies used to carry the last ten user/bot turns verbatim,
+so long threads grew the prompt until the oldest turns fell off and were
+forgotten outright.  :class:`ConversationMemory` instead keeps a short
+running summary per (channel, user): once enough turns have piled up since
+the last summary, the older ones are folded into it in the background (on
+the ``scheduled`` route, so it never competes with a reply) and only the
+newest few stay verbatim.  Each prompt then costs roughly one summary plus
+a handful of turns however long the conversation runs.
+
+Summaries live in :class:`StateCache` so they survive restarts.  Each one
+records the newest message id it covers, which is how already-summarized
+turns are told apart from pending ones in the channel context buffer.
+
+Example::
+
+    memory = ConversationMemory(summarize)
+    summary, pending = await memory.prepare(channel_id, user_id, turns)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Sequence
+
+from ..infra.state_cache import StateCache, get_state_cache
+from .context_buffer import BufferedMessage
+from .tokenizer import truncate_to_token_budget
+
+log = logging.getLogger(f"gentlebot.{__name__}")
+
+KEY_PREFIX = "conversation:"
+# Turns always kept verbatim after a compaction
+KEEP_TURNS = 4
+# Pending (unsummarized) turns that trigger a background compaction
+COMPACT_AT = 8
+# Upper bound on the stored summary
+SUMMARY_TOKENS = 300
+# Conversations idle this long start over
+TTL_HOURS = 72
+
+Summarizer = Callable[[str, Sequence[BufferedMessage]], Awaitable[str]]
+
+
+@dataclass
+class ConversationSummary:
+    """Running summary of one user's conversation with the bot in a channel."""
+
+    text: str = ""
+    # Newest message id folded into ``text``
+    through: int = 0
+    # Number of turns folded in so far
+    turns: int = 0
+
+
+class ConversationMemory:
+    """Summaries keyed by (channel, user), compacted in the background.
+
+    *summarize* is awaited with the previous summary text and the turns to
+    fold in (oldest first) and returns the new summary.
+    """
+
+    def __init__(
+        self,
+        summarize: Summarizer,
+        state: StateCache | None = None,
+        keep_turns: int = KEEP_TURNS,
+        compact_at: int = COMPACT_AT,
+        ttl_hours: float = TTL_HOURS,
+    ) -> None:
+        self.summarize = summarize
+        self.keep_turns = keep_turns
+        self.compact_at = max(compact_at, keep_turns + 1)
+        self.ttl_hours = ttl_hours
+        self._state = state
+        self._summaries: dict[tuple[int, int], ConversationSummary] = {}
+        self._tasks: dict[tuple[int, int], asyncio.Task] = {}
+
+    @property
+    def state(self) -> StateCache:
+        if self._state is None:
+            self._state = get_state_cache()
+        return self._state
+
+    @staticmethod
+    def _key(channel_id: int, user_id: int) -> str:
+        return f"{KEY_PREFIX}{channel_id}:{user_id}"
+
+    async def summary(self, channel_id: int, user_id: int) -> ConversationSummary:
+        """Return the summary for (*channel_id*, *user_id*), loading it once."""
+        key = (channel_id, user_id)
+        cached = self._summaries.get(key)
+        if cached is not None:
+            return cached
+        try:
+            stored = await asyncio.to_thread(self.state.get, self._key(channel_id, user_id))
+        except Exception:
+            log.exception("Failed to load conversation summary %s", key)
+            stored = None
+        summary = ConversationSummary(**stored) if isinstance(stored, dict) else ConversationSummary()
+        return self._summaries.setdefault(key, summary)
+
+    async def prepare(
+        self, channel_id: int, user_id: int, turns: Sequence[BufferedMessage]
+    ) -> tuple[str, list[BufferedMessage]]:
+        """Split *turns* (oldest first) into the summary text and pending turns.
+
+        Turns already covered by the summary are dropped.  When at least
+        ``compact_at`` turns are pending, all but the newest ``keep_turns``
+        are handed to a background compaction; until it lands they are
+        still returned verbatim, so nothing is lost in between.
+        """
+        summary = await self.summary(channel_id, user_id)
+        pending = [msg for msg in turns if msg.message_id > summary.through]
+        if len(pending) >= self.compact_at:
+            self._compact_soon((channel_id, user_id), pending[: -self.keep_turns])
+        return summary.text, pending
+
+    def _compact_soon(
+        self, key: tuple[int, int], older: list[BufferedMessage]
+    ) -> None:
+        task = self._tasks.get(key)
+        if task is not None and not task.done():
+            return
+        task = asyncio.create_task(self._compact(key, older))
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+
+    async def _compact(self, key: tuple[int, int], older: list[BufferedMessage]) -> None:
+        previous = self._summaries.get(key) or ConversationSummary()
+        older = [msg for msg in older if msg.message_id > previous.through]
+        if not older:
+            return
+        try:
+            text = await self.summarize(previous.text, older)
+        except Exception as exc:
+            # Pending turns stay verbatim and the next reply tries again.
+            log.warning("Conversation compaction failed for %s: %s", key, exc)
+            return
+        text = truncate_to_token_budget((text or "").strip(), SUMMARY_TOKENS)
+        if not text:
+            return
+        updated = ConversationSummary(text, older[-1].message_id, previous.turns + len(older))
+        self._summaries[key] = updated
+        try:
+            await asyncio.to_thread(
+                self.state.set, self._key(*key), asdict(updated), ttl_hours=self.ttl_hours
+            )
+        except Exception:
+            log.exception("Failed to persist conversation summary %s", key)
+        log.debug("Compacted %d turns for %s (%d total)", len(older), key, updated.turns)
+
+    async def wait_idle(self) -> None:
+        """Wait for in-flight compactions to finish."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks.values()), return_exceptions=True)
+
+    def close(self) -> None:
+        """Cancel in-flight compactions."""
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
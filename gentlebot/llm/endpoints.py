@@ -0,0 +1,153 @@
+"""Model endpoints and their rolling health.
+
+An :class:`Endpoint` is one (provider, model) pair a route can be served
+from.  Each route has a primary endpoint (``self.client`` with
+``MODEL_<ROUTE>``) and optional backups, e.g. a lighter Gemini model from
+``MODEL_<ROUTE>_BACKUP`` or another :class:`LLMProvider` registered with
+``router.add_endpoint``.
+
+:class:`EndpointHealth` keeps a short window of latencies and outcomes per
+endpoint and kind of request (``unary`` measures the whole response,
+``stream`` the time to the first chunk).  The router uses it to
+
+* rank endpoints: failing or markedly slower endpoints drop behind healthy
+  ones, otherwise the configured order wins;
+* decide when to hedge: an interactive request that has not answered by
+  its endpoint's p95 gets a backup request, and the first success wins.
+"""
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable
+
+from ..metrics import percentile
+from .providers.base import LLMProvider
+
+# Samples kept per endpoint and kind
+WINDOW = 50
+# Seconds after which a sample is forgotten, so a demoted endpoint is retried
+MAX_AGE = 300.0
+# Samples needed before percentiles are trusted
+MIN_SAMPLES = 8
+# Error rate above which an endpoint is ranked behind healthy ones
+UNHEALTHY_ERROR_RATE = 0.5
+# A healthy endpoint this many times slower (p50) than the best is demoted
+SLOW_FACTOR = 2.0
+
+# Hedge after the primary's p95, clamped to these bounds (seconds)
+HEDGE_MIN_DELAY = 1.0
+HEDGE_MAX_DELAY = 10.0
+# Used until the primary has MIN_SAMPLES samples
+HEDGE_DEFAULT_DELAY = {"unary": 8.0, "stream": 4.0}
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """One provider/model pair serving a route."""
+
+    provider: LLMProvider
+    model: str
+
+    @property
+    def name(self) -> str:
+        return f"{self.provider.name}:{self.model}"
+
+
+class EndpointStats:
+    """Sliding window of latencies and outcomes for one endpoint."""
+
+    def __init__(self, window: int = WINDOW, max_age: float = MAX_AGE) -> None:
+        self.max_age = max_age
+        self._latencies: deque[tuple[float, float]] = deque(maxlen=window)
+        self._outcomes: deque[tuple[float, bool]] = deque(maxlen=window)
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.max_age
+        for window in (self._latencies, self._outcomes):
+            while window and window[0][0] < cutoff:
+                window.popleft()
+
+    @property
+    def samples(self) -> int:
+        self._prune()
+        return len(self._latencies)
+
+    @property
+    def outcomes(self) -> int:
+        self._prune()
+        return len(self._outcomes)
+
+    @property
+    def error_rate(self) -> float:
+        self._prune()
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for _, ok in self._outcomes if not ok) / len(self._outcomes)
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the *pct* latency percentile in ms, or ``None`` if too few samples."""
+        self._prune()
+        if len(self._latencies) < MIN_SAMPLES:
+            return None
+        return percentile((latency for _, latency in self._latencies), pct)
+
+    def observe(self, latency_ms: float, ok: bool) -> None:
+        now = time.monotonic()
+        self._outcomes.append((now, ok))
+        if ok:
+            # Failures are often instant and would make the endpoint look fast.
+            self._latencies.append((now, latency_ms))
+
+
+class EndpointHealth:
+    """Rolling latency and error estimates for every endpoint the router uses."""
+
+    def __init__(self) -> None:
+        self._stats: dict[tuple[str, str], EndpointStats] = {}
+
+    def stats(self, endpoint: Endpoint, kind: str = "unary") -> EndpointStats:
+        key = (endpoint.name, kind)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = EndpointStats()
+        return stats
+
+    def observe(self, endpoint: Endpoint, kind: str, latency_ms: float, ok: bool) -> None:
+        self.stats(endpoint, kind).observe(latency_ms, ok)
+
+    def rank(self, endpoints: Iterable[Endpoint], kind: str = "unary") -> list[Endpoint]:
+        """Order *endpoints* best first, keeping the configured order among equals."""
+        endpoints = list(endpoints)
+        if len(endpoints) < 2:
+            return endpoints
+        stats = [self.stats(e, kind) for e in endpoints]
+        unhealthy = [
+            s.outcomes >= MIN_SAMPLES and s.error_rate > UNHEALTHY_ERROR_RATE
+            for s in stats
+        ]
+        medians = [s.percentile(50) for s in stats]
+        healthy = [m for m, bad in zip(medians, unhealthy) if m is not None and not bad]
+        best = min(healthy, default=None)
+        slow = [
+            best is not None and m is not None and m > best * SLOW_FACTOR for m in medians
+        ]
+        order = sorted(range(len(endpoints)), key=lambda i: (unhealthy[i], slow[i], i))
+        return [endpoints[i] for i in order]
+
+    def hedge_delay(self, endpoint: Endpoint, kind: str = "unary") -> float:
+        """Seconds to wait on *endpoint* before sending a backup request."""
+        p95 = self.stats(endpoint, kind).percentile(95)
+        if p95 is None:
+            return HEDGE_DEFAULT_DELAY.get(kind, HEDGE_MAX_DELAY)
+        return min(HEDGE_MAX_DELAY, max(HEDGE_MIN_DELAY, p95 / 1000))
+
+    def snapshot(self) -> list[tuple[str, str, EndpointStats]]:
+        """Return ``(endpoint, kind, stats)`` for every endpoint seen so far."""
+        return [(name, kind, stats) for (name, kind), stats in sorted(self._stats.items())]
+
+    def reset(self) -> None:
+        self._stats.clear()
@@ -0,0 +1,239 @@
+"""Ledger of LLM calls: who asked, what it cost and how long it took.
+
+Every public router call (``generate``, ``generate_async``,
+``generate_stream``) produces one :class:`LLMCall`.  Calls are aggregated in
+memory per (caller, route) for ``/llmstats`` and, once a Postgres pool is
+attached, written to ``discord.llm_call`` in batches so recording never
+waits on the database.
+
+The caller is the module that invoked the router (``gemini_cog``,
+``book_enrichment_cog``, ...) unless a :class:`GenerationContext` names one
+explicitly.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+from ..metrics import Histogram
+
+log = logging.getLogger(f"gentlebot.{__name__}")
+
+# LLM latency histogram bucket bounds (ms), sized for multi-second calls
+BUCKETS_MS: tuple[float, ...] = (
+    250, 500, 1000, 2000, 3000, 5000, 8000, 13000, 20000, 30000, 60000
+)
+
+FLUSH_INTERVAL = 5.0
+MAX_BATCH = 200
+# Rows kept while the database is unreachable before the oldest are dropped
+MAX_PENDING = 2000
+
+_INTERNAL_PREFIXES = (
+    "gentlebot.llm.", "gentlebot.infra.", "asyncio", "concurrent.", "threading", "contextlib"
+)
+
+INSERT_SQL = """
+    INSERT INTO discord.llm_call (
+        route, model, caller, tokens_in, tokens_out, cache_hit, attempts,
+        fallback, ttfb_ms, latency_ms, status, created_at
+    ) VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12)
+"""
+
+
+def caller_name(skip: int = 2, depth: int = 12) -> str:
+    """Return the short module name of the first frame outside the LLM stack."""
+    frame = sys._getframe(skip)
+    for _ in range(depth):
+        if frame is None:
+            break
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith(_INTERNAL_PREFIXES):
+            return module.rsplit(".", 1)[-1]
+        frame = frame.f_back
+    return "unknown"
+
+
+@dataclass
+class LLMCall:
+    """One public router call as recorded in the ledger."""
+
+    route: str
+    model: str
+    caller: str
+    tokens_in: int
+    tokens_out: int
+    cache_hit: bool
+    attempts: int
+    fallback: bool
+    ttfb_ms: int
+    latency_ms: int
+    status: str
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def row(self) -> tuple[Any, ...]:
+        return (
+            self.route,
+            self.model,
+            self.caller,
+            self.tokens_in,
+            self.tokens_out,
+            self.cache_hit,
+            self.attempts,
+            self.fallback,
+            self.ttfb_ms,
+            self.latency_ms,
+            self.status,
+            self.created_at,
+        )
+
+
+@dataclass
+class CallStats:
+    """Latency histogram and token totals for one (caller, route) pair."""
+
+    caller: str
+    route: str
+    calls: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    fallbacks: int = 0
+    tokens_in: int = 0
+    tokens_out: int = 0
+    # Cache hits are left out; they are near-instant and would hide model latency
+    latency: Histogram = field(default_factory=lambda: Histogram(BUCKETS_MS))
+
+    @property
+    def max_ms(self) -> float:
+        return self.latency.max
+
+    def percentile(self, pct: float) -> float:
+        """Return the latency bucket bound holding the *pct* percentile (ms)."""
+        return self.latency.percentile(pct)
+
+    def observe(self, call: LLMCall) -> None:
+        self.calls += 1
+        self.tokens_in += call.tokens_in
+        self.tokens_out += call.tokens_out
+        if call.status not in ("ok", "cache_hit", "shared"):
+            self.errors += 1
+        if call.fallback:
+            self.fallbacks += 1
+        if call.cache_hit:
+            self.cache_hits += 1
+            return
+        self.latency.observe(call.latency_ms)
+
+
+class LLMLedger:
+    """Aggregate :class:`LLMCall` records and batch them into Postgres."""
+
+    def __init__(
+        self, flush_interval: float = FLUSH_INTERVAL, max_batch: int = MAX_BATCH
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.written = 0
+        self.dropped = 0
+        self._stats: dict[tuple[str, str], CallStats] = {}
+        self._pending: list[LLMCall] = []
+        self._lock = threading.Lock()
+        self._pool: Any = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushing: asyncio.Task | None = None
+
+    def attach(self, pool: Any) -> None:
+        """Start writing rows through *pool* from the running event loop."""
+        self._pool = pool
+        self._loop = asyncio.get_running_loop()
+
+    def record(self, call: LLMCall) -> None:
+        """Add *call* to the in-memory stats and queue it for the database.
+
+        Safe to call from worker threads; never blocks on I/O.
+        """
+        with self._lock:
+            key = (call.caller, call.route)
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = CallStats(call.caller, call.route)
+            stats.observe(call)
+            if self._pool is None:
+                return
+            self._pending.append(call)
+            if len(self._pending) > MAX_PENDING:
+                overflow = len(self._pending) - MAX_PENDING
+                del self._pending[:overflow]
+                self.dropped += overflow
+            full = len(self._pending) >= self.max_batch
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._schedule(full)
+        else:
+            loop.call_soon_threadsafe(self._schedule, full)
+
+    def _schedule(self, now: bool) -> None:
+        if now:
+            self._start_flush()
+        elif self._timer is None:
+            assert self._loop is not None
+            self._timer = self._loop.call_later(self.flush_interval, self._start_flush)
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._flushing is None or self._flushing.done():
+            self._flushing = asyncio.ensure_future(self.flush())
+
+    async def flush(self) -> None:
+        """Write every pending row now."""
+        while self._pool is not None:
+            with self._lock:
+                batch = self._pending[: self.max_batch]
+                del self._pending[: self.max_batch]
+            if not batch:
+                return
+            try:
+                await self._pool.executemany(INSERT_SQL, [call.row() for call in batch])
+            except Exception:
+                log.exception("Failed to write %d llm_call rows", len(batch))
+                with self._lock:
+                    self._pending[:0] = batch
+                return
+            self.written += len(batch)
+
+    async def close(self) -> None:
+        """Flush what is pending and stop writing."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._flushing is not None and not self._flushing.done():
+            await self._flushing
+        await self.flush()
+        self._pool = None
+
+    def top(self, limit: int = 10, by: str = "tokens_in") -> list[CallStats]:
+        """Return the *limit* heaviest (caller, route) pairs ranked by *by*."""
+        return sorted(self, key=lambda s: getattr(s, by), reverse=True)[:limit]
+
+    def __iter__(self) -> Iterator[CallStats]:
+        with self._lock:
+            return iter(list(self._stats.values()))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._pending.clear()
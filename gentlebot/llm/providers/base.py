@@ -6,9 +6,10 @@ changing the router or cog code.
 """
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 
 @dataclass
@@ -144,6 +145,63 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def generate_async(
+        self,
+        model: str,
+        messages: List[Message],
+        temperature: float = 0.6,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        system_instruction: Optional[str] = None,
+        json_mode: bool = False,
+        **kwargs: Any,
+    ) -> GenerationResult:
+        """Async variant of :meth:`generate`.
+
+        The default runs :meth:`generate` in a worker thread; providers whose
+        SDK has a native async client should override this.
+        """
+        return await asyncio.to_thread(
+            self.generate,
+            model,
+            messages,
+            temperature,
+            max_tokens,
+            tools,
+            system_instruction,
+            json_mode,
+            **kwargs,
+        )
+
+    async def generate_stream(
+        self,
+        model: str,
+        messages: List[Message],
+        temperature: float = 0.6,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        system_instruction: Optional[str] = None,
+        json_mode: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[GenerationResult]:
+        """Yield a completion incrementally as partial results.
+
+        Each result's ``text`` is a delta to append to what came before;
+        tool calls and usage arrive on whichever chunk carries them.  The
+        default yields the whole :meth:`generate_async` result as one chunk;
+        providers with a streaming API should override this.
+        """
+        yield await self.generate_async(
+            model,
+            messages,
+            temperature,
+            max_tokens,
+            tools,
+            system_instruction,
+            json_mode,
+            **kwargs,
+        )
+
     @abstractmethod
     def convert_tool_schema(self, tool: "Tool") -> Dict[str, Any]:
         """Convert a provider-agnostic tool to provider-specific format.
@@ -162,6 +220,15 @@ class LLMProvider(ABC):
         """Provider name for logging and identification."""
         pass
 
+    @property
+    def supports_context_cache(self) -> bool:
+        """Whether the provider reuses a server-side cache for stable prefixes.
+
+        Providers that can cache the system instruction and tool block
+        should override this; callers only use it for logging and metrics.
+        """
+        return False
+
     def estimate_tokens(self, text: str) -> int:
         """Estimate token count for the given text.
 
@@ -0,0 +1,419 @@
+"""Deterministic fake LLM provider for tests and offline benchmarks.
+
+:class:`FakeProvider` implements :class:`LLMProvider` without touching the
+network.  It answers after a latency drawn from a seeded
+:class:`Latency` distribution, can inject HTTP 429 and 5xx errors at a
+configured rate (raised as the Gemini SDK's own error types, so the router
+retries and falls back exactly as it does in production), and serves
+responses from a JSON :class:`Cassette` recorded from a real provider.
+
+Example::
+
+    provider = FakeProvider(latency=Latency.lognormal(0.8, 0.4), server_error_rate=0.05)
+    router.client = provider
+    await router.generate_async("general", messages)
+
+    # Record real answers once, then replay them offline
+    cassette = Cassette("tests/cassettes/tldr.json")
+    recorder = FakeProvider(cassette=cassette, record_from=GeminiProvider(api_key))
+    ...
+    cassette.save()
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
+
+from ..tokenizer import estimate_tokens, estimate_tokens_for_messages
+from .base import GenerationResult, LLMProvider, ToolCall
+
+log = logging.getLogger(f"gentlebot.{__name__}")
+
+try:
+    from google.genai.errors import ClientError, ServerError  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    ClientError = ServerError = None  # type: ignore[assignment,misc]
+
+
+class FakeAPIError(Exception):
+    """HTTP error raised when the Gemini SDK is not installed."""
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(f"{code} {message}")
+        self.code = code
+
+
+def api_error(code: int, message: str = "injected by FakeProvider") -> Exception:
+    """Return an error the router treats like a Gemini API error with *code*."""
+    if ClientError is None:
+        return FakeAPIError(code, message)
+    error_cls = ClientError if code < 500 else ServerError
+    return error_cls(code, {"error": {"code": code, "message": message}})
+
+
+class Latency:
+    """Seeded latency distribution, sampled in seconds.
+
+    Use the constructors :meth:`fixed`, :meth:`uniform` and
+    :meth:`lognormal`; the same seed always yields the same sequence.
+    """
+
+    def __init__(self, sample: Callable[[random.Random], float], seed: int = 0) -> None:
+        self._sample = sample
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def fixed(cls, seconds: float) -> Latency:
+        return cls(lambda rng: seconds)
+
+    @classmethod
+    def uniform(cls, low: float, high: float, seed: int = 0) -> Latency:
+        return cls(lambda rng: rng.uniform(low, high), seed)
+
+    @classmethod
+    def lognormal(cls, median: float, sigma: float = 0.5, seed: int = 0) -> Latency:
+        """Right-skewed latency with the given *median*, like real model calls."""
+        mu = math.log(median) if median > 0 else 0.0
+        return cls(lambda rng: rng.lognormvariate(mu, sigma) if median > 0 else 0.0, seed)
+
+    def sample(self) -> float:
+        with self._lock:
+            return max(0.0, self._sample(self._rng))
+
+
+@dataclass
+class FakeRequest:
+    """One request as seen by :class:`FakeProvider`."""
+
+    model: str
+    messages: List[Any]
+    system_instruction: Optional[str] = None
+    tools: Optional[List[Dict[str, Any]]] = None
+    temperature: float = 0.6
+    json_mode: bool = False
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def prompt(self) -> str:
+        """Content of the last message."""
+        if not self.messages:
+            return ""
+        last = self.messages[-1]
+        return str(last.get("content", "") if isinstance(last, dict) else getattr(last, "content", ""))
+
+
+class Cassette:
+    """Recorded responses keyed by model, messages, system prompt and JSON mode.
+
+    Entries are plain JSON (``text``, ``tool_calls``, ``usage``) so cassettes
+    can be reviewed and edited by hand.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path else None
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        if self.path is not None and self.path.exists():
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+
+    @staticmethod
+    def key(request: FakeRequest) -> str:
+        messages = [
+            m if isinstance(m, dict) else {"role": m.role, "content": m.content}
+            for m in request.messages
+        ]
+        payload = json.dumps(
+            [request.model, messages, request.system_instruction, request.json_mode],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, request: FakeRequest) -> GenerationResult | None:
+        entry = self.entries.get(self.key(request))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return GenerationResult(
+            text=entry.get("text", ""),
+            tool_calls=[ToolCall.from_dict(call) for call in entry.get("tool_calls", [])],
+            usage=entry.get("usage"),
+            finish_reason=entry.get("finish_reason"),
+        )
+
+    def put(self, request: FakeRequest, result: GenerationResult) -> None:
+        self.entries[self.key(request)] = {
+            "text": result.text,
+            "tool_calls": [call.to_dict() for call in result.tool_calls],
+            "usage": result.usage,
+            "finish_reason": result.finish_reason,
+        }
+
+    def save(self) -> None:
+        if self.path is None:
+            raise ValueError("cassette has no path")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True), encoding="utf-8")
+
+
+Responder = Union[str, Callable[[FakeRequest], Union[str, GenerationResult]]]
+
+
+class FakeProvider(LLMProvider):
+    """In-process provider with configurable latency, faults and cassettes.
+
+    Args:
+        responses: Reply text, or a callable mapping a :class:`FakeRequest`
+            to text or a :class:`GenerationResult`.  Defaults to echoing the
+            last message.
+        latency: Seconds before the response (or first streamed chunk).
+        rate_limit_rate: Fraction of requests failing with HTTP 429.
+        server_error_rate: Fraction of requests failing with HTTP 503.
+        cassette: Serve recorded responses; a miss raises ``LookupError``
+            unless *record_from* is set.
+        record_from: Real provider to call (and record) on cassette misses.
+        chunk_size: Characters per streamed chunk.
+        chunk_delay: Seconds between streamed chunks.
+        seed: Seed for fault injection.
+    """
+
+    def __init__(
+        self,
+        responses: Responder | None = None,
+        *,
+        latency: Latency | float = 0.0,
+        rate_limit_rate: float = 0.0,
+        server_error_rate: float = 0.0,
+        cassette: Cassette | None = None,
+        record_from: LLMProvider | None = None,
+        chunk_size: int = 24,
+        chunk_delay: float = 0.0,
+        seed: int = 0,
+        name: str = "fake",
+    ) -> None:
+        self.responses = responses
+        self.latency = latency if isinstance(latency, Latency) else Latency.fixed(latency)
+        self.rate_limit_rate = rate_limit_rate
+        self.server_error_rate = server_error_rate
+        self.cassette = cassette
+        self.record_from = record_from
+        self.chunk_size = max(1, chunk_size)
+        self.chunk_delay = chunk_delay
+        self._name = name
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests: list[FakeRequest] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.injected: dict[int, int] = {}
+        self.busy_seconds = 0.0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def convert_tool_schema(self, tool: Any) -> Dict[str, Any]:
+        return tool.to_gemini_schema()
+
+    def _begin(
+        self,
+        model: str,
+        messages: List[Any],
+        temperature: float,
+        tools: Optional[List[Dict[str, Any]]],
+        system_instruction: Optional[str],
+        json_mode: bool,
+        options: Dict[str, Any],
+    ) -> tuple[FakeRequest, float, int | None]:
+        """Log the request and draw its latency and injected fault."""
+        request = FakeRequest(
+            model, list(messages), system_instruction, tools, temperature, json_mode, options
+        )
+        delay = self.latency.sample()
+        with self._lock:
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            roll = self._rng.random()
+        fault = None
+        if roll < self.rate_limit_rate:
+            fault = 429
+        elif roll < self.rate_limit_rate + self.server_error_rate:
+            fault = 503
+        return request, delay, fault
+
+    def _end(self, elapsed: float, fault: int | None) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.busy_seconds += elapsed
+            if fault is not None:
+                self.injected[fault] = self.injected.get(fault, 0) + 1
+
+    def _respond(self, request: FakeRequest) -> GenerationResult | None:
+        """Return the scripted or replayed response, or ``None`` to record one."""
+        if self.cassette is not None:
+            result = self.cassette.get(request)
+            if result is not None or self.record_from is not None:
+                return result
+            raise LookupError(f"no recorded response for {request.prompt[:60]!r}")
+        if callable(self.responses):
+            reply = self.responses(request)
+        elif self.responses is not None:
+            reply = self.responses
+        else:
+            reply = f"Fake reply to: {request.prompt[:80]}"
+        if isinstance(reply, GenerationResult):
+            return reply
+        return GenerationResult(text=reply, finish_reason="stop")
+
+    def _with_usage(self, request: FakeRequest, result: GenerationResult) -> GenerationResult:
+        if result.usage is not None:
+            return result
+        messages = [m if isinstance(m, dict) else m.to_dict() for m in request.messages]
+        tokens_in = estimate_tokens_for_messages(messages, request.system_instruction)
+        tokens_out = estimate_tokens(result.text)
+        return replace(
+            result,
+            usage={
+                "input_tokens": tokens_in,
+                "output_tokens": tokens_out,
+                "total_tokens": tokens_in + tokens_out,
+            },
+        )
+
+    def _record(self, request: FakeRequest, result: GenerationResult) -> GenerationResult:
+        assert self.cassette is not None
+        self.cassette.put(request, result)
+        return result
+
+    def _real_kwargs(self, request: FakeRequest) -> Dict[str, Any]:
+        return dict(
+            model=request.model,
+            messages=request.messages,
+            temperature=request.temperature,
+            tools=request.tools,
+            system_instruction=request.system_instruction,
+            json_mode=request.json_mode,
+            **request.options,
+        )
+
+    def generate(
+        self,
+        model: str,
+        messages: List[Any],
+        temperature: float = 0.6,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        system_instruction: Optional[str] = None,
+        json_mode: bool = False,
+        **kwargs: Any,
+    ) -> GenerationResult:
+        request, delay, fault = self._begin(
+            model, messages, temperature, tools, system_instruction, json_mode, kwargs
+        )
+        start = time.monotonic()
+        try:
+            time.sleep(delay)
+            if fault is not None:
+                raise api_error(fault)
+            result = self._respond(request)
+            if result is None:
+                assert self.record_from is not None
+                result = self._record(
+                    request, self.record_from.generate(**self._real_kwargs(request))
+                )
+            return self._with_usage(request, result)
+        finally:
+            self._end(time.monotonic() - start, fault)
+
+    async def generate_async(
+        self,
+        model: str,
+        messages: List[Any],
+        temperature: float = 0.6,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        system_instruction: Optional[str] = None,
+        json_mode: bool = False,
+        **kwargs: Any,
+    ) -> GenerationResult:
+        request, delay, fault = self._begin(
+            model, messages, temperature, tools, system_instruction, json_mode, kwargs
+        )
+        start = time.monotonic()
+        try:
+            await asyncio.sleep(delay)
+            if fault is not None:
+                raise api_error(fault)
+            result = self._respond(request)
+            if result is None:
+                assert self.record_from is not None
+                result = self._record(
+                    request,
+                    await self.record_from.generate_async(**self._real_kwargs(request)),
+                )
+            return self._with_usage(request, result)
+        finally:
+            self._end(time.monotonic() - start, fault)
+
+    async def generate_stream(
+        self,
+        model: str,
+        messages: List[Any],
+        temperature: float = 0.6,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        system_instruction: Optional[str] = None,
+        json_mode: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[GenerationResult]:
+        """Stream the response in ``chunk_size`` pieces after the sampled latency."""
+        request, delay, fault = self._begin(
+            model, messages, temperature, tools, system_instruction, json_mode, kwargs
+        )
+        start = time.monotonic()
+        try:
+            await asyncio.sleep(delay)
+            if fault is not None:
+                raise api_error(fault)
+            result = self._respond(request)
+            if result is None:
+                assert self.record_from is not None
+                result = self._record(
+                    request,
+                    await self.record_from.generate_async(**self._real_kwargs(request)),
+                )
+            result = self._with_usage(request, result)
+            text = result.text
+            for i in range(0, len(text), self.chunk_size):
+                if i and self.chunk_delay:
+                    await asyncio.sleep(self.chunk_delay)
+                yield GenerationResult(text=text[i : i + self.chunk_size])
+            yield GenerationResult(
+                text="",
+                tool_calls=result.tool_calls,
+                usage=result.usage,
+                finish_reason=result.finish_reason,
+            )
+        finally:
+            self._end(time.monotonic() - start, fault)
+
+    def reset(self) -> None:
+        """Forget recorded requests and counters."""
+        with self._lock:
+            self.requests.clear()
+            self.injected.clear()
+            self.max_in_flight = self.in_flight
+            self.busy_seconds = 0.0
@@ -5,12 +5,17 @@ interface, wrapping the google-genai SDK.
 """
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
 from types import SimpleNamespace
 
 from .base import LLMProvider, Message, GenerationResult, ToolCall
 from ...infra.retries import _extract_status
+from ...infra.singleflight import SingleFlight
 
 try:
     from google import genai  # type: ignore
@@ -24,6 +29,22 @@ except Exception:  # pragma: no cover - optional dependency
             def generate_content(*a: Any, **k: Any) -> Any:
                 raise RuntimeError("google-genai library not installed")
 
+        class caches:
+            @staticmethod
+            def create(*a: Any, **k: Any) -> Any:
+                raise RuntimeError("google-genai library not installed")
+
+        class aio:
+            class models:
+                @staticmethod
+                async def generate_content(*a: Any, **k: Any) -> Any:
+                    raise RuntimeError("google-genai library not installed")
+
+            class caches:
+                @staticmethod
+                async def create(*a: Any, **k: Any) -> Any:
+                    raise RuntimeError("google-genai library not installed")
+
     class _DummyTypes:
         class GenerateContentConfig:
             def __init__(self, *a: Any, **k: Any) -> None:
@@ -33,6 +54,10 @@ except Exception:  # pragma: no cover - optional dependency
             def __init__(self, *a: Any, **k: Any) -> None:
                 pass
 
+        class CreateCachedContentConfig:
+            def __init__(self, *a: Any, **k: Any) -> None:
+                pass
+
         class Part:
             @staticmethod
             def from_bytes(data: bytes, mime_type: str) -> bytes:
@@ -42,11 +67,85 @@ except Exception:  # pragma: no cover - optional dependency
 
 log = logging.getLogger(f"gentlebot.{__name__}")
 
+# SDK errors carrying an HTTP status; async retries are limited to these so
+# network and programming errors fail fast, as with ``call_with_backoff``.
+try:
+    from google.genai.errors import APIError as _APIError  # type: ignore
+
+    RETRYABLE_ERRORS: tuple[type[Exception], ...] = (_APIError,)
+except Exception:  # pragma: no cover - optional dependency
+    RETRYABLE_ERRORS = ()
+
 
 # Gemini accepts only ``user`` or ``model`` roles; map assistant messages to
 # ``model`` and treat all others as ``user``.
 ROLE_MAP = {"user": "user", "assistant": "model", "system": "user"}
 
+# Lifetime of cached-content handles; refreshed a minute before expiry.
+DEFAULT_CACHE_TTL = 3600
+_CACHE_REFRESH_MARGIN = 60
+
+
+def _cached_content_rejected(exc: BaseException) -> bool:
+    """Whether *exc* says the request's cached-content handle is missing or invalid.
+
+    Rate limits and server errors are not: the handle is fine and the
+    caller's backoff should see the error untouched.
+    """
+    if _extract_status(exc) not in (400, 403, 404):
+        return False
+    message = str(exc).lower().replace(" ", "")
+    return "cachedcontent" in message
+
+
+class ContextCache:
+    """Cached-content handles for stable request prefixes.
+
+    Gemini can store a system instruction and tool block server-side and
+    bill later requests that reference the handle at the cached-token rate.
+    Handles are keyed by model, system instruction and tools, so any change
+    to the prefix gets a fresh handle.  Prefixes the API refuses to cache
+    (for example ones below the minimum cacheable size) are remembered and
+    retried only after a TTL.
+    """
+
+    def __init__(self, ttl_seconds: int = DEFAULT_CACHE_TTL) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._handles: dict[str, tuple[str, float]] = {}
+        self._failed: dict[str, float] = {}
+        self._flights = SingleFlight("gemini_context_cache")
+        self.hits = 0
+        self.created = 0
+
+    @staticmethod
+    def key(model: str, system_instruction: str, tools: Optional[List[Dict[str, Any]]]) -> str:
+        payload = json.dumps([model, system_instruction, tools], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> str | None:
+        """Return a live handle name for *key*, or ``None``."""
+        entry = self._handles.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            self.hits += 1
+            return entry[0]
+        return None
+
+    def should_create(self, key: str) -> bool:
+        return self._failed.get(key, 0.0) <= time.monotonic()
+
+    def store(self, key: str, name: str) -> str:
+        self.created += 1
+        expires = time.monotonic() + self.ttl_seconds - _CACHE_REFRESH_MARGIN
+        self._handles[key] = (name, expires)
+        return name
+
+    def fail(self, key: str, exc: Exception) -> None:
+        log.info("Gemini context cache unavailable for prefix %s: %s", key[:12], exc)
+        self._failed[key] = time.monotonic() + self.ttl_seconds
+
+    def invalidate(self, key: str) -> None:
+        self._handles.pop(key, None)
+
 
 class GeminiProvider(LLMProvider):
     """Gemini LLM provider implementing the abstract interface.
@@ -55,12 +154,15 @@ class GeminiProvider(LLMProvider):
     interface for consistency with other providers.
     """
 
-    def __init__(self, api_key: str | None) -> None:
+    def __init__(self, api_key: str | None, context_cache: bool | None = None) -> None:
         """Create a Gemini provider.
 
         Args:
             api_key: API key for Gemini. If not provided, a placeholder is used
                      but requests will fail.
+            context_cache: Serve system instructions and tools from cached
+                content handles.  Defaults to the ``GEMINI_CONTEXT_CACHE``
+                environment variable (off when unset).
         """
         if not api_key:
             log.warning("GEMINI_API_KEY not configured; using placeholder key")
@@ -69,6 +171,20 @@ class GeminiProvider(LLMProvider):
             log.debug("GEMINI_API_KEY provided (%d chars)", len(api_key))
 
         self.client = genai.Client(api_key=api_key)
+        if context_cache is None:
+            context_cache = os.getenv("GEMINI_CONTEXT_CACHE", "").strip().lower() in {
+                "1", "true", "yes", "on"
+            }
+        self.context_cache: ContextCache | None = (
+            ContextCache(int(os.getenv("GEMINI_CONTEXT_CACHE_TTL", DEFAULT_CACHE_TTL)))
+            if context_cache
+            else None
+        )
+
+    @property
+    def supports_context_cache(self) -> bool:
+        """Whether requests reuse cached-content handles for their prefix."""
+        return self.context_cache is not None
 
     @property
     def name(self) -> str:
@@ -148,35 +264,243 @@ class GeminiProvider(LLMProvider):
         Returns:
             GenerationResult with text and/or tool calls
         """
-        thinking_budget = kwargs.get("thinking_budget", 0)
+        content = self._convert_messages(messages)
+        cache_key, cached = self._cached_prefix(model, system_instruction, tools)
+
+        def call(handle: str | None) -> Any:
+            config = self._build_config(
+                temperature,
+                tools,
+                system_instruction,
+                json_mode,
+                kwargs.get("thinking_budget", 0),
+                handle,
+            )
+            return self.client.models.generate_content(
+                model=model, contents=content, config=config
+            )
 
-        config = genai.types.GenerateContentConfig(
-            temperature=temperature,
-            system_instruction=system_instruction,
-        )
-        if json_mode:
-            config.response_mime_type = "application/json"
-        if thinking_budget:
-            config.thinking = genai.types.ThinkingConfig(budget_tokens=thinking_budget)
-        if tools:
-            config.tools = tools
+        try:
+            try:
+                response = call(cached)
+            except Exception as exc:
+                if cached is None or not _cached_content_rejected(exc):
+                    raise
+                # The handle expired server-side; resend once with the full prefix.
+                self._drop_cached_prefix(cache_key, exc)
+                response = call(None)
+        except Exception as exc:
+            self._log_error(exc)
+            raise
+        return self._to_result(response, tools)
+
+    async def generate_async(
+        self,
+        model: str,
+        messages: List[Message] | List[Dict[str, Any]],
+        temperature: float = 0.6,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        system_instruction: Optional[str] = None,
+        json_mode: bool = False,
+        **kwargs: Any,
+    ) -> GenerationResult:
+        """Generate a completion using the SDK's native async client.
 
+        Takes the same arguments as :meth:`generate` but awaits
+        ``client.aio`` instead of blocking a thread.
+        """
         content = self._convert_messages(messages)
+        cache_key, cached = await self._cached_prefix_async(model, system_instruction, tools)
+
+        async def call(handle: str | None) -> Any:
+            config = self._build_config(
+                temperature,
+                tools,
+                system_instruction,
+                json_mode,
+                kwargs.get("thinking_budget", 0),
+                handle,
+            )
+            return await self.client.aio.models.generate_content(
+                model=model, contents=content, config=config
+            )
 
         try:
-            response = self.client.models.generate_content(
+            try:
+                response = await call(cached)
+            except Exception as exc:
+                if cached is None or not _cached_content_rejected(exc):
+                    raise
+                self._drop_cached_prefix(cache_key, exc)
+                response = await call(None)
+        except Exception as exc:
+            self._log_error(exc)
+            raise
+        return self._to_result(response, tools)
+
+    async def generate_stream(
+        self,
+        model: str,
+        messages: List[Message] | List[Dict[str, Any]],
+        temperature: float = 0.6,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        system_instruction: Optional[str] = None,
+        json_mode: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[GenerationResult]:
+        """Stream a completion from ``client.aio`` chunk by chunk.
+
+        A rejected cached prefix is retried with the full prefix only if no
+        chunk has been yielded yet.
+        """
+        content = self._convert_messages(messages)
+        cache_key, cached = await self._cached_prefix_async(model, system_instruction, tools)
+
+        async def open_stream(handle: str | None) -> Any:
+            config = self._build_config(
+                temperature,
+                tools,
+                system_instruction,
+                json_mode,
+                kwargs.get("thinking_budget", 0),
+                handle,
+            )
+            return await self.client.aio.models.generate_content_stream(
                 model=model, contents=content, config=config
             )
+
+        started = False
+        try:
+            try:
+                stream = await open_stream(cached)
+                async for chunk in stream:
+                    started = True
+                    yield self._to_result(chunk, tools)
+            except Exception as exc:
+                if cached is None or started or not _cached_content_rejected(exc):
+                    raise
+                self._drop_cached_prefix(cache_key, exc)
+                stream = await open_stream(None)
+                async for chunk in stream:
+                    yield self._to_result(chunk, tools)
         except Exception as exc:
-            status = _extract_status(exc)
-            if status == 429:
-                log.warning("Gemini rate-limited (429): %s", exc)
-            elif status == 400:
-                log.warning("Gemini client error (400): %s", exc)
-            else:
-                log.exception("Gemini API call failed: %s", exc)
+            self._log_error(exc)
             raise
 
+    def _cache_config(
+        self, system_instruction: str, tools: Optional[List[Dict[str, Any]]]
+    ) -> Any:
+        assert self.context_cache is not None
+        config = genai.types.CreateCachedContentConfig(
+            system_instruction=system_instruction,
+            ttl=f"{self.context_cache.ttl_seconds}s",
+        )
+        if tools:
+            config.tools = tools
+        return config
+
+    def _cached_prefix(
+        self,
+        model: str,
+        system_instruction: Optional[str],
+        tools: Optional[List[Dict[str, Any]]],
+    ) -> tuple[str, str | None]:
+        """Return ``(key, handle name)`` for the request prefix, creating it if needed."""
+        cache = self.context_cache
+        if cache is None or not system_instruction:
+            return "", None
+        key = cache.key(model, system_instruction, tools)
+        name = cache.lookup(key)
+        if name is not None or not cache.should_create(key):
+            return key, name
+
+        def _create() -> str | None:
+            try:
+                created = self.client.caches.create(
+                    model=model, config=self._cache_config(system_instruction, tools)
+                )
+            except Exception as exc:
+                cache.fail(key, exc)
+                return None
+            return cache.store(key, created.name)
+
+        return key, cache._flights.do_blocking(key, _create)
+
+    async def _cached_prefix_async(
+        self,
+        model: str,
+        system_instruction: Optional[str],
+        tools: Optional[List[Dict[str, Any]]],
+    ) -> tuple[str, str | None]:
+        """Async variant of :meth:`_cached_prefix` on ``client.aio``."""
+        cache = self.context_cache
+        if cache is None or not system_instruction:
+            return "", None
+        key = cache.key(model, system_instruction, tools)
+        name = cache.lookup(key)
+        if name is not None or not cache.should_create(key):
+            return key, name
+
+        async def _create() -> str | None:
+            try:
+                created = await self.client.aio.caches.create(
+                    model=model, config=self._cache_config(system_instruction, tools)
+                )
+            except Exception as exc:
+                cache.fail(key, exc)
+                return None
+            return cache.store(key, created.name)
+
+        return key, await cache._flights.do(key, _create)
+
+    def _drop_cached_prefix(self, key: str, exc: Exception) -> None:
+        assert self.context_cache is not None
+        log.info("Cached prefix %s rejected (%s); resending full prefix", key[:12], exc)
+        # Only the handle is gone; the next request may create a fresh one.
+        self.context_cache.invalidate(key)
+
+    def _build_config(
+        self,
+        temperature: float,
+        tools: Optional[List[Dict[str, Any]]],
+        system_instruction: Optional[str],
+        json_mode: bool,
+        thinking_budget: int,
+        cached_content: str | None = None,
+    ) -> Any:
+        if cached_content:
+            # The handle already carries the system instruction and tools.
+            config = genai.types.GenerateContentConfig(
+                temperature=temperature,
+                cached_content=cached_content,
+            )
+        else:
+            config = genai.types.GenerateContentConfig(
+                temperature=temperature,
+                system_instruction=system_instruction,
+            )
+            if tools:
+                config.tools = tools
+        if json_mode:
+            config.response_mime_type = "application/json"
+        if thinking_budget:
+            config.thinking = genai.types.ThinkingConfig(budget_tokens=thinking_budget)
+        return config
+
+    def _log_error(self, exc: Exception) -> None:
+        status = _extract_status(exc)
+        if status == 429:
+            log.warning("Gemini rate-limited (429): %s", exc)
+        elif status == 400:
+            log.warning("Gemini client error (400): %s", exc)
+        else:
+            log.exception("Gemini API call failed: %s", exc)
+
+    def _to_result(
+        self, response: Any, tools: Optional[List[Dict[str, Any]]]
+    ) -> GenerationResult:
         # Extract text
         text = getattr(response, "text", "") or ""
 
@@ -210,16 +534,27 @@ class GeminiProvider(LLMProvider):
         Returns:
             Raw Gemini response with image data
         """
+        parts, config = self._image_request(prompt, images)
+        response = self.client.models.generate_content(
+            model=model, contents=parts, config=config
+        )
+        return response
+
+    async def generate_image_async(self, model: str, prompt: str, *images: bytes) -> Any:
+        """Async variant of :meth:`generate_image` on ``client.aio``."""
+        parts, config = self._image_request(prompt, images)
+        return await self.client.aio.models.generate_content(
+            model=model, contents=parts, config=config
+        )
+
+    def _image_request(self, prompt: str, images: tuple[bytes, ...]) -> tuple[List[Any], Any]:
         parts: List[Any] = [prompt]
         for img in images:
             parts.append(genai.types.Part.from_bytes(img, mime_type="image/png"))
         config = genai.types.GenerateContentConfig(
             response_modalities=["TEXT", "IMAGE"]
         )
-        response = self.client.models.generate_content(
-            model=model, contents=parts, config=config
-        )
-        return response
+        return parts, config
 
 
 # Backward compatibility alias
@@ -254,3 +589,25 @@ class GeminiClient(GeminiProvider):
         )
         # Return raw response for backward compatibility
         return result.raw_response
+
+    async def generate_async(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        temperature: float = 0.6,
+        json_mode: bool = False,
+        thinking_budget: int = 0,
+        system_instruction: str | None = None,
+        tools: list[dict[str, Any]] | None = None,
+    ) -> Any:
+        """Async counterpart of :meth:`generate` returning the raw response."""
+        result = await super().generate_async(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            tools=tools,
+            system_instruction=system_instruction,
+            json_mode=json_mode,
+            thinking_budget=thinking_budget,
+        )
+        return result.raw_response
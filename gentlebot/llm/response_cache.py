@@ -0,0 +1,189 @@
+"""Persistent cache of LLM responses for deterministic call sites.
+
+Callers opt in per request (``router.generate(..., cache=True)``).  Entries
+are keyed by route, model, a hash of the whitespace-normalized prompt and a
+temperature bucket, so a re-pasted link or a TL;DR repeated after a restart
+is answered without spending tokens or RPM headroom.
+
+Lookups hit an in-memory LRU first and fall back to :class:`StateCache`
+(SQLite), which keeps entries across restarts.  Each route has its own TTL;
+override it with ``LLM_CACHE_<ROUTE>_TTL_HOURS`` (``0`` disables caching
+for that route).
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+from ..infra.state_cache import StateCache, get_state_cache
+
+log = logging.getLogger(f"gentlebot.{__name__}")
+
+KEY_PREFIX = "llm_response:"
+
+DEFAULT_TTL_HOURS: dict[str, float] = {
+    "general": 24.0,
+    "scheduled": 6.0,
+}
+
+# Temperatures within the same 0.2-wide bucket share cache entries.
+_TEMPERATURE_BUCKET = 0.2
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize(text: str | None) -> str:
+    return _WHITESPACE_RE.sub(" ", text or "").strip()
+
+
+def ttl_hours_for(route: str, default: float | None = None) -> float:
+    """Return the cache TTL for *route*, honoring env overrides."""
+    fallback = DEFAULT_TTL_HOURS.get(route, 0.0) if default is None else default
+    raw = os.getenv(f"LLM_CACHE_{route.upper()}_TTL_HOURS")
+    if raw is None:
+        return fallback
+    try:
+        return float(raw)
+    except ValueError:
+        log.warning("Invalid LLM cache TTL for %s: %s; using %s", route, raw, fallback)
+        return fallback
+
+
+def cache_key(
+    route: str,
+    model: str,
+    messages: List[Dict[str, Any]],
+    system_instruction: str | None,
+    temperature: float,
+    json_mode: bool = False,
+) -> str:
+    """Return the cache key for a generation request."""
+    payload = {
+        "messages": [
+            [m.get("role", "user"), _normalize(str(m.get("content", "")))]
+            for m in messages
+        ],
+        "system": _normalize(system_instruction),
+        "json": json_mode,
+    }
+    digest = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+    bucket = int(round(temperature / _TEMPERATURE_BUCKET))
+    return f"{route}:{model}:t{bucket}:{digest}"
+
+
+class ResponseCache:
+    """In-memory LRU in front of a persistent :class:`StateCache`."""
+
+    def __init__(
+        self,
+        state: StateCache | None = None,
+        max_entries: int = 512,
+    ) -> None:
+        self._state = state
+        self.max_entries = max_entries
+        # key -> (expires_at epoch seconds, text)
+        self._lru: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def state(self) -> StateCache:
+        if self._state is None:
+            self._state = get_state_cache()
+        return self._state
+
+    def _remember(self, key: str, expires_at: float, text: str) -> None:
+        self._lru[key] = (expires_at, text)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def _lookup_memory(self, key: str) -> str | None:
+        entry = self._lru.get(key)
+        if entry is None:
+            return None
+        expires_at, text = entry
+        if expires_at <= time.time():
+            del self._lru[key]
+            return None
+        self._lru.move_to_end(key)
+        return text
+
+    def _load(self, key: str) -> tuple[float, str] | None:
+        """Read ``(expires_at, text)`` for *key* from SQLite; safe off the loop."""
+        try:
+            stored = self.state.get(KEY_PREFIX + key)
+        except Exception:  # pragma: no cover - cache must never break generation
+            log.exception("LLM cache read failed")
+            return None
+        if not isinstance(stored, dict) or "text" not in stored:
+            return None
+        expires_at = float(stored.get("expires_at", 0))
+        if expires_at <= time.time():
+            return None
+        return expires_at, stored["text"]
+
+    def _loaded(self, key: str, loaded: tuple[float, str] | None) -> str | None:
+        if loaded is None:
+            return None
+        self._remember(key, *loaded)
+        return loaded[1]
+
+    def _store(self, key: str, text: str, ttl_hours: float, expires_at: float) -> None:
+        try:
+            self.state.set(
+                KEY_PREFIX + key,
+                {"text": text, "expires_at": expires_at},
+                ttl_hours=ttl_hours,
+            )
+        except Exception:  # pragma: no cover - cache must never break generation
+            log.exception("LLM cache write failed")
+
+    def _count(self, text: str | None) -> str | None:
+        if text is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return text
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for *key*, or ``None``."""
+        text = self._lookup_memory(key)
+        if text is None:
+            text = self._loaded(key, self._load(key))
+        return self._count(text)
+
+    async def get_async(self, key: str) -> str | None:
+        """Like :meth:`get`, reading SQLite off the event loop on LRU misses."""
+        text = self._lookup_memory(key)
+        if text is None:
+            # The LRU is only touched on the loop, after the read returns.
+            text = self._loaded(key, await asyncio.to_thread(self._load, key))
+        return self._count(text)
+
+    def put(self, route: str, key: str, text: str) -> None:
+        """Cache *text* under *key* for *route*'s TTL."""
+        ttl = ttl_hours_for(route)
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl * 3600
+        self._remember(key, expires_at, text)
+        self._store(key, text, ttl, expires_at)
+
+    async def put_async(self, route: str, key: str, text: str) -> None:
+        """Like :meth:`put`, writing SQLite off the event loop."""
+        ttl = ttl_hours_for(route)
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl * 3600
+        self._remember(key, expires_at, text)
+        await asyncio.to_thread(self._store, key, text, ttl, expires_at)
@@ -2,20 +2,38 @@
 from __future__ import annotations
 
 import ast
+import asyncio
 import json
 import math
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from contextlib import aclosing
 from pathlib import Path
-from typing import Any, Callable, Dict, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List
 
 from dotenv import load_dotenv
 
-from ..infra import Limit, QuotaGuard, RateLimited, call_with_backoff, get_logger
+from ..infra import (
+    Limit,
+    QuotaGuard,
+    RateLimited,
+    SingleFlight,
+    async_retry,
+    call_with_backoff,
+    get_logger,
+)
 from ..infra.retries import _extract_status
-from .providers.gemini import GeminiClient
+from .context import GenerationContext
+from .endpoints import Endpoint, EndpointHealth
+from .ledger import LLMCall, LLMLedger, caller_name
+from .providers.base import GenerationResult, LLMProvider
+from .providers.gemini import RETRYABLE_ERRORS, GeminiClient, GeminiProvider
+from .response_cache import ResponseCache, cache_key
+from .scheduler import LLMScheduler, Priority
 from .tokenizer import estimate_tokens, estimate_tokens_for_messages
-from .tools import get_all_gemini_schemas
+from .tools import ALL_TOOLS, get_all_gemini_schemas
 
 log = get_logger(__name__)
 
@@ -53,6 +71,11 @@ SYSTEM_INSTRUCTION = (
     "Call tools only when needed, summarize their results for the user, and do not invent tool outputs."
 )
 
+# Seconds a single tool call may take before the model is told it timed out
+TOOL_TIMEOUTS = {"calculate": 5.0, "read_file": 5.0, "generate_image": 90.0}
+DEFAULT_TOOL_TIMEOUT = 15.0
+
+
 class SafetyBlocked(Exception):
     """Raised when content is blocked for safety."""
 
@@ -86,6 +109,8 @@ class LLMRouter:
                 "image": _limit("image", Limit(rpm=5, tpm=1_000_000, rpd=1_500)),
             }
         )
+        # Async callers queue for quota by priority instead of failing fast
+        self.scheduler = LLMScheduler(self.quota)
         self.tool_limits = QuotaGuard(
             {
                 "calculate": Limit(rpm=10, rpd=500),
@@ -94,16 +119,40 @@ class LLMRouter:
             }
         )
         self.base_dir = Path(os.getenv("GENTLEBOT_ROOT", Path.cwd())).resolve()
-        # Store pending images generated by tool calls (for attachment to responses)
-        self._pending_images: list[tuple[str, bytes]] = []
+        # Worker threads for concurrent tool calls on the blocking path
+        self._tool_pool: ThreadPoolExecutor | None = None
         # Models that don't support function calling (discovered at runtime)
         self._no_tool_models: set[str] = set()
+        self._tool_schema_cache: list[dict[str, Any]] | None = None
+        # Opt-in cache for deterministic prompts (see generate(cache=True))
+        self.response_cache = ResponseCache()
+        # Identical concurrent prompts share one upstream call
+        self.inflight = SingleFlight("llm")
+        # Per-call usage and latency, batched into discord.llm_call
+        self.ledger = LLMLedger()
+        # Backup endpoints per route; the primary is always self.client
+        self.backups: dict[str, list[Endpoint]] = {}
+        for route in self.models:
+            for model in os.getenv(f"MODEL_{route.upper()}_BACKUP", "").split(","):
+                if model.strip():
+                    self.add_endpoint(route, self.client, model.strip())
+        self.health = EndpointHealth()
+        # Interactive requests slower than the primary's p95 get a backup request
+        self.hedging = os.getenv("LLM_HEDGE", "1") != "0"
+        self._provider_tool_cache: dict[str, list[dict[str, Any]]] = {}
 
-    def get_pending_images(self) -> list[tuple[str, bytes]]:
-        """Retrieve and clear any images generated during the last generate() call."""
-        images = list(self._pending_images)
-        self._pending_images.clear()
-        return images
+    def add_endpoint(self, route: str, provider: LLMProvider, model: str) -> Endpoint:
+        """Register *model* on *provider* as a backup for *route*."""
+        endpoint = Endpoint(provider, model)
+        self.backups.setdefault(route, []).append(endpoint)
+        return endpoint
+
+    def _endpoints(self, route: str, kind: str = "unary") -> list[Endpoint]:
+        """Return the endpoints serving *route*, best first."""
+        model = self.models.get(route)
+        if not model:
+            raise ValueError(f"unknown route {route}")
+        return self.health.rank([Endpoint(self.client, model), *self.backups.get(route, [])], kind)
 
     def _tokens_estimate(
         self, messages: List[Dict[str, Any]], system_instruction: str | None = None
@@ -118,11 +167,60 @@ class LLMRouter:
         """Get tool schemas in Gemini format.
 
         Includes custom function declarations from tools.py plus Gemini's
-        native Google Search grounding tool.
+        native Google Search grounding tool.  Built once and reused so every
+        request carries an identical (cacheable) tool block.
         """
-        schemas = get_all_gemini_schemas()
-        schemas.append({"google_search": {}})
-        return schemas
+        if self._tool_schema_cache is None:
+            schemas = get_all_gemini_schemas()
+            schemas.append({"google_search": {}})
+            self._tool_schema_cache = schemas
+        return self._tool_schema_cache
+
+    def _endpoint_tools(
+        self, endpoint: Endpoint, json_mode: bool = False
+    ) -> list[dict[str, Any]] | None:
+        """Tool schemas in the format of *endpoint*'s provider, or ``None`` without tools."""
+        if json_mode or endpoint.model in self._no_tool_models:
+            return None
+        if isinstance(endpoint.provider, GeminiProvider):
+            return self._tool_schemas()
+        name = endpoint.provider.name
+        if name not in self._provider_tool_cache:
+            self._provider_tool_cache[name] = [
+                endpoint.provider.convert_tool_schema(tool) for tool in ALL_TOOLS
+            ]
+        return self._provider_tool_cache[name]
+
+    def _read_response(
+        self, resp: Any, tools: bool
+    ) -> tuple[str, list[tuple[str | None, dict[str, Any]]], Any, int, Any]:
+        """Return ``(text, tool_calls, usage, tokens_out, block_reason)`` of *resp*.
+
+        *resp* is either a raw Gemini response (from :class:`GeminiClient`)
+        or a :class:`GenerationResult` from any other provider.
+        """
+        if isinstance(resp, GenerationResult):
+            usage = resp.usage or {}
+            calls = [(call.name, call.arguments) for call in resp.tool_calls] if tools else []
+            return (
+                resp.text,
+                calls,
+                usage,
+                usage.get("output_tokens") or 0,
+                getattr(resp.raw_response, "prompt_feedback", None),
+            )
+        usage = getattr(resp, "usage_metadata", None)
+        calls = [
+            (call.get("name"), call.get("args") or {})
+            for call in (self._extract_tool_calls(resp) if tools else [])
+        ]
+        return (
+            getattr(resp, "text", ""),
+            calls,
+            usage,
+            getattr(usage, "candidates_token_count", 0) or 0,
+            getattr(resp, "prompt_feedback", None),
+        )
 
     def _extract_tool_calls(self, response: Any) -> list[dict[str, Any]]:
         calls: list[dict[str, Any]] = []
@@ -181,11 +279,14 @@ class LLMRouter:
 
         return _eval(node)
 
-    def _tool_handlers(self) -> dict[str, Callable[[dict[str, Any]], str]]:
+    def _tool_handlers(
+        self, context: GenerationContext | None = None
+    ) -> dict[str, Callable[[dict[str, Any]], str]]:
+        ctx = context if context is not None else GenerationContext()
         return {
             "calculate": self._run_calculate,
             "read_file": self._run_read_file,
-            "generate_image": self._run_generate_image,
+            "generate_image": lambda params: self._run_generate_image(params, ctx),
         }
 
     def _run_calculate(self, params: dict[str, Any]) -> str:
@@ -213,40 +314,87 @@ class LLMRouter:
             return ""
         return data[offset : offset + limit]
 
-    def _run_generate_image(self, params: dict[str, Any]) -> str:
+    def _run_generate_image(self, params: dict[str, Any], context: GenerationContext) -> str:
         """Generate an image and store it for attachment to the response.
 
-        The image data is stored in self._pending_images and should be
-        retrieved by the caller after the generate() call completes.
+        The image data is added to ``context.images`` for the caller of the
+        generate() call that triggered the tool.
         """
+        prompt = self._image_tool_prompt(params)
+        try:
+            data = self.generate_image(prompt)
+        except Exception as exc:
+            return self._image_tool_error(prompt, exc)
+        return self._image_tool_result(prompt, data, context)
+
+    async def _run_generate_image_async(
+        self, params: dict[str, Any], context: GenerationContext
+    ) -> str:
+        """Async variant of :meth:`_run_generate_image`."""
+        prompt = self._image_tool_prompt(params)
+        try:
+            data = await self.generate_image_async(prompt)
+        except Exception as exc:
+            return self._image_tool_error(prompt, exc)
+        return self._image_tool_result(prompt, data, context)
+
+    def _image_tool_prompt(self, params: dict[str, Any]) -> str:
         prompt = str(params.get("prompt", "")).strip()
         if not prompt:
             raise ValueError("prompt is required")
+        return prompt[:2000]
 
-        if len(prompt) > 2000:
-            prompt = prompt[:2000]
-
-        try:
-            data = self.generate_image(prompt)
-        except RateLimited:
+    def _image_tool_error(self, prompt: str, exc: Exception) -> str:
+        if isinstance(exc, RateLimited):
             log.info("tool=generate_image status=rate_limited prompt=%s", prompt[:100])
             return "Image generation is temporarily rate limited. Try again in a moment."
-        except SafetyBlocked:
+        if isinstance(exc, SafetyBlocked):
             return "The image request was blocked by safety filters. Please try a different prompt."
-        except Exception as exc:
-            log.exception("tool=generate_image status=error prompt=%s", prompt[:100])
-            return f"Image generation failed: {exc}"
+        log.exception("tool=generate_image status=error prompt=%s", prompt[:100])
+        return f"Image generation failed: {exc}"
 
+    def _image_tool_result(
+        self, prompt: str, data: bytes | None, context: GenerationContext
+    ) -> str:
         if data:
-            self._pending_images.append((prompt, data))
+            context.add_image(prompt, data)
             log.info("tool=generate_image status=ok prompt=%s size=%d", prompt[:100], len(data))
             return f"Image generated successfully for prompt: '{prompt[:100]}...'. The image will be attached to my response."
         else:
             return "Image generation returned no data. The request may have been filtered or failed silently."
 
-    def _invoke_tool(
-        self, name: str | None, args: dict[str, Any], handlers: dict[str, Callable[[dict[str, Any]], str]]
-    ) -> str:
+    def _async_tool_handlers(
+        self, context: GenerationContext | None = None
+    ) -> dict[str, Callable[[dict[str, Any]], Awaitable[str]]]:
+        ctx = context if context is not None else GenerationContext()
+
+        async def calculate(params: dict[str, Any]) -> str:
+            return self._run_calculate(params)
+
+        async def read_file(params: dict[str, Any]) -> str:
+            return await asyncio.to_thread(self._run_read_file, params)
+
+        async def generate_image(params: dict[str, Any]) -> str:
+            return await self._run_generate_image_async(params, ctx)
+
+        return {
+            "calculate": calculate,
+            "read_file": read_file,
+            "generate_image": generate_image,
+        }
+
+    def _tool_timeout(self, name: str | None) -> float:
+        return TOOL_TIMEOUTS.get(name or "", DEFAULT_TOOL_TIMEOUT)
+
+    def _tool_executor(self) -> ThreadPoolExecutor:
+        if self._tool_pool is None:
+            self._tool_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="llm-tool")
+        return self._tool_pool
+
+    def _check_tool(
+        self, name: str | None, args: dict[str, Any], handlers: dict[str, Any]
+    ) -> str | None:
+        """Return a refusal message if the tool call may not run."""
         if not name or name not in handlers:
             log.warning("tool=%s status=unknown args=%s", name, args)
             return "Tool not recognized"
@@ -257,15 +405,395 @@ class LLMRouter:
         except RateLimited:
             log.info("tool=%s status=rate_limited args=%s", name, args)
             return "Tool temporarily rate limited"
+        return None
 
-        handler = handlers[name]
+    def _invoke_tool(
+        self, name: str, args: dict[str, Any], handlers: dict[str, Callable[[dict[str, Any]], str]]
+    ) -> tuple[str, str]:
+        """Run one admitted tool call and return ``(result, status)``."""
+        try:
+            result = handlers[name](args)
+            log.info("tool=%s status=ok args=%s", name, args)
+            return result, "ok"
+        except Exception as exc:  # pragma: no cover - observability
+            log.exception("tool=%s status=error args=%s", name, args)
+            return f"Tool failed: {exc}", "error"
+
+    async def _invoke_tool_async(
+        self,
+        name: str,
+        args: dict[str, Any],
+        handlers: dict[str, Callable[[dict[str, Any]], Awaitable[str]]],
+    ) -> tuple[str, str]:
+        timeout = self._tool_timeout(name)
         try:
-            result = handler(args)
+            result = await asyncio.wait_for(handlers[name](args), timeout)
             log.info("tool=%s status=ok args=%s", name, args)
-            return result
+            return result, "ok"
+        except asyncio.TimeoutError:
+            log.warning("tool=%s status=timeout timeout_s=%s args=%s", name, timeout, args)
+            return f"Tool timed out after {timeout:g}s", "timeout"
         except Exception as exc:  # pragma: no cover - observability
             log.exception("tool=%s status=error args=%s", name, args)
-            return f"Tool failed: {exc}"
+            return f"Tool failed: {exc}", "error"
+
+    def _run_tools(
+        self,
+        calls: list[tuple[str | None, dict[str, Any]]],
+        handlers: dict[str, Callable[[dict[str, Any]], str]],
+        context: GenerationContext,
+    ) -> list[tuple[str | None, dict[str, Any], str]]:
+        """Run the tool calls of one model turn concurrently on worker threads.
+
+        Each call gets its own timeout from :data:`TOOL_TIMEOUTS`; a call that
+        overruns is reported to the model as timed out and left to finish in
+        the background.  Results keep the order of *calls*.
+        """
+        def _timed(name: str, args: dict[str, Any]) -> tuple[str, str, float]:
+            start = time.monotonic()
+            result, status = self._invoke_tool(name, args, handlers)
+            return result, status, time.monotonic() - start
+
+        # Rate-limit checks stay on this thread; QuotaGuard is not thread-safe.
+        pending: list[tuple[str | None, dict[str, Any], Any]] = []
+        for name, args in calls:
+            refused = self._check_tool(name, args, handlers)
+            if refused is not None:
+                context.record_tool(name or "", 0, "refused")
+                pending.append((name, args, refused))
+            else:
+                pending.append((name, args, self._tool_executor().submit(_timed, name, args)))
+
+        submitted = time.monotonic()
+        results: list[tuple[str | None, dict[str, Any], str]] = []
+        for name, args, outcome in pending:
+            if isinstance(outcome, str):
+                results.append((name, args, outcome))
+                continue
+            timeout = self._tool_timeout(name)
+            try:
+                result, status, elapsed = outcome.result(
+                    timeout=max(0.0, submitted + timeout - time.monotonic())
+                )
+            except FutureTimeout:
+                log.warning("tool=%s status=timeout timeout_s=%s args=%s", name, timeout, args)
+                result, status, elapsed = f"Tool timed out after {timeout:g}s", "timeout", timeout
+            context.record_tool(name or "", int(elapsed * 1000), status)
+            results.append((name, args, result))
+        return results
+
+    async def _run_tools_async(
+        self,
+        calls: list[tuple[str | None, dict[str, Any]]],
+        handlers: dict[str, Callable[[dict[str, Any]], Awaitable[str]]],
+        context: GenerationContext,
+    ) -> list[tuple[str | None, dict[str, Any], str]]:
+        """Async counterpart of :meth:`_run_tools` using ``asyncio.gather``."""
+
+        async def _run(name: str | None, args: dict[str, Any]) -> tuple[str | None, dict[str, Any], str]:
+            refused = self._check_tool(name, args, handlers)
+            if refused is not None:
+                context.record_tool(name or "", 0, "refused")
+                return name, args, refused
+            start = time.monotonic()
+            result, status = await self._invoke_tool_async(name, args, handlers)
+            context.record_tool(name, int((time.monotonic() - start) * 1000), status)
+            return name, args, result
+
+        return list(await asyncio.gather(*(_run(name, args) for name, args in calls)))
+
+    def _log_response(
+        self,
+        route: str,
+        model: str,
+        tokens_in: int,
+        tokens_out: int,
+        start: float,
+        status: str,
+        block: Any = None,
+        first_token: float | None = None,
+        context: GenerationContext | None = None,
+    ) -> None:
+        """Log one model turn and record it on *context*.
+
+        *first_token* is when the first streamed text arrived; unary calls
+        receive everything at once, so their time to first byte is the total.
+        """
+        end = time.time()
+        total_ms = (end - start) * 1000
+        ttfb_ms = ((first_token or end) - start) * 1000
+        if context is not None:
+            context.record_turn(
+                model, tokens_in, tokens_out or 0, int(ttfb_ms), int(total_ms), status, start
+            )
+        log.info(
+            "route=%s model=%s tokens_in=%s tokens_out=%s ttfb_ms=%s total_ms=%s status=%s block_reason=%s",
+            route,
+            model,
+            tokens_in,
+            tokens_out,
+            int(ttfb_ms),
+            int(total_ms),
+            status,
+            block,
+        )
+
+    def _log_fallback(
+        self, route: str, model: str, tokens_in: int, status: Any
+    ) -> None:
+        if status == "rate_limited":
+            log.info(
+                "route=%s model=%s tokens_in=%s status=rate_limited fallback=general",
+                route,
+                model,
+                tokens_in,
+            )
+        else:
+            log.warning(
+                "route=%s model=%s tokens_in=%s status=%s fallback=general",
+                route,
+                model,
+                tokens_in,
+                status,
+            )
+
+    def _is_fallback_error(self, exc: Exception) -> bool:
+        status = _extract_status(exc)
+        return status == 429 or bool(status and 500 <= status < 600)
+
+    async def _admit_extra(self, route: str, tokens_in: int, priority: Priority) -> bool:
+        """Take a quota slot for a hedged or failover request if one is free now."""
+        try:
+            await self.scheduler.admit(route, tokens_in, priority, wait=False)
+        except RateLimited:
+            log.info("route=%s status=rate_limited extra_request=skipped", route)
+            return False
+        return True
+
+    async def _race(
+        self,
+        route: str,
+        kind: str,
+        endpoints: list[Endpoint],
+        attempt: Callable[[Endpoint], Awaitable[Any]],
+        priority: Priority,
+        tokens_in: int,
+        discard: Callable[[Any], Awaitable[None]] | None = None,
+    ) -> tuple[Endpoint, Any]:
+        """Run *attempt* on the best endpoint, hedging and failing over to the rest.
+
+        An interactive request that has not finished within the primary's
+        hedge delay (its rolling p95) gets one backup request on the next
+        endpoint; the first success wins and the other is cancelled, or
+        passed to *discard* if it finished too.  When an attempt fails and
+        nothing else is in flight the next endpoint is tried.  Extra requests
+        need a free quota slot on *route*; without one the last error is
+        raised as before.  Returns the winning endpoint and its result.
+        """
+        primary, backups = endpoints[0], list(endpoints[1:])
+        hedge = self.hedging and priority == Priority.INTERACTIVE
+        hedged = False
+        running: dict[asyncio.Future, tuple[Endpoint, float]] = {}
+        error: BaseException | None = None
+
+        def launch(endpoint: Endpoint) -> None:
+            running[asyncio.ensure_future(attempt(endpoint))] = (endpoint, time.monotonic())
+
+        launch(primary)
+        started = time.monotonic()
+        try:
+            while True:
+                timeout = None
+                if hedge and backups:
+                    delay = self.health.hedge_delay(primary, kind)
+                    timeout = max(0.0, started + delay - time.monotonic())
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedge = False
+                    if await self._admit_extra(route, tokens_in, priority):
+                        hedged = True
+                        self.health.stats(primary, kind).hedges += 1
+                        log.info(
+                            "route=%s model=%s status=hedged backup=%s after_ms=%d",
+                            route,
+                            primary.model,
+                            backups[0].name,
+                            int((time.monotonic() - started) * 1000),
+                        )
+                        launch(backups.pop(0))
+                    continue
+                for future in done:
+                    endpoint, began = running.pop(future)
+                    now = time.monotonic()
+                    exc = future.exception()
+                    self.health.observe(endpoint, kind, (now - began) * 1000, exc is None)
+                    if exc is not None:
+                        error = exc
+                        continue
+                    for other, other_began in running.values():
+                        # A slower request started earlier took at least this long.
+                        if other_began < began:
+                            self.health.observe(other, kind, (now - other_began) * 1000, True)
+                    if hedged and endpoint is not primary:
+                        self.health.stats(primary, kind).hedge_wins += 1
+                    return endpoint, future.result()
+                if running:
+                    continue
+                hedge = False
+                assert error is not None
+                if not backups or not await self._admit_extra(route, tokens_in, priority):
+                    raise error
+                log.warning(
+                    "route=%s model=%s status=failover backup=%s error=%s",
+                    route,
+                    endpoint.model,
+                    backups[0].name,
+                    error,
+                )
+                launch(backups.pop(0))
+        finally:
+            for future in running:
+                if not future.done():
+                    future.cancel()
+                elif discard is not None and not future.cancelled() and future.exception() is None:
+                    await discard(future.result())
+
+    def _lacks_tool_support(
+        self, exc: Exception, route: str, model: str, tool_schemas: Any
+    ) -> bool:
+        """Return True (and remember it) if *exc* says *model* cannot call tools."""
+        if (
+            tool_schemas
+            and getattr(exc, "code", None) == 400
+            and "function calling" in str(exc).lower()
+        ):
+            self._no_tool_models.add(model)
+            log.info(
+                "route=%s model=%s marked as no-tool-support",
+                route,
+                model,
+            )
+            return True
+        return False
+
+    def _tool_feedback(self, results: list[tuple[str | None, dict[str, Any], str]]) -> list[dict[str, str]]:
+        """Echo tool calls and their results back into the chat history."""
+        feedback: list[dict[str, str]] = []
+        for name, args, result in results:
+            feedback.append(
+                {
+                    "role": "assistant",
+                    "content": f"Calling {name} with {json.dumps(args)}",
+                }
+            )
+            feedback.append(
+                {
+                    "role": "user",
+                    "content": f"Tool {name} result: {result}",
+                }
+            )
+        feedback.append(
+            {
+                "role": "user",
+                "content": "Use the tool output above to answer the user's question.",
+            }
+        )
+        return feedback
+
+    def _cache_key(
+        self,
+        route: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        json_mode: bool,
+        system_instruction: str | None,
+    ) -> str:
+        model = self.models.get(route)
+        if not model:
+            raise ValueError(f"unknown route {route}")
+        return cache_key(
+            route,
+            model,
+            messages,
+            system_instruction or SYSTEM_INSTRUCTION,
+            temperature,
+            json_mode,
+        )
+
+    def _log_cache_hit(self, route: str) -> None:
+        log.info("route=%s model=%s status=cache_hit", route, self.models.get(route))
+
+    def _real_tokens_in(self, route: str, estimate: int, usage: Any) -> int:
+        """Return the provider's prompt token count and correct the quota by it."""
+        real = getattr(usage, "prompt_token_count", None)
+        if isinstance(usage, dict):
+            real = usage.get("input_tokens")
+        if not isinstance(real, int) or real <= 0:
+            return estimate
+        self.quota.adjust(route, real - estimate)
+        return real
+
+    def _begin_call(
+        self, route: str, context: GenerationContext | None
+    ) -> tuple[GenerationContext, dict[str, Any] | None]:
+        """Open a ledger entry for a public call.
+
+        Returns the context to use and the entry, which is ``None`` when the
+        call re-enters a context already in use -- i.e. a fallback, which is
+        booked on the original call.
+        """
+        ctx = context if context is not None else GenerationContext()
+        if ctx.caller is None:
+            ctx.caller = caller_name(skip=3)
+        if ctx.in_call:
+            ctx.fallback = True
+            return ctx, None
+        ctx.in_call = True
+        return ctx, {"route": route, "start": time.time(), "first_turn": len(ctx.turns)}
+
+    def _end_call(
+        self,
+        ctx: GenerationContext,
+        entry: dict[str, Any] | None,
+        status: str,
+    ) -> None:
+        if entry is None:
+            return
+        ctx.in_call = False
+        turns = ctx.turns[entry["first_turn"] :]
+        end = time.time()
+        start = entry["start"]
+        ttfb_ms = int((end - start) * 1000)
+        if turns and turns[-1].started:
+            ttfb_ms = int((turns[-1].started - start) * 1000) + turns[-1].ttfb_ms
+        route = entry["route"]
+        self.ledger.record(
+            LLMCall(
+                route=route,
+                model=turns[-1].model if turns else self.models.get(route, ""),
+                caller=ctx.caller or "unknown",
+                tokens_in=sum(t.tokens_in for t in turns),
+                tokens_out=sum(t.tokens_out for t in turns),
+                cache_hit=status == "cache_hit",
+                attempts=len(turns),
+                fallback=ctx.fallback,
+                ttfb_ms=ttfb_ms,
+                latency_ms=int((end - start) * 1000),
+                status=status,
+            )
+        )
+
+    @staticmethod
+    def _failure_status(exc: BaseException) -> str:
+        if isinstance(exc, RateLimited):
+            return "rate_limited"
+        if isinstance(exc, SafetyBlocked):
+            return "blocked"
+        if isinstance(exc, (asyncio.CancelledError, GeneratorExit)):
+            return "cancelled"
+        return "error"
 
     def generate(
         self,
@@ -275,38 +803,77 @@ class LLMRouter:
         think_budget: int = 0,
         json_mode: bool = False,
         system_instruction: str | None = None,
+        cache: bool = False,
+        context: GenerationContext | None = None,
     ) -> str:
         """Send a chat prompt to Gemini and optionally handle tool calls.
 
+        With ``cache=True`` an identical earlier prompt is answered from
+        :attr:`response_cache` without touching the quota or the API; only
+        deterministic call sites should opt in.  Concurrent identical requests
+        share a single upstream call via :attr:`inflight` either way.
+
         Tool invocations are rate limited separately from model quotas and any
         tool outputs are echoed back into the chat history before asking the
         model for a final response. A small retry loop allows the model to chain
         multiple tools while still honoring the scheduled-route fallbacks.
+        Tool calls from the same turn run concurrently, each with its own
+        timeout.  Pass a :class:`GenerationContext` as *context* to get back
+        generated images, per-turn usage and tool timings.
+
+        This blocks the calling thread; code running on the event loop should
+        use :meth:`generate_async` instead.
         """
+        key = self._cache_key(route, messages, temperature, json_mode, system_instruction)
+        ctx, entry = self._begin_call(route, context)
+        status = "error"
+        try:
+            if cache:
+                cached = self.response_cache.get(key)
+                if cached is not None:
+                    self._log_cache_hit(route)
+                    status = "cache_hit"
+                    return cached
+
+            def _produce() -> tuple[str, GenerationContext]:
+                text = self._generate(
+                    route, messages, temperature, think_budget, json_mode, system_instruction, ctx
+                )
+                if cache and not ctx.images:
+                    self.response_cache.put(route, key, text)
+                return text, ctx
+
+            text, produced = self.inflight.do_blocking((key, think_budget), _produce)
+            ctx.absorb(produced)
+            status = "ok" if produced is ctx else "shared"
+            return text
+        except BaseException as exc:
+            status = self._failure_status(exc)
+            raise
+        finally:
+            self._end_call(ctx, entry, status)
+
+    def _generate(
+        self,
+        route: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        think_budget: int,
+        json_mode: bool,
+        system_instruction: str | None,
+        context: GenerationContext,
+    ) -> str:
         model = self.models.get(route)
         if not model:
             raise ValueError(f"unknown route {route}")
 
-        tool_handlers = self._tool_handlers()
+        tool_handlers = self._tool_handlers(context)
         tool_schemas = self._tool_schemas() if not json_mode else None
         # Skip tools for models known not to support function calling
         if model in self._no_tool_models:
             tool_schemas = None
         current_messages = list(messages)
 
-        def _log_response(tokens_in: int, tokens_out: int, start: float, status: str, block: Any = None):
-            total_ms = (time.time() - start) * 1000
-            log.info(
-                "route=%s model=%s tokens_in=%s tokens_out=%s ttfb_ms=0 total_ms=%s status=%s block_reason=%s",
-                route,
-                model,
-                tokens_in,
-                tokens_out,
-                int(total_ms),
-                status,
-                block,
-            )
-
         for attempt in range(5):
             system_prompt = system_instruction or SYSTEM_INSTRUCTION
             tokens_in = self._tokens_estimate(current_messages, system_prompt)
@@ -315,12 +882,7 @@ class LLMRouter:
                 temp_delta = self.quota.check(route, tokens_in)
             except RateLimited:
                 if allow_fallback:
-                    log.info(
-                        "route=%s model=%s tokens_in=%s status=rate_limited fallback=general",
-                        route,
-                        model,
-                        tokens_in,
-                    )
+                    self._log_fallback(route, model, tokens_in, "rate_limited")
                     return self.generate(
                         "general",
                         current_messages,
@@ -328,6 +890,7 @@ class LLMRouter:
                         think_budget,
                         json_mode,
                         system_instruction=system_prompt,
+                        context=context,
                     )
                 raise
             temp = max(0.0, temperature + temp_delta)
@@ -344,29 +907,8 @@ class LLMRouter:
                         system_instruction=system_prompt,
                         tools=tool_schemas,
                     )
-                except TypeError as exc:
-                    if "tools" in str(exc):  # backward compatibility with test shims
-                        return self.client.generate(
-                            model=model,
-                            messages=current_messages,
-                            temperature=temp,
-                            json_mode=json_mode,
-                            thinking_budget=think_budget,
-                            system_instruction=system_prompt,
-                        )
-                    raise
                 except Exception as exc:
-                    if (
-                        tool_schemas
-                        and getattr(exc, "code", None) == 400
-                        and "function calling" in str(exc).lower()
-                    ):
-                        self._no_tool_models.add(model)
-                        log.info(
-                            "route=%s model=%s marked as no-tool-support",
-                            route,
-                            model,
-                        )
+                    if self._lacks_tool_support(exc, route, model, tool_schemas):
                         return self.client.generate(
                             model=model,
                             messages=current_messages,
@@ -381,12 +923,7 @@ class LLMRouter:
                 resp = call_with_backoff(_call)
             except RateLimited:
                 if allow_fallback:
-                    log.info(
-                        "route=%s model=%s tokens_in=%s status=rate_limited fallback=general",
-                        route,
-                        model,
-                        tokens_in,
-                    )
+                    self._log_fallback(route, model, tokens_in, "rate_limited")
                     return self.generate(
                         "general",
                         current_messages,
@@ -394,21 +931,15 @@ class LLMRouter:
                         think_budget,
                         json_mode,
                         system_instruction=system_prompt,
+                        context=context,
                     )
                 log.info(
                     "route=%s model=%s tokens_in=%s status=rate_limited", route, model, tokens_in
                 )
                 raise
             except Exception as exc:
-                status = _extract_status(exc)
-                if allow_fallback and (status == 429 or (status and 500 <= status < 600)):
-                    log.warning(
-                        "route=%s model=%s tokens_in=%s status=%s fallback=general",
-                        route,
-                        model,
-                        tokens_in,
-                        status,
-                    )
+                if allow_fallback and self._is_fallback_error(exc):
+                    self._log_fallback(route, model, tokens_in, _extract_status(exc))
                     return self.generate(
                         "general",
                         current_messages,
@@ -416,90 +947,457 @@ class LLMRouter:
                         think_budget,
                         json_mode,
                         system_instruction=system_prompt,
+                        context=context,
                     )
                 log.exception(
                     "route=%s model=%s tokens_in=%s status=error", route, model, tokens_in
                 )
                 raise
 
-            tokens_out = getattr(
-                getattr(resp, "usage_metadata", None), "candidates_token_count", 0
+            text, tool_calls, usage, tokens_out, block_reason = self._read_response(
+                resp, bool(tool_schemas)
             )
-            tool_calls = self._extract_tool_calls(resp) if tool_schemas else []
-            text = getattr(resp, "text", "")
-            block_reason = getattr(resp, "prompt_feedback", None)
+            tokens_in = self._real_tokens_in(route, tokens_in, usage)
 
             if tool_calls:
-                _log_response(tokens_in, tokens_out, start, "tool_call", block_reason)
-                tool_feedback: list[dict[str, str]] = []
-                for call in tool_calls:
-                    name = call.get("name")
-                    args = call.get("args") or {}
-                    result = self._invoke_tool(name, args, tool_handlers)
-                    tool_feedback.append(
-                        {
-                            "role": "assistant",
-                            "content": f"Calling {name} with {json.dumps(args)}",
-                        }
+                self._log_response(
+                    route, model, tokens_in, tokens_out, start, "tool_call", block_reason,
+                    context=context,
+                )
+                results = self._run_tools(
+                    tool_calls,
+                    tool_handlers,
+                    context,
+                )
+                current_messages = current_messages + self._tool_feedback(results)
+                continue
+
+            status = "ok" if text else "blocked"
+            self._log_response(
+                route, model, tokens_in, tokens_out, start, status, block_reason, context=context
+            )
+            if not text:
+                raise SafetyBlocked
+            return text
+
+        raise RuntimeError("LLM tool loop exceeded attempts")
+
+    async def generate_async(
+        self,
+        route: str,
+        messages: List[Dict[str, Any]],
+        temperature: float = 0.6,
+        think_budget: int = 0,
+        json_mode: bool = False,
+        system_instruction: str | None = None,
+        cache: bool = False,
+        priority: Priority = Priority.INTERACTIVE,
+        context: GenerationContext | None = None,
+    ) -> str:
+        """Async counterpart of :meth:`generate`.
+
+        Uses the provider's native async client and backs off with
+        ``asyncio.sleep``, so concurrent calls do not hold worker threads
+        while waiting on the API or a rate-limit window.  Cache lookups and
+        writes go through a worker thread for the SQLite tier.
+
+        Quota is granted by :attr:`scheduler`: when the route is saturated
+        the request waits in a queue ordered by *priority* and only raises
+        :class:`RateLimited` once its class deadline passes or it is shed.
+        """
+        key = self._cache_key(route, messages, temperature, json_mode, system_instruction)
+        ctx, entry = self._begin_call(route, context)
+        status = "error"
+        try:
+            if cache:
+                cached = await self.response_cache.get_async(key)
+                if cached is not None:
+                    self._log_cache_hit(route)
+                    status = "cache_hit"
+                    return cached
+
+            async def _produce() -> tuple[str, GenerationContext]:
+                text = await self._generate_async(
+                    route,
+                    messages,
+                    temperature,
+                    think_budget,
+                    json_mode,
+                    system_instruction,
+                    priority,
+                    ctx,
+                )
+                if cache and not ctx.images:
+                    await self.response_cache.put_async(route, key, text)
+                return text, ctx
+
+            text, produced = await self.inflight.do((key, think_budget, priority), _produce)
+            ctx.absorb(produced)
+            status = "ok" if produced is ctx else "shared"
+            return text
+        except BaseException as exc:
+            status = self._failure_status(exc)
+            raise
+        finally:
+            self._end_call(ctx, entry, status)
+
+    async def _generate_async(
+        self,
+        route: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        think_budget: int,
+        json_mode: bool,
+        system_instruction: str | None,
+        priority: Priority,
+        context: GenerationContext,
+    ) -> str:
+        model = self.models.get(route)
+        if not model:
+            raise ValueError(f"unknown route {route}")
+
+        tool_handlers = self._async_tool_handlers(context)
+        current_messages = list(messages)
+
+        for attempt in range(5):
+            system_prompt = system_instruction or SYSTEM_INSTRUCTION
+            tokens_in = self._tokens_estimate(current_messages, system_prompt)
+            allow_fallback = route == "scheduled" and attempt == 0
+            try:
+                # Scheduled calls can fall back to general, so only queue
+                # for a slot when there is nowhere else to go.
+                temp_delta = await self.scheduler.admit(
+                    route, tokens_in, priority, wait=not allow_fallback
+                )
+            except RateLimited:
+                if allow_fallback:
+                    self._log_fallback(route, model, tokens_in, "rate_limited")
+                    return await self.generate_async(
+                        "general",
+                        current_messages,
+                        temperature,
+                        think_budget,
+                        json_mode,
+                        system_instruction=system_prompt,
+                        priority=priority,
+                        context=context,
                     )
-                    tool_feedback.append(
-                        {
-                            "role": "user",
-                            "content": f"Tool {name} result: {result}",
-                        }
+                raise
+            request = {
+                "messages": current_messages,
+                "temperature": max(0.0, temperature + temp_delta),
+                "json_mode": json_mode,
+                "thinking_budget": think_budget,
+                "system_instruction": system_prompt,
+            }
+            start = time.time()
+
+            async def _call(endpoint: Endpoint, request: dict[str, Any] = request) -> Any:
+                provider, name = endpoint.provider, endpoint.model
+                tools = self._endpoint_tools(endpoint, json_mode)
+
+                async def _once() -> Any:
+                    try:
+                        return await provider.generate_async(model=name, **request, tools=tools)
+                    except Exception as exc:
+                        if self._lacks_tool_support(exc, route, name, tools):
+                            return await provider.generate_async(model=name, **request)
+                        raise
+
+                return await async_retry(
+                    _once, retry_on=RETRYABLE_ERRORS, rate_limit_delay=12.0
+                )
+
+            try:
+                endpoint, resp = await self._race(
+                    route, "unary", self._endpoints(route), _call, priority, tokens_in
+                )
+            except RateLimited:
+                if allow_fallback:
+                    self._log_fallback(route, model, tokens_in, "rate_limited")
+                    return await self.generate_async(
+                        "general",
+                        current_messages,
+                        temperature,
+                        think_budget,
+                        json_mode,
+                        system_instruction=system_prompt,
+                        priority=priority,
+                        context=context,
                     )
-                tool_feedback.append(
-                    {
-                        "role": "user",
-                        "content": "Use the tool output above to answer the user's question.",
-                    }
+                log.info(
+                    "route=%s model=%s tokens_in=%s status=rate_limited", route, model, tokens_in
                 )
-                current_messages = current_messages + tool_feedback
+                raise
+            except Exception as exc:
+                if allow_fallback and self._is_fallback_error(exc):
+                    self._log_fallback(route, model, tokens_in, _extract_status(exc))
+                    return await self.generate_async(
+                        "general",
+                        current_messages,
+                        temperature,
+                        think_budget,
+                        json_mode,
+                        system_instruction=system_prompt,
+                        priority=priority,
+                        context=context,
+                    )
+                log.exception(
+                    "route=%s model=%s tokens_in=%s status=error", route, model, tokens_in
+                )
+                raise
+
+            model = endpoint.model
+            text, tool_calls, usage, tokens_out, block_reason = self._read_response(
+                resp, bool(self._endpoint_tools(endpoint, json_mode))
+            )
+            tokens_in = self._real_tokens_in(route, tokens_in, usage)
+
+            if tool_calls:
+                self._log_response(
+                    route, model, tokens_in, tokens_out, start, "tool_call", block_reason,
+                    context=context,
+                )
+                results = await self._run_tools_async(
+                    tool_calls,
+                    tool_handlers,
+                    context,
+                )
+                current_messages = current_messages + self._tool_feedback(results)
                 continue
 
             status = "ok" if text else "blocked"
-            _log_response(tokens_in, tokens_out, start, status, block_reason)
+            self._log_response(
+                route, model, tokens_in, tokens_out, start, status, block_reason, context=context
+            )
             if not text:
                 raise SafetyBlocked
             return text
 
         raise RuntimeError("LLM tool loop exceeded attempts")
 
-    def generate_image(self, prompt: str) -> bytes | None:
-        model = self.models.get("image")
-        if not model:
-            raise ValueError("image model not configured")
-        tokens_in = len(prompt.split())
-        self.quota.check("image", tokens_in)
-        start = time.time()
+    async def generate_stream(
+        self,
+        route: str,
+        messages: List[Dict[str, Any]],
+        temperature: float = 0.6,
+        think_budget: int = 0,
+        system_instruction: str | None = None,
+        priority: Priority = Priority.INTERACTIVE,
+        context: GenerationContext | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield the reply to *messages* as text deltas while it is generated.
 
-        def _call():
-            return self.client.generate_image(model=model, prompt=prompt)
+        Quota admission, retries and tool calls work as in
+        :meth:`generate_async`: a turn that asks for tools is run to the end,
+        the tools are invoked, and the follow-up turn is streamed.  Retries
+        and the scheduled-to-general fallback only happen before the first
+        delta of a turn.  Streams skip the response cache and request
+        coalescing, which both need the complete text.
 
+        Raises :class:`SafetyBlocked` if the final turn produced no text.
+        """
+        ctx, entry = self._begin_call(route, context)
+        status = "error"
         try:
-            resp = call_with_backoff(_call)
-        except RateLimited:
-            log.info("route=image model=%s tokens_in=%s status=rate_limited", model, tokens_in)
+            # aclosing() closes the provider stream when the consumer stops early
+            async with aclosing(self._generate_stream(
+                route, messages, temperature, think_budget, system_instruction, priority, ctx
+            )) as deltas:
+                async for delta in deltas:
+                    yield delta
+            status = "ok"
+        except BaseException as exc:
+            status = self._failure_status(exc)
             raise
-        except Exception as exc:
-            if (
-                getattr(exc, "code", None) == 400
-                and "modalities" in str(exc).lower()
-            ):
-                log.error(
-                    "route=image model=%s does not support image generation. "
-                    "Set MODEL_IMAGE to a compatible model (e.g. gemini-2.5-flash-image).",
-                    model,
+        finally:
+            self._end_call(ctx, entry, status)
+
+    async def _generate_stream(
+        self,
+        route: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        think_budget: int,
+        system_instruction: str | None,
+        priority: Priority,
+        ctx: GenerationContext,
+    ) -> AsyncIterator[str]:
+        model = self.models.get(route)
+        if not model:
+            raise ValueError(f"unknown route {route}")
+
+        tool_handlers = self._async_tool_handlers(ctx)
+        system_prompt = system_instruction or SYSTEM_INSTRUCTION
+        current_messages = list(messages)
+
+        for attempt in range(5):
+            tokens_in = self._tokens_estimate(current_messages, system_prompt)
+            allow_fallback = route == "scheduled" and attempt == 0
+            fallback_status: Any = None
+            try:
+                temp_delta = await self.scheduler.admit(
+                    route, tokens_in, priority, wait=not allow_fallback
                 )
-                raise ValueError(
-                    f"Model '{model}' does not support image generation. "
-                    f"Update MODEL_IMAGE to a compatible model (e.g. gemini-2.5-flash-image)."
-                ) from exc
-            log.exception(
-                "route=image model=%s tokens_in=%s status=error", model, tokens_in
+            except RateLimited:
+                if not allow_fallback:
+                    raise
+                fallback_status = "rate_limited"
+            else:
+                request = {
+                    "messages": current_messages,
+                    "temperature": max(0.0, temperature + temp_delta),
+                    "thinking_budget": think_budget,
+                    "system_instruction": system_prompt,
+                }
+                start = time.time()
+
+                async def _open(
+                    endpoint: Endpoint, request: dict[str, Any] = request
+                ) -> tuple[Any, Any]:
+                    provider, name = endpoint.provider, endpoint.model
+                    tools = self._endpoint_tools(endpoint)
+
+                    async def _once() -> tuple[Any, Any]:
+                        # Retrying is only safe until the first chunk is consumed.
+                        try:
+                            stream = provider.generate_stream(model=name, **request, tools=tools)
+                            return stream, await anext(stream, None)
+                        except Exception as exc:
+                            if self._lacks_tool_support(exc, route, name, tools):
+                                stream = provider.generate_stream(model=name, **request)
+                                return stream, await anext(stream, None)
+                            raise
+
+                    return await async_retry(
+                        _once, retry_on=RETRYABLE_ERRORS, rate_limit_delay=12.0
+                    )
+
+                async def _close(opened: tuple[Any, Any]) -> None:
+                    await opened[0].aclose()
+
+                try:
+                    endpoint, (stream, chunk) = await self._race(
+                        route,
+                        "stream",
+                        self._endpoints(route, "stream"),
+                        _open,
+                        priority,
+                        tokens_in,
+                        discard=_close,
+                    )
+                    model = endpoint.model
+                except RateLimited:
+                    if not allow_fallback:
+                        log.info(
+                            "route=%s model=%s tokens_in=%s status=rate_limited",
+                            route, model, tokens_in,
+                        )
+                        raise
+                    fallback_status = "rate_limited"
+                except Exception as exc:
+                    if not (allow_fallback and self._is_fallback_error(exc)):
+                        log.exception(
+                            "route=%s model=%s tokens_in=%s status=error", route, model, tokens_in
+                        )
+                        raise
+                    fallback_status = _extract_status(exc)
+
+            if fallback_status is not None:
+                self._log_fallback(route, model, tokens_in, fallback_status)
+                async with aclosing(self.generate_stream(
+                    "general",
+                    current_messages,
+                    temperature,
+                    think_budget,
+                    system_instruction=system_prompt,
+                    priority=priority,
+                    context=ctx,
+                )) as deltas:
+                    async for delta in deltas:
+                        yield delta
+                return
+
+            first_token: float | None = None
+            parts: list[str] = []
+            tool_calls: list[Any] = []
+            tokens_out = 0
+            usage: dict[str, Any] = {}
+            block_reason = None
+            try:
+                while chunk is not None:
+                    if chunk.text:
+                        if first_token is None:
+                            first_token = time.time()
+                        parts.append(chunk.text)
+                        yield chunk.text
+                    tool_calls.extend(chunk.tool_calls)
+                    if chunk.usage:
+                        usage = chunk.usage
+                        tokens_out = chunk.usage.get("output_tokens") or tokens_out
+                    block_reason = getattr(chunk.raw_response, "prompt_feedback", block_reason)
+                    chunk = await anext(stream, None)
+            except Exception:
+                log.exception(
+                    "route=%s model=%s tokens_in=%s status=error", route, model, tokens_in
+                )
+                raise
+            finally:
+                # Release the provider stream if the consumer stops early or
+                # the reply is cancelled.
+                await stream.aclose()
+
+            tokens_in = self._real_tokens_in(route, tokens_in, usage)
+            if tool_calls:
+                self._log_response(
+                    route, model, tokens_in, tokens_out, start, "tool_call", block_reason,
+                    first_token, ctx,
+                )
+                results = await self._run_tools_async(
+                    [(call.name, call.arguments) for call in tool_calls], tool_handlers, ctx
+                )
+                current_messages = current_messages + self._tool_feedback(results)
+                continue
+
+            status = "ok" if parts else "blocked"
+            self._log_response(
+                route, model, tokens_in, tokens_out, start, status, block_reason, first_token, ctx
             )
-            raise
+            if not parts:
+                raise SafetyBlocked
+            return
+
+        raise RuntimeError("LLM tool loop exceeded attempts")
+
+    def _image_model(self) -> str:
+        model = self.models.get("image")
+        if not model:
+            raise ValueError("image model not configured")
+        return model
+
+    def _handle_image_error(self, exc: Exception, model: str, tokens_in: int) -> None:
+        """Log a failed image request, translating unsupported-model errors."""
+        if isinstance(exc, RateLimited):
+            log.info("route=image model=%s tokens_in=%s status=rate_limited", model, tokens_in)
+            return
+        if (
+            getattr(exc, "code", None) == 400
+            and "modalities" in str(exc).lower()
+        ):
+            log.error(
+                "route=image model=%s does not support image generation. "
+                "Set MODEL_IMAGE to a compatible model (e.g. gemini-2.5-flash-image).",
+                model,
+            )
+            raise ValueError(
+                f"Model '{model}' does not support image generation. "
+                f"Update MODEL_IMAGE to a compatible model (e.g. gemini-2.5-flash-image)."
+            ) from exc
+        log.exception(
+            "route=image model=%s tokens_in=%s status=error", model, tokens_in
+        )
 
+    def _image_data(self, resp: Any, model: str, tokens_in: int, start: float) -> bytes | None:
         data = None
         try:
             # Gemini responses may include textual parts before the actual
@@ -525,6 +1423,41 @@ class LLMRouter:
             return data
         return None
 
+    def generate_image(self, prompt: str) -> bytes | None:
+        model = self._image_model()
+        tokens_in = len(prompt.split())
+        self.quota.check("image", tokens_in)
+        start = time.time()
+
+        def _call():
+            return self.client.generate_image(model=model, prompt=prompt)
+
+        try:
+            resp = call_with_backoff(_call)
+        except Exception as exc:
+            self._handle_image_error(exc, model, tokens_in)
+            raise
+        return self._image_data(resp, model, tokens_in, start)
+
+    async def generate_image_async(self, prompt: str) -> bytes | None:
+        """Async counterpart of :meth:`generate_image`."""
+        model = self._image_model()
+        tokens_in = len(prompt.split())
+        await self.scheduler.admit("image", tokens_in)
+        start = time.time()
+
+        async def _call() -> Any:
+            return await self.client.generate_image_async(model=model, prompt=prompt)
+
+        try:
+            resp = await async_retry(
+                _call, retry_on=RETRYABLE_ERRORS, rate_limit_delay=12.0
+            )
+        except Exception as exc:
+            self._handle_image_error(exc, model, tokens_in)
+            raise
+        return self._image_data(resp, model, tokens_in, start)
+
 
 # Module-level router instance with lazy initialization support
 _router: LLMRouter | None = None
@@ -0,0 +1,225 @@
+"""Priority-aware admission control for LLM requests.
+
+:class:`QuotaGuard` fails fast: once a route's RPM window is full every
+caller gets :class:`RateLimited`, so book detection running on every message
+competes equally with a user who just mentioned the bot.  The scheduler sits
+in front of the guard and turns that into a wait queue:
+
+* Requests carry a :class:`Priority`.  Higher classes are admitted first.
+* Lower classes may only take a slot while part of the route's RPM budget is
+  still free, keeping headroom for interactive replies.
+* Each route queue is bounded.  When it overflows the lowest-priority, newest
+  waiter is shed with :class:`RateLimited`.
+* Every waiter has a per-class deadline, after which it gives up with
+  :class:`RateLimited` instead of replying minutes late.
+
+The per-route token bucket is the guard's own RPM window: a token is a free
+slot, and it comes back 60 seconds after use.  Admission and accounting share
+one source of truth, so an admitted request is never rejected by the guard's
+RPM check.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+from ..infra.quotas import QuotaGuard, RateLimited
+
+log = logging.getLogger(f"gentlebot.{__name__}")
+
+
+class Priority(IntEnum):
+    """Admission classes; lower values are served first."""
+
+    INTERACTIVE = 0
+    REACTION = 1
+    SCHEDULED = 2
+    SPECULATIVE = 3
+
+
+# Seconds a request may wait in the queue before giving up.
+DEFAULT_DEADLINES: dict[Priority, float] = {
+    Priority.INTERACTIVE: 15.0,
+    Priority.REACTION: 30.0,
+    Priority.SCHEDULED: 120.0,
+    Priority.SPECULATIVE: 5.0,
+}
+
+# Fraction of a route's RPM that must stay free for a class to take a slot.
+RESERVED_FRACTION: dict[Priority, float] = {
+    Priority.INTERACTIVE: 0.0,
+    Priority.REACTION: 0.2,
+    Priority.SCHEDULED: 0.2,
+    Priority.SPECULATIVE: 0.4,
+}
+
+# Never spin faster than this while waiting for a slot.
+_MIN_WAKEUP = 0.05
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    tokens: int = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+@dataclass
+class SchedulerStats:
+    """Counters keyed by priority name."""
+
+    admitted: Counter[str] = field(default_factory=Counter)
+    queued: Counter[str] = field(default_factory=Counter)
+    shed: Counter[str] = field(default_factory=Counter)
+    expired: Counter[str] = field(default_factory=Counter)
+
+
+class LLMScheduler:
+    """Queue LLM requests per route and admit them by priority.
+
+    Args:
+        quota: Guard whose RPM windows act as the per-route token buckets.
+        max_queue: Maximum waiters per route before shedding.
+        deadlines: Per-class queue deadlines overriding
+            :data:`DEFAULT_DEADLINES`.
+    """
+
+    def __init__(
+        self,
+        quota: QuotaGuard,
+        max_queue: int = 32,
+        deadlines: dict[Priority, float] | None = None,
+    ) -> None:
+        self.quota = quota
+        self.max_queue = max_queue
+        self.deadlines = {**DEFAULT_DEADLINES, **(deadlines or {})}
+        self.stats = SchedulerStats()
+        self._queues: dict[str, list[_Waiter]] = defaultdict(list)
+        self._timers: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.TimerHandle]] = {}
+        self._seq = itertools.count()
+
+    def queued(self, route: str) -> int:
+        """Return how many live requests are waiting on *route*."""
+        return sum(1 for w in self._queues.get(route, ()) if not w.future.done())
+
+    def _reserve(self, route: str, priority: Priority) -> int:
+        limit = self.quota.limits.get(route)
+        rpm = limit.rpm if limit and limit.rpm else 0
+        return int(rpm * RESERVED_FRACTION[priority])
+
+    def _slot_open(self, route: str, priority: Priority) -> tuple[bool, float]:
+        free, wait = self.quota.rpm_window(route)
+        if free is None:
+            return True, 0.0
+        return free > self._reserve(route, priority), wait
+
+    async def admit(
+        self,
+        route: str,
+        tokens: int,
+        priority: Priority = Priority.INTERACTIVE,
+        wait: bool = True,
+    ) -> float:
+        """Wait for quota on *route* and return the temperature delta.
+
+        With ``wait=False`` the request is admitted only if a slot is free
+        right now, otherwise :class:`RateLimited` is raised immediately.
+        """
+        priority = Priority(priority)
+        queue = self._queues[route]
+        ahead = any(w.priority <= priority and not w.future.done() for w in queue)
+        if not ahead:
+            is_open, retry_after = self._slot_open(route, priority)
+            if is_open:
+                try:
+                    delta = self.quota.check(route, tokens)
+                except RateLimited as exc:
+                    if not wait or exc.retry_after is None:
+                        raise
+                else:
+                    self.stats.admitted[priority.name] += 1
+                    return delta
+            elif not wait:
+                raise RateLimited("reserved", retry_after=retry_after)
+        if not wait:
+            raise RateLimited("queued")
+
+        self._make_room(route, priority)
+        waiter = _Waiter(
+            priority, next(self._seq), tokens, asyncio.get_running_loop().create_future()
+        )
+        heapq.heappush(queue, waiter)
+        self.stats.queued[priority.name] += 1
+        self._pump(route)
+        try:
+            return await asyncio.wait_for(waiter.future, self.deadlines[priority])
+        except asyncio.TimeoutError:
+            self.stats.expired[priority.name] += 1
+            log.info(
+                "route=%s priority=%s status=deadline_exceeded", route, priority.name
+            )
+            raise RateLimited("deadline") from None
+
+    def _make_room(self, route: str, priority: Priority) -> None:
+        queue = self._queues[route]
+        live = [w for w in queue if not w.future.done()]
+        if len(live) != len(queue):
+            heapq.heapify(live)
+            queue[:] = live
+        if len(live) < self.max_queue:
+            return
+        worst = max(live)
+        if worst.priority <= priority:
+            self.stats.shed[priority.name] += 1
+            log.info("route=%s priority=%s status=shed", route, priority.name)
+            raise RateLimited("shed")
+        worst.future.set_exception(RateLimited("shed"))
+        self.stats.shed[Priority(worst.priority).name] += 1
+        log.info(
+            "route=%s priority=%s status=shed", route, Priority(worst.priority).name
+        )
+
+    def _pump(self, route: str) -> None:
+        """Admit queued requests while slots are open, then sleep until one frees."""
+        self._timers.pop(route, None)
+        queue = self._queues[route]
+        while queue:
+            head = queue[0]
+            if head.future.done():
+                heapq.heappop(queue)
+                continue
+            priority = Priority(head.priority)
+            is_open, retry_after = self._slot_open(route, priority)
+            if not is_open:
+                self._wake_in(route, retry_after)
+                return
+            try:
+                delta = self.quota.check(route, head.tokens)
+            except RateLimited as exc:
+                if exc.retry_after is None:
+                    heapq.heappop(queue)
+                    head.future.set_exception(exc)
+                    continue
+                self._wake_in(route, exc.retry_after)
+                return
+            heapq.heappop(queue)
+            head.future.set_result(delta)
+            self.stats.admitted[priority.name] += 1
+
+    def _wake_in(self, route: str, delay: float) -> None:
+        loop = asyncio.get_running_loop()
+        delay = max(delay, _MIN_WAKEUP)
+        pending = self._timers.get(route)
+        if pending is not None:
+            timer_loop, timer = pending
+            if timer_loop is loop and not timer.cancelled():
+                if timer.when() <= loop.time() + delay:
+                    return
+                timer.cancel()
+        self._timers[route] = (loop, loop.call_later(delay, self._pump, route))
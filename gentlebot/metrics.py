@@ -0,0 +1,71 @@
+"""Latency percentile helpers shared by the stats collectors.
+
+Two shapes cover every collector in the bot:
+
+* :class:`Histogram` keeps fixed buckets for long-lived per-key counters
+  (query fingerprints, LLM callers), so memory stays constant however many
+  observations arrive;
+* :func:`percentile` ranks a bounded window of raw samples (HTTP hosts,
+  LLM endpoints, loop lag, benchmarks).
+
+Both use the nearest-rank definition, so ``p50`` of ``[1, 2, 3, 4]`` is
+``2`` whichever collector reports it.
+
+Example::
+
+    hist = Histogram(BUCKETS_MS)
+    hist.observe(42.0)
+    hist.percentile(95)      # -> 50, the bucket bound holding p95
+    percentile([3, 1, 2], 50)  # -> 2
+"""
+from __future__ import annotations
+
+import bisect
+import math
+from dataclasses import dataclass, field
+from typing import Iterable
+
+
+def percentile(samples: Iterable[float], pct: float) -> float | None:
+    """Return the nearest-rank *pct* percentile of *samples*, or ``None`` if empty."""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(len(ordered) * pct / 100) - 1))]
+
+
+@dataclass
+class Histogram:
+    """Counts of observations per bucket; *bounds* are ascending upper bounds.
+
+    Values above the last bound land in an unbounded overflow bucket, whose
+    percentile is reported as the largest value seen.
+    """
+
+    bounds: tuple[float, ...]
+    counts: list[int] = field(init=False)
+    max: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * (len(self.bounds) + 1)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, value: float) -> None:
+        self.max = max(self.max, value)
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+
+    def percentile(self, pct: float) -> float:
+        """Return the upper bound of the bucket holding the *pct* percentile."""
+        total = self.total
+        if not total:
+            return 0.0
+        rank = max(1, math.ceil(total * pct / 100))
+        seen = 0
+        for idx, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.bounds[idx] if idx < len(self.bounds) else self.max
+        return self.max  # pragma: no cover - counts always sum to total
@@ -22,7 +22,7 @@ class PostgresHandler(logging.Handler):
     async def connect(self) -> None:
         # Use the shared pool if available, otherwise create our own
         try:
-            self.pool = await get_pool()
+            self.pool = await get_pool(lane="logging")
             self._owns_pool = False
         except RuntimeError:
             # Fallback to creating own pool if get_pool() fails
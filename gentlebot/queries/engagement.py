@@ -11,6 +11,8 @@ from typing import Any
 
 import asyncpg
 
+from .. import db
+
 log = logging.getLogger(f"gentlebot.{__name__}")
 
 # ---------------------------------------------------------------------------
@@ -240,25 +242,157 @@ async def new_hof_count(pool: asyncpg.Pool | None, interval: timedelta) -> int:
 
 # ===================================================================
 # User-specific queries (used by /mystats)
+#
+# These run on every /mystats invocation, so they are registered as named
+# statements and prepared once per pooled connection.
 # ===================================================================
 
+_USER_MESSAGE_COUNT = db.register_statement(
+    "user_message_count",
+    f"""
+    SELECT COUNT(*)
+    FROM discord.message m
+    {_PRIVACY_JOIN}
+    WHERE m.author_id = $1
+      AND m.created_at >= now() - $2::interval
+    {_PRIVACY_FILTER}
+    """,
+)
+
+_USER_MESSAGE_PERCENTILE = db.register_statement(
+    "user_message_percentile",
+    f"""
+    WITH poster_counts AS (
+        SELECT m.author_id, COUNT(*) AS cnt
+        FROM discord.message m
+        {_NON_BOT_JOIN}
+        {_PRIVACY_JOIN}
+        WHERE m.created_at >= now() - $2::interval
+        {_NON_BOT_FILTER}
+        {_PRIVACY_FILTER}
+        GROUP BY m.author_id
+    )
+    SELECT PERCENT_RANK() OVER (ORDER BY cnt) AS pct
+    FROM poster_counts
+    WHERE author_id = $1
+    """,
+)
+
+_USER_REACTIONS_RECEIVED = db.register_statement(
+    "user_reactions_received",
+    f"""
+    SELECT COUNT(*)
+    FROM discord.reaction_event re
+    JOIN discord.message m ON re.message_id = m.message_id
+    {_PRIVACY_JOIN}
+    WHERE m.author_id = $1
+      AND re.event_at >= now() - $2::interval
+      AND re.reaction_action = 'MESSAGE_REACTION_ADD'
+    {_PRIVACY_FILTER}
+    """,
+)
+
+_USER_TOP_EMOJIS_RECEIVED = db.register_statement(
+    "user_top_emojis_received",
+    f"""
+    SELECT re.emoji, COUNT(*) AS cnt
+    FROM discord.reaction_event re
+    JOIN discord.message m ON re.message_id = m.message_id
+    {_PRIVACY_JOIN}
+    WHERE m.author_id = $1
+      AND re.event_at >= now() - $2::interval
+      AND re.reaction_action = 'MESSAGE_REACTION_ADD'
+    {_PRIVACY_FILTER}
+    GROUP BY re.emoji
+    ORDER BY cnt DESC
+    LIMIT $3
+    """,
+)
+
+_USER_TOP_CHANNELS = db.register_statement(
+    "user_top_channels",
+    f"""
+    SELECT c.channel_id, c.name, COUNT(*) AS cnt
+    FROM discord.message m
+    {_PRIVACY_JOIN}
+    WHERE m.author_id = $1
+      AND m.created_at >= now() - $2::interval
+    {_PRIVACY_FILTER}
+    GROUP BY c.channel_id, c.name
+    ORDER BY cnt DESC
+    LIMIT $3
+    """,
+)
+
+_USER_PEAK_HOUR = db.register_statement(
+    "user_peak_hour",
+    f"""
+    SELECT EXTRACT(HOUR FROM m.created_at AT TIME ZONE 'America/Los_Angeles')::int AS hr
+    FROM discord.message m
+    {_PRIVACY_JOIN}
+    WHERE m.author_id = $1
+      AND m.created_at >= now() - $2::interval
+    {_PRIVACY_FILTER}
+    GROUP BY hr
+    ORDER BY COUNT(*) DESC
+    LIMIT 1
+    """,
+)
+
+_USER_HALL_OF_FAME_COUNT = db.register_statement(
+    "user_hall_of_fame_count",
+    """
+    SELECT COUNT(*)
+    FROM discord.hall_of_fame
+    WHERE author_id = $1
+      AND inducted_at IS NOT NULL
+    """,
+)
+
+_USER_FUN_FACTS = db.register_statement(
+    "user_fun_facts",
+    """
+    SELECT
+        u.first_seen_at,
+        COUNT(m.message_id) AS lifetime_messages,
+        COALESCE(MAX(LENGTH(m.content)), 0) AS longest_message_len
+    FROM discord."user" u
+    LEFT JOIN discord.message m ON m.author_id = u.user_id
+    WHERE u.user_id = $1
+    GROUP BY u.user_id, u.first_seen_at
+    """,
+)
+
+_USER_REACTION_PERCENTILE = db.register_statement(
+    "user_reaction_percentile",
+    f"""
+    WITH author_reacts AS (
+        SELECT m.author_id, COUNT(*) AS cnt
+        FROM discord.reaction_event re
+        JOIN discord.message m ON re.message_id = m.message_id
+        {_NON_BOT_JOIN}
+        {_PRIVACY_JOIN}
+        WHERE re.event_at >= now() - $2::interval
+          AND re.reaction_action = 'MESSAGE_REACTION_ADD'
+        {_NON_BOT_FILTER}
+        {_PRIVACY_FILTER}
+        GROUP BY m.author_id
+    )
+    SELECT PERCENT_RANK() OVER (ORDER BY cnt) AS pct
+    FROM author_reacts
+    WHERE author_id = $1
+    """,
+)
+
+
 async def user_message_count(
     pool: asyncpg.Pool | None, user_id: int, interval: timedelta,
 ) -> int:
     """Message count for one user in public channels within *interval*."""
     if pool is None:
         return 0
-    return await pool.fetchval(
-        f"""
-        SELECT COUNT(*)
-        FROM discord.message m
-        {_PRIVACY_JOIN}
-        WHERE m.author_id = $1
-          AND m.created_at >= now() - $2::interval
-        {_PRIVACY_FILTER}
-        """,
-        user_id,
-        interval,
+    return await db.fetchval_named(
+        pool, _USER_MESSAGE_COUNT, user_id, interval,
     ) or 0
 
 
@@ -271,24 +405,8 @@ async def user_message_percentile(
     """
     if pool is None:
         return None
-    return await pool.fetchval(
-        f"""
-        WITH poster_counts AS (
-            SELECT m.author_id, COUNT(*) AS cnt
-            FROM discord.message m
-            {_NON_BOT_JOIN}
-            {_PRIVACY_JOIN}
-            WHERE m.created_at >= now() - $2::interval
-            {_NON_BOT_FILTER}
-            {_PRIVACY_FILTER}
-            GROUP BY m.author_id
-        )
-        SELECT PERCENT_RANK() OVER (ORDER BY cnt) AS pct
-        FROM poster_counts
-        WHERE author_id = $1
-        """,
-        user_id,
-        interval,
+    return await db.fetchval_named(
+        pool, _USER_MESSAGE_PERCENTILE, user_id, interval,
     )
 
 
@@ -298,19 +416,8 @@ async def user_reactions_received(
     """Total ADD reactions on a user's messages in the window."""
     if pool is None:
         return 0
-    return await pool.fetchval(
-        f"""
-        SELECT COUNT(*)
-        FROM discord.reaction_event re
-        JOIN discord.message m ON re.message_id = m.message_id
-        {_PRIVACY_JOIN}
-        WHERE m.author_id = $1
-          AND re.event_at >= now() - $2::interval
-          AND re.reaction_action = 'MESSAGE_REACTION_ADD'
-        {_PRIVACY_FILTER}
-        """,
-        user_id,
-        interval,
+    return await db.fetchval_named(
+        pool, _USER_REACTIONS_RECEIVED, user_id, interval,
     ) or 0
 
 
@@ -320,23 +427,8 @@ async def user_top_emojis_received(
     """Top emojis received as ``[(emoji, count)]``."""
     if pool is None:
         return []
-    rows = await pool.fetch(
-        f"""
-        SELECT re.emoji, COUNT(*) AS cnt
-        FROM discord.reaction_event re
-        JOIN discord.message m ON re.message_id = m.message_id
-        {_PRIVACY_JOIN}
-        WHERE m.author_id = $1
-          AND re.event_at >= now() - $2::interval
-          AND re.reaction_action = 'MESSAGE_REACTION_ADD'
-        {_PRIVACY_FILTER}
-        GROUP BY re.emoji
-        ORDER BY cnt DESC
-        LIMIT $3
-        """,
-        user_id,
-        interval,
-        limit,
+    rows = await db.fetch_named(
+        pool, _USER_TOP_EMOJIS_RECEIVED, user_id, interval, limit,
     )
     return [(r["emoji"], r["cnt"]) for r in rows]
 
@@ -347,21 +439,8 @@ async def user_top_channels(
     """User's most-posted channels as ``[(channel_id, name, count)]``."""
     if pool is None:
         return []
-    rows = await pool.fetch(
-        f"""
-        SELECT c.channel_id, c.name, COUNT(*) AS cnt
-        FROM discord.message m
-        {_PRIVACY_JOIN}
-        WHERE m.author_id = $1
-          AND m.created_at >= now() - $2::interval
-        {_PRIVACY_FILTER}
-        GROUP BY c.channel_id, c.name
-        ORDER BY cnt DESC
-        LIMIT $3
-        """,
-        user_id,
-        interval,
-        limit,
+    rows = await db.fetch_named(
+        pool, _USER_TOP_CHANNELS, user_id, interval, limit,
     )
     return [(r["channel_id"], r["name"], r["cnt"]) for r in rows]
 
@@ -372,20 +451,8 @@ async def user_peak_hour(
     """Most active hour of day in LA timezone. Returns 0–23 or *None*."""
     if pool is None:
         return None
-    return await pool.fetchval(
-        f"""
-        SELECT EXTRACT(HOUR FROM m.created_at AT TIME ZONE 'America/Los_Angeles')::int AS hr
-        FROM discord.message m
-        {_PRIVACY_JOIN}
-        WHERE m.author_id = $1
-          AND m.created_at >= now() - $2::interval
-        {_PRIVACY_FILTER}
-        GROUP BY hr
-        ORDER BY COUNT(*) DESC
-        LIMIT 1
-        """,
-        user_id,
-        interval,
+    return await db.fetchval_named(
+        pool, _USER_PEAK_HOUR, user_id, interval,
     )
 
 
@@ -395,14 +462,8 @@ async def user_hall_of_fame_count(
     """Inducted HoF entries for a user."""
     if pool is None:
         return 0
-    return await pool.fetchval(
-        """
-        SELECT COUNT(*)
-        FROM discord.hall_of_fame
-        WHERE author_id = $1
-          AND inducted_at IS NOT NULL
-        """,
-        user_id,
+    return await db.fetchval_named(
+        pool, _USER_HALL_OF_FAME_COUNT, user_id,
     ) or 0
 
 
@@ -412,19 +473,7 @@ async def user_fun_facts(
     """Fun facts: ``{first_seen_at, lifetime_messages, longest_message_len}``."""
     if pool is None:
         return {"first_seen_at": None, "lifetime_messages": 0, "longest_message_len": 0}
-    row = await pool.fetchrow(
-        """
-        SELECT
-            u.first_seen_at,
-            COUNT(m.message_id) AS lifetime_messages,
-            COALESCE(MAX(LENGTH(m.content)), 0) AS longest_message_len
-        FROM discord."user" u
-        LEFT JOIN discord.message m ON m.author_id = u.user_id
-        WHERE u.user_id = $1
-        GROUP BY u.user_id, u.first_seen_at
-        """,
-        user_id,
-    )
+    row = await db.fetchrow_named(pool, _USER_FUN_FACTS, user_id)
     if row is None:
         return {"first_seen_at": None, "lifetime_messages": 0, "longest_message_len": 0}
     return dict(row)
@@ -439,24 +488,6 @@ async def user_reaction_percentile(
     """
     if pool is None:
         return None
-    return await pool.fetchval(
-        f"""
-        WITH author_reacts AS (
-            SELECT m.author_id, COUNT(*) AS cnt
-            FROM discord.reaction_event re
-            JOIN discord.message m ON re.message_id = m.message_id
-            {_NON_BOT_JOIN}
-            {_PRIVACY_JOIN}
-            WHERE re.event_at >= now() - $2::interval
-              AND re.reaction_action = 'MESSAGE_REACTION_ADD'
-            {_NON_BOT_FILTER}
-            {_PRIVACY_FILTER}
-            GROUP BY m.author_id
-        )
-        SELECT PERCENT_RANK() OVER (ORDER BY cnt) AS pct
-        FROM author_reacts
-        WHERE author_id = $1
-        """,
-        user_id,
-        interval,
+    return await db.fetchval_named(
+        pool, _USER_REACTION_PERCENTILE, user_id, interval,
     )
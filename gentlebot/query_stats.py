@@ -0,0 +1,172 @@
+"""Per-statement query metrics for the shared Postgres pool.
+
+Every query issued through a :class:`gentlebot.db.LanePool` (and every named
+statement) is recorded here under its statement fingerprint and the cog
+that issued it.  For each pair we keep a latency histogram, row counts and
+pool acquire wait, which ``/perf db`` uses to rank the worst offenders.
+
+Statements slower than ``PG_SLOW_QUERY_MS`` (default 250ms) are logged
+with their parameters redacted down to type and size.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Sequence
+
+from .metrics import Histogram
+from .util import int_env
+
+log = logging.getLogger(f"gentlebot.{__name__}")
+
+# Upper bounds (ms) of the latency histogram buckets; the last is unbounded.
+BUCKETS_MS: tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_FINGERPRINT_MAX = 160
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"(?<![$\w])\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST_RE = re.compile(r"\(\s*(?:\$\d+|\?)(?:\s*,\s*(?:\$\d+|\?))+\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def slow_query_ms() -> int:
+    """Threshold above which a statement is logged as slow."""
+    return int_env("PG_SLOW_QUERY_MS", 250)
+
+
+def fingerprint(sql: str) -> str:
+    """Normalize *sql* so different literals share one fingerprint."""
+    text = _STRING_RE.sub("?", sql)
+    text = _NUMBER_RE.sub("?", text)
+    text = _PLACEHOLDER_LIST_RE.sub("(...)", text)
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+    if len(text) > _FINGERPRINT_MAX:
+        text = text[: _FINGERPRINT_MAX - 3] + "..."
+    return text
+
+
+def redact(args: Sequence[Any]) -> list[str]:
+    """Describe query parameters without revealing their values."""
+    out = []
+    for arg in args:
+        if arg is None:
+            out.append("NULL")
+        elif isinstance(arg, (str, bytes, list, tuple)):
+            out.append(f"<{type(arg).__name__} len={len(arg)}>")
+        else:
+            out.append(f"<{type(arg).__name__}>")
+    return out
+
+
+def row_count(result: Any, status: bool = False) -> int:
+    """Best-effort number of rows returned or affected by a query.
+
+    With *status* set, *result* is a command status tag such as
+    ``"INSERT 0 3"`` or ``"UPDATE 2"``.
+    """
+    if result is None:
+        return 0
+    if status:
+        tail = str(result).rsplit(" ", 1)[-1]
+        return int(tail) if tail.isdigit() else 0
+    if isinstance(result, list):
+        return len(result)
+    return 1
+
+
+@dataclass
+class StatementStats:
+    """Latency histogram and counters for one (fingerprint, source) pair."""
+
+    fingerprint: str
+    source: str
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    wait_total_ms: float = 0.0
+    latency: Histogram = field(default_factory=lambda: Histogram(BUCKETS_MS))
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    @property
+    def wait_avg_ms(self) -> float:
+        return self.wait_total_ms / self.calls if self.calls else 0.0
+
+    @property
+    def max_ms(self) -> float:
+        return self.latency.max
+
+    def percentile(self, pct: float) -> float:
+        """Return the bucket upper bound containing the *pct* percentile."""
+        return self.latency.percentile(pct)
+
+    def observe(self, elapsed_ms: float, rows: int, wait_ms: float, ok: bool) -> None:
+        self.calls += 1
+        if not ok:
+            self.errors += 1
+        self.rows += rows
+        self.total_ms += elapsed_ms
+        self.wait_total_ms += wait_ms
+        self.latency.observe(elapsed_ms)
+
+
+class QueryStats:
+    """Registry of :class:`StatementStats` keyed by fingerprint and source."""
+
+    def __init__(self) -> None:
+        self._stats: dict[tuple[str, str], StatementStats] = {}
+
+    def record(
+        self,
+        sql: str,
+        args: Sequence[Any],
+        *,
+        source: str | None,
+        elapsed_ms: float,
+        rows: int = 0,
+        wait_ms: float = 0.0,
+        ok: bool = True,
+        name: str | None = None,
+        warn: bool = True,
+    ) -> None:
+        """Record one statement execution.
+
+        Named statements are keyed by *name* instead of a fingerprint of
+        their SQL text.  With ``warn=False`` slow statements are counted but
+        not logged.
+        """
+        fp = name or fingerprint(sql)
+        src = source or "-"
+        stats = self._stats.get((fp, src))
+        if stats is None:
+            stats = self._stats[(fp, src)] = StatementStats(fp, src)
+        stats.observe(elapsed_ms, rows, wait_ms, ok)
+        if warn and elapsed_ms >= slow_query_ms():
+            log.warning(
+                "Slow query %.0fms source=%s rows=%d wait_ms=%.0f sql=%s params=%s",
+                elapsed_ms,
+                src,
+                rows,
+                wait_ms,
+                fp,
+                redact(args),
+            )
+
+    def top(self, limit: int = 10, by: str = "total_ms") -> list[StatementStats]:
+        """Return the *limit* worst statements ranked by attribute *by*."""
+        return sorted(
+            self._stats.values(), key=lambda s: getattr(s, by), reverse=True
+        )[:limit]
+
+    def __iter__(self) -> Iterator[StatementStats]:
+        return iter(list(self._stats.values()))
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+
+query_stats = QueryStats()
@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from gentlebot.infra import MicroBatcher
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_is_full():
+    batches: list[list[int]] = []
+
+    async def handler(items):
+        batches.append(items)
+        return [i * 2 for i in items]
+
+    batcher = MicroBatcher(handler, max_size=3, max_delay=60)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+    assert results == [0, 2, 4]
+    assert batches == [[0, 1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_flushes_partial_batch_after_delay():
+    async def handler(items):
+        return [str(i) for i in items]
+
+    batcher = MicroBatcher(handler, max_size=10, max_delay=0.01)
+    assert await asyncio.gather(batcher.submit(1), batcher.submit(2)) == ["1", "2"]
+    assert (batcher.batches, batcher.items) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_handler_errors_reach_every_caller():
+    async def handler(items):
+        raise RuntimeError("down")
+
+    batcher = MicroBatcher(handler, max_size=2, max_delay=60)
+    results = await asyncio.gather(
+        batcher.submit(1), batcher.submit(2), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
@@ -2,7 +2,9 @@
 import asyncio
 import collections
 import types
-from unittest.mock import MagicMock, patch
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 def test_search_open_library_returns_none_on_failure():
@@ -12,9 +14,8 @@ def test_search_open_library_returns_none_on_failure():
 
     cog = BookEnrichmentCog(bot)
 
-    with patch.object(cog.session, "get") as mock_get:
-        mock_get.side_effect = Exception("Network error")
-        result = cog._search_open_library("Test Book")
+    with patch.object(cog.http, "get", AsyncMock(side_effect=Exception("Network error"))):
+        result = asyncio.run(cog._search_open_library("Test Book"))
         assert result is None
 
 
@@ -28,8 +29,8 @@ def test_search_open_library_returns_none_on_empty():
     mock_response = MagicMock()
     mock_response.json.return_value = {"docs": []}
 
-    with patch.object(cog.session, "get", return_value=mock_response):
-        result = cog._search_open_library("Nonexistent Book 12345")
+    with patch.object(cog.http, "get", AsyncMock(return_value=mock_response)):
+        result = asyncio.run(cog._search_open_library("Nonexistent Book 12345"))
         assert result is None
 
 
@@ -65,9 +66,8 @@ def test_search_open_library_parses_response():
         "description": "A test book description."
     }
 
-    with patch.object(cog.session, "get") as mock_get:
-        mock_get.side_effect = [mock_response, mock_work_response]
-        result = cog._search_open_library("Test Book")
+    with patch.object(cog.http, "get", AsyncMock(side_effect=[mock_response, mock_work_response])):
+        result = asyncio.run(cog._search_open_library("Test Book"))
 
         assert result is not None
         assert result["title"] == "Test Book"
@@ -217,3 +217,131 @@ def test_dedup_deque_initialized():
     cog = BookEnrichmentCog(bot)
     assert isinstance(cog._responded_messages, collections.deque)
     assert cog._responded_messages.maxlen == 500
+
+
+def test_prefilter_skips_chatter(tmp_path):
+    """Only plausible book mentions should be escalated to the LLM."""
+    from gentlebot.cogs.book_enrichment_cog import BookEnrichmentCog
+    from gentlebot.infra.state_cache import StateCache
+
+    cog = BookEnrichmentCog(types.SimpleNamespace())
+    cog._state = StateCache(tmp_path / "state.db")
+
+    async def run():
+        assert await cog._is_candidate("Just finished reading 1984")
+        assert await cog._is_candidate("The Midnight Library was amazing")
+        assert await cog._is_candidate("Has anyone read Project Hail Mary by Andy Weir?")
+        assert not await cog._is_candidate("lol same, see you at lunch")
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "So I went to the store",
+        "Yeah I agree",
+        "Honestly I think that's fair",
+        "Happy Friday!",
+        "Thanks John",
+        "Good Morning everyone",
+        "I'll send it by Monday",
+        "Started work today",
+        "I'd recommend the tacos",
+        "I *really* liked it",
+        "rename it to _snake_case_ please",
+    ],
+)
+def test_prefilter_skips_everyday_chatter(tmp_path, text):
+    """Sentence-initial capitals, "I" and everyday verbs are not book cues."""
+    from gentlebot.cogs.book_enrichment_cog import BookEnrichmentCog
+    from gentlebot.infra.state_cache import StateCache
+
+    cog = BookEnrichmentCog(types.SimpleNamespace())
+    cog._state = StateCache(tmp_path / "state.db")
+
+    assert not asyncio.run(cog._is_candidate(text))
+
+
+def test_gazetteer_evicts_oldest_title(tmp_path, monkeypatch):
+    """A full gazetteer drops its oldest title, never the one just added."""
+    from gentlebot.cogs import book_enrichment_cog as module
+    from gentlebot.infra.state_cache import StateCache
+
+    monkeypatch.setattr(module, "MAX_GAZETTEER_SIZE", 2)
+    cog = module.BookEnrichmentCog(types.SimpleNamespace())
+    cog._state = StateCache(tmp_path / "state.db")
+
+    async def run():
+        for title in ("Hyperion", "Piranesi", "Kindred"):
+            await cog._remember_title(title)
+
+    asyncio.run(run())
+    assert list(cog._gazetteer) == ["piranesi", "kindred"]
+
+
+def test_gazetteer_recognizes_past_titles(tmp_path):
+    """Titles found on Open Library are remembered across instances."""
+    from gentlebot.cogs.book_enrichment_cog import BookEnrichmentCog
+    from gentlebot.infra.state_cache import StateCache
+
+    cog = BookEnrichmentCog(types.SimpleNamespace())
+    cog._state = StateCache(tmp_path / "state.db")
+
+    async def run():
+        assert not await cog._is_candidate("has anyone tried piranesi yet")
+        await cog._remember_title("Piranesi")
+
+        fresh = BookEnrichmentCog(types.SimpleNamespace())
+        fresh._state = StateCache(tmp_path / "state.db")
+        assert await fresh._is_candidate("has anyone tried piranesi yet")
+
+    asyncio.run(run())
+
+
+def test_detections_are_micro_batched(monkeypatch):
+    """Concurrent candidates share one LLM call returning JSON per message."""
+    from gentlebot.cogs import book_enrichment_cog as module
+
+    calls: list[str] = []
+
+    async def fake_generate(route, messages, **kwargs):
+        calls.append(messages[0]["content"])
+        assert kwargs["json_mode"] is True
+        return '{"1": "Hyperion", "2": null, "3": "Dune by Frank Herbert"}'
+
+    monkeypatch.setattr(module.router, "generate_async", fake_generate)
+    cog = module.BookEnrichmentCog(types.SimpleNamespace())
+    cog._batcher.max_delay = 0.01
+
+    async def run():
+        return await asyncio.gather(
+            cog._detect_book_mention("Just finished Hyperion"),
+            cog._detect_book_mention("I love reading sci-fi books"),
+            cog._detect_book_mention("Starting Dune by Frank Herbert"),
+        )
+
+    assert asyncio.run(run()) == ["Hyperion", None, "Dune by Frank Herbert"]
+    assert len(calls) == 1
+
+
+def test_gazetteer_lookup_uses_one_precompiled_pattern(tmp_path):
+    """The fallback matches every title with one pattern built on change."""
+    from gentlebot.cogs.book_enrichment_cog import BookEnrichmentCog
+    from gentlebot.infra.state_cache import StateCache
+
+    cog = BookEnrichmentCog(types.SimpleNamespace())
+    cog._state = StateCache(tmp_path / "state.db")
+
+    async def run():
+        for title in ("Piranesi", "Kindred", "Piranesi Redux"):
+            await cog._remember_title(title)
+        pattern = cog._gazetteer_re
+        hits = [
+            await cog._is_candidate(text)
+            for text in ("has anyone tried kindred", "piranesis are cool", "lol same")
+        ]
+        assert cog._gazetteer_re is pattern
+        return hits
+
+    assert asyncio.run(run()) == [True, False, False]
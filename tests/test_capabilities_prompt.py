@@ -0,0 +1,20 @@
+"""Tests for CapabilityRegistry prompt rendering."""
+import asyncio
+from unittest.mock import MagicMock
+
+from gentlebot.capabilities import CapabilityRegistry
+
+
+def test_generate_prompt_is_memoized_until_discover():
+    bot = MagicMock()
+    bot.cogs = {}
+    bot.tree.get_commands.return_value = []
+    registry = CapabilityRegistry(bot)
+
+    first = registry.generate_prompt()
+    assert registry.generate_prompt() is first
+
+    asyncio.run(registry.discover())
+    second = registry.generate_prompt()
+    assert second is not first
+    assert second == first
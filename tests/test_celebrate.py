@@ -1,7 +1,7 @@
 """Tests for the /celebrate command cog."""
 import asyncio
 import types
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 def test_fallback_message_with_reason():
@@ -51,7 +51,7 @@ def test_giphy_gifs_no_api_key():
     cog.pool = None
 
     with patch("gentlebot.cogs.celebrate_cog.GIPHY_API_KEY", ""):
-        result = cog._fetch_giphy_gifs("celebrate", limit=3)
+        result = asyncio.run(cog._fetch_giphy_gifs("celebrate", limit=3))
         assert result == []
 
 
@@ -72,8 +72,8 @@ def test_giphy_gifs_successful_fetch():
     }
 
     with patch("gentlebot.cogs.celebrate_cog.GIPHY_API_KEY", "test-key"):
-        with patch.object(cog.session, "get", return_value=mock_response):
-            result = cog._fetch_giphy_gifs("celebrate", limit=2)
+        with patch.object(cog.http, "get", AsyncMock(return_value=mock_response)):
+            result = asyncio.run(cog._fetch_giphy_gifs("celebrate", limit=2))
             assert len(result) == 2
             assert all("giphy.com" in url for url in result)
 
@@ -26,7 +26,7 @@ async def fake_create_pool(url, *args, **kwargs):
 def test_command_logged(monkeypatch):
     async def run_test():
         monkeypatch.setattr(db.asyncpg, "create_pool", fake_create_pool)
-        db._pool = None
+        db._pools.clear()
         monkeypatch.setenv("LOG_COMMANDS", "1")
         monkeypatch.setenv("PG_DSN", "postgresql+asyncpg://u:p@localhost/db")
 
@@ -53,7 +53,7 @@ def test_command_logged(monkeypatch):
 def test_dm_skipped(monkeypatch):
     async def run_test():
         monkeypatch.setattr(db.asyncpg, "create_pool", fake_create_pool)
-        db._pool = None
+        db._pools.clear()
         monkeypatch.setenv("LOG_COMMANDS", "1")
         monkeypatch.setenv("PG_DSN", "postgresql+asyncpg://u:p@localhost/db")
 
@@ -0,0 +1,110 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import discord
+from discord.ext import commands
+
+from gentlebot.cogs.gemini_cog import GeminiCog
+from gentlebot.llm.context_buffer import BufferedMessage, ChannelContextBuffer
+
+
+def _msg(mid, author_id=1, content="hi", minutes_ago=0):
+    return BufferedMessage(
+        message_id=mid,
+        author_id=author_id,
+        author=f"user{author_id}",
+        content=content,
+        created_at=datetime.now(timezone.utc) - timedelta(minutes=minutes_ago),
+    )
+
+
+def test_ring_is_bounded_and_applies_edits_and_deletes():
+    buf = ChannelContextBuffer(maxlen=3)
+    for mid in range(5):
+        buf.append(10, _msg(mid))
+    assert [m.message_id for m in buf.recent(10)] == [2, 3, 4]
+
+    buf.edit(10, 3, "edited text")
+    buf.delete(10, 4)
+    recent = buf.recent(10)
+    assert [m.message_id for m in recent] == [2, 3]
+    assert recent[1].content == "edited text"
+    assert recent[1].tokens > 0
+
+
+def test_recent_filters_by_author_age_and_exclusion():
+    buf = ChannelContextBuffer()
+    buf.seed(10, [_msg(1, author_id=1, minutes_ago=60 * 30), _msg(2, author_id=2, minutes_ago=5)])
+    buf.append(10, _msg(3, author_id=1))
+    assert [m.message_id for m in buf.recent(10, since=timedelta(hours=24))] == [2, 3]
+    assert [m.message_id for m in buf.recent(10, authors={1})] == [1, 3]
+    assert [m.message_id for m in buf.recent(10, exclude=3, limit=1)] == [2]
+
+
+def test_seed_keeps_live_messages_newest():
+    buf = ChannelContextBuffer()
+    buf.append(10, _msg(5))
+    buf.seed(10, [_msg(1), _msg(5, content="stale")])
+    assert [m.message_id for m in buf.recent(10)] == [1, 5]
+    assert buf.recent(10)[-1].content == "hi"
+    assert buf.is_seeded(10)
+
+
+def test_cog_builds_context_without_io():
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+    cog = GeminiCog(bot)
+    cog.context.seed(42, [])
+    cog.context.append(42, _msg(1, author_id=7, content="what's up"))
+    cog.context.append(42, _msg(2, author_id=99, content="not much"))
+    cog.context.append(42, _msg(3, author_id=8, content="lunch?"))
+    cog.context.append(42, _msg(4, author_id=7, content="@bot hello"))
+
+    async def run():
+        channel = SimpleNamespace(id=42)
+        history = await cog._build_chat_history_block(channel, SimpleNamespace(id=4))
+        archive = await cog._get_context_from_archive(42)
+        turns = await cog._get_conversation_turns(42, 7, 99, exclude=4)
+        return history, archive, turns
+
+    history, archive, turns = asyncio.run(run())
+    assert "user8: lunch?" in history and "hello" not in history
+    assert archive.startswith("Active participants: user7")
+    assert turns == [
+        {"role": "user", "content": "what's up"},
+        {"role": "assistant", "content": "not much"},
+    ]
+
+
+def test_cog_without_database_seeds_from_channel_history():
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+    cog = GeminiCog(bot)
+    cog.pool = None
+    now = datetime.now(timezone.utc)
+    history = [
+        SimpleNamespace(
+            id=mid,
+            author=SimpleNamespace(id=7, display_name="alice", name="alice"),
+            clean_content=text,
+            created_at=now - timedelta(minutes=mid),
+            attachments=[],
+        )
+        for mid, text in [(1, "newest"), (2, "oldest")]
+    ]
+
+    async def fake_history(limit):
+        for msg in history[:limit]:
+            yield msg
+
+    channel = SimpleNamespace(id=42, history=fake_history)
+
+    async def run():
+        # A bare id cannot be seeded without a database, so it must not block
+        # the history fallback for the channel object.
+        assert await cog._get_context_from_archive(42) == ""
+        assert not cog.context.is_seeded(42)
+        return await cog._get_context_from_archive(channel)
+
+    archive = asyncio.run(run())
+    assert archive.endswith("alice: oldest\nalice: newest")
+    assert cog.context.is_seeded(42)
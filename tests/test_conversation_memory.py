@@ -0,0 +1,118 @@
+"""Tests for rolling per-(channel, user) conversation summaries."""
+import asyncio
+from datetime import datetime, timezone
+
+import discord
+from discord.ext import commands
+
+import gentlebot.cogs.gemini_cog as gemini_cog
+from gentlebot.cogs.gemini_cog import GeminiCog
+from gentlebot.infra.state_cache import StateCache
+from gentlebot.llm.context_buffer import BufferedMessage
+from gentlebot.llm.conversation_memory import ConversationMemory
+
+
+def _msg(message_id, author_id=7, content=None):
+    return BufferedMessage(
+        message_id=message_id,
+        author_id=author_id,
+        author=f"user{author_id}",
+        content=content or f"turn {message_id}",
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def _memory(tmp_path, calls, reply="summary"):
+    async def summarize(previous, turns):
+        calls.append((previous, [m.message_id for m in turns]))
+        return f"{reply} {len(calls)}"
+
+    return ConversationMemory(summarize, state=StateCache(tmp_path / "state.db"))
+
+
+def test_compacts_older_turns_in_background(tmp_path):
+    calls = []
+    memory = _memory(tmp_path, calls)
+    turns = [_msg(i) for i in range(1, 9)]
+
+    async def run():
+        first = await memory.prepare(1, 7, turns)
+        await memory.wait_idle()
+        second = await memory.prepare(1, 7, turns + [_msg(9)])
+        return first, second
+
+    (summary, pending), (summary2, pending2) = asyncio.run(run())
+
+    # Until the summary lands every turn stays verbatim
+    assert summary == "" and len(pending) == 8
+    assert calls == [("", [1, 2, 3, 4])]
+    assert summary2 == "summary 1"
+    assert [m.message_id for m in pending2] == [5, 6, 7, 8, 9]
+
+
+def test_summary_rolls_forward_and_persists(tmp_path):
+    calls = []
+    memory = _memory(tmp_path, calls)
+
+    async def run():
+        await memory.prepare(1, 7, [_msg(i) for i in range(1, 9)])
+        await memory.wait_idle()
+        await memory.prepare(1, 7, [_msg(i) for i in range(5, 13)])
+        await memory.wait_idle()
+
+    asyncio.run(run())
+
+    assert calls == [("", [1, 2, 3, 4]), ("summary 1", [5, 6, 7, 8])]
+    # A fresh instance (e.g. after a restart) picks the summary up from disk
+    reloaded = ConversationMemory(None, state=StateCache(tmp_path / "state.db"))
+    stored = asyncio.run(reloaded.summary(1, 7))
+    assert (stored.text, stored.through, stored.turns) == ("summary 2", 8, 8)
+    assert asyncio.run(reloaded.summary(1, 8)).text == ""
+
+
+def test_failed_compaction_keeps_turns_verbatim(tmp_path):
+    async def summarize(previous, turns):
+        raise RuntimeError("quota")
+
+    memory = ConversationMemory(summarize, state=StateCache(tmp_path / "state.db"))
+    turns = [_msg(i) for i in range(1, 11)]
+
+    async def run():
+        await memory.prepare(1, 7, turns)
+        await memory.wait_idle()
+        return await memory.prepare(1, 7, turns)
+
+    summary, pending = asyncio.run(run())
+    assert summary == "" and len(pending) == 10
+
+
+def test_cog_replaces_old_turns_with_summary(tmp_path, monkeypatch):
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+    cog = GeminiCog(bot)
+    cog.memory._state = StateCache(tmp_path / "state.db")
+    requests = []
+
+    async def fake_generate(route, messages, temperature=0.6, **kwargs):
+        requests.append((route, kwargs.get("priority"), messages[0]["content"]))
+        return "They asked about lunch spots."
+
+    monkeypatch.setattr(gemini_cog.router, "generate_async", fake_generate)
+    cog.context.seed(42, [])
+    for i in range(1, 13):
+        cog.context.append(42, _msg(i, author_id=7 if i % 2 else 99))
+
+    async def run():
+        await cog._get_conversation_turns(42, 7, 99)
+        await cog.memory.wait_idle()
+        return await cog._get_conversation_turns(42, 7, 99)
+
+    turns = asyncio.run(run())
+
+    ((route, priority, prompt),) = requests
+    assert route == "scheduled" and priority == gemini_cog.Priority.SCHEDULED
+    assert "user7: turn 1" in prompt and "turn 9" not in prompt
+    assert turns[0] == {
+        "role": "system",
+        "content": "Summary of your earlier conversation: They asked about lunch spots.",
+    }
+    assert [t["content"] for t in turns[1:]] == [f"turn {i}" for i in range(9, 13)]
@@ -80,11 +80,10 @@ def test_post_haiku_posts_message(cog, monkeypatch):
 
         cog.pool = DummyPool()
 
-        monkeypatch.setattr(
-            router,
-            "generate",
-            lambda route, msgs, temp=0.6, think_budget=0, json_mode=False: "line1\nline2\nline3",
-        )
+        async def fake_generate(route, msgs, temp=0.6, think_budget=0, json_mode=False, priority=None):
+            return "line1\nline2\nline3"
+
+        monkeypatch.setattr(router, "generate_async", fake_generate)
 
         sent: list[str] = []
         import gentlebot.cogs.daily_haiku_cog as module
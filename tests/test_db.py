@@ -0,0 +1,222 @@
+"""Tests for the shared pool lanes and named statement registry in gentlebot.db."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from gentlebot import db
+
+
+class FakeStatement:
+    def __init__(self, sql):
+        self.sql = sql
+        self.calls = []
+
+    async def fetch(self, *args):
+        self.calls.append(("fetch", args))
+        return [{"n": 1}]
+
+    async def fetchval(self, *args):
+        self.calls.append(("fetchval", args))
+        return 1
+
+    def get_statusmsg(self):
+        return "INSERT 0 1"
+
+
+class FakeConnection:
+    def __init__(self):
+        self.prepare_calls = []
+
+    async def prepare(self, sql):
+        self.prepare_calls.append(sql)
+        return FakeStatement(sql)
+
+    async def execute(self, sql, *args):  # pragma: no cover - should not be used
+        raise AssertionError("inline execute used for a prepared connection")
+
+
+def test_prepare_statements_prepares_registry():
+    conn = FakeConnection()
+    asyncio.run(db.prepare_statements(conn))
+    assert set(conn.prepared) == set(db.STATEMENTS)
+    assert len(conn.prepare_calls) == len(db.STATEMENTS)
+
+
+def test_named_execution_reuses_prepared_statement():
+    async def run():
+        conn = FakeConnection()
+        await db.prepare_statements(conn)
+        before = len(conn.prepare_calls)
+        tag = await db.execute_named(conn, "streak_reset", 42)
+        val = await db.fetchval_named(conn, "message_exists", 7)
+        await db.fetchval_named(conn, "message_exists", 8)
+        return conn, before, tag, val
+
+    conn, before, tag, val = asyncio.run(run())
+    assert tag == "INSERT 0 1"
+    assert val == 1
+    assert len(conn.prepare_calls) == before
+    assert conn.prepared["message_exists"].calls == [("fetchval", (7,)), ("fetchval", (8,))]
+
+
+def test_named_execution_prepares_lazily():
+    async def run():
+        conn = FakeConnection()
+        conn.prepared = {}
+        await db.fetchval_named(conn, "message_exists", 1)
+        await db.fetchval_named(conn, "message_exists", 2)
+        return conn
+
+    conn = asyncio.run(run())
+    assert conn.prepare_calls == [db.STATEMENTS["message_exists"]]
+
+
+def test_unprepared_target_runs_registered_sql():
+    pool = AsyncMock()
+    pool.fetchval = AsyncMock(return_value=5)
+    assert asyncio.run(db.fetchval_named(pool, "message_exists", 3)) == 5
+    pool.fetchval.assert_awaited_once_with(db.STATEMENTS["message_exists"], 3)
+
+
+def test_unknown_statement_raises():
+    with pytest.raises(KeyError):
+        asyncio.run(db.fetchval_named(AsyncMock(), "does_not_exist"))
+
+
+def test_register_statement_rejects_conflicting_sql():
+    name = db.register_statement("test_only_statement", "SELECT 1")
+    assert db.register_statement(name, "SELECT 1") == name
+    with pytest.raises(ValueError):
+        db.register_statement(name, "SELECT 2")
+    del db.STATEMENTS[name]
+
+
+def test_get_pool_uses_statement_connection_class(monkeypatch):
+    captured = {}
+
+    async def fake_create_pool(url, **kwargs):
+        captured.update(kwargs)
+        return AsyncMock(is_closing=lambda: False)
+
+    monkeypatch.setattr(db.asyncpg, "create_pool", fake_create_pool)
+    monkeypatch.setenv("PG_DSN", "postgresql+asyncpg://u:p@localhost/db")
+    db._pools.clear()
+    try:
+        asyncio.run(db.get_pool())
+    finally:
+        db._pools.clear()
+    assert captured["connection_class"] is db.Connection
+
+
+class FakeAcquire:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *args):
+        return False
+
+
+def test_lane_pool_applies_acquire_timeout():
+    timeouts = []
+    conn = AsyncMock()
+    conn.fetchval = AsyncMock(return_value=3)
+    raw = AsyncMock()
+
+    def acquire(timeout=None):
+        timeouts.append(timeout)
+        return FakeAcquire(conn)
+
+    raw.acquire = acquire
+    pool = db.LanePool("batch", raw, acquire_timeout=60)
+
+    async def run():
+        assert await pool.fetchval("SELECT 3") == 3
+        async with pool.acquire(timeout=1):
+            assert pool.stats.in_use == 1
+
+    asyncio.run(run())
+    assert timeouts == [60, 1]
+
+
+class TimeoutAcquire:
+    async def __aenter__(self):
+        raise asyncio.TimeoutError
+
+    async def __aexit__(self, *args):
+        return False
+
+
+def test_lane_pool_records_stats():
+    raw = AsyncMock()
+    raw.acquire = lambda timeout=None: FakeAcquire(AsyncMock())
+    pool = db.LanePool("ingest", raw, acquire_timeout=10, max_size=4)
+
+    async def run():
+        async with pool.acquire():
+            async with pool.acquire():
+                assert pool.stats.saturation == 0.5
+        raw.acquire = lambda timeout=None: TimeoutAcquire()
+        with pytest.raises(asyncio.TimeoutError):
+            async with pool.acquire():
+                pass
+
+    asyncio.run(run())
+    snap = pool.stats.snapshot()
+    assert snap["acquires"] == 2
+    assert snap["timeouts"] == 1
+    assert snap["in_use"] == 0
+    assert snap["peak_in_use"] == 2
+
+
+def test_slow_acquire_is_not_logged_for_logging_lane(monkeypatch, caplog):
+    monkeypatch.setattr(db, "SLOW_ACQUIRE_MS", 0)
+    raw = AsyncMock()
+    raw.acquire = lambda timeout=None: FakeAcquire(AsyncMock())
+
+    async def run(lane):
+        async with db.LanePool(lane, raw, acquire_timeout=10, max_size=1).acquire():
+            pass
+
+    with caplog.at_level("INFO", logger="gentlebot.db"):
+        asyncio.run(run(db.LOGGING_LANE))
+        assert "slow acquire" not in caplog.text
+        asyncio.run(run("ingest"))
+    assert "Pool lane ingest: slow acquire" in caplog.text
+
+
+def test_get_pool_rejects_unknown_lane():
+    with pytest.raises(ValueError):
+        asyncio.run(db.get_pool(lane="nope"))
+
+
+def test_get_pool_caches_per_lane(monkeypatch):
+    created = []
+
+    async def fake_create_pool(url, **kwargs):
+        created.append(kwargs["max_size"])
+        return AsyncMock(is_closing=lambda: False)
+
+    monkeypatch.setattr(db.asyncpg, "create_pool", fake_create_pool)
+    monkeypatch.setenv("PG_DSN", "postgresql+asyncpg://u:p@localhost/db")
+    monkeypatch.setenv("PG_POOL_BATCH_MAX", "7")
+    db._pools.clear()
+
+    async def run():
+        a = await db.get_pool(lane="batch")
+        b = await db.get_pool(lane="batch")
+        c = await db.get_pool(lane="ingest")
+        return a, b, c
+
+    try:
+        a, b, c = asyncio.run(run())
+    finally:
+        db._pools.clear()
+    assert a is b
+    assert a is not c
+    assert created == [7, db.LANES["ingest"].max_size]
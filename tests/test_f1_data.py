@@ -0,0 +1,104 @@
+"""Tests for the shared F1 data service."""
+import asyncio
+from types import SimpleNamespace
+
+from gentlebot.f1_data import F1Data
+
+CALENDAR = {
+    "races": [
+        {
+            "name": "Hungarian Grand Prix",
+            "location": "Budapest",
+            "slug": "hungarian-grand-prix",
+            "round": 13,
+            "sessions": {
+                "fp1": "2025-08-01T11:30:00Z",
+                "Qualifying": "2025-08-02T14:00:00Z",
+                "Grand Prix": "2025-08-03T13:00:00Z",
+            },
+        }
+    ]
+}
+
+TRACK_PAGE = '<table><tr><td class="infobox-image"><img src="//upload/map.svg"></td></tr></table>'
+
+
+class FakeHttp:
+    """Stand-in for :class:`HttpClient` counting GETs per URL."""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls: list[str] = []
+        self.params: list[dict | None] = []
+        self.delay = delay
+
+    async def get(self, url, params=None, headers=None, cache=None):
+        self.calls.append(url)
+        self.params.append(params)
+        await asyncio.sleep(self.delay)
+        body = TRACK_PAGE if "wikipedia" in url else ""
+        return SimpleNamespace(raise_for_status=lambda: None, json=lambda: CALENDAR, text=body)
+
+
+def test_calendar_is_fetched_once_for_both_cogs():
+    http = FakeHttp(delay=0.01)
+    f1 = F1Data(http=http)
+
+    async def run():
+        return await asyncio.gather(f1.sessions(2025), f1.sessions(2025), f1.thread_sessions(2025))
+
+    sessions, again, thread_sessions = asyncio.run(run())
+
+    assert again is sessions
+    assert [s["session"] for s in sessions] == ["fp1", "Qualifying", "Grand Prix"]
+    assert sessions[0]["round"] == "Hungarian Grand Prix"
+    assert [(s["gp_name"], s["country_iso"], s["session"]) for s in thread_sessions] == [
+        ("Hungarian", "HU", "QUALI"),
+        ("Hungarian", "HU", "RACE"),
+    ]
+    assert len(http.calls) == 1
+
+
+def test_schedule_url_override_is_sent_unchanged(monkeypatch):
+    http = FakeHttp()
+    asyncio.run(F1Data(http=http).calendar(2025))
+    assert http.params == [{"season": 2025}]
+
+    monkeypatch.setenv("F1_SCHEDULE_URL", "https://example.test/f1.json")
+    http = FakeHttp()
+    asyncio.run(F1Data(http=http).calendar(2025))
+    assert http.calls == ["https://example.test/f1.json"]
+    assert http.params == [None]
+
+
+def test_expired_memo_is_served_while_refreshing():
+    http = FakeHttp()
+    f1 = F1Data(http=http)
+
+    async def run():
+        first = await f1.sessions(2025)
+        memo = f1._memo[("sessions", 2025)]
+        memo.loaded_at -= 3600
+        stale = await f1.sessions(2025)
+        await f1.wait_idle()
+        fresh = await f1.sessions(2025)
+        return first, stale, fresh
+
+    first, stale, fresh = asyncio.run(run())
+
+    assert stale is first
+    assert fresh is not first and fresh == first
+    assert len(http.calls) == 2
+
+
+def test_track_map_is_memoized_per_slug():
+    http = FakeHttp()
+    f1 = F1Data(http=http)
+
+    async def run():
+        return [await f1.track_map("hungaroring") for _ in range(3)]
+
+    maps = asyncio.run(run())
+
+    assert maps == ["https://upload/map.svg"] * 3
+    assert http.calls == ["https://en.wikipedia.org/wiki/Hungaroring"]
+    assert asyncio.run(f1.track_map("")) is None
@@ -5,6 +5,7 @@ from discord.ext import commands
 
 from datetime import datetime, timezone, timedelta
 from gentlebot.cogs.f1_thread_cog import F1ThreadCog, iso_to_flag
+from gentlebot.f1_data import F1Data
 
 
 class DummyThread(SimpleNamespace):
@@ -75,17 +76,17 @@ def test_open_threads(monkeypatch):
 def test_fetch_schedule_uses_current_year(monkeypatch):
     captured = {}
 
-    def fake_get(url, headers=None, timeout=10):
-        captured["url"] = url
-        return SimpleNamespace(
-            raise_for_status=lambda: None, json=lambda: {"races": []}
-        )
+    async def fake_get(url, params=None, headers=None, cache=None):
+        captured["params"] = params
+        return SimpleNamespace(raise_for_status=lambda: None, json=lambda: {"races": []})
 
     monkeypatch.setattr(
-        "gentlebot.cogs.f1_thread_cog.requests.get", fake_get
+        F1ThreadCog, "session_task", SimpleNamespace(start=lambda *a, **k: None)
     )
-    F1ThreadCog.fetch_schedule(SimpleNamespace())
-    assert f"season={datetime.now(timezone.utc).year}" in captured["url"]
+    cog = F1ThreadCog(SimpleNamespace())
+    cog.f1 = F1Data(http=SimpleNamespace(get=fake_get))
+    assert asyncio.run(cog.fetch_schedule()) == []
+    assert captured["params"] == {"season": datetime.now(timezone.utc).year}
 
 
 def test_due_sessions_query_has_two_hour_window(monkeypatch):
@@ -0,0 +1,97 @@
+"""Tests for the deterministic fake LLM provider."""
+import asyncio
+
+import pytest
+
+import gentlebot.llm.router as llm_router
+from gentlebot.infra.retries import _extract_status
+from gentlebot.llm.providers.base import GenerationResult, ToolCall
+from gentlebot.llm.providers.fake import Cassette, FakeProvider, Latency
+
+
+def test_latency_is_reproducible_per_seed():
+    a = Latency.lognormal(0.8, 0.5, seed=7)
+    b = Latency.lognormal(0.8, 0.5, seed=7)
+    samples = [a.sample() for _ in range(5)]
+    assert samples == [b.sample() for _ in range(5)]
+    assert all(s > 0 for s in samples)
+    assert Latency.fixed(0.25).sample() == 0.25
+
+
+def test_injected_errors_carry_http_status():
+    provider = FakeProvider(rate_limit_rate=1.0)
+    with pytest.raises(Exception) as exc:
+        asyncio.run(provider.generate_async("m", [{"role": "user", "content": "hi"}]))
+    assert _extract_status(exc.value) == 429
+    assert provider.injected == {429: 1}
+    assert provider.in_flight == 0
+
+
+def test_router_retries_injected_server_error():
+    router = llm_router.LLMRouter()
+    # Seed 1 fails the first request and passes the second
+    router.client = FakeProvider("recovered", server_error_rate=0.5, seed=1)
+
+    text = asyncio.run(router.generate_async("general", [{"content": "hi"}]))
+
+    assert text == "recovered"
+    assert len(router.client.requests) == 2
+    assert router.client.injected == {503: 1}
+
+
+def test_router_runs_scripted_tool_calls():
+    replies = [
+        GenerationResult(text="", tool_calls=[ToolCall("1", "calculate", {"expression": "6*7"})]),
+        GenerationResult(text="It is 42."),
+    ]
+    router = llm_router.LLMRouter()
+    router.client = FakeProvider(lambda request: replies.pop(0))
+
+    text = asyncio.run(router.generate_async("general", [{"content": "6*7?"}]))
+
+    assert text == "It is 42."
+    assert "Tool calculate result: 42.0" in router.client.requests[1].messages[-2]["content"]
+
+
+def test_stream_yields_chunks_then_usage():
+    provider = FakeProvider("abcdefghij", chunk_size=4)
+
+    async def collect():
+        return [c async for c in provider.generate_stream("m", [{"content": "hi"}])]
+
+    chunks = asyncio.run(collect())
+
+    assert [c.text for c in chunks] == ["abcd", "efgh", "ij", ""]
+    assert chunks[-1].usage["output_tokens"] > 0
+
+
+def test_cassette_records_and_replays(tmp_path):
+    path = tmp_path / "cassette.json"
+    messages = [{"role": "user", "content": "summarize this"}]
+    recorder = FakeProvider(cassette=Cassette(path), record_from=FakeProvider("• recorded"))
+    asyncio.run(recorder.generate_async("m", messages, system_instruction="sys"))
+    recorder.cassette.save()
+
+    replay = FakeProvider(cassette=Cassette(path))
+    result = asyncio.run(replay.generate_async("m", messages, system_instruction="sys"))
+
+    assert result.text == "• recorded"
+    assert replay.cassette.hits == 1
+    with pytest.raises(LookupError):
+        asyncio.run(replay.generate_async("m", messages, system_instruction="other"))
+
+
+def test_bench_reports_throughput_and_quota(tmp_path):
+    from gentlebot.llm import bench
+
+    provider = FakeProvider(latency=Latency.uniform(0.005, 0.02, seed=3))
+    router = bench.build_router(provider, rpm=10, state_path=str(tmp_path / "bench.db"))
+    router.scheduler.deadlines[llm_router.Priority.INTERACTIVE] = 0.05
+
+    result = asyncio.run(bench.run_bench(router, "async", requests=12, concurrency=4))
+    report = bench.format_result(result)
+
+    assert result.statuses == {"ok": 10, "rate_limited": 2}
+    assert result.provider_requests == 10
+    assert result.max_in_flight <= 4
+    assert "throughput=" in report and "quota left general  rpm=0" in report
@@ -80,11 +80,11 @@ def test_call_llm_robot_persona(monkeypatch):
 
     captured: dict[str, list[dict]] = {}
 
-    def fake_generate(route: str, messages: list[dict], temperature: float):
+    async def fake_generate(route: str, messages: list[dict], temperature: float):
         captured["messages"] = messages
         return "hi"
 
-    monkeypatch.setattr(gemini_cog.router, "generate", fake_generate)
+    monkeypatch.setattr(gemini_cog.router, "generate_async", fake_generate)
 
     asyncio.run(cog.call_llm(0, "hello"))
 
@@ -100,10 +100,10 @@ def test_call_llm_logs_output_not_input(monkeypatch, caplog):
     bot = commands.Bot(command_prefix="!", intents=intents)
     cog = GeminiCog(bot)
 
-    def fake_generate(route: str, messages: list[dict], temperature: float):
+    async def fake_generate(route: str, messages: list[dict], temperature: float):
         return "logged output"
 
-    monkeypatch.setattr(gemini_cog.router, "generate", fake_generate)
+    monkeypatch.setattr(gemini_cog.router, "generate_async", fake_generate)
 
     with caplog.at_level(logging.INFO):
         asyncio.run(cog.call_llm(0, "secret input"))
@@ -309,3 +309,163 @@ def test_on_message_replies_to_direct_mention_without_text(monkeypatch):
 
     assert "pinged you directly" in captured["prompt"]
     message.reply.assert_called_once_with("Hello there!", files=None, mention_author=True)
+
+
+def test_call_llm_keeps_system_instruction_stable(monkeypatch):
+    """The cacheable prefix must not change between requests; context does."""
+    monkeypatch.setenv("GEMINI_API_KEY", "fake")
+    intents = discord.Intents.none()
+    bot = commands.Bot(command_prefix="!", intents=intents)
+    cog = GeminiCog(bot)
+
+    calls: list[tuple[list[dict], str]] = []
+
+    async def fake_generate(route, messages, temperature, system_instruction=None, **kwargs):
+        calls.append((messages, system_instruction))
+        return "hi"
+
+    monkeypatch.setattr(gemini_cog.router, "generate_async", fake_generate)
+    cog._build_chat_history_block = AsyncMock(side_effect=["first", "second"])
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.id = 42
+    channel.name = "general"
+    channel.topic = None
+    cog._get_conversation_turns = AsyncMock(return_value=[])
+
+    asyncio.run(cog.call_llm(channel, "hello"))
+    asyncio.run(cog.call_llm(channel, "again"))
+
+    (first_msgs, first_sys), (second_msgs, second_sys) = calls
+    assert first_sys == second_sys
+    assert "# CORE INSTRUCTIONS" in first_sys
+    assert "CONTEXT LAYER" not in first_sys
+    assert "first" in first_msgs[0]["content"]
+    assert "second" in second_msgs[0]["content"]
+
+
+def test_call_llm_streams_partial_text(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "fake")
+    intents = discord.Intents.none()
+    bot = commands.Bot(command_prefix="!", intents=intents)
+    cog = GeminiCog(bot)
+
+    async def fake_stream(route, messages, temperature, system_instruction=None, **kwargs):
+        for delta in ["Hello", " there"]:
+            yield delta
+
+    monkeypatch.setattr(gemini_cog.router, "generate_stream", fake_stream)
+    partials: list[str] = []
+
+    async def on_delta(text: str) -> None:
+        partials.append(text)
+
+    reply = asyncio.run(cog.call_llm(0, "hello", on_delta=on_delta))
+
+    assert reply == "Hello there"
+    assert partials == ["Hello", "Hello there"]
+
+
+def _mention(content: str, message_id: int) -> MagicMock:
+    message = MagicMock(spec=discord.Message)
+    message.id = message_id
+    message.author.bot = False
+    message.author.id = 456
+    message.author.mention = "<@456>"
+    message.flags = MagicMock(ephemeral=False)
+    message.content = f"<@123> {content}"
+    message.guild = None
+    message.reference = None
+    message.channel = MagicMock()
+    message.channel.id = 789
+    message.channel.typing.side_effect = lambda: dummy_typing()
+    message.reply = AsyncMock()
+    return message
+
+
+def _coalescing_cog(stream_text: str | None):
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+    cog = GeminiCog(bot)
+    cog.mention_strs = ["<@123>"]
+    cog.cooldown_seconds = 0.2
+    cog._get_context_from_archive = AsyncMock(return_value="")
+    calls: list[str] = []
+    active = {"now": 0, "max": 0}
+
+    async def fake_call(channel, prompt, user=None, exclude=None, on_delta=None, generation=None):
+        calls.append(prompt)
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        try:
+            if stream_text and on_delta is not None:
+                await on_delta(stream_text)
+            await asyncio.sleep(0.1)
+        finally:
+            active["now"] -= 1
+        return f"answer to {prompt!r}"
+
+    cog.call_llm = fake_call
+    return cog, calls, active
+
+
+def test_messages_within_cooldown_are_merged():
+    cog, calls, active = _coalescing_cog(stream_text=None)
+    first, second = _mention("is it", 1), _mention("going to rain?", 2)
+
+    async def run():
+        handler = asyncio.create_task(cog.on_message(first))
+        await asyncio.sleep(0.02)
+        await cog.on_message(second)
+        await handler
+
+    asyncio.run(run())
+
+    # The unseen first reply is superseded by one answer to both messages
+    assert calls == ["is it", "is it\ngoing to rain?"]
+    first.reply.assert_not_called()
+    second.reply.assert_called_once_with(
+        "answer to 'is it\\ngoing to rain?'", files=None, mention_author=True
+    )
+    assert active["max"] == 1
+    assert cog._pending == {}
+
+
+def test_visible_reply_is_not_superseded():
+    cog, calls, active = _coalescing_cog(stream_text="x" * 60)
+    first, second = _mention("hello", 1), _mention("also this", 2)
+
+    async def run():
+        handler = asyncio.create_task(cog.on_message(first))
+        await asyncio.sleep(0.02)
+        await cog.on_message(second)
+        await handler
+
+    asyncio.run(run())
+
+    assert calls == ["hello", "also this"]
+    assert first.reply.await_count == 1 and second.reply.await_count == 1
+    assert active["max"] == 1
+
+
+def test_messages_after_visible_reply_wait_for_it():
+    cog, calls, active = _coalescing_cog(stream_text="x" * 60)
+    cog.cooldown_seconds = 0.03  # shorter than A's reply
+    first = _mention("A", 1)
+    second, third = _mention("C", 2), _mention("D", 3)
+
+    async def run():
+        handler = asyncio.create_task(cog.on_message(first))
+        while not first.reply.await_count:  # A is visible and still streaming
+            await asyncio.sleep(0.005)
+        waiting = asyncio.create_task(cog.on_message(second))
+        await asyncio.sleep(0.01)
+        await cog.on_message(third)
+        await asyncio.gather(handler, waiting)
+
+    asyncio.run(run())
+
+    # D supersedes the waiting C but still starts only after A finishes,
+    # and A's prompt is not answered twice.
+    assert calls == ["A", "C\nD"]
+    assert active["max"] == 1
+    second.reply.assert_not_called()
+    assert cog._pending == {}
@@ -0,0 +1,173 @@
+"""Tests for GeminiProvider cached-content handles."""
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from gentlebot.llm.providers.gemini import GeminiProvider
+
+SYSTEM = "You are Gentlebot." * 50
+TOOLS = [{"function_declarations": [{"name": "web_search"}]}]
+
+
+def _response(text: str = "ok") -> SimpleNamespace:
+    part = SimpleNamespace(text=text, function_call=None)
+    candidate = SimpleNamespace(content=SimpleNamespace(parts=[part]), finish_reason="STOP")
+    return SimpleNamespace(candidates=[candidate], text=text, prompt_feedback=None)
+
+
+def _make_provider(enabled: bool = True) -> GeminiProvider:
+    provider = GeminiProvider(api_key="test-key", context_cache=enabled)
+    provider.client = MagicMock()
+    provider.client.caches.create.return_value = SimpleNamespace(name="cachedContents/abc")
+    provider.client.models.generate_content.return_value = _response()
+    return provider
+
+
+def _generate(provider: GeminiProvider, system: str = SYSTEM):
+    return provider.generate(
+        model="gemini-2.5-flash",
+        messages=[{"role": "user", "content": "hello"}],
+        tools=TOOLS,
+        system_instruction=system,
+    )
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("GEMINI_CONTEXT_CACHE", raising=False)
+    provider = GeminiProvider(api_key="test-key")
+    assert not provider.supports_context_cache
+
+    monkeypatch.setenv("GEMINI_CONTEXT_CACHE", "1")
+    assert GeminiProvider(api_key="test-key").supports_context_cache
+
+
+def test_handle_created_once_and_reused():
+    provider = _make_provider()
+
+    _generate(provider)
+    _generate(provider)
+
+    provider.client.caches.create.assert_called_once()
+    for call in provider.client.models.generate_content.call_args_list:
+        config = call.kwargs["config"]
+        assert config.cached_content == "cachedContents/abc"
+        assert getattr(config, "system_instruction", None) is None
+        assert getattr(config, "tools", None) is None
+    assert provider.context_cache.hits == 1
+
+
+def test_changed_prefix_gets_new_handle():
+    provider = _make_provider()
+
+    _generate(provider)
+    _generate(provider, system=SYSTEM + " Updated.")
+
+    assert provider.client.caches.create.call_count == 2
+
+
+def test_create_failure_falls_back_without_retrying():
+    provider = _make_provider()
+    provider.client.caches.create.side_effect = Exception("content too small")
+
+    _generate(provider)
+    _generate(provider)
+
+    provider.client.caches.create.assert_called_once()
+    config = provider.client.models.generate_content.call_args.kwargs["config"]
+    assert config.system_instruction == SYSTEM
+    assert config.tools == TOOLS
+
+
+class _APIError(Exception):
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(f"{code} {message}")
+        self.code = code
+
+
+def test_rejected_handle_retries_with_full_prefix():
+    provider = _make_provider()
+    provider.client.models.generate_content.side_effect = [
+        _APIError(404, "CachedContent not found (or permission denied)"),
+        _response("fresh"),
+    ]
+
+    result = _generate(provider)
+
+    assert result.text == "fresh"
+    first, second = provider.client.models.generate_content.call_args_list
+    assert first.kwargs["config"].cached_content == "cachedContents/abc"
+    assert second.kwargs["config"].system_instruction == SYSTEM
+    key = provider.context_cache.key("gemini-2.5-flash", SYSTEM, TOOLS)
+    assert provider.context_cache.lookup(key) is None
+    assert provider.context_cache.should_create(key)
+
+
+@pytest.mark.parametrize("code", [429, 503])
+def test_rate_limit_with_handle_is_raised_without_resending(code):
+    provider = _make_provider()
+    provider.client.models.generate_content.side_effect = _APIError(code, "RESOURCE_EXHAUSTED")
+
+    with pytest.raises(_APIError):
+        _generate(provider)
+
+    provider.client.models.generate_content.assert_called_once()
+    key = provider.context_cache.key("gemini-2.5-flash", SYSTEM, TOOLS)
+    assert provider.context_cache.lookup(key) == "cachedContents/abc"
+
+
+def test_stream_rate_limit_with_handle_is_raised_without_resending():
+    provider = _make_provider()
+    provider.client.aio.caches.create = AsyncMock(
+        return_value=SimpleNamespace(name="cachedContents/abc")
+    )
+    provider.client.aio.models.generate_content_stream = AsyncMock(
+        side_effect=_APIError(429, "RESOURCE_EXHAUSTED")
+    )
+
+    async def run():
+        async for _ in provider.generate_stream(
+            model="gemini-2.5-flash",
+            messages=[{"role": "user", "content": "hello"}],
+            system_instruction=SYSTEM,
+        ):
+            pass
+
+    with pytest.raises(_APIError):
+        asyncio.run(run())
+    provider.client.aio.models.generate_content_stream.assert_awaited_once()
+
+
+def test_concurrent_async_calls_share_one_create():
+    provider = _make_provider()
+    started = 0
+
+    async def create(**kwargs):
+        nonlocal started
+        started += 1
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(name="cachedContents/xyz")
+
+    provider.client.aio.caches.create = create
+    provider.client.aio.models.generate_content = AsyncMock(return_value=_response())
+
+    async def run():
+        await asyncio.gather(
+            *(
+                provider.generate_async(
+                    model="gemini-2.5-flash",
+                    messages=[{"role": "user", "content": str(i)}],
+                    system_instruction=SYSTEM,
+                )
+                for i in range(3)
+            )
+        )
+
+    asyncio.run(run())
+
+    assert started == 1
+    for call in provider.client.aio.models.generate_content.call_args_list:
+        assert call.kwargs["config"].cached_content == "cachedContents/xyz"
@@ -0,0 +1,122 @@
+"""Tests for the shared client's HTTP response cache."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from gentlebot.infra.http import HostPolicy, HttpClient
+from gentlebot.infra.http_cache import CachePolicy, HttpCache, cache_key
+from gentlebot.infra.state_cache import StateCache
+
+
+async def _serve(handler):
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+def _client(tmp_path) -> HttpClient:
+    return HttpClient(
+        default_policy=HostPolicy(backoff_factor=0.01, retries=1),
+        cache=HttpCache(StateCache(tmp_path / "state.db")),
+    )
+
+
+def _age(client: HttpClient, key: str, seconds: float) -> None:
+    entry = client.cache._lru[key]
+    client.cache._lru[key] = replace(entry, fetched_at=entry.fetched_at - seconds)
+
+
+@pytest.mark.asyncio
+async def test_fresh_hits_skip_network_and_expired_entries_revalidate(tmp_path) -> None:
+    seen: list[str | None] = []
+
+    async def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response({"season": 2026}, headers={"ETag": '"v1"'})
+
+    server = await _serve(handler)
+    client = _client(tmp_path)
+    policy = CachePolicy(ttl=60)
+    url = str(server.make_url("/schedule"))
+    try:
+        first = await client.get(url, params={"team": "sea"}, cache=policy)
+        second = await client.get(url, params={"team": "sea"}, cache=policy)
+        _age(client, cache_key(url, {"team": "sea"}), 120)
+        third = await client.get(url, params={"team": "sea"}, cache=policy)
+    finally:
+        await client.close()
+        await server.close()
+
+    assert seen == [None, '"v1"']
+    assert not first.cached and second.cached and third.cached
+    assert second.headers.get("etag") == '"v1"'
+    assert third.json() == {"season": 2026}
+    assert client.stats("127.0.0.1").cache == {"miss": 1, "hit": 1, "revalidated": 1}
+
+    # A new client over the same StateCache (a restart) starts warm
+    restarted = _client(tmp_path)
+    warm = await restarted.get(url, params={"team": "sea"}, cache=policy)
+    assert warm.cached and warm.json() == {"season": 2026}
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_revalidating(tmp_path) -> None:
+    versions = iter(["old", "new"])
+
+    async def handler(request):
+        return web.Response(text=next(versions))
+
+    server = await _serve(handler)
+    client = _client(tmp_path)
+    policy = CachePolicy(ttl=60, stale=3600)
+    url = str(server.make_url("/calendar"))
+    try:
+        await client.get(url, cache=policy)
+        _age(client, url, 120)
+        stale = await client.get(url, cache=policy)
+        await client.wait_idle()
+        refreshed = await client.get(url, cache=policy)
+    finally:
+        await client.close()
+        await server.close()
+
+    assert stale.cached and stale.text == "old"
+    assert refreshed.cached and refreshed.text == "new"
+    assert client.stats("127.0.0.1").cache == {"miss": 2, "stale": 1, "hit": 1}
+
+
+@pytest.mark.asyncio
+async def test_upstream_failure_serves_cached_body(tmp_path) -> None:
+    calls = {"n": 0}
+
+    async def handler(request):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return web.Response(text="standings", headers={"Last-Modified": "Sun, 18 Oct 2026 00:00:00 GMT"})
+        return web.Response(status=503)
+
+    server = await _serve(handler)
+    client = _client(tmp_path)
+    policy = CachePolicy(ttl=60)
+    url = str(server.make_url("/standings"))
+    try:
+        await client.get(url, cache=policy)
+        _age(client, url, 120)
+        resp = await client.get(url, cache=policy)
+        uncached = await client.get(str(server.make_url("/other")), cache=policy)
+    finally:
+        await client.close()
+        await server.close()
+
+    assert resp.cached and resp.text == "standings"
+    assert uncached.status_code == 503 and not uncached.cached
+    assert client.stats("127.0.0.1").cache["stale_error"] == 1
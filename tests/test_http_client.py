@@ -96,3 +96,127 @@ class TestAsyncSession:
                 assert session is not None
         except ImportError:
             pytest.skip("aiohttp not installed")
+
+
+class TestHttpClient:
+    """Tests for the shared async HttpClient against a local server."""
+
+    @staticmethod
+    async def _serve(handler):
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", handler)
+        server = TestServer(app)
+        await server.start_server()
+        return server
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_status_and_records_stats(self) -> None:
+        from aiohttp import web
+
+        hits: list[str] = []
+
+        async def handler(request):
+            hits.append(request.path)
+            if len(hits) == 1:
+                return web.Response(status=503)
+            return web.json_response({"ok": True, "q": request.query.get("q")})
+
+        server = await self._serve(handler)
+        client = http_module.HttpClient(
+            default_policy=http_module.HostPolicy(backoff_factor=0.01)
+        )
+        try:
+            resp = await client.get(str(server.make_url("/data")), params={"q": "x"})
+            first_session = await client.session()
+            await client.get(str(server.make_url("/again")))
+            assert await client.session() is first_session
+        finally:
+            await client.close()
+            await server.close()
+
+        assert resp.json() == {"ok": True, "q": "x"}
+        (host, stats), = client.snapshot()
+        assert host == "127.0.0.1"
+        assert stats.requests == 3 and stats.retries == 1
+        assert stats.statuses == {503: 1, 200: 2}
+        assert stats.percentile(50) is not None
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self) -> None:
+        from aiohttp import web
+
+        from gentlebot.infra.retries import _extract_status
+
+        async def handler(request):
+            return web.Response(status=404, text="missing")
+
+        server = await self._serve(handler)
+        client = http_module.HttpClient()
+        try:
+            resp = await client.get(str(server.make_url("/nope")))
+        finally:
+            await client.close()
+            await server.close()
+
+        assert not resp.ok and resp.text == "missing"
+        with pytest.raises(http_module.HTTPStatusError) as exc:
+            resp.raise_for_status()
+        assert _extract_status(exc.value) == 404
+        assert client.stats("127.0.0.1").requests == 1
+
+    @pytest.mark.asyncio
+    async def test_header_lookup_is_case_insensitive(self) -> None:
+        from aiohttp import web
+
+        async def handler(request):
+            return web.Response(text="<p>hi</p>", headers={"x-page-kind": "article"})
+
+        server = await self._serve(handler)
+        client = http_module.HttpClient()
+        try:
+            resp = await client.get(str(server.make_url("/page")))
+        finally:
+            await client.close()
+            await server.close()
+
+        assert resp.headers.get("X-Page-Kind") == "article"
+        assert resp.headers["x-page-kind"] == "article"
+        assert resp.headers.get("content-type", "").startswith("text/plain")
+
+    @pytest.mark.asyncio
+    async def test_host_limit_caps_concurrency(self) -> None:
+        import asyncio
+
+        from aiohttp import web
+
+        active = {"now": 0, "max": 0}
+
+        async def handler(request):
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+            await asyncio.sleep(0.02)
+            active["now"] -= 1
+            return web.Response(text="ok")
+
+        server = await self._serve(handler)
+        client = http_module.HttpClient(
+            policies={"127.0.0.1": http_module.HostPolicy(limit=2)}
+        )
+        try:
+            url = str(server.make_url("/slow"))
+            await asyncio.gather(*(client.get(url) for _ in range(6)))
+        finally:
+            await client.close()
+            await server.close()
+
+        assert active["max"] == 2
+
+    def test_policy_matches_parent_domains(self) -> None:
+        client = http_module.HttpClient()
+        espn = client.policy("sports.core.api.espn.com")
+        assert espn.timeout == 30
+        assert client.policy("api.giphy.com").retries == 1
+        assert client.policy("example.org") is client.default_policy
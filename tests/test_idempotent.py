@@ -0,0 +1,127 @@
+"""Tests for the idempotent_task claim semantics."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from gentlebot.infra import idempotent
+from gentlebot.infra.idempotent import idempotent_task
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    idempotent.clear_completed_cache()
+    yield
+    idempotent.clear_completed_cache()
+
+
+def _pool(claimed: bool, status: str = "running") -> AsyncMock:
+    pool = AsyncMock()
+    pool.fetchrow = AsyncMock(return_value={"claimed": claimed, "status": status})
+    return pool
+
+
+class Task:
+    def __init__(self, pool, fail: bool = False):
+        self.pool = pool
+        self.fail = fail
+        self.calls = 0
+
+    @idempotent_task("test_task", lambda self: "2026-10-18")
+    async def run(self) -> str:
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("boom")
+        return "posted"
+
+
+@pytest.mark.asyncio
+async def test_claimed_run_is_marked_done() -> None:
+    pool = _pool(claimed=True)
+    task = Task(pool)
+
+    assert await task.run() == "posted"
+
+    assert task.calls == 1
+    pool.fetchrow.assert_awaited_once()
+    args = pool.execute.await_args.args
+    assert args[1:] == ("test_task", "2026-10-18", "done", "posted")
+
+
+@pytest.mark.asyncio
+async def test_completed_key_short_circuits_without_db() -> None:
+    pool = _pool(claimed=True)
+    task = Task(pool)
+
+    await task.run()
+    await task.run()
+
+    assert task.calls == 1
+    assert pool.fetchrow.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_skips_when_another_run_holds_the_lease() -> None:
+    pool = _pool(claimed=False, status="running")
+    task = Task(pool)
+
+    assert await task.run() is None
+    assert task.calls == 0
+    pool.execute.assert_not_awaited()
+    # A running claim is not cached: it may still fail and be retried.
+    assert not idempotent._is_completed("test_task", "2026-10-18")
+
+
+@pytest.mark.asyncio
+async def test_skip_on_done_is_cached() -> None:
+    pool = _pool(claimed=False, status="done")
+    task = Task(pool)
+
+    await task.run()
+    await task.run()
+
+    assert task.calls == 0
+    assert pool.fetchrow.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_marks_failed_and_reraises() -> None:
+    pool = _pool(claimed=True)
+    task = Task(pool, fail=True)
+
+    with pytest.raises(RuntimeError):
+        await task.run()
+
+    args = pool.execute.await_args.args
+    assert args[3] == "failed"
+    assert "boom" in args[4]
+    assert not idempotent._is_completed("test_task", "2026-10-18")
+
+
+@pytest.mark.asyncio
+async def test_claim_error_still_runs_task() -> None:
+    pool = AsyncMock()
+    pool.fetchrow = AsyncMock(side_effect=OSError("db down"))
+    task = Task(pool)
+
+    assert await task.run() == "posted"
+    assert task.calls == 1
+    # Falls back to the upsert so the run is still recorded.
+    assert "INSERT INTO discord.task_execution" in pool.execute.await_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_insert_without_row_counts_as_running(caplog) -> None:
+    # A racing worker's uncommitted insert leaves the claim with no row.
+    pool = AsyncMock()
+    pool.fetchrow = AsyncMock(return_value=None)
+    task = Task(pool)
+
+    with caplog.at_level("INFO"):
+        assert await task.run() is None
+
+    assert task.calls == 0
+    pool.execute.assert_not_awaited()
+    assert "key=2026-10-18 is running" in caplog.text
+    assert not idempotent._is_completed("test_task", "2026-10-18")
@@ -52,14 +52,14 @@ def test_imagine_error_uses_generate(monkeypatch):
 
         interaction = DummyInteraction()
 
-        def fake_generate_image(prompt):
+        async def fake_generate_image(prompt):
             raise Exception("boom")
 
-        def fake_generate(*args, **kwargs):
+        async def fake_generate(*args, **kwargs):
             return "friendly"
 
-        monkeypatch.setattr(image_cog.router, "generate_image", fake_generate_image)
-        monkeypatch.setattr(image_cog.router, "generate", fake_generate)
+        monkeypatch.setattr(image_cog.router, "generate_image_async", fake_generate_image)
+        monkeypatch.setattr(image_cog.router, "generate_async", fake_generate)
 
         await image_cog.ImageCog.imagine.callback(cog, interaction, prompt="hi")
         assert interaction.followup.sent[0][0] == "friendly"
@@ -79,14 +79,14 @@ def test_imagine_error_fallback(monkeypatch):
 
         interaction = DummyInteraction()
 
-        def raise_rate_limited(prompt):
+        async def raise_rate_limited(prompt):
             raise RateLimited()
 
-        def fail_generate(*args, **kwargs):
+        async def fail_generate(*args, **kwargs):
             raise RateLimited()
 
-        monkeypatch.setattr(image_cog.router, "generate_image", raise_rate_limited)
-        monkeypatch.setattr(image_cog.router, "generate", fail_generate)
+        monkeypatch.setattr(image_cog.router, "generate_image_async", raise_rate_limited)
+        monkeypatch.setattr(image_cog.router, "generate_async", fail_generate)
 
         await image_cog.ImageCog.imagine.callback(cog, interaction, prompt="hi")
         assert interaction.followup.sent[0][0] == (
@@ -108,10 +108,10 @@ def test_imagine_includes_prompt(monkeypatch):
 
         interaction = DummyInteraction()
 
-        def fake_generate_image(prompt):
+        async def fake_generate_image(prompt):
             return b"img"
 
-        monkeypatch.setattr(image_cog.router, "generate_image", fake_generate_image)
+        monkeypatch.setattr(image_cog.router, "generate_image_async", fake_generate_image)
 
         await image_cog.ImageCog.imagine.callback(cog, interaction, prompt="hi")
         content, kwargs = interaction.followup.sent[0]
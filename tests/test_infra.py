@@ -241,3 +241,20 @@ async def test_log_errors_returns_fallback(mock_bot: MagicMock) -> None:
     result = await cog.method_with_fallback()
 
     assert result == "fallback"
+
+
+@pytest.mark.asyncio
+async def test_pool_aware_cog_uses_pool_lane(mock_bot: MagicMock) -> None:
+    """cog_load requests the pool for the cog's configured lane."""
+
+    class BatchCog(PoolAwareCog):
+        pool_lane = "batch"
+
+    cog = BatchCog(mock_bot)
+    mock_pool = AsyncMock()
+
+    with patch("gentlebot.infra.cog_base.get_pool", return_value=mock_pool) as get_pool:
+        await cog.cog_load()
+
+    get_pool.assert_awaited_once_with(lane="batch")
+    assert cog.pool is mock_pool
@@ -1,7 +1,7 @@
 """Tests for the link summarizer cog."""
 import asyncio
 import types
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 def test_extract_domain():
@@ -62,9 +62,8 @@ def test_fetch_page_content_handles_failure():
 
     cog = LinkSummarizerCog(bot)
 
-    with patch.object(cog.session, "get") as mock_get:
-        mock_get.side_effect = Exception("Network error")
-        result = cog._fetch_page_content("https://example.com")
+    with patch.object(cog.http, "get", AsyncMock(side_effect=Exception("Network error"))):
+        result = asyncio.run(cog._fetch_page_content("https://example.com"))
         assert result is None
 
 
@@ -194,7 +193,7 @@ def test_summarize_content_returns_empty_on_llm_failure():
 
     async def run():
         with patch("gentlebot.cogs.link_summarizer_cog.router") as mock_router:
-            mock_router.generate.side_effect = Exception("LLM down")
+            mock_router.generate_async = AsyncMock(side_effect=Exception("LLM down"))
             result = await cog._summarize_content("https://example.com", "some content")
             assert result == ""
 
@@ -211,7 +210,7 @@ def test_summarize_content_returns_empty_on_rate_limit():
 
     async def run():
         with patch("gentlebot.cogs.link_summarizer_cog.router") as mock_router:
-            mock_router.generate.side_effect = RateLimited("general")
+            mock_router.generate_async = AsyncMock(side_effect=RateLimited("general"))
             result = await cog._summarize_content("https://example.com", "some content")
             assert result == ""
 
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from types import SimpleNamespace
 
 import pytest
@@ -58,3 +60,45 @@ def test_fallback_on_error(monkeypatch, status):
     result = router.generate("scheduled", [{"content": "hi"}])
     assert result == "ok"
     assert calls == [scheduled_model, general_model]
+
+
+@pytest.mark.parametrize("status", [429, 500])
+def test_async_fallback_on_error(monkeypatch, status):
+    router = llm_router.LLMRouter()
+    scheduled_model = router.models["scheduled"]
+    general_model = router.models["general"]
+
+    calls: list[str] = []
+
+    async def fake_generate_async(self, model, messages, **kwargs):
+        calls.append(model)
+        if model == scheduled_model:
+            exc = Exception("boom")
+            exc.response = SimpleNamespace(status_code=status)
+            raise exc
+        return _ok_resp()
+
+    async def no_retry(fn, **kw):
+        return await fn()
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_async", fake_generate_async)
+    monkeypatch.setattr(llm_router, "async_retry", no_retry)
+
+    result = asyncio.run(router.generate_async("scheduled", [{"content": "hi"}]))
+    assert result == "ok"
+    assert calls == [scheduled_model, general_model]
+
+
+def test_async_generate_runs_on_event_loop(monkeypatch):
+    """generate_async must not hand the request to a worker thread."""
+    router = llm_router.LLMRouter()
+    threads: list[int] = []
+
+    async def fake_generate_async(self, model, messages, **kwargs):
+        threads.append(threading.get_ident())
+        return _ok_resp()
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_async", fake_generate_async)
+
+    assert asyncio.run(router.generate_async("general", [{"content": "hi"}])) == "ok"
+    assert threads == [threading.get_ident()]
@@ -0,0 +1,181 @@
+"""Tests for latency-aware endpoint ranking, hedging and failover."""
+import asyncio
+import time
+
+import gentlebot.llm.endpoints as endpoints
+import gentlebot.llm.router as llm_router
+from gentlebot.infra.quotas import Limit
+from gentlebot.llm.endpoints import Endpoint, EndpointHealth
+from gentlebot.llm.ledger import LLMLedger
+from gentlebot.llm.providers.base import GenerationResult, LLMProvider
+from gentlebot.llm.scheduler import Priority
+
+
+class FakeProvider(LLMProvider):
+    """Local provider answering after *delay* seconds, or raising *error*."""
+
+    def __init__(self, name, delay=0.0, error=None, chunks=("hello ", "world")):
+        self._name = name
+        self.delay = delay
+        self.error = error
+        self.chunks = chunks
+        self.calls = 0
+        self.cancelled = 0
+
+    @property
+    def name(self):
+        return self._name
+
+    def generate(self, model, messages, **kwargs):  # pragma: no cover - unused
+        raise NotImplementedError
+
+    async def generate_async(self, model, messages, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return GenerationResult(
+            text=f"{self._name}:{model}", usage={"input_tokens": 10, "output_tokens": 3}
+        )
+
+    async def generate_stream(self, model, messages, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        for chunk in self.chunks:
+            yield GenerationResult(text=f"{self._name}-{chunk}")
+        yield GenerationResult(text="", usage={"input_tokens": 10, "output_tokens": 2})
+
+    def convert_tool_schema(self, tool):
+        return tool.to_openai_schema()
+
+
+def _router(monkeypatch, primary, backup, hedge_after=0.05):
+    monkeypatch.setitem(endpoints.HEDGE_DEFAULT_DELAY, "unary", hedge_after)
+    monkeypatch.setitem(endpoints.HEDGE_DEFAULT_DELAY, "stream", hedge_after)
+    router = llm_router.LLMRouter()
+    router.ledger = LLMLedger()
+    router.client = primary
+    router.models["general"] = "main"
+    router.add_endpoint("general", backup, "spare")
+    return router
+
+
+def test_slow_primary_is_hedged(monkeypatch):
+    primary = FakeProvider("primary", delay=2.0)
+    backup = FakeProvider("backup")
+    router = _router(monkeypatch, primary, backup)
+
+    start = time.monotonic()
+    text = asyncio.run(router.generate_async("general", [{"content": "hi"}]))
+
+    assert text == "backup:spare"
+    assert time.monotonic() - start < 1.0
+    assert primary.cancelled == 1
+    stats = router.health.stats(Endpoint(primary, "main"))
+    assert (stats.hedges, stats.hedge_wins) == (1, 1)
+    (call,) = list(router.ledger)
+    assert call.tokens_in == 10
+
+
+def test_fast_primary_is_not_hedged(monkeypatch):
+    primary = FakeProvider("primary")
+    backup = FakeProvider("backup")
+    router = _router(monkeypatch, primary, backup, hedge_after=1.0)
+
+    text = asyncio.run(router.generate_async("general", [{"content": "hi"}]))
+
+    assert text == "primary:main"
+    assert backup.calls == 0
+
+
+def test_background_requests_are_not_hedged(monkeypatch):
+    primary = FakeProvider("primary", delay=0.2)
+    backup = FakeProvider("backup")
+    router = _router(monkeypatch, primary, backup)
+
+    text = asyncio.run(
+        router.generate_async("general", [{"content": "hi"}], priority=Priority.SCHEDULED)
+    )
+
+    assert text == "primary:main"
+    assert backup.calls == 0
+
+
+def test_failed_primary_fails_over(monkeypatch):
+    primary = FakeProvider("primary", error=ValueError("bad request"))
+    backup = FakeProvider("backup")
+    router = _router(monkeypatch, primary, backup)
+
+    text = asyncio.run(
+        router.generate_async("general", [{"content": "hi"}], priority=Priority.SCHEDULED)
+    )
+
+    assert text == "backup:spare"
+    assert router.health.stats(Endpoint(primary, "main")).error_rate == 1.0
+
+
+def test_hedge_needs_a_free_quota_slot(monkeypatch):
+    primary = FakeProvider("primary", delay=0.2)
+    backup = FakeProvider("backup")
+    router = _router(monkeypatch, primary, backup)
+    router.quota.limits["general"] = Limit(rpm=1)
+
+    text = asyncio.run(router.generate_async("general", [{"content": "hi"}]))
+
+    assert text == "primary:main"
+    assert backup.calls == 0
+
+
+def test_stream_is_hedged_before_first_chunk(monkeypatch):
+    primary = FakeProvider("primary", delay=2.0)
+    backup = FakeProvider("backup")
+    router = _router(monkeypatch, primary, backup)
+
+    async def collect():
+        return [d async for d in router.generate_stream("general", [{"content": "hi"}])]
+
+    start = time.monotonic()
+    deltas = asyncio.run(collect())
+
+    assert deltas == ["backup-hello ", "backup-world"]
+    assert time.monotonic() - start < 1.0
+    assert primary.cancelled == 1
+
+
+def test_rank_demotes_failing_and_slow_endpoints():
+    health = EndpointHealth()
+    a, b, c = (Endpoint(FakeProvider(n), "m") for n in "abc")
+    assert health.rank([a, b, c]) == [a, b, c]
+
+    for _ in range(endpoints.MIN_SAMPLES):
+        health.observe(a, "unary", 100, ok=False)
+        health.observe(b, "unary", 5000, ok=True)
+        health.observe(c, "unary", 800, ok=True)
+
+    assert health.rank([a, b, c]) == [c, b, a]
+    # Stream latency is tracked separately
+    assert health.rank([a, b, c], "stream") == [a, b, c]
+
+
+def test_hedge_delay_follows_p95():
+    health = EndpointHealth()
+    endpoint = Endpoint(FakeProvider("a"), "m")
+    assert health.hedge_delay(endpoint) == endpoints.HEDGE_DEFAULT_DELAY["unary"]
+
+    for ms in [1000] * 19 + [3000]:
+        health.observe(endpoint, "unary", ms, ok=True)
+    assert health.hedge_delay(endpoint) == 1.0
+
+    for _ in range(10):
+        health.observe(endpoint, "unary", 60_000, ok=True)
+    assert health.hedge_delay(endpoint) == endpoints.HEDGE_MAX_DELAY
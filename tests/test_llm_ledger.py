@@ -0,0 +1,178 @@
+"""Tests for the LLM call ledger and its router wiring."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import gentlebot.llm.router as llm_router
+from gentlebot.cogs import perf_cog
+from gentlebot.infra.quotas import Limit, QuotaGuard, RateLimited
+from gentlebot.llm.context import GenerationContext
+from gentlebot.llm.ledger import LLMCall, LLMLedger
+
+
+def _call(**overrides):
+    values = dict(
+        route="general",
+        model="m",
+        caller="gemini_cog",
+        tokens_in=100,
+        tokens_out=20,
+        cache_hit=False,
+        attempts=1,
+        fallback=False,
+        ttfb_ms=400,
+        latency_ms=900,
+        status="ok",
+    )
+    values.update(overrides)
+    return LLMCall(**values)
+
+
+def _resp(text="ok", prompt_tokens=None, out_tokens=7):
+    return SimpleNamespace(
+        text=text,
+        candidates=[],
+        usage_metadata=SimpleNamespace(
+            prompt_token_count=prompt_tokens, candidates_token_count=out_tokens
+        ),
+    )
+
+
+class FakePool:
+    def __init__(self, fail=False):
+        self.batches: list[list[tuple]] = []
+        self.fail = fail
+
+    async def executemany(self, sql, rows):
+        if self.fail:
+            raise ConnectionError("db down")
+        self.batches.append(rows)
+
+
+def test_stats_aggregate_per_caller_and_route():
+    ledger = LLMLedger()
+    ledger.record(_call(latency_ms=900))
+    ledger.record(_call(latency_ms=4000, tokens_in=50))
+    ledger.record(_call(cache_hit=True, status="cache_hit", latency_ms=1, tokens_in=0))
+    ledger.record(_call(caller="tldr_cog", status="error"))
+
+    stats = {(s.caller, s.route): s for s in ledger}
+    gemini = stats[("gemini_cog", "general")]
+    assert gemini.calls == 3
+    assert gemini.cache_hits == 1
+    assert gemini.tokens_in == 150
+    assert gemini.percentile(50) == 1000
+    assert gemini.percentile(95) == 5000
+    assert stats[("tldr_cog", "general")].errors == 1
+    assert ledger.top(1)[0].caller == "gemini_cog"
+
+
+def test_rows_are_written_in_batches():
+    async def run():
+        ledger = LLMLedger(flush_interval=0.01, max_batch=2)
+        pool = FakePool()
+        ledger.attach(pool)
+        for _ in range(3):
+            ledger.record(_call())
+        await asyncio.sleep(0.05)
+        await ledger.close()
+        return ledger, pool
+
+    ledger, pool = asyncio.run(run())
+    assert [len(batch) for batch in pool.batches] == [2, 1]
+    assert ledger.written == 3
+
+
+def test_failed_write_keeps_rows_for_next_flush():
+    async def run():
+        ledger = LLMLedger(flush_interval=60)
+        pool = FakePool(fail=True)
+        ledger.attach(pool)
+        ledger.record(_call())
+        await ledger.flush()
+        pool.fail = False
+        await ledger.close()
+        return pool
+
+    pool = asyncio.run(run())
+    assert len(pool.batches) == 1
+
+
+def test_router_records_caller_tokens_and_corrects_quota(monkeypatch):
+    router = llm_router.LLMRouter()
+    router.ledger = LLMLedger()
+
+    async def fake_generate_async(self, model, messages, **kwargs):
+        return _resp(prompt_tokens=1234)
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_async", fake_generate_async)
+
+    asyncio.run(router.generate_async("general", [{"content": "hi"}]))
+
+    (stats,) = list(router.ledger)
+    assert stats.caller == "test_llm_ledger"
+    assert stats.tokens_in == 1234
+    assert stats.tokens_out == 7
+    assert router.quota.tok_used["general"] == 1234
+
+
+def test_router_books_fallback_once(monkeypatch):
+    router = llm_router.LLMRouter()
+    router.ledger = LLMLedger()
+
+    async def fake_generate_async(self, model, messages, **kwargs):
+        return _resp()
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_async", fake_generate_async)
+
+    async def fake_admit(route, tokens, priority, wait=True):
+        if route == "scheduled":
+            raise RateLimited("rpm")
+        return 0.0
+
+    monkeypatch.setattr(router.scheduler, "admit", fake_admit)
+
+    ctx = GenerationContext(caller="weekly_recap")
+    asyncio.run(router.generate_async("scheduled", [{"content": "hi"}], context=ctx))
+
+    (stats,) = list(router.ledger)
+    assert (stats.caller, stats.route, stats.calls, stats.fallbacks) == (
+        "weekly_recap", "scheduled", 1, 1
+    )
+
+
+def test_router_books_failures(monkeypatch):
+    router = llm_router.LLMRouter()
+    router.ledger = LLMLedger()
+
+    async def blocked(self, model, messages, **kwargs):
+        return _resp(text="")
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_async", blocked)
+
+    with pytest.raises(llm_router.SafetyBlocked):
+        asyncio.run(router.generate_async("general", [{"content": "hi"}]))
+
+    assert list(router.ledger)[0].errors == 1
+
+
+def test_quota_adjust_books_difference():
+    quota = QuotaGuard({"general": Limit(tpm=1000)})
+    quota.check("general", 100)
+    quota.adjust("general", 250)
+    assert quota.remaining("general")["tpm"] == 650
+    quota.adjust("general", -300)
+    assert quota.remaining("general")["tpm"] == 950
+
+
+def test_llm_report_lists_callers_and_quota(monkeypatch):
+    router = llm_router.LLMRouter()
+    router.ledger.record(_call(caller="book_enrichment_cog", tokens_in=4200))
+    monkeypatch.setattr(perf_cog, "get_router", lambda: router)
+
+    report = perf_cog.format_llm_report()
+
+    assert "book_enrichment_cog [general]" in report
+    assert "in=4.2k" in report
+    assert "general: rpm=" in report
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import gentlebot.llm.router as llm_router
+from gentlebot.infra.state_cache import StateCache
+from gentlebot.llm.response_cache import ResponseCache, cache_key
+
+
+def _ok_resp(text="summary"):
+    return SimpleNamespace(
+        text=text, usage_metadata=SimpleNamespace(candidates_token_count=0)
+    )
+
+
+def test_cache_key_normalizes_whitespace_and_buckets_temperature():
+    a = cache_key("general", "m", [{"role": "user", "content": "hi  there\n"}], None, 0.4)
+    b = cache_key("general", "m", [{"role": "user", "content": "hi there"}], None, 0.41)
+    c = cache_key("general", "m", [{"role": "user", "content": "hi there"}], None, 0.9)
+    d = cache_key("general", "other", [{"role": "user", "content": "hi there"}], None, 0.4)
+    assert a == b
+    assert a != c
+    assert a != d
+
+
+def test_response_cache_persists_across_instances(tmp_path):
+    state = StateCache(tmp_path / "state.db")
+    cache = ResponseCache(state)
+    cache.put("general", "k", "text")
+    assert cache.get("k") == "text"
+
+    fresh = ResponseCache(StateCache(tmp_path / "state.db"))
+    assert fresh.get("k") == "text"
+    assert fresh.get("missing") is None
+    assert (fresh.hits, fresh.misses) == (1, 1)
+
+
+def test_async_miss_fills_lru_on_the_loop_thread(tmp_path):
+    ResponseCache(StateCache(tmp_path / "state.db")).put("general", "k", "text")
+    cache = ResponseCache(StateCache(tmp_path / "state.db"))
+    threads: list[int] = []
+    remember = cache._remember
+
+    def recording_remember(*args):
+        threads.append(threading.get_ident())
+        remember(*args)
+
+    cache._remember = recording_remember
+
+    async def run():
+        text = await cache.get_async("k")
+        return text, threading.get_ident()
+
+    text, loop_thread = asyncio.run(run())
+    assert text == "text"
+    assert threads == [loop_thread]
+    assert "k" in cache._lru
+
+
+def test_response_cache_route_ttl_override(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_GENERAL_TTL_HOURS", "0")
+    cache = ResponseCache(StateCache(tmp_path / "state.db"))
+    cache.put("general", "k", "text")
+    assert cache.get("k") is None
+
+
+def test_router_serves_cached_response(monkeypatch, tmp_path):
+    router = llm_router.LLMRouter()
+    router.response_cache = ResponseCache(StateCache(tmp_path / "state.db"))
+    calls: list[str] = []
+
+    async def fake_generate_async(self, model, messages, **kwargs):
+        calls.append(model)
+        return _ok_resp()
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_async", fake_generate_async)
+
+    async def run():
+        first = await router.generate_async(
+            "general", [{"role": "user", "content": "tl;dr"}], temperature=0.4, cache=True
+        )
+        second = await router.generate_async(
+            "general", [{"role": "user", "content": "tl;dr "}], temperature=0.4, cache=True
+        )
+        uncached = await router.generate_async(
+            "general", [{"role": "user", "content": "tl;dr"}], temperature=0.4
+        )
+        return first, second, uncached
+
+    assert asyncio.run(run()) == ("summary", "summary", "summary")
+    assert len(calls) == 2
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from gentlebot.infra.quotas import Limit, RateLimited
+from gentlebot.llm.scheduler import LLMScheduler, Priority
+
+
+class FakeQuota:
+    """RPM-only guard whose slots are released by the test."""
+
+    def __init__(self, rpm: int):
+        self.limits = {"general": Limit(rpm=rpm)}
+        self.used = 0
+
+    def rpm_window(self, route):
+        return self.limits[route].rpm - self.used, 0.01
+
+    def check(self, route, tokens):
+        if self.used >= self.limits[route].rpm:
+            raise RateLimited("rpm", retry_after=0.01)
+        self.used += 1
+        return 0.0
+
+
+@pytest.mark.asyncio
+async def test_admits_immediately_when_slots_free():
+    quota = FakeQuota(rpm=5)
+    scheduler = LLMScheduler(quota)
+    assert await scheduler.admit("general", 10) == 0.0
+    assert quota.used == 1
+
+
+@pytest.mark.asyncio
+async def test_interactive_is_served_before_background():
+    quota = FakeQuota(rpm=5)
+    quota.used = 5
+    scheduler = LLMScheduler(quota)
+    order: list[str] = []
+
+    async def request(name, priority):
+        await scheduler.admit("general", 10, priority)
+        order.append(name)
+
+    tasks = [
+        asyncio.create_task(request("scheduled", Priority.SCHEDULED)),
+        asyncio.create_task(request("reaction", Priority.REACTION)),
+        asyncio.create_task(request("interactive", Priority.INTERACTIVE)),
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queued("general") == 3
+    quota.used = 0
+    await asyncio.gather(*tasks)
+    assert order == ["interactive", "reaction", "scheduled"]
+
+
+@pytest.mark.asyncio
+async def test_background_leaves_headroom_for_interactive():
+    quota = FakeQuota(rpm=5)
+    quota.used = 3
+    scheduler = LLMScheduler(quota)
+    with pytest.raises(RateLimited):
+        await scheduler.admit("general", 10, Priority.SPECULATIVE, wait=False)
+    assert await scheduler.admit("general", 10, Priority.INTERACTIVE, wait=False) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_sheds_lowest_class_first():
+    quota = FakeQuota(rpm=1)
+    quota.used = 1
+    scheduler = LLMScheduler(quota, max_queue=2)
+    speculative = asyncio.create_task(scheduler.admit("general", 1, Priority.SPECULATIVE))
+    reaction = asyncio.create_task(scheduler.admit("general", 1, Priority.REACTION))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(scheduler.admit("general", 1, Priority.INTERACTIVE))
+    await asyncio.sleep(0)
+
+    with pytest.raises(RateLimited):
+        await speculative
+    assert scheduler.stats.shed["SPECULATIVE"] == 1
+
+    # A newcomer that is no better than the worst waiter is shed itself.
+    with pytest.raises(RateLimited):
+        await scheduler.admit("general", 1, Priority.SCHEDULED)
+
+    quota.used = -1
+    await asyncio.gather(interactive, reaction)
+
+
+@pytest.mark.asyncio
+async def test_deadline_expires_with_rate_limited():
+    quota = FakeQuota(rpm=1)
+    quota.used = 1
+    scheduler = LLMScheduler(quota, deadlines={Priority.INTERACTIVE: 0.05})
+    with pytest.raises(RateLimited):
+        await scheduler.admit("general", 1)
+    assert scheduler.stats.expired["INTERACTIVE"] == 1
+    assert scheduler.queued("general") == 0
@@ -0,0 +1,140 @@
+"""Tests for streamed generation in the provider and router."""
+import asyncio
+import logging
+import re
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+import gentlebot.llm.router as llm_router
+from gentlebot.llm.providers.base import GenerationResult, ToolCall
+from gentlebot.llm.providers.gemini import GeminiProvider
+
+
+def _chunk(text="", tool_calls=None):
+    return GenerationResult(text=text, tool_calls=tool_calls or [], usage={"output_tokens": 3})
+
+
+async def _collect(stream):
+    return [delta async for delta in stream]
+
+
+def test_provider_streams_chunks():
+    provider = GeminiProvider(api_key="test-key")
+    provider.client = MagicMock()
+
+    async def chunks():
+        for text in ["Hel", "lo"]:
+            yield SimpleNamespace(text=text, candidates=[], usage_metadata=None)
+
+    async def open_stream(**kwargs):
+        return chunks()
+
+    provider.client.aio.models.generate_content_stream = open_stream
+
+    results = asyncio.run(
+        _collect(provider.generate_stream("m", [{"role": "user", "content": "hi"}]))
+    )
+    assert [r.text for r in results] == ["Hel", "lo"]
+
+
+def test_router_yields_deltas_and_logs_ttfb(monkeypatch, caplog):
+    router = llm_router.LLMRouter()
+
+    async def fake_stream(self, model, messages, **kwargs):
+        yield _chunk("Hello ")
+        await asyncio.sleep(0.05)
+        yield _chunk("world")
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_stream", fake_stream)
+
+    with caplog.at_level(logging.INFO):
+        deltas = asyncio.run(_collect(router.generate_stream("general", [{"content": "hi"}])))
+
+    assert deltas == ["Hello ", "world"]
+    line = next(r.getMessage() for r in caplog.records if "status=ok" in r.getMessage())
+    ttfb = int(re.search(r"ttfb_ms=(\d+)", line).group(1))
+    total = int(re.search(r"total_ms=(\d+)", line).group(1))
+    assert ttfb < total
+    assert total >= 50
+
+
+def test_router_runs_tools_between_turns(monkeypatch):
+    router = llm_router.LLMRouter()
+    seen: list[list[dict]] = []
+
+    async def fake_stream(self, model, messages, **kwargs):
+        seen.append(messages)
+        if len(seen) == 1:
+            yield _chunk(tool_calls=[ToolCall(id="1", name="calculate", arguments={"expression": "2+2"})])
+        else:
+            yield _chunk("It is 4.")
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_stream", fake_stream)
+
+    deltas = asyncio.run(_collect(router.generate_stream("general", [{"content": "2+2?"}])))
+
+    assert deltas == ["It is 4."]
+    assert any("Tool calculate result: 4" in m["content"] for m in seen[1])
+
+
+def test_router_empty_stream_is_blocked(monkeypatch):
+    router = llm_router.LLMRouter()
+
+    async def fake_stream(self, model, messages, **kwargs):
+        yield _chunk("")
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_stream", fake_stream)
+
+    with pytest.raises(llm_router.SafetyBlocked):
+        asyncio.run(_collect(router.generate_stream("general", [{"content": "hi"}])))
+
+
+def test_scheduled_stream_falls_back_before_first_delta(monkeypatch):
+    router = llm_router.LLMRouter()
+    scheduled_model = router.models["scheduled"]
+    calls: list[str] = []
+
+    async def fake_stream(self, model, messages, **kwargs):
+        calls.append(model)
+        if model == scheduled_model:
+            exc = Exception("boom")
+            exc.response = SimpleNamespace(status_code=500)
+            raise exc
+        yield _chunk("ok")
+
+    async def no_retry(fn, **kwargs):
+        return await fn()
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_stream", fake_stream)
+    monkeypatch.setattr(llm_router, "async_retry", no_retry)
+
+    deltas = asyncio.run(_collect(router.generate_stream("scheduled", [{"content": "hi"}])))
+
+    assert deltas == ["ok"]
+    assert calls == [scheduled_model, router.models["general"]]
+
+
+def test_router_closes_provider_stream_when_consumer_stops(monkeypatch):
+    router = llm_router.LLMRouter()
+    closed: list[bool] = []
+
+    async def fake_stream(self, model, messages, **kwargs):
+        try:
+            for text in ["one ", "two ", "three"]:
+                yield _chunk(text)
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_stream", fake_stream)
+
+    async def run():
+        stream = router.generate_stream("general", [{"content": "hi"}])
+        first = await anext(stream)
+        await stream.aclose()
+        # Closed right away, not when the loop finalizes leftover generators
+        assert closed == [True]
+        return first
+
+    assert asyncio.run(run()) == "one "
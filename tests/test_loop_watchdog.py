@@ -0,0 +1,45 @@
+import asyncio
+import time
+import traceback
+
+from gentlebot.infra.loop_watchdog import LoopWatchdog, attribute
+
+
+def _frame(path: str, name: str) -> traceback.FrameSummary:
+    return traceback.FrameSummary(path, 1, name)
+
+
+def test_attribute_prefers_innermost_cog_frame():
+    stack = [
+        _frame("/app/gentlebot/__main__.py", "main"),
+        _frame("/app/gentlebot/cogs/sports_cog.py", "nextf1"),
+        _frame("/app/gentlebot/util.py", "helper"),
+        _frame("/usr/lib/python3/site-packages/requests/api.py", "get"),
+    ]
+    assert attribute(stack) == "sports_cog:nextf1"
+
+
+def test_attribute_falls_back_to_package_frame():
+    stack = [
+        _frame("/app/gentlebot/db.py", "get_pool"),
+        _frame("/usr/lib/python3/socket.py", "recv"),
+    ]
+    assert attribute(stack) == "db:get_pool"
+    assert attribute([_frame("/usr/lib/python3/socket.py", "recv")]) == "unknown"
+
+
+def test_watchdog_records_stall_and_stack():
+    watchdog = LoopWatchdog(interval=0.02, threshold_ms=60)
+
+    async def run():
+        watchdog.start()
+        await asyncio.sleep(0.05)
+        time.sleep(0.25)  # block the loop
+        await asyncio.sleep(0.05)
+        await watchdog.stop()
+
+    asyncio.run(run())
+    snap = watchdog.stats.snapshot()
+    assert snap["stalls"] >= 1
+    assert snap["max_ms"] >= 150
+    assert sum(snap["by_source"].values()) >= 1
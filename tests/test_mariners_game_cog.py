@@ -69,7 +69,7 @@ def test_posts_summary(monkeypatch):
             mariners_game_cog.MarinersGameCog, "_ensure_tracking_state", noop
         )
         monkeypatch.setattr(mariners_game_cog.MarinersGameCog, "_sync_schedule", noop)
-        db._pool = None
+        db._pools.clear()
         monkeypatch.setenv("PG_DSN", "postgresql+asyncpg://u:p@localhost/db")
 
         intents = discord.Intents.none()
@@ -119,7 +119,7 @@ def test_no_repeat_across_sessions(monkeypatch):
             mariners_game_cog.MarinersGameCog, "_ensure_tracking_state", noop
         )
         monkeypatch.setattr(mariners_game_cog.MarinersGameCog, "_sync_schedule", noop)
-        db._pool = None
+        db._pools.clear()
         monkeypatch.setenv("PG_DSN", "postgresql+asyncpg://u:p@localhost/db")
 
         intents = discord.Intents.none()
@@ -305,3 +305,109 @@ class DummyPool:
             "summary": stored,
             "message_id": None,
         }
+
+
+def _espn_docs() -> dict:
+    team_url = mariners_game_cog.ESPN_TEAM_URL.format(season=2024)
+    group_url = mariners_game_cog.ESPN_GROUP_URL.format(
+        season=2024, group=mariners_game_cog.DIVISION_GROUP_ID
+    )
+
+    def standing(ref, gb):
+        return {
+            "team": {"$ref": ref},
+            "records": [{"type": "total", "stats": [{"name": "gamesBehind", "displayValue": gb}]}],
+        }
+
+    competitors = [
+        {"homeAway": "away", "score": "5", "team": {"abbreviation": "SEA", "displayName": "Mariners"}},
+        {"homeAway": "home", "score": "3", "team": {"abbreviation": "HOU", "displayName": "Astros"}},
+    ]
+    return {
+        mariners_game_cog.ESPN_SUMMARY_URL: {
+            "header": {"competitions": [{"date": "2024-09-17T20:10Z", "competitors": competitors}]},
+        },
+        team_url: {"record": {"$ref": "record"}},
+        "record": {
+            "items": [
+                {"type": "total", "summary": "82-66", "stats": [{"name": "streak", "displayValue": "W2"}]},
+                {"type": "lasttengames", "summary": "7-3"},
+            ]
+        },
+        group_url: {"standings": {"$ref": "standings"}},
+        "standings": {"items": [{"name": "overall", "$ref": "overall"}]},
+        "overall": {"standings": [standing("team/hou", "-"), standing("team/sea", "1.5")]},
+        "team/hou": {"abbreviation": "HOU"},
+        "team/sea": {"abbreviation": "SEA"},
+    }
+
+
+def test_summary_resolves_refs_concurrently():
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+    cog = mariners_game_cog.MarinersGameCog(bot)
+    docs = _espn_docs()
+    fetched: list[str] = []
+    active = {"now": 0, "max": 0}
+
+    async def fake_get_json(url, *, cache=None, **params):
+        fetched.append(url)
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return docs[url]
+
+    cog._get_json = fake_get_json
+    summary = asyncio.run(cog._build_summary_from_event("401", {"season_year": 2024}))
+
+    assert summary["record"] == "82-66 (W2)"
+    assert summary["al_west"] == "2nd • 1.5 GB of HOU • Last 10: 7-3"
+    # Every document is fetched once, with independent branches in flight together
+    assert sorted(fetched) == sorted(docs)
+    assert active["max"] >= 3
+
+
+def test_loops_share_one_schedule_fetch():
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+    cog = mariners_game_cog.MarinersGameCog(bot)
+    calls = []
+    schedule = {
+        "events": [
+            {
+                "id": 1,
+                "shortName": "SEA @ HOU",
+                "competitions": [
+                    {
+                        "date": "2024-09-17T20:10Z",
+                        "status": {"type": {"state": "pre"}},
+                        "competitors": [
+                            {"homeAway": "away", "team": {"abbreviation": "SEA"}},
+                            {"homeAway": "home", "team": {"abbreviation": "HOU"}},
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+    async def fake_get_json(url, *, cache=None, **params):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        return schedule
+
+    async def fail_linescore(game_id):
+        raise AssertionError("pre-game threads should not poll the summary")
+
+    cog._get_json = fake_get_json
+    cog._fetch_live_linescore = fail_linescore
+    cog.threads["1"] = SimpleNamespace()
+
+    async def tick():
+        return await asyncio.gather(
+            cog._fetch_schedule(), cog._fetch_upcoming_games(), cog._update_live_scores()
+        )
+
+    rows, games, _ = asyncio.run(tick())
+
+    assert calls == [mariners_game_cog.ESPN_SCHEDULE_URL]
+    assert rows[0]["event_id"] == "1" and games[0]["id"] == "1"
@@ -134,7 +134,7 @@ def test_on_message(monkeypatch):
             assert url.startswith("postgresql://")
             return pool
         monkeypatch.setattr(db.asyncpg, "create_pool", fake_create_pool)
-        db._pool = None
+        db._pools.clear()
         monkeypatch.setenv("ARCHIVE_MESSAGES", "1")
         monkeypatch.setenv("PG_DSN", "postgresql+asyncpg://u:p@localhost/db")
         intents = discord.Intents.default()
@@ -245,7 +245,7 @@ def test_on_ready_populates(monkeypatch):
             return pool
 
         monkeypatch.setattr(db.asyncpg, "create_pool", fake_create_pool)
-        db._pool = None
+        db._pools.clear()
         monkeypatch.setenv("ARCHIVE_MESSAGES", "1")
         monkeypatch.setenv("PG_DSN", "postgresql+asyncpg://u:p@localhost/db")
 
@@ -354,7 +354,7 @@ def test_reply_to_missing(monkeypatch):
             return pool
 
         monkeypatch.setattr(db.asyncpg, "create_pool", fake_create_pool)
-        db._pool = None
+        db._pools.clear()
         monkeypatch.setenv("ARCHIVE_MESSAGES", "1")
         monkeypatch.setenv("PG_DSN", "postgresql+asyncpg://u:p@localhost/db")
 
@@ -0,0 +1,22 @@
+"""Tests for the shared percentile helpers."""
+from gentlebot.metrics import Histogram, percentile
+
+
+def test_sample_percentile_is_nearest_rank():
+    assert percentile([], 50) is None
+    assert percentile([4, 1, 3, 2], 50) == 2
+    assert percentile([4, 1, 3, 2], 75) == 3
+    assert percentile([4, 1, 3, 2], 100) == 4
+    assert percentile([7], 0) == 7
+
+
+def test_histogram_reports_bucket_bounds_and_overflow_max():
+    hist = Histogram((10, 100))
+    assert hist.percentile(50) == 0.0
+    for value in (5, 10, 50, 80, 900):
+        hist.observe(value)
+
+    assert hist.total == 5 and hist.counts == [2, 2, 1]
+    assert hist.percentile(40) == 10
+    assert hist.percentile(80) == 100
+    assert hist.percentile(99) == hist.max == 900
@@ -93,3 +93,54 @@ def test_close_asyncio_run_not_called(monkeypatch):
         assert not called
 
     asyncio.run(run_test())
+
+
+def test_slow_log_insert_does_not_log_itself(monkeypatch):
+    from gentlebot import db
+
+    class SlowConn:
+        def __init__(self):
+            self.inserts = 0
+
+        async def execute(self, *args, **kwargs):
+            self.inserts += 1
+            return "INSERT 0 1"
+
+    class Acquire:
+        def __init__(self, conn):
+            self.conn = conn
+
+        async def __aenter__(self):
+            return self.conn
+
+        async def __aexit__(self, *args):
+            return False
+
+    class RawPool:
+        def __init__(self, conn):
+            self.conn = conn
+
+        def acquire(self, timeout=None):
+            return Acquire(self.conn)
+
+    async def run_test():
+        # Every statement counts as slow
+        monkeypatch.setenv("PG_SLOW_QUERY_MS", "0")
+        conn = SlowConn()
+        handler = PostgresHandler("postgresql+asyncpg://u:p@localhost/db")
+        handler.pool = db.LanePool(db.LOGGING_LANE, RawPool(conn), acquire_timeout=5, max_size=1)
+        handler.loop = asyncio.get_running_loop()
+        root = logging.getLogger()
+        previous = root.level
+        root.setLevel(logging.INFO)
+        root.addHandler(handler)
+        try:
+            logging.getLogger("gentlebot.test").info("hello")
+            for _ in range(10):
+                await asyncio.sleep(0)
+        finally:
+            root.removeHandler(handler)
+            root.setLevel(previous)
+        assert conn.inserts == 1
+
+    asyncio.run(run_test())
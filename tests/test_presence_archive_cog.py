@@ -27,7 +27,7 @@ async def fake_create_pool(url, *args, **kwargs):
 def test_presence_logged(monkeypatch, caplog):
     async def run_test():
         monkeypatch.setattr(db.asyncpg, "create_pool", fake_create_pool)
-        db._pool = None
+        db._pools.clear()
         monkeypatch.setenv("ARCHIVE_PRESENCE", "1")
         monkeypatch.setenv("PG_DSN", "postgresql+asyncpg://u:p@localhost/db")
         intents = discord.Intents.default()
@@ -0,0 +1,97 @@
+"""Tests for throttled progressive Discord replies."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from gentlebot.infra.progressive_reply import ProgressiveReply, split_message
+
+
+def _sender():
+    sent: list[MagicMock] = []
+
+    async def send(content, files=None):
+        msg = MagicMock()
+        msg.content = content
+        msg.files = files
+        msg.edit = AsyncMock()
+        msg.delete = AsyncMock()
+        sent.append(msg)
+        return msg
+
+    return send, sent
+
+
+def test_posts_once_enough_text_then_edits_at_throttled_cadence():
+    send, sent = _sender()
+    reply = ProgressiveReply(send, min_interval=60, min_chars=10)
+
+    async def run():
+        await reply.update("Hi")
+        assert not reply.started
+        await reply.update("Hi there, friends")
+        await reply.update("Hi there, friends. More")
+        await reply.update("Hi there, friends. More text")
+        await reply.finish("Hi there, friends. More text arrives.")
+
+    asyncio.run(run())
+
+    assert len(sent) == 1
+    assert sent[0].content == "Hi there, friends"
+    # Intermediate updates fall inside the throttle window; finish() catches up.
+    sent[0].edit.assert_awaited_once_with(content="Hi there, friends. More text arrives.")
+
+
+def test_edits_when_interval_elapsed():
+    send, sent = _sender()
+    reply = ProgressiveReply(send, min_interval=0, min_chars=1)
+
+    async def run():
+        await reply.update("a")
+        await reply.update("ab")
+        await reply.finish("ab")
+
+    asyncio.run(run())
+
+    assert len(sent) == 1
+    sent[0].edit.assert_awaited_once_with(content="ab")
+    assert reply.edits == 1
+
+
+def test_overflow_spills_into_new_messages():
+    send, sent = _sender()
+    reply = ProgressiveReply(send, min_interval=0, min_chars=1)
+    text = "x" * 2500
+
+    async def run():
+        await reply.update(text[:1500])
+        await reply.finish(text)
+
+    asyncio.run(run())
+
+    assert [m.content for m in sent] == [text[:1500], text[1900:]]
+    sent[0].edit.assert_awaited_once_with(content=text[:1900])
+
+
+def test_finish_without_stream_sends_chunks_with_files_on_first():
+    send, sent = _sender()
+    reply = ProgressiveReply(send)
+    files = [MagicMock()]
+
+    asyncio.run(reply.finish("y" * 2100, files))
+
+    assert [m.content for m in sent] == split_message("y" * 2100)
+    assert sent[0].files == files
+    assert sent[1].files is None
+
+
+def test_finish_drops_surplus_messages():
+    send, sent = _sender()
+    reply = ProgressiveReply(send, min_interval=0, min_chars=1)
+
+    async def run():
+        await reply.update("z" * 2100)
+        await reply.finish("Something's wrong... I need a mechanic.")
+
+    asyncio.run(run())
+
+    sent[1].delete.assert_awaited_once()
+    sent[0].edit.assert_awaited_once_with(content="Something's wrong... I need a mechanic.")
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+from unittest.mock import AsyncMock
+
+from gentlebot import db
+from gentlebot.cogs import perf_cog
+from gentlebot.query_stats import QueryStats, fingerprint, query_stats, redact, row_count
+
+
+class FakeAcquire:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *args):
+        return False
+
+
+def test_fingerprint_strips_literals_and_whitespace():
+    a = fingerprint("SELECT *  FROM t\n WHERE id = 42 AND name = 'bob'")
+    b = fingerprint("SELECT * FROM t WHERE id = 7 AND name = 'alice'")
+    assert a == b == "SELECT * FROM t WHERE id = ? AND name = ?"
+
+
+def test_redact_hides_values():
+    assert redact([1, "secret", None]) == ["<int>", "<str len=6>", "NULL"]
+
+
+def test_row_count_parses_status_tags():
+    assert row_count("INSERT 0 3", status=True) == 3
+    assert row_count([1, 2]) == 2
+    assert row_count("a value") == 1
+    assert row_count(None) == 0
+
+
+def test_histogram_and_slow_log(monkeypatch, caplog):
+    monkeypatch.setenv("PG_SLOW_QUERY_MS", "100")
+    stats = QueryStats()
+    stats.record("SELECT 1", (), source="A", elapsed_ms=3)
+    with caplog.at_level(logging.WARNING, logger="gentlebot.gentlebot.query_stats"):
+        stats.record("SELECT 1", ("hunter2",), source="A", elapsed_ms=400, rows=2)
+    entry = stats.top(1)[0]
+    assert entry.calls == 2
+    assert entry.rows == 2
+    assert entry.percentile(50) == 5
+    assert entry.percentile(99) == 500
+    assert "Slow query" in caplog.text
+    assert "hunter2" not in caplog.text
+
+
+def test_lane_pool_records_queries_by_source():
+    query_stats.reset()
+    conn = AsyncMock()
+    conn.fetch = AsyncMock(return_value=[1, 2, 3])
+    raw = AsyncMock()
+    raw.acquire = lambda timeout=None: FakeAcquire(conn)
+    base = db.LanePool("interactive", raw, acquire_timeout=5, max_size=4)
+    pool = base.tagged("StatsCog")
+
+    asyncio.run(pool.fetch("SELECT * FROM t WHERE id = $1", 9))
+    asyncio.run(base.fetch("SELECT 1"))
+
+    by_source = {s.source: s for s in query_stats}
+    assert by_source["StatsCog"].rows == 3
+    assert "interactive lane" in by_source
+    assert base.stats.acquires == 2
+
+    report = perf_cog.format_db_report()
+    assert "[StatsCog] SELECT * FROM t WHERE id = $1" in report
+    query_stats.reset()
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+
+import pytest
+
+import gentlebot.infra.quotas as quotas
+from gentlebot.infra.quotas import Limit, QuotaGuard, RateLimited
+from gentlebot.infra.state_cache import StateCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(quotas, "_now", lambda: now[0])
+    return now
+
+
+def test_token_window_slides_with_running_total(clock):
+    guard = QuotaGuard({"general": Limit(tpm=100)})
+    guard.check("general", 60)
+    clock[0] += 30
+    with pytest.raises(RateLimited) as exc:
+        guard.check("general", 50)
+    assert exc.value.retry_after == pytest.approx(30)
+    clock[0] += 31
+    guard.check("general", 50)
+    assert guard.tok_used["general"] == 50
+
+
+def test_rejected_request_does_not_consume_other_windows(clock):
+    guard = QuotaGuard({"general": Limit(rpm=5, tpm=100, rpd=10)})
+    with pytest.raises(RateLimited):
+        guard.check("general", 500)
+    assert guard.remaining("general") == {"rpm": 5, "tpm": 100, "rpd": 10}
+
+
+def test_daily_count_recorded_near_rpm_limit(clock):
+    guard = QuotaGuard({"general": Limit(rpm=2, rpd=10)})
+    assert guard.check("general", 1) == 0.0
+    assert guard.check("general", 1) == -0.2
+    assert guard.remaining("general")["rpd"] == 8
+
+
+def test_usage_survives_restart(clock, tmp_path):
+    state = StateCache(tmp_path / "state.db")
+    limits = {"general": Limit(rpm=5, rpd=3)}
+    guard = QuotaGuard(limits)
+    guard.attach_state(state, "llm")
+    guard.check("general", 1)
+    guard.check("general", 1)
+    guard.checkpoint()
+
+    restarted = QuotaGuard(limits)
+    restarted.attach_state(StateCache(tmp_path / "state.db"), "llm")
+    assert restarted.remaining("general") == {"rpm": 3, "tpm": None, "rpd": 1}
+    restarted.check("general", 1)
+    with pytest.raises(RateLimited) as exc:
+        restarted.check("general", 1)
+    assert exc.value.retry_after is None
+
+    # The minute window drains on its own; the daily budget resets after a day.
+    clock[0] += 86_400
+    again = QuotaGuard(limits)
+    again.attach_state(StateCache(tmp_path / "state.db"), "llm")
+    assert again.remaining("general") == {"rpm": 5, "tpm": None, "rpd": 3}
+
+
+def test_check_never_writes_and_background_checkpoint_runs_off_loop(tmp_path):
+    state = StateCache(tmp_path / "state.db")
+    writes: list[int] = []
+    original_set = state.set
+
+    def recording_set(*args, **kwargs):
+        writes.append(threading.get_ident())
+        return original_set(*args, **kwargs)
+
+    state.set = recording_set
+    guard = QuotaGuard({"general": Limit(rpd=10)})
+    guard.attach_state(state, "llm", checkpoint_interval=0.01)
+
+    async def run():
+        guard.start_checkpoints()
+        guard.check("general", 1)
+        assert writes == []
+        for _ in range(100):
+            if writes:
+                break
+            await asyncio.sleep(0.01)
+        guard.check("general", 1)
+        await guard.aclose()
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert writes and loop_thread not in writes
+
+    restarted = QuotaGuard({"general": Limit(rpd=10)})
+    restarted.attach_state(StateCache(tmp_path / "state.db"), "llm")
+    assert restarted.remaining("general")["rpd"] == 8
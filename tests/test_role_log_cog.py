@@ -60,7 +60,7 @@ async def fake_create_pool(url, *args, **kwargs):
 def test_role_add_logged(monkeypatch):
     async def run_test():
         monkeypatch.setattr(db.asyncpg, "create_pool", fake_create_pool)
-        db._pool = None
+        db._pools.clear()
         monkeypatch.setenv("LOG_ROLES", "1")
         monkeypatch.setenv("PG_DSN", "postgresql+asyncpg://u:p@localhost/db")
         intents = discord.Intents.default()
@@ -1,3 +1,4 @@
+import asyncio
 from types import SimpleNamespace
 
 from gentlebot.llm.router import LLMRouter
@@ -32,3 +33,28 @@ def test_generate_image_returns_final_image(monkeypatch):
     router.client.generate_image = fake_generate_image
     data = router.generate_image("test")
     assert data == b"img2"
+
+
+def test_generate_image_async_uses_async_client(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "fake")
+    router = LLMRouter()
+
+    class DummyQuota:
+        def check(self, *a, **k):
+            return None
+
+    router.quota = DummyQuota()
+
+    async def fake_generate_image_async(model: str, prompt: str):
+        return SimpleNamespace(
+            candidates=[
+                SimpleNamespace(
+                    content=SimpleNamespace(
+                        parts=[SimpleNamespace(inline_data=SimpleNamespace(data=b"img"))]
+                    )
+                )
+            ]
+        )
+
+    router.client.generate_image_async = fake_generate_image_async
+    assert asyncio.run(router.generate_image_async("test")) == b"img"
@@ -0,0 +1,130 @@
+"""Tests for concurrent tool execution and per-call generation context."""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import gentlebot.llm.router as llm_router
+from gentlebot.llm.context import GenerationContext
+
+
+def _tool_resp(*calls):
+    parts = [
+        SimpleNamespace(function_call=SimpleNamespace(name=name, args=args))
+        for name, args in calls
+    ]
+    return SimpleNamespace(
+        text="",
+        candidates=[SimpleNamespace(content=SimpleNamespace(parts=parts))],
+        usage_metadata=SimpleNamespace(candidates_token_count=2),
+    )
+
+
+def _text_resp(text="done"):
+    return SimpleNamespace(
+        text=text, candidates=[], usage_metadata=SimpleNamespace(candidates_token_count=5)
+    )
+
+
+def test_async_tools_run_concurrently(monkeypatch):
+    router = llm_router.LLMRouter()
+    responses = [_tool_resp(("slow", {"n": 1}), ("slow", {"n": 2}), ("slow", {"n": 3})), _text_resp()]
+
+    async def fake_generate_async(self, model, messages, **kwargs):
+        return responses.pop(0)
+
+    async def slow(params):
+        await asyncio.sleep(0.2)
+        return str(params["n"])
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_async", fake_generate_async)
+    monkeypatch.setattr(router, "_async_tool_handlers", lambda ctx=None: {"slow": slow})
+
+    ctx = GenerationContext()
+    start = time.monotonic()
+    assert asyncio.run(router.generate_async("general", [{"content": "hi"}], context=ctx)) == "done"
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.5
+    assert [t.status for t in ctx.tools] == ["ok", "ok", "ok"]
+    assert [turn.status for turn in ctx.turns] == ["tool_call", "ok"]
+    assert ctx.tokens_out == 7
+
+
+def test_async_tool_timeout_is_reported_to_model(monkeypatch):
+    router = llm_router.LLMRouter()
+    responses = [_tool_resp(("hang", {})), _text_resp()]
+    seen: list[list[dict]] = []
+
+    async def fake_generate_async(self, model, messages, **kwargs):
+        seen.append(messages)
+        return responses.pop(0)
+
+    async def hang(params):
+        await asyncio.sleep(5)
+        return "never"
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_async", fake_generate_async)
+    monkeypatch.setattr(router, "_async_tool_handlers", lambda ctx=None: {"hang": hang})
+    monkeypatch.setitem(llm_router.TOOL_TIMEOUTS, "hang", 0.05)
+
+    ctx = GenerationContext()
+    asyncio.run(router.generate_async("general", [{"content": "hi"}], context=ctx))
+
+    assert ctx.tools[0].status == "timeout"
+    assert any("timed out after 0.05s" in m["content"] for m in seen[1])
+
+
+def test_sync_tools_run_concurrently(monkeypatch):
+    router = llm_router.LLMRouter()
+    responses = [_tool_resp(("slow", {"n": 1}), ("slow", {"n": 2})), _text_resp()]
+    seen: list[list[dict]] = []
+
+    def fake_generate(self, model, messages, **kwargs):
+        seen.append(messages)
+        return responses.pop(0)
+
+    def slow(params):
+        time.sleep(0.2)
+        return f"result {params['n']}"
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate", fake_generate)
+    monkeypatch.setattr(router, "_tool_handlers", lambda ctx=None: {"slow": slow})
+
+    start = time.monotonic()
+    router.generate("general", [{"content": "hi"}])
+
+    assert time.monotonic() - start < 0.35
+    feedback = [m["content"] for m in seen[1]]
+    assert feedback.index("Tool slow result: result 1") < feedback.index(
+        "Tool slow result: result 2"
+    )
+
+
+def test_images_stay_with_their_request(monkeypatch):
+    router = llm_router.LLMRouter()
+
+    async def fake_generate_async(self, model, messages, **kwargs):
+        prompt = messages[0]["content"]
+        if len(messages) == 1:
+            return _tool_resp(("generate_image", {"prompt": prompt}))
+        return _text_resp(prompt)
+
+    async def fake_image(prompt, *images):
+        await asyncio.sleep(0.01)
+        return prompt.encode()
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_async", fake_generate_async)
+    monkeypatch.setattr(router, "generate_image_async", fake_image)
+
+    async def run():
+        first, second = GenerationContext(), GenerationContext()
+        await asyncio.gather(
+            router.generate_async("general", [{"content": "cat"}], context=first),
+            router.generate_async("general", [{"content": "dog"}], context=second),
+        )
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first.images == [("cat", b"cat")]
+    assert second.images == [("dog", b"dog")]
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import gentlebot.llm.router as llm_router
+from gentlebot.infra import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    flights = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "page"
+
+    results = await asyncio.gather(*(flights.do("url", fetch) for _ in range(3)))
+    assert results == ["page"] * 3
+    assert calls == 1
+    assert (flights.calls, flights.shared) == (1, 2)
+    assert flights.in_flight() == 0
+
+    # Nothing is cached once the flight lands.
+    assert await flights.do("url", fetch) == "page"
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_every_waiter():
+    flights = SingleFlight()
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("down")
+
+    results = await asyncio.gather(
+        flights.do("k", boom), flights.do("k", boom), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    flights = SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.02)
+        return 42
+
+    first = asyncio.create_task(flights.do("k", slow))
+    second = asyncio.create_task(flights.do("k", slow))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == 42
+
+
+def test_blocking_callers_share_one_call():
+    flights = SingleFlight()
+    calls = 0
+    started = threading.Event()
+
+    def fetch():
+        nonlocal calls
+        calls += 1
+        started.set()
+        time.sleep(0.05)
+        return "page"
+
+    results: list[str] = []
+    leader = threading.Thread(target=lambda: results.append(flights.do_blocking("k", fetch)))
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=lambda: results.append(flights.do_blocking("k", fetch)))
+    follower.start()
+    leader.join()
+    follower.join()
+    assert results == ["page", "page"]
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_router_coalesces_identical_requests(monkeypatch):
+    router = llm_router.LLMRouter()
+    calls: list[str] = []
+
+    async def fake_generate_async(self, model, messages, **kwargs):
+        calls.append(model)
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(
+            text="ok", usage_metadata=SimpleNamespace(candidates_token_count=0)
+        )
+
+    monkeypatch.setattr(llm_router.GeminiClient, "generate_async", fake_generate_async)
+
+    messages = [{"role": "user", "content": "summarize"}]
+    results = await asyncio.gather(
+        router.generate_async("general", messages),
+        router.generate_async("general", messages),
+        router.generate_async("general", [{"role": "user", "content": "other"}]),
+    )
+    assert results == ["ok", "ok", "ok"]
+    assert len(calls) == 2
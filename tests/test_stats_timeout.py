@@ -2,17 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any, Iterable
 
-import gentlebot.cogs.mariners_game_cog as mariners_game_cog
 from gentlebot.cogs.mariners_game_cog import MarinersGameCog
 from gentlebot.cogs.sports_cog import STATS_TIMEOUT, TEAM_ID
 
 
 @dataclass
 class DummyResponse:
-    """Minimal response object mimicking :class:`requests.Response`."""
+    """Minimal response object mimicking :class:`HttpResponse`."""
 
     payload: dict[str, Any]
 
@@ -23,38 +23,33 @@ class DummyResponse:
         return self.payload
 
 
-class DummySession:
-    """Context manager capturing timeout arguments passed to ``get``."""
+class DummyClient:
+    """Shared HTTP client stand-in capturing timeout arguments passed to ``get``."""
 
     def __init__(self, responses: Iterable[DummyResponse], sink: list[Any]):
         self._responses = list(responses)
         self._timeouts = sink
 
-    def mount(self, *_args: Any, **_kwargs: Any) -> None:
-        return None
-
-    def get(self, _url: str, *, timeout: Any | None = None) -> DummyResponse:
+    async def get(
+        self,
+        _url: str,
+        *,
+        params: Any = None,
+        timeout: Any | None = None,
+        cache: Any = None,
+    ) -> DummyResponse:
         self._timeouts.append(timeout)
         if not self._responses:
             raise AssertionError("No dummy response left for GET request")
         return self._responses.pop(0)
 
-    def close(self) -> None:  # pragma: no cover - compatibility shim
-        return None
-
-    def __enter__(self) -> "DummySession":
-        return self
 
-    def __exit__(self, *_exc: Any) -> None:
-        self.close()
-
-
-def test_fetch_game_summary_uses_stats_timeout(monkeypatch) -> None:
+def test_fetch_game_summary_uses_stats_timeout() -> None:
     """All Mariners API requests should include ``timeout=STATS_TIMEOUT``."""
 
     timeouts: list[Any] = []
 
-    def session_factory() -> DummySession:
+    def client_factory() -> DummyClient:
         schedule_payload = {
             "dates": [
                 {
@@ -137,12 +132,11 @@ def test_fetch_game_summary_uses_stats_timeout(monkeypatch) -> None:
             DummyResponse(feed_payload),
             DummyResponse(standings_payload),
         ]
-        return DummySession(responses, timeouts)
-
-    monkeypatch.setattr(mariners_game_cog.requests, "Session", session_factory)
+        return DummyClient(responses, timeouts)
 
     cog = MarinersGameCog(bot=None)
-    summary = cog.fetch_game_summary()
+    cog.http = client_factory()
+    summary = asyncio.run(cog.fetch_game_summary())
 
     assert summary is not None
     assert timeouts == [STATS_TIMEOUT, STATS_TIMEOUT, STATS_TIMEOUT]
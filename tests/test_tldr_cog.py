@@ -158,7 +158,7 @@ def test_error_summary_returns_empty():
 
     async def run():
         with patch("gentlebot.cogs.tldr_cog.router") as mock_router:
-            mock_router.generate.side_effect = Exception("LLM down")
+            mock_router.generate_async = AsyncMock(side_effect=Exception("LLM down"))
             result = await cog._summarize_message("test content", "TestUser")
             assert result == ""
 
@@ -34,10 +34,10 @@ def test_friendship_tips(monkeypatch):
     cur = [SimpleNamespace(content="hi", author=SimpleNamespace(display_name="a"))]
     prior = [SimpleNamespace(content="hi", author=SimpleNamespace(display_name="b"))]
 
-    def fake_generate(route, messages, temperature, think_budget=0, json_mode=False):
+    async def fake_generate(route, messages, temperature, think_budget=0, json_mode=False):
         return "tip1\ntip2"
 
-    monkeypatch.setattr(vibecheck_cog.router, "generate", fake_generate)
+    monkeypatch.setattr(vibecheck_cog.router, "generate_async", fake_generate)
 
     async def run():
         tips = await cog._friendship_tips(cur, prior)
@@ -57,11 +57,11 @@ def test_derive_topics_uses_gemini(monkeypatch):
         ArchivedMessage(1, "c", 2, "b", "more chats", now, False, 0),
     ]
 
-    def fake_generate(route, messages, temperature, think_budget=0, json_mode=False):
+    async def fake_generate(route, messages, temperature, think_budget=0, json_mode=False):
         assert route == "general"
         return "topic one\ntopic two"
 
-    monkeypatch.setattr(vibecheck_cog.router, "generate", fake_generate)
+    monkeypatch.setattr(vibecheck_cog.router, "generate_async", fake_generate)
 
     async def run():
         topics = await cog._derive_topics(msgs)
@@ -79,10 +79,10 @@ def test_derive_topics_skips_empty(monkeypatch):
         ArchivedMessage(1, "c", 1, "a", None, now, False, 0),
     ]
 
-    def boom(*args, **kwargs):
+    async def boom(*args, **kwargs):
         raise AssertionError("should not call")
 
-    monkeypatch.setattr(vibecheck_cog.router, "generate", boom)
+    monkeypatch.setattr(vibecheck_cog.router, "generate_async", boom)
 
     async def run():
         topics = await cog._derive_topics(msgs)
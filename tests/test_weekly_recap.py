@@ -218,8 +218,8 @@ def test_generate_vibe_fallback_on_disabled():
 def test_generate_vibe_fallback_on_error():
     """Vibe generation should fall back on LLM error."""
     with patch(
-        "gentlebot.cogs.weekly_recap_cog.router.generate",
-        side_effect=Exception("API error"),
+        "gentlebot.cogs.weekly_recap_cog.router.generate_async",
+        new=AsyncMock(side_effect=Exception("API error")),
     ):
         result = asyncio.run(weekly_recap_cog._generate_vibe({}, "TestServer"))
     assert "TestServer" in result